@@ -23,6 +23,14 @@ from langchain_core.messages import AIMessage, HumanMessage
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 
+from src.agents.fundamental.application.workflow_orchestrator.services.valuation_compute_executor_service import (
+    shutdown_valuation_compute_executor,
+    warmup_valuation_compute_executor,
+)
+from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.providers import (
+    shutdown_arelle_worker_pools,
+    warmup_arelle_worker_pool,
+)
 from src.agents.fundamental.subdomains.forward_signals.infrastructure.sec_xbrl import (
     warmup_dependency_matcher,
     warmup_forward_looking_filter,
@@ -172,9 +180,53 @@ async def lifespan(app: FastAPI):
                 "⚠️ [Lifespan] Dependency matcher warmup failed: %s", str(exc)
             )
 
+    valuation_compute_warmup_enabled = os.getenv(
+        "FUNDAMENTAL_VALUATION_COMPUTE_WARMUP", "1"
+    ).strip().lower() not in {
+        "0",
+        "false",
+        "no",
+    }
+    if valuation_compute_warmup_enabled:
+        logger.info("🚀 [Lifespan] Warming up valuation compute executor...")
+        try:
+            compute_result = await asyncio.to_thread(warmup_valuation_compute_executor)
+            logger.info(
+                "✅ [Lifespan] Valuation compute warmup completed: mode=%s workers=%s warmup=%sms",
+                compute_result.get("mode"),
+                compute_result.get("workers"),
+                compute_result.get("warmup_ms"),
+            )
+        except Exception as exc:
+            logger.warning("⚠️ [Lifespan] Valuation compute warmup failed: %s", str(exc))
+
+    arelle_warmup_enabled = os.getenv(
+        "FUNDAMENTAL_XBRL_ARELLE_WARMUP", "1"
+    ).strip().lower() not in {
+        "0",
+        "false",
+        "no",
+    }
+    if arelle_warmup_enabled:
+        logger.info("🚀 [Lifespan] Warming up Arelle worker pool...")
+        try:
+            arelle_result = await asyncio.to_thread(warmup_arelle_worker_pool)
+            logger.info(
+                "✅ [Lifespan] Arelle worker pool warmup completed: mode=%s workers=%s warmup=%sms",
+                arelle_result.get("mode"),
+                arelle_result.get("workers"),
+                arelle_result.get("warmup_ms"),
+            )
+        except Exception as exc:
+            logger.warning(
+                "⚠️ [Lifespan] Arelle worker pool warmup failed: %s", str(exc)
+            )
+
     logger.info("✅ [Lifespan] Initialization complete.")
     yield
     await close_shared_async_client()
+    await asyncio.to_thread(shutdown_valuation_compute_executor)
+    await asyncio.to_thread(shutdown_arelle_worker_pools)
     logger.info("🛑 [Lifespan] Shutting down...")
 
 
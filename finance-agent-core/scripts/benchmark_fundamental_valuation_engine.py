@@ -0,0 +1,625 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.orchestrator import (  # noqa: E402
+    build_params,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.param_cache_service import (  # noqa: E402
+    PARAM_CACHE_ENABLED_ENV,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.valuation_model_registry import (  # noqa: E402
+    ValuationModelRegistry,
+)
+from src.agents.fundamental.subdomains.core_valuation.interface.replay_contracts import (  # noqa: E402
+    ValuationReplayInputModel,
+    parse_valuation_replay_input_model,
+)
+from src.agents.fundamental.subdomains.financial_statements.interface.contracts import (  # noqa: E402
+    parse_financial_reports_model,
+)
+from src.shared.kernel.types import JSONObject  # noqa: E402
+
+BASELINE_SCHEMA_VERSION = "fundamental_valuation_benchmark_baseline_v1"
+
+# Analyst-supplied inputs the replay snapshots do not carry (multiples,
+# explicit residual income / EVA paths, bank capital targets). Fixed values
+# keep every calculator covered while staying fully offline.
+_MISSING_INPUT_DEFAULTS: dict[str, dict[str, object]] = {
+    "bank": {"tier1_target_ratio": 0.12},
+    "ev_revenue": {"ev_revenue_multiple": 6.0},
+    "ev_ebitda": {"ebitda": 250.0, "ev_ebitda_multiple": 12.0},
+    "reit_ffo": {"ffo": 150.0, "ffo_multiple": 16.0},
+    "residual_income": {
+        "projected_residual_incomes": [60.0, 62.0, 64.0, 66.0, 68.0],
+        "required_return": 0.09,
+        "terminal_growth": 0.02,
+    },
+    "eva": {
+        "projected_evas": [50.0, 52.0, 54.0, 56.0, 58.0],
+        "wacc": 0.085,
+        "terminal_growth": 0.02,
+    },
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    kind: str
+    model: str
+    ticker: str
+    iterations: int | None
+    run: Callable[[], object]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    kind: str
+    model: str
+    ticker: str
+    iterations: int | None
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    peak_kib: float
+    error: str | None = None
+
+
+def _default_replay_inputs() -> list[Path]:
+    return sorted(
+        (PROJECT_ROOT / "tests" / "fixtures" / "fundamental_replay_inputs").glob(
+            "*.replay.json"
+        )
+    )
+
+
+def _default_baseline_path() -> Path:
+    return PROJECT_ROOT / "reports" / "fundamental_valuation_benchmark_baseline.json"
+
+
+@contextmanager
+def _param_cache_disabled() -> Iterator[None]:
+    # Builder timings must measure the builders, not the content-hash cache.
+    previous = os.environ.get(PARAM_CACHE_ENABLED_ENV)
+    os.environ[PARAM_CACHE_ENABLED_ENV] = "false"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(PARAM_CACHE_ENABLED_ENV, None)
+        else:
+            os.environ[PARAM_CACHE_ENABLED_ENV] = previous
+
+
+def _load_replay_input(path: Path) -> ValuationReplayInputModel:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return parse_valuation_replay_input_model(raw, context=f"benchmark.{path.name}")
+
+
+def _market_snapshot(replay_input: ValuationReplayInputModel) -> JSONObject | None:
+    snapshot: JSONObject = {}
+    if isinstance(replay_input.market_snapshot, Mapping):
+        snapshot.update(dict(replay_input.market_snapshot))
+    if isinstance(replay_input.forward_signals, list):
+        snapshot["forward_signals"] = list(replay_input.forward_signals)
+    return snapshot or None
+
+
+def _build_cases(
+    replay_paths: list[Path],
+    *,
+    models: list[str],
+    mc_iterations: list[int],
+) -> tuple[list[BenchmarkCase], list[str]]:
+    """
+    One builder and one deterministic calculator case per (replay input,
+    model), plus Monte Carlo cases at each iteration count for models whose
+    params carry monte_carlo_iterations. Params are built once up front from
+    the frozen replay inputs, so no provider is touched. Inputs the builder
+    reports missing are filled from _MISSING_INPUT_DEFAULTS; calculator cases
+    still missing inputs after that are skipped and listed.
+    """
+    cases: list[BenchmarkCase] = []
+    skipped: list[str] = []
+    for path in replay_paths:
+        replay_input = _load_replay_input(path)
+        ticker = replay_input.ticker
+        reports = parse_financial_reports_model(
+            [
+                report.model_dump(mode="json", exclude_none=False)
+                for report in replay_input.reports
+            ],
+            context="benchmark.financial_reports",
+            inject_default_provenance=True,
+        )
+        market_snapshot = _market_snapshot(replay_input)
+        for model in models:
+            runtime = ValuationModelRegistry.get_model_runtime(model)
+            if runtime is None:
+                raise ValueError(f"Unknown valuation model: {model}")
+
+            build = partial(
+                build_params, model, ticker, reports, market_snapshot=market_snapshot
+            )
+            build_result = build()
+            cases.append(
+                BenchmarkCase(
+                    name=f"param_builder:{model}:{ticker}",
+                    kind="param_builder",
+                    model=model,
+                    ticker=ticker,
+                    iterations=None,
+                    run=build,
+                )
+            )
+            params = dict(build_result.params)
+            defaults = _MISSING_INPUT_DEFAULTS.get(model, {})
+            unresolved = [name for name in build_result.missing if name not in defaults]
+            if unresolved:
+                skipped.append(
+                    f"calculator:{model}:{ticker} missing={','.join(unresolved)}"
+                )
+                continue
+            params.update({name: defaults[name] for name in build_result.missing})
+            # Unresolved inputs are also traced as empty fields; drop those so
+            # the filled-in values reach the graph.
+            params["trace_inputs"] = {
+                name: value
+                for name, value in build_result.trace_inputs.items()
+                if value.value is not None
+            }
+            has_monte_carlo = "monte_carlo_iterations" in params
+            if has_monte_carlo:
+                params["monte_carlo_iterations"] = 0
+            cases.append(
+                _calculator_case(
+                    runtime, params, kind="calculator", model=model, ticker=ticker
+                )
+            )
+            if not has_monte_carlo:
+                continue
+            for iterations in mc_iterations:
+                cases.append(
+                    _calculator_case(
+                        runtime,
+                        {**params, "monte_carlo_iterations": iterations},
+                        kind="monte_carlo",
+                        model=model,
+                        ticker=ticker,
+                        iterations=iterations,
+                    )
+                )
+    return cases, skipped
+
+
+def _calculator_case(
+    runtime: Mapping[str, object],
+    params: dict[str, object],
+    *,
+    kind: str,
+    model: str,
+    ticker: str,
+    iterations: int | None = None,
+) -> BenchmarkCase:
+    schema = runtime["schema"]
+    calculator = runtime["calculator"]
+    params_obj = schema(**params)
+
+    def _run() -> object:
+        result = calculator(params_obj)
+        if isinstance(result, Mapping) and result.get("error"):
+            raise RuntimeError(str(result["error"]))
+        return result
+
+    suffix = f"@{iterations}" if iterations is not None else ""
+    return BenchmarkCase(
+        name=f"{kind}:{model}:{ticker}{suffix}",
+        kind=kind,
+        model=model,
+        ticker=ticker,
+        iterations=iterations,
+        run=_run,
+    )
+
+
+def _peak_kib(fn: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        retained = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+    return peak / 1024.0
+
+
+def _benchmark_case(case: BenchmarkCase, *, repeats: int) -> BenchmarkResult:
+    try:
+        case.run()  # warm-up: imports, compiled plans, lazily built policies
+        samples: list[float] = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            case.run()
+            samples.append((time.perf_counter() - started) * 1000.0)
+        # Memory is traced in a separate run so tracemalloc does not skew timings.
+        peak_kib = _peak_kib(case.run)
+    except Exception as exc:  # noqa: BLE001
+        return BenchmarkResult(
+            name=case.name,
+            kind=case.kind,
+            model=case.model,
+            ticker=case.ticker,
+            iterations=case.iterations,
+            samples=0,
+            p50_ms=0.0,
+            p95_ms=0.0,
+            peak_kib=0.0,
+            error=f"{exc.__class__.__name__}: {exc}",
+        )
+    timings = np.asarray(samples, dtype=float)
+    return BenchmarkResult(
+        name=case.name,
+        kind=case.kind,
+        model=case.model,
+        ticker=case.ticker,
+        iterations=case.iterations,
+        samples=len(samples),
+        p50_ms=round(float(np.percentile(timings, 50)), 4),
+        p95_ms=round(float(np.percentile(timings, 95)), 4),
+        peak_kib=round(peak_kib, 1),
+    )
+
+
+def run_benchmarks(
+    replay_paths: list[Path],
+    *,
+    models: list[str],
+    mc_iterations: list[int],
+    repeats: int,
+) -> tuple[list[BenchmarkResult], list[str]]:
+    with _param_cache_disabled():
+        cases, skipped = _build_cases(
+            replay_paths, models=models, mc_iterations=mc_iterations
+        )
+        return [_benchmark_case(case, repeats=repeats) for case in cases], skipped
+
+
+def build_baseline_payload(results: list[BenchmarkResult]) -> JSONObject:
+    return {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": {
+            item.name: {
+                "p50_ms": item.p50_ms,
+                "p95_ms": item.p95_ms,
+                "peak_kib": item.peak_kib,
+            }
+            for item in results
+            if item.error is None
+        },
+    }
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float]] | None:
+    if not path.exists():
+        return None
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema_version") != BASELINE_SCHEMA_VERSION
+    ):
+        raise ValueError(f"unsupported benchmark baseline schema: {path}")
+    benchmarks = payload.get("benchmarks")
+    if not isinstance(benchmarks, dict):
+        raise ValueError(f"benchmark baseline missing benchmarks: {path}")
+    baseline: dict[str, dict[str, float]] = {}
+    for name, entry in benchmarks.items():
+        if not isinstance(entry, dict):
+            continue
+        baseline[str(name)] = {
+            key: float(value)
+            for key, value in entry.items()
+            if isinstance(value, int | float) and not isinstance(value, bool)
+        }
+    return baseline
+
+
+def collect_gate_failures(
+    results: list[BenchmarkResult],
+    *,
+    baseline: Mapping[str, Mapping[str, float]],
+    max_p50_regression_pct: float,
+    max_p95_regression_pct: float,
+    max_memory_regression_pct: float,
+    min_regression_ms: float,
+    min_memory_regression_kib: float,
+) -> list[str]:
+    """
+    A metric fails only when it exceeds both the relative threshold and the
+    absolute floor, so sub-millisecond jitter on fast cases cannot trip the
+    gate. Benchmarks missing from the baseline are reported, not failed.
+    """
+    failures: list[str] = []
+    for item in results:
+        if item.error is not None:
+            failures.append(f"`{item.name}` error={item.error}")
+            continue
+        reference = baseline.get(item.name)
+        if reference is None:
+            continue
+        for metric, current, limit_pct, floor in (
+            ("p50_ms", item.p50_ms, max_p50_regression_pct, min_regression_ms),
+            ("p95_ms", item.p95_ms, max_p95_regression_pct, min_regression_ms),
+            (
+                "peak_kib",
+                item.peak_kib,
+                max_memory_regression_pct,
+                min_memory_regression_kib,
+            ),
+        ):
+            previous = reference.get(metric)
+            if previous is None or previous <= 0:
+                continue
+            delta = current - previous
+            regression_pct = delta / previous * 100.0
+            if regression_pct > limit_pct and delta > floor:
+                failures.append(
+                    f"`{item.name}` {metric}={current:.4f} regressed "
+                    f"{regression_pct:.1f}% vs baseline {previous:.4f}"
+                )
+    return failures
+
+
+def _render_markdown(
+    results: list[BenchmarkResult],
+    *,
+    baseline: Mapping[str, Mapping[str, float]],
+    gate_failures: list[str],
+) -> str:
+    lines = [
+        "# Fundamental Valuation Engine Benchmark",
+        "",
+        f"- generated_at: `{datetime.now(UTC).isoformat()}`",
+        "",
+        "| Benchmark | p50 (ms) | p95 (ms) | Peak (KiB) | Baseline p50 (ms) |",
+        "|---|---:|---:|---:|---:|",
+    ]
+    for item in results:
+        previous = baseline.get(item.name, {}).get("p50_ms")
+        previous_text = f"{previous:.4f}" if previous is not None else "-"
+        if item.error is not None:
+            lines.append(f"| {item.name} | error | error | - | {previous_text} |")
+            continue
+        lines.append(
+            f"| {item.name} | {item.p50_ms:.4f} | {item.p95_ms:.4f} | "
+            f"{item.peak_kib:.1f} | {previous_text} |"
+        )
+    lines.extend(["", "## Gate", ""])
+    if gate_failures:
+        lines.extend(f"- FAIL {failure}" for failure in gate_failures)
+    else:
+        lines.append("- PASS timing and memory regression gates.")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Offline benchmark of the valuation calculators, parameter builders "
+            "and Monte Carlo runs on frozen replay inputs, gated against a JSON "
+            "baseline."
+        )
+    )
+    parser.add_argument(
+        "--replay-inputs",
+        nargs="+",
+        type=Path,
+        default=_default_replay_inputs(),
+        help="Frozen replay input JSON files.",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=list(ValuationModelRegistry.MODEL_RUNTIMES),
+        help="Valuation models to benchmark.",
+    )
+    parser.add_argument(
+        "--mc-iterations",
+        nargs="+",
+        type=int,
+        default=[1000, 10000],
+        help="Monte Carlo iteration counts to benchmark.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=7,
+        help="Timed runs per benchmark after one warm-up run.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=_default_baseline_path(),
+        help="Baseline JSON with p50/p95 timings and peak memory per benchmark.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the current run to --baseline instead of gating against it.",
+    )
+    parser.add_argument(
+        "--require-baseline",
+        action="store_true",
+        help="Fail when --baseline does not exist.",
+    )
+    parser.add_argument(
+        "--max-p50-regression-pct",
+        type=float,
+        default=25.0,
+        help="Allowed p50 slowdown vs baseline, in percent.",
+    )
+    parser.add_argument(
+        "--max-p95-regression-pct",
+        type=float,
+        default=50.0,
+        help="Allowed p95 slowdown vs baseline, in percent.",
+    )
+    parser.add_argument(
+        "--max-memory-regression-pct",
+        type=float,
+        default=20.0,
+        help="Allowed peak memory growth vs baseline, in percent.",
+    )
+    parser.add_argument(
+        "--min-regression-ms",
+        type=float,
+        default=1.0,
+        help="Timing regressions smaller than this many ms never fail the gate.",
+    )
+    parser.add_argument(
+        "--min-memory-regression-kib",
+        type=float,
+        default=64.0,
+        help="Memory regressions smaller than this many KiB never fail the gate.",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="Root log level while benchmarking (calculators log per run).",
+    )
+    parser.add_argument(
+        "--report-json",
+        type=Path,
+        default=PROJECT_ROOT / "reports" / "fundamental_valuation_benchmark.json",
+    )
+    parser.add_argument(
+        "--report-md",
+        type=Path,
+        default=PROJECT_ROOT / "reports" / "fundamental_valuation_benchmark.md",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    root_logger.setLevel(args.log_level.upper())
+    try:
+        results, skipped = run_benchmarks(
+            list(args.replay_inputs),
+            models=list(args.models),
+            mc_iterations=list(args.mc_iterations),
+            repeats=max(args.repeats, 1),
+        )
+    finally:
+        root_logger.setLevel(previous_level)
+
+    baseline_path: Path = args.baseline
+    baseline: dict[str, dict[str, float]] = {}
+    gate_failures: list[str] = []
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(
+            json.dumps(
+                build_baseline_payload(results),
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        gate_failures = [
+            f"`{item.name}` error={item.error}"
+            for item in results
+            if item.error is not None
+        ]
+    else:
+        loaded = load_baseline(baseline_path)
+        if loaded is None and args.require_baseline:
+            gate_failures.append(f"baseline not found: {baseline_path}")
+        baseline = loaded or {}
+        gate_failures.extend(
+            collect_gate_failures(
+                results,
+                baseline=baseline,
+                max_p50_regression_pct=args.max_p50_regression_pct,
+                max_p95_regression_pct=args.max_p95_regression_pct,
+                max_memory_regression_pct=args.max_memory_regression_pct,
+                min_regression_ms=args.min_regression_ms,
+                min_memory_regression_kib=args.min_memory_regression_kib,
+            )
+        )
+
+    gate_passed = not gate_failures
+    payload = {
+        "summary": {
+            "generated_at": datetime.now(UTC).isoformat(),
+            "replay_inputs": [str(path) for path in args.replay_inputs],
+            "models": list(args.models),
+            "mc_iterations": list(args.mc_iterations),
+            "repeats": args.repeats,
+            "baseline": str(baseline_path),
+            "baseline_updated": bool(args.update_baseline),
+            "baseline_benchmark_count": len(baseline),
+            "skipped": skipped,
+            "new_benchmarks": [
+                item.name for item in results if item.name not in baseline
+            ],
+            "max_p50_regression_pct": args.max_p50_regression_pct,
+            "max_p95_regression_pct": args.max_p95_regression_pct,
+            "max_memory_regression_pct": args.max_memory_regression_pct,
+            "gate_passed": gate_passed,
+            "gate_failures": gate_failures,
+        },
+        "results": [asdict(item) for item in results],
+    }
+    args.report_json.parent.mkdir(parents=True, exist_ok=True)
+    args.report_json.write_text(
+        json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    args.report_md.parent.mkdir(parents=True, exist_ok=True)
+    args.report_md.write_text(
+        _render_markdown(results, baseline=baseline, gate_failures=gate_failures),
+        encoding="utf-8",
+    )
+
+    print(f"[valuation-benchmark] json={args.report_json}")
+    print(f"[valuation-benchmark] markdown={args.report_md}")
+    if args.update_baseline:
+        print(f"[valuation-benchmark] baseline={baseline_path}")
+    print(f"[valuation-benchmark] gate_passed={gate_passed}")
+    return 0 if gate_passed else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
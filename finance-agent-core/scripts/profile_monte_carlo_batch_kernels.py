@@ -3,14 +3,63 @@ from __future__ import annotations
 import argparse
 import json
 import statistics
+import sys
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
 import numpy as np
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.calculation_plan import (  # noqa: E402
+    CalculationPlan,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.dcf_kernels import (  # noqa: E402
+    KernelDtype,
+    guard_terminal_growth,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.bank_ddm import (  # noqa: E402
+    create_bank_graph,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.dcf_standard import (  # noqa: E402
+    create_dcf_standard_graph,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.saas_fcff import (  # noqa: E402
+    create_saas_graph,
+)
+
+_FCFF_BASE_GROWTH = np.array([0.15, 0.14, 0.12, 0.10, 0.08], dtype=float)
+_FCFF_BASE_MARGIN = np.array([0.10, 0.12, 0.14, 0.16, 0.18], dtype=float)
+_FCFF_STATIC_INPUTS: dict[str, float] = {
+    "initial_revenue": 100.0,
+    "tax_rate": 0.21,
+    "cash": 10.0,
+    "total_debt": 5.0,
+    "preferred_stock": 0.0,
+    "shares_outstanding": 100.0,
+}
+_FCFF_SERIES_INPUTS: dict[str, np.ndarray] = {
+    "da_rates": np.full(5, 0.03),
+    "capex_rates": np.full(5, 0.05),
+    "wc_rates": np.full(5, 0.01),
+    "sbc_rates": np.full(5, 0.02),
+}
+
+_BANK_BASE_GROWTH = np.array([0.06, 0.055, 0.05, 0.045, 0.04], dtype=float)
+_BANK_STATIC_INPUTS: dict[str, float] = {
+    "rwa_intensity": 0.025,
+    "tier1_target_ratio": 0.11,
+    "initial_capital": 280.0,
+    "shares_outstanding": 3000.0,
+}
+_BANK_INITIAL_NET_INCOME = 35.0
+_BANK_BETA = 1.2
+_BANK_MARKET_RISK_PREMIUM = 0.05
 
 
 @dataclass(frozen=True)
@@ -18,42 +67,46 @@ class BenchmarkResult:
     model: str
     iterations: int
     p50_reference_ms: float
-    p50_optimized_ms: float
+    p50_kernel_ms: float
+    p50_kernel_float32_ms: float
     speedup_ratio: float
     improvement_pct: float
     max_abs_diff: float
     mean_abs_error: float
+    float32_max_rel_diff: float
 
 
-def _saas_reference(
-    *,
-    growth_shock: np.ndarray,
-    margin_shock: np.ndarray,
-    wacc: np.ndarray,
-    terminal_growth: np.ndarray,
-) -> np.ndarray:
-    base_growth = np.array([0.15, 0.14, 0.12, 0.10, 0.08], dtype=float)
-    base_margin = np.array([0.10, 0.12, 0.14, 0.16, 0.18], dtype=float)
-    da_rates = np.array([0.03, 0.03, 0.03, 0.03, 0.03], dtype=float)
-    capex_rates = np.array([0.05, 0.05, 0.05, 0.05, 0.05], dtype=float)
-    wc_rates = np.array([0.01, 0.01, 0.01, 0.01, 0.01], dtype=float)
-    sbc_rates = np.array([0.02, 0.02, 0.02, 0.02, 0.02], dtype=float)
-    initial_revenue = 100.0
-    tax_rate = 0.21
-    cash = 10.0
-    total_debt = 5.0
-    preferred_stock = 0.0
-    shares_outstanding = 100.0
-
-    years = base_growth.shape[0]
-    batch_size = growth_shock.shape[0]
+@dataclass(frozen=True)
+class BenchmarkCase:
+    model: str
+    reference_fn: Callable[..., np.ndarray]
+    kernel_fn: Callable[..., np.ndarray]
+    sample_inputs: Callable[[np.random.Generator, int], dict[str, np.ndarray]]
+
+
+def _shocked_fcff_drivers(
+    growth_shock: np.ndarray, margin_shock: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
     growth_rates = np.clip(
-        base_growth[np.newaxis, :] + growth_shock[:, np.newaxis], -0.80, 1.50
+        _FCFF_BASE_GROWTH[np.newaxis, :] + growth_shock[:, np.newaxis], -0.80, 1.50
     )
     operating_margins = np.clip(
-        base_margin[np.newaxis, :] + margin_shock[:, np.newaxis], -0.50, 0.70
+        _FCFF_BASE_MARGIN[np.newaxis, :] + margin_shock[:, np.newaxis], -0.50, 0.70
     )
+    return growth_rates, operating_margins
 
+
+def _fcff_equity_reference(
+    *,
+    growth_rates: np.ndarray,
+    operating_margins: np.ndarray,
+    wacc: np.ndarray,
+    terminal: np.ndarray,
+) -> np.ndarray:
+    # Year-by-year loop kept independent of the kernels as a numerical oracle.
+    static = _FCFF_STATIC_INPUTS
+    initial_revenue = static["initial_revenue"]
+    batch_size, years = growth_rates.shape
     projected_revenue = np.empty((batch_size, years), dtype=float)
     revenue_level = np.full(batch_size, initial_revenue, dtype=float)
     for year_idx in range(years):
@@ -61,10 +114,9 @@ def _saas_reference(
         projected_revenue[:, year_idx] = revenue_level
 
     ebit = projected_revenue * operating_margins
-    nopat = ebit * (1.0 - tax_rate)
-    da = projected_revenue * da_rates[np.newaxis, :]
-    capex = projected_revenue * capex_rates[np.newaxis, :]
-    sbc = projected_revenue * sbc_rates[np.newaxis, :]
+    nopat = ebit * (1.0 - static["tax_rate"])
+    da = projected_revenue * _FCFF_SERIES_INPUTS["da_rates"][np.newaxis, :]
+    capex = projected_revenue * _FCFF_SERIES_INPUTS["capex_rates"][np.newaxis, :]
     previous_revenue = np.concatenate(
         [
             np.full((batch_size, 1), initial_revenue, dtype=float),
@@ -72,76 +124,57 @@ def _saas_reference(
         ],
         axis=1,
     )
-    delta_wc = (projected_revenue - previous_revenue) * wc_rates[np.newaxis, :]
-    fcff = nopat + da - capex - delta_wc + sbc
+    delta_wc = (projected_revenue - previous_revenue) * _FCFF_SERIES_INPUTS["wc_rates"][
+        np.newaxis, :
+    ]
+    fcff = nopat + da - capex - delta_wc
 
-    discount_years = np.arange(1, years + 1, dtype=float)
-    terminal = np.minimum(terminal_growth, wacc - 0.001)
-    discount_curve = np.power(1.0 + wacc[:, np.newaxis], discount_years[np.newaxis, :])
-    pv_fcff = np.sum(fcff / discount_curve, axis=1)
+    pv_fcff = np.zeros(batch_size, dtype=float)
+    for year_idx in range(years):
+        pv_fcff += fcff[:, year_idx] / np.power(1.0 + wacc, year_idx + 1)
     final_fcff = fcff[:, -1]
     terminal_value = final_fcff * (1.0 + terminal) / (wacc - terminal)
     pv_terminal = terminal_value / np.power(1.0 + wacc, years)
     enterprise_value = pv_fcff + pv_terminal
-    equity_value = enterprise_value + cash - total_debt - preferred_stock
-    return equity_value / shares_outstanding
+    equity_value = (
+        enterprise_value
+        + static["cash"]
+        - static["total_debt"]
+        - static["preferred_stock"]
+    )
+    return equity_value / static["shares_outstanding"]
 
 
-def _saas_optimized(
+def _saas_reference(
     *,
     growth_shock: np.ndarray,
     margin_shock: np.ndarray,
     wacc: np.ndarray,
     terminal_growth: np.ndarray,
 ) -> np.ndarray:
-    base_growth = np.array([0.15, 0.14, 0.12, 0.10, 0.08], dtype=float)
-    base_margin = np.array([0.10, 0.12, 0.14, 0.16, 0.18], dtype=float)
-    da_rates = np.array([0.03, 0.03, 0.03, 0.03, 0.03], dtype=float)
-    capex_rates = np.array([0.05, 0.05, 0.05, 0.05, 0.05], dtype=float)
-    wc_rates = np.array([0.01, 0.01, 0.01, 0.01, 0.01], dtype=float)
-    sbc_rates = np.array([0.02, 0.02, 0.02, 0.02, 0.02], dtype=float)
-    initial_revenue = 100.0
-    tax_rate = 0.21
-    cash = 10.0
-    total_debt = 5.0
-    preferred_stock = 0.0
-    shares_outstanding = 100.0
-
-    years = base_growth.shape[0]
-    batch_size = growth_shock.shape[0]
-    discount_years = np.arange(1, years + 1, dtype=float)
-    growth_rates = np.clip(
-        base_growth[np.newaxis, :] + growth_shock[:, np.newaxis], -0.80, 1.50
-    )
-    operating_margins = np.clip(
-        base_margin[np.newaxis, :] + margin_shock[:, np.newaxis], -0.50, 0.70
+    growth_rates, operating_margins = _shocked_fcff_drivers(growth_shock, margin_shock)
+    return _fcff_equity_reference(
+        growth_rates=growth_rates,
+        operating_margins=operating_margins,
+        wacc=wacc,
+        terminal=np.minimum(terminal_growth, wacc - 0.001),
     )
 
-    projected_revenue = np.empty((batch_size, years), dtype=float)
-    revenue_level = np.full(batch_size, initial_revenue, dtype=float)
-    for year_idx in range(years):
-        revenue_level *= 1.0 + growth_rates[:, year_idx]
-        projected_revenue[:, year_idx] = revenue_level
-    ebit = projected_revenue * operating_margins
-    nopat = ebit * (1.0 - tax_rate)
-    da = projected_revenue * da_rates[np.newaxis, :]
-    capex = projected_revenue * capex_rates[np.newaxis, :]
-    sbc = projected_revenue * sbc_rates[np.newaxis, :]
-    previous_revenue = np.empty_like(projected_revenue)
-    previous_revenue[:, 0] = initial_revenue
-    previous_revenue[:, 1:] = projected_revenue[:, :-1]
-    delta_wc = (projected_revenue - previous_revenue) * wc_rates[np.newaxis, :]
-    fcff = nopat + da - capex - delta_wc + sbc
-
-    terminal = np.minimum(terminal_growth, wacc - 0.001)
-    discount_curve = np.power(1.0 + wacc[:, np.newaxis], discount_years[np.newaxis, :])
-    pv_fcff = np.sum(fcff / discount_curve, axis=1)
-    final_fcff = fcff[:, -1]
-    terminal_value = final_fcff * (1.0 + terminal) / (wacc - terminal)
-    pv_terminal = terminal_value / np.power(1.0 + wacc, years)
-    enterprise_value = pv_fcff + pv_terminal
-    equity_value = enterprise_value + cash - total_debt - preferred_stock
-    return equity_value / shares_outstanding
+
+def _dcf_reference(
+    *,
+    growth_shock: np.ndarray,
+    margin_shock: np.ndarray,
+    wacc: np.ndarray,
+    terminal_growth: np.ndarray,
+) -> np.ndarray:
+    growth_rates, operating_margins = _shocked_fcff_drivers(growth_shock, margin_shock)
+    return _fcff_equity_reference(
+        growth_rates=growth_rates,
+        operating_margins=operating_margins,
+        wacc=wacc,
+        terminal=np.minimum(np.clip(terminal_growth, -0.01, 0.05), wacc - 0.005),
+    )
 
 
 def _bank_reference(
@@ -151,20 +184,14 @@ def _bank_reference(
     risk_free_rate: np.ndarray,
     terminal_growth: np.ndarray,
 ) -> np.ndarray:
-    base_growth = np.array([0.06, 0.055, 0.05, 0.045, 0.04], dtype=float)
-    initial_net_income = 35.0
-    rwa_intensity = 0.025
-    tier1_target_ratio = 0.11
-    initial_capital = 280.0
-    beta = 1.2
-    market_risk_premium = 0.05
-    shares_outstanding = 3000.0
-
-    years = base_growth.shape[0]
+    static = _BANK_STATIC_INPUTS
+    years = _BANK_BASE_GROWTH.shape[0]
     batch_size = provision_rate.shape[0]
-    adjusted_initial_income = initial_net_income * (1.0 - provision_rate)
+    adjusted_initial_income = _BANK_INITIAL_NET_INCOME * (1.0 - provision_rate)
     growth_rates = np.clip(
-        base_growth[np.newaxis, :] + income_growth_shock[:, np.newaxis], -0.80, 1.50
+        _BANK_BASE_GROWTH[np.newaxis, :] + income_growth_shock[:, np.newaxis],
+        -0.80,
+        1.50,
     )
     net_income = np.empty((batch_size, years), dtype=float)
     income_level = adjusted_initial_income.copy()
@@ -172,114 +199,209 @@ def _bank_reference(
         income_level = income_level * (1.0 + growth_rates[:, year_idx])
         net_income[:, year_idx] = income_level
 
-    rwa = net_income / rwa_intensity
-    required_capital = rwa * tier1_target_ratio
+    rwa = net_income / static["rwa_intensity"]
+    required_capital = rwa * static["tier1_target_ratio"]
     previous_capital = np.concatenate(
         [
-            np.full((batch_size, 1), initial_capital, dtype=float),
+            np.full((batch_size, 1), static["initial_capital"], dtype=float),
             required_capital[:, :-1],
         ],
         axis=1,
     )
     dividends = net_income - (required_capital - previous_capital)
-    cost_of_equity = risk_free_rate + (beta * market_risk_premium)
+    cost_of_equity = risk_free_rate + (_BANK_BETA * _BANK_MARKET_RISK_PREMIUM)
     terminal = np.minimum(terminal_growth, cost_of_equity - 0.001)
 
-    discount_years = np.arange(1, years + 1, dtype=float)
-    discount_curve = np.power(
-        1.0 + cost_of_equity[:, np.newaxis], discount_years[np.newaxis, :]
-    )
-    pv_dividends = np.sum(dividends / discount_curve, axis=1)
+    pv_dividends = np.zeros(batch_size, dtype=float)
+    for year_idx in range(years):
+        pv_dividends += dividends[:, year_idx] / np.power(
+            1.0 + cost_of_equity, year_idx + 1
+        )
     last_dividend = dividends[:, -1]
     terminal_value = last_dividend * (1.0 + terminal) / (cost_of_equity - terminal)
     pv_terminal = terminal_value / np.power(1.0 + cost_of_equity, years)
     equity_value = pv_dividends + pv_terminal
-    return equity_value / shares_outstanding
+    return equity_value / static["shares_outstanding"]
+
+
+def _saas_kernel(plan: CalculationPlan) -> Callable[..., np.ndarray]:
+    def evaluate(
+        *,
+        growth_shock: np.ndarray,
+        margin_shock: np.ndarray,
+        wacc: np.ndarray,
+        terminal_growth: np.ndarray,
+        dtype: KernelDtype = "float64",
+    ) -> np.ndarray:
+        growth_rates, operating_margins = _shocked_fcff_drivers(
+            growth_shock, margin_shock
+        )
+        results = plan.calculate_batch(
+            {
+                **_FCFF_STATIC_INPUTS,
+                **_FCFF_SERIES_INPUTS,
+                "growth_rates": growth_rates,
+                "operating_margins": operating_margins,
+                "wacc": wacc,
+                "terminal_growth": guard_terminal_growth(
+                    terminal_growth, wacc, spread=0.001
+                ),
+            },
+            dtype=dtype,
+        )
+        return np.asarray(results["intrinsic_value"], dtype=float)
 
+    return evaluate
 
-def _bank_optimized(
-    *,
-    provision_rate: np.ndarray,
-    income_growth_shock: np.ndarray,
-    risk_free_rate: np.ndarray,
-    terminal_growth: np.ndarray,
-) -> np.ndarray:
-    base_growth = np.array([0.06, 0.055, 0.05, 0.045, 0.04], dtype=float)
-    initial_net_income = 35.0
-    rwa_intensity = 0.025
-    tier1_target_ratio = 0.11
-    initial_capital = 280.0
-    beta = 1.2
-    market_risk_premium = 0.05
-    shares_outstanding = 3000.0
-
-    years = base_growth.shape[0]
-    batch_size = provision_rate.shape[0]
-    discount_years = np.arange(1, years + 1, dtype=float)
-    adjusted_initial_income = initial_net_income * (1.0 - provision_rate)
-    growth_rates = np.clip(
-        base_growth[np.newaxis, :] + income_growth_shock[:, np.newaxis], -0.80, 1.50
-    )
-    net_income = np.empty((batch_size, years), dtype=float)
-    income_level = adjusted_initial_income.copy()
-    for year_idx in range(years):
-        income_level *= 1.0 + growth_rates[:, year_idx]
-        net_income[:, year_idx] = income_level
 
-    rwa = net_income / rwa_intensity
-    required_capital = rwa * tier1_target_ratio
-    previous_capital = np.empty_like(required_capital)
-    previous_capital[:, 0] = initial_capital
-    previous_capital[:, 1:] = required_capital[:, :-1]
-    dividends = net_income - (required_capital - previous_capital)
-    cost_of_equity = risk_free_rate + (beta * market_risk_premium)
-    terminal = np.minimum(terminal_growth, cost_of_equity - 0.001)
+def _dcf_kernel(plan: CalculationPlan) -> Callable[..., np.ndarray]:
+    converged_series = {
+        f"{name}_converged": values for name, values in _FCFF_SERIES_INPUTS.items()
+    }
 
-    discount_curve = np.power(
-        1.0 + cost_of_equity[:, np.newaxis], discount_years[np.newaxis, :]
+    def evaluate(
+        *,
+        growth_shock: np.ndarray,
+        margin_shock: np.ndarray,
+        wacc: np.ndarray,
+        terminal_growth: np.ndarray,
+        dtype: KernelDtype = "float64",
+    ) -> np.ndarray:
+        growth_rates, operating_margins = _shocked_fcff_drivers(
+            growth_shock, margin_shock
+        )
+        results = plan.calculate_batch(
+            {
+                **_FCFF_STATIC_INPUTS,
+                **converged_series,
+                "projection_years": _FCFF_BASE_GROWTH.shape[0],
+                "growth_rates_converged": growth_rates,
+                "operating_margins_converged": operating_margins,
+                "wacc": wacc,
+                "terminal_growth": terminal_growth,
+            },
+            dtype=dtype,
+        )
+        return np.asarray(results["intrinsic_value"], dtype=float)
+
+    return evaluate
+
+
+def _bank_kernel(plan: CalculationPlan) -> Callable[..., np.ndarray]:
+    def evaluate(
+        *,
+        provision_rate: np.ndarray,
+        income_growth_shock: np.ndarray,
+        risk_free_rate: np.ndarray,
+        terminal_growth: np.ndarray,
+        dtype: KernelDtype = "float64",
+    ) -> np.ndarray:
+        growth_rates = np.clip(
+            _BANK_BASE_GROWTH[np.newaxis, :] + income_growth_shock[:, np.newaxis],
+            -0.80,
+            1.50,
+        )
+        cost_of_equity = risk_free_rate + (_BANK_BETA * _BANK_MARKET_RISK_PREMIUM)
+        results = plan.calculate_batch(
+            {
+                **_BANK_STATIC_INPUTS,
+                "initial_net_income": _BANK_INITIAL_NET_INCOME * (1.0 - provision_rate),
+                "income_growth_rates": growth_rates,
+                "cost_of_equity": cost_of_equity,
+                "terminal_growth": guard_terminal_growth(
+                    terminal_growth, cost_of_equity, spread=0.001
+                ),
+            },
+            dtype=dtype,
+        )
+        return np.asarray(results["intrinsic_value"], dtype=float)
+
+    return evaluate
+
+
+def _sample_fcff_inputs(
+    rng: np.random.Generator, iterations: int
+) -> dict[str, np.ndarray]:
+    return {
+        "growth_shock": rng.normal(0.0, 0.03, size=iterations),
+        "margin_shock": rng.normal(0.0, 0.02, size=iterations),
+        "wacc": np.clip(rng.normal(0.10, 0.015, size=iterations), 0.03, 0.30),
+        "terminal_growth": np.clip(
+            rng.normal(0.025, 0.005, size=iterations), -0.01, 0.05
+        ),
+    }
+
+
+def _sample_bank_inputs(
+    rng: np.random.Generator, iterations: int
+) -> dict[str, np.ndarray]:
+    return {
+        "provision_rate": np.clip(rng.normal(0.012, 0.004, size=iterations), 0.0, 0.30),
+        "income_growth_shock": rng.normal(0.0, 0.03, size=iterations),
+        "risk_free_rate": np.clip(rng.normal(0.042, 0.01, size=iterations), 0.0, 0.20),
+        "terminal_growth": np.clip(
+            rng.normal(0.02, 0.005, size=iterations), -0.01, 0.06
+        ),
+    }
+
+
+def _build_cases() -> list[BenchmarkCase]:
+    fcff_inputs = (
+        *_FCFF_STATIC_INPUTS,
+        *_FCFF_SERIES_INPUTS,
+        "growth_rates",
+        "operating_margins",
+        "wacc",
+        "terminal_growth",
     )
-    pv_dividends = np.sum(dividends / discount_curve, axis=1)
-    last_dividend = dividends[:, -1]
-    terminal_value = last_dividend * (1.0 + terminal) / (cost_of_equity - terminal)
-    pv_terminal = terminal_value / np.power(1.0 + cost_of_equity, years)
-    equity_value = pv_dividends + pv_terminal
-    return equity_value / shares_outstanding
-
-
-def _reit_reference(*, occupancy_rate: np.ndarray, cap_rate: np.ndarray) -> np.ndarray:
-    base_ffo = 120.0
-    depreciation_and_amortization = 50.0
-    maintenance_capex_ratio = 0.8
-    cash = 100.0
-    total_debt = 300.0
-    preferred_stock = 0.0
-    shares_outstanding = 1000.0
-
-    adjusted_cap_rate = np.maximum(cap_rate, 1e-6)
-    ffo = base_ffo * occupancy_rate
-    maintenance_capex = depreciation_and_amortization * maintenance_capex_ratio
-    affo = ffo - maintenance_capex
-    enterprise_value = affo / adjusted_cap_rate
-    equity_value = enterprise_value + cash - total_debt - preferred_stock
-    return equity_value / shares_outstanding
-
-
-def _reit_optimized(*, occupancy_rate: np.ndarray, cap_rate: np.ndarray) -> np.ndarray:
-    base_ffo = 120.0
-    depreciation_and_amortization = 50.0
-    maintenance_capex_ratio = 0.8
-    cash = 100.0
-    total_debt = 300.0
-    preferred_stock = 0.0
-    shares_outstanding = 1000.0
-
-    adjusted_cap_rate = np.maximum(cap_rate, 1e-6)
-    ffo = base_ffo * occupancy_rate
-    maintenance_capex = depreciation_and_amortization * maintenance_capex_ratio
-    affo = ffo - maintenance_capex
-    enterprise_value = affo / adjusted_cap_rate
-    equity_value = enterprise_value + cash - total_debt - preferred_stock
-    return equity_value / shares_outstanding
+    dcf_inputs = (
+        *_FCFF_STATIC_INPUTS,
+        *(f"{name}_converged" for name in _FCFF_SERIES_INPUTS),
+        "projection_years",
+        "growth_rates_converged",
+        "operating_margins_converged",
+        "wacc",
+        "terminal_growth",
+    )
+    bank_inputs = (
+        *_BANK_STATIC_INPUTS,
+        "initial_net_income",
+        "income_growth_rates",
+        "cost_of_equity",
+        "terminal_growth",
+    )
+    return [
+        BenchmarkCase(
+            model="saas",
+            reference_fn=_saas_reference,
+            kernel_fn=_saas_kernel(
+                create_saas_graph().compile(
+                    inputs=fcff_inputs, outputs=("intrinsic_value",)
+                )
+            ),
+            sample_inputs=_sample_fcff_inputs,
+        ),
+        BenchmarkCase(
+            model="dcf_standard",
+            reference_fn=_dcf_reference,
+            kernel_fn=_dcf_kernel(
+                create_dcf_standard_graph().compile(
+                    inputs=dcf_inputs, outputs=("intrinsic_value",)
+                )
+            ),
+            sample_inputs=_sample_fcff_inputs,
+        ),
+        BenchmarkCase(
+            model="bank",
+            reference_fn=_bank_reference,
+            kernel_fn=_bank_kernel(
+                create_bank_graph().compile(
+                    inputs=bank_inputs, outputs=("intrinsic_value",)
+                )
+            ),
+            sample_inputs=_sample_bank_inputs,
+        ),
+    ]
 
 
 def _measure_ms(func, *, repeats: int, inner_loops: int) -> list[float]:
@@ -295,81 +417,136 @@ def _measure_ms(func, *, repeats: int, inner_loops: int) -> list[float]:
 
 def _benchmark_case(
     *,
-    model: str,
+    case: BenchmarkCase,
     iterations: int,
     repeats: int,
-    reference_fn,
-    optimized_fn,
     sampled_kwargs: dict[str, np.ndarray],
     inner_loops: int,
 ) -> BenchmarkResult:
     ref_times = _measure_ms(
-        lambda: reference_fn(**sampled_kwargs),
+        lambda: case.reference_fn(**sampled_kwargs),
+        repeats=repeats,
+        inner_loops=inner_loops,
+    )
+    kernel_times = _measure_ms(
+        lambda: case.kernel_fn(**sampled_kwargs),
         repeats=repeats,
         inner_loops=inner_loops,
     )
-    opt_times = _measure_ms(
-        lambda: optimized_fn(**sampled_kwargs),
+    float32_times = _measure_ms(
+        lambda: case.kernel_fn(**sampled_kwargs, dtype="float32"),
         repeats=repeats,
         inner_loops=inner_loops,
     )
-    ref_values = reference_fn(**sampled_kwargs)
-    opt_values = optimized_fn(**sampled_kwargs)
+    ref_values = case.reference_fn(**sampled_kwargs)
+    kernel_values = case.kernel_fn(**sampled_kwargs)
+    float32_values = case.kernel_fn(**sampled_kwargs, dtype="float32")
 
-    abs_diff = np.abs(ref_values - opt_values)
+    abs_diff = np.abs(ref_values - kernel_values)
+    float32_scale = np.maximum(np.abs(kernel_values), 1e-9)
+    float32_rel_diff = np.abs(float32_values - kernel_values) / float32_scale
     p50_ref = statistics.median(ref_times)
-    p50_opt = statistics.median(opt_times)
-    speedup = (p50_ref / p50_opt) if p50_opt > 0 else 0.0
-    improvement = ((p50_ref - p50_opt) / p50_ref * 100.0) if p50_ref > 0 else 0.0
+    p50_kernel = statistics.median(kernel_times)
+    speedup = (p50_ref / p50_kernel) if p50_kernel > 0 else 0.0
+    improvement = ((p50_ref - p50_kernel) / p50_ref * 100.0) if p50_ref > 0 else 0.0
 
     return BenchmarkResult(
-        model=model,
+        model=case.model,
         iterations=iterations,
         p50_reference_ms=round(p50_ref, 4),
-        p50_optimized_ms=round(p50_opt, 4),
+        p50_kernel_ms=round(p50_kernel, 4),
+        p50_kernel_float32_ms=round(statistics.median(float32_times), 4),
         speedup_ratio=round(speedup, 4),
         improvement_pct=round(improvement, 2),
         max_abs_diff=float(np.max(abs_diff)),
         mean_abs_error=float(np.mean(abs_diff)),
+        float32_max_rel_diff=float(np.max(float32_rel_diff)),
     )
 
 
-def _render_markdown(results: list[BenchmarkResult], tolerance: float) -> str:
+def _load_baseline_timings(path: Path | None) -> dict[tuple[str, int], float]:
+    if path is None:
+        return {}
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    timings: dict[tuple[str, int], float] = {}
+    for item in payload.get("results", []):
+        kernel_ms = item.get("p50_kernel_ms")
+        if isinstance(kernel_ms, int | float):
+            timings[(str(item["model"]), int(item["iterations"]))] = float(kernel_ms)
+    return timings
+
+
+def _collect_gate_failures(
+    results: list[BenchmarkResult],
+    *,
+    tolerance: float,
+    float32_tolerance: float,
+    baseline_timings: dict[tuple[str, int], float],
+    max_regression_pct: float,
+) -> list[str]:
+    failures: list[str] = []
+    for item in results:
+        label = f"{item.model}@{item.iterations}"
+        if item.max_abs_diff > tolerance:
+            failures.append(f"`{label}` max_abs_diff={item.max_abs_diff:.6g}")
+        if item.float32_max_rel_diff > float32_tolerance:
+            failures.append(
+                f"`{label}` float32_max_rel_diff={item.float32_max_rel_diff:.6g}"
+            )
+        baseline_ms = baseline_timings.get((item.model, item.iterations))
+        if baseline_ms is None or baseline_ms <= 0:
+            continue
+        regression_pct = (item.p50_kernel_ms - baseline_ms) / baseline_ms * 100.0
+        if regression_pct > max_regression_pct:
+            failures.append(
+                f"`{label}` p50_kernel_ms={item.p50_kernel_ms:.4f} regressed "
+                f"{regression_pct:.1f}% vs baseline {baseline_ms:.4f}"
+            )
+    return failures
+
+
+def _render_markdown(
+    results: list[BenchmarkResult],
+    *,
+    tolerance: float,
+    float32_tolerance: float,
+    gate_failures: list[str],
+) -> str:
     now = datetime.now(UTC).isoformat()
     lines = [
         "# Fundamental MC Batch Kernel Profiling",
         "",
         f"- generated_at: `{now}`",
         f"- tolerance: `{tolerance}`",
+        f"- float32_tolerance: `{float32_tolerance}`",
         "",
-        "| Model | Iterations | Ref p50 (ms) | Opt p50 (ms) | Speedup | Improvement | Max Abs Diff | MAE |",
-        "|---|---:|---:|---:|---:|---:|---:|---:|",
+        "| Model | Iterations | Ref p50 (ms) | Kernel p50 (ms) | Kernel f32 p50 (ms) | Speedup | Improvement | Max Abs Diff | MAE | f32 Max Rel Diff |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|",
     ]
     for item in results:
         lines.append(
             f"| {item.model} | {item.iterations} | {item.p50_reference_ms:.4f} | "
-            f"{item.p50_optimized_ms:.4f} | {item.speedup_ratio:.4f}x | "
-            f"{item.improvement_pct:.2f}% | {item.max_abs_diff:.6g} | {item.mean_abs_error:.6g} |"
+            f"{item.p50_kernel_ms:.4f} | {item.p50_kernel_float32_ms:.4f} | "
+            f"{item.speedup_ratio:.4f}x | {item.improvement_pct:.2f}% | "
+            f"{item.max_abs_diff:.6g} | {item.mean_abs_error:.6g} | "
+            f"{item.float32_max_rel_diff:.6g} |"
         )
     lines.append("")
     lines.append("## Gate")
     lines.append("")
-    gate_failures: list[str] = []
-    for item in results:
-        if item.max_abs_diff > tolerance:
-            gate_failures.append(
-                f"- FAIL `{item.model}@{item.iterations}` max_abs_diff={item.max_abs_diff:.6g}"
-            )
     if gate_failures:
-        lines.extend(gate_failures)
+        lines.extend(f"- FAIL {failure}" for failure in gate_failures)
     else:
-        lines.append("- PASS numerical consistency within tolerance.")
+        lines.append("- PASS numerical consistency and timing regression gates.")
     return "\n".join(lines) + "\n"
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Profile fundamental MC batch kernels (reference vs optimized)."
+        description=(
+            "Regression benchmark for the fundamental MC batch kernels "
+            "(loop reference vs shared DCF kernels)."
+        )
     )
     parser.add_argument(
         "--iterations",
@@ -400,7 +577,25 @@ def parse_args() -> argparse.Namespace:
         "--tolerance",
         type=float,
         default=1e-9,
-        help="Max absolute error tolerance gate.",
+        help="Max absolute error tolerance gate (float64 kernels vs reference).",
+    )
+    parser.add_argument(
+        "--float32-tolerance",
+        type=float,
+        default=1e-4,
+        help="Max relative error tolerance gate (float32 vs float64 kernels).",
+    )
+    parser.add_argument(
+        "--baseline-json",
+        type=Path,
+        default=None,
+        help="Previous report JSON; kernel p50 timings are gated against it.",
+    )
+    parser.add_argument(
+        "--max-regression-pct",
+        type=float,
+        default=25.0,
+        help="Allowed kernel p50 slowdown vs --baseline-json, in percent.",
     )
     parser.add_argument(
         "--report-json",
@@ -418,101 +613,47 @@ def parse_args() -> argparse.Namespace:
 def main() -> int:
     args = parse_args()
     rng = np.random.default_rng(args.seed)
+    cases = _build_cases()
     results: list[BenchmarkResult] = []
 
     for iterations in args.iterations:
         inner_loops = args.inner_loops
         if inner_loops <= 0:
             inner_loops = 20 if iterations <= 1000 else 8
-        # SaaS
-        saas_kwargs = {
-            "growth_shock": rng.normal(0.0, 0.03, size=iterations),
-            "margin_shock": rng.normal(0.0, 0.02, size=iterations),
-            "wacc": np.clip(rng.normal(0.10, 0.015, size=iterations), 0.03, 0.30),
-            "terminal_growth": np.clip(
-                rng.normal(0.025, 0.005, size=iterations), -0.01, 0.05
-            ),
-        }
-        results.append(
-            _benchmark_case(
-                model="saas",
-                iterations=iterations,
-                repeats=args.repeats,
-                reference_fn=_saas_reference,
-                optimized_fn=_saas_optimized,
-                sampled_kwargs=saas_kwargs,
-                inner_loops=inner_loops,
-            )
-        )
-
-        # Bank
-        bank_kwargs = {
-            "provision_rate": np.clip(
-                rng.normal(0.012, 0.004, size=iterations), 0.0, 0.30
-            ),
-            "income_growth_shock": rng.normal(0.0, 0.03, size=iterations),
-            "risk_free_rate": np.clip(
-                rng.normal(0.042, 0.01, size=iterations), 0.0, 0.20
-            ),
-            "terminal_growth": np.clip(
-                rng.normal(0.02, 0.005, size=iterations), -0.01, 0.06
-            ),
-        }
-        results.append(
-            _benchmark_case(
-                model="bank",
-                iterations=iterations,
-                repeats=args.repeats,
-                reference_fn=_bank_reference,
-                optimized_fn=_bank_optimized,
-                sampled_kwargs=bank_kwargs,
-                inner_loops=inner_loops,
-            )
-        )
-
-        # REIT
-        reit_kwargs = {
-            "occupancy_rate": np.clip(
-                rng.triangular(0.70, 0.90, 0.98, size=iterations), 0.50, 1.0
-            ),
-            "cap_rate": np.clip(rng.normal(0.08, 0.015, size=iterations), 0.02, 0.25),
-        }
-        results.append(
-            _benchmark_case(
-                model="reit",
-                iterations=iterations,
-                repeats=args.repeats,
-                reference_fn=_reit_reference,
-                optimized_fn=_reit_optimized,
-                sampled_kwargs=reit_kwargs,
-                inner_loops=inner_loops,
+        for case in cases:
+            results.append(
+                _benchmark_case(
+                    case=case,
+                    iterations=iterations,
+                    repeats=args.repeats,
+                    sampled_kwargs=case.sample_inputs(rng, iterations),
+                    inner_loops=inner_loops,
+                )
             )
-        )
 
-    gate_passed = all(item.max_abs_diff <= args.tolerance for item in results)
+    gate_failures = _collect_gate_failures(
+        results,
+        tolerance=args.tolerance,
+        float32_tolerance=args.float32_tolerance,
+        baseline_timings=_load_baseline_timings(args.baseline_json),
+        max_regression_pct=args.max_regression_pct,
+    )
+    gate_passed = not gate_failures
     summary = {
         "generated_at": datetime.now(UTC).isoformat(),
         "iterations": args.iterations,
         "repeats": args.repeats,
         "seed": args.seed,
         "tolerance": args.tolerance,
+        "float32_tolerance": args.float32_tolerance,
+        "baseline_json": str(args.baseline_json) if args.baseline_json else None,
+        "max_regression_pct": args.max_regression_pct,
         "gate_passed": gate_passed,
+        "gate_failures": gate_failures,
     }
     payload = {
         "summary": summary,
-        "results": [
-            {
-                "model": item.model,
-                "iterations": item.iterations,
-                "p50_reference_ms": item.p50_reference_ms,
-                "p50_optimized_ms": item.p50_optimized_ms,
-                "speedup_ratio": item.speedup_ratio,
-                "improvement_pct": item.improvement_pct,
-                "max_abs_diff": item.max_abs_diff,
-                "mean_abs_error": item.mean_abs_error,
-            }
-            for item in results
-        ],
+        "results": [asdict(item) for item in results],
     }
 
     args.report_json.parent.mkdir(parents=True, exist_ok=True)
@@ -522,7 +663,13 @@ def main() -> int:
     )
     args.report_md.parent.mkdir(parents=True, exist_ok=True)
     args.report_md.write_text(
-        _render_markdown(results, args.tolerance), encoding="utf-8"
+        _render_markdown(
+            results,
+            tolerance=args.tolerance,
+            float32_tolerance=args.float32_tolerance,
+            gate_failures=gate_failures,
+        ),
+        encoding="utf-8",
     )
 
     print(f"[mc-kernel-profile] json={args.report_json}")
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.dcf_standard import (  # noqa: E402
+    create_dcf_standard_graph,
+)
+
+# Ten-year standard DCF, matching the dcf_standard calculator's graph inputs.
+_DCF_STANDARD_INPUTS: dict[str, object] = {
+    "initial_revenue": 220.0,
+    "growth_rates": [0.22, 0.20, 0.18, 0.16, 0.14, 0.12, 0.10, 0.08, 0.07, 0.06],
+    "operating_margins": [0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.2],
+    "tax_rate": 0.21,
+    "da_rates": [0.03] * 10,
+    "capex_rates": [0.06, 0.06, 0.058, 0.056, 0.054, 0.052, 0.05, 0.05, 0.05, 0.05],
+    "wc_rates": [0.012, 0.011, 0.011, 0.01, 0.01, 0.01, 0.009, 0.009, 0.009, 0.009],
+    "sbc_rates": [0.018, 0.017, 0.016, 0.016, 0.015, 0.015, 0.014, 0.014, 0.014, 0.014],
+    "wacc": 0.105,
+    "terminal_growth": 0.028,
+    "cash": 25.0,
+    "total_debt": 12.0,
+    "preferred_stock": 0.0,
+    "shares_outstanding": 120.0,
+}
+
+_TRACE_DICT_ADAPTER = TypeAdapter(dict[str, object])
+
+
+@dataclass(frozen=True)
+class TraceModeResult:
+    mode: str
+    calculate_ms_p50: float
+    serialize_ms_p50: float
+    payload_bytes: int
+    retained_kib: float
+    peak_kib: float
+
+
+def _p50_ms(fn: Callable[[], object], *, repeats: int, inner_loops: int) -> float:
+    samples: list[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(inner_loops):
+            fn()
+        samples.append((time.perf_counter() - started) * 1000.0 / inner_loops)
+    return statistics.median(samples)
+
+
+def _memory_kib(fn: Callable[[], object]) -> tuple[float, float]:
+    tracemalloc.start()
+    try:
+        retained = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+    return current / 1024.0, peak / 1024.0
+
+
+def _profile_modes(*, repeats: int, inner_loops: int) -> list[TraceModeResult]:
+    graph = create_dcf_standard_graph()
+    inputs = dict(_DCF_STANDARD_INPUTS)
+
+    def full_trace() -> dict[str, object]:
+        return graph.calculate(inputs, trace=True, emit_lifecycle_events=False)
+
+    def compact_trace():
+        return graph.calculate_compact(inputs, emit_lifecycle_events=False)
+
+    full = full_trace()
+    compact = compact_trace()
+    if compact.materialize_all() != full:
+        raise RuntimeError("compact trace does not materialize to the full trace")
+
+    full_payload = _TRACE_DICT_ADAPTER.dump_json(full)
+    compact_payload = compact.model_dump_json().encode("utf-8")
+    results: list[TraceModeResult] = []
+    for mode, build, serialize, payload in (
+        ("full", full_trace, lambda: _TRACE_DICT_ADAPTER.dump_json(full), full_payload),
+        ("compact", compact_trace, compact.model_dump_json, compact_payload),
+    ):
+        retained_kib, peak_kib = _memory_kib(build)
+        results.append(
+            TraceModeResult(
+                mode=mode,
+                calculate_ms_p50=_p50_ms(
+                    build, repeats=repeats, inner_loops=inner_loops
+                ),
+                serialize_ms_p50=_p50_ms(
+                    serialize, repeats=repeats, inner_loops=inner_loops
+                ),
+                payload_bytes=len(payload),
+                retained_kib=retained_kib,
+                peak_kib=peak_kib,
+            )
+        )
+    return results
+
+
+def _render_markdown(results: list[TraceModeResult]) -> str:
+    lines = [
+        "# Valuation Trace Mode Profile (dcf_standard)",
+        "",
+        "| mode | calculate p50 (ms) | serialize p50 (ms) | payload (bytes) "
+        "| retained (KiB) | peak (KiB) |",
+        "| --- | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for item in results:
+        lines.append(
+            f"| {item.mode} | {item.calculate_ms_p50:.3f} | "
+            f"{item.serialize_ms_p50:.3f} | {item.payload_bytes} | "
+            f"{item.retained_kib:.1f} | {item.peak_kib:.1f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare full TraceableField tracing with compact lazy provenance "
+            "for a standard DCF graph run."
+        )
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=9,
+        help="Repetitions per benchmark sample; p50 is reported.",
+    )
+    parser.add_argument(
+        "--inner-loops",
+        type=int,
+        default=50,
+        help="Run each timed sample for N inner loops (stabilizes micro-benchmarks).",
+    )
+    parser.add_argument(
+        "--report-json",
+        type=Path,
+        default=None,
+        help="Optional path for the JSON report.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = _profile_modes(repeats=args.repeats, inner_loops=args.inner_loops)
+    if args.report_json is not None:
+        args.report_json.parent.mkdir(parents=True, exist_ok=True)
+        args.report_json.write_text(
+            json.dumps(
+                {
+                    "generated_at": datetime.now(UTC).isoformat(),
+                    "results": [asdict(item) for item in results],
+                },
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"[trace-mode-profile] json={args.report_json}")
+    print(_render_markdown(results), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,6 +5,7 @@ import asyncio
 import json
 import re
 import sys
+import time
 from collections.abc import Mapping
 from enum import Enum
 from pathlib import Path
@@ -1100,11 +1101,16 @@ def _build_report(
     return report
 
 
-async def _run() -> int:
-    args = parse_args()
-
-    replay_input = _load_replay_input(args.input)
-    cli_override = _load_override_input(args.override_json)
+def build_replay_report(
+    *,
+    input_path: Path,
+    override_json: Path | None,
+    abs_tol: float,
+    rel_tol: float,
+) -> JSONObject:
+    started = time.perf_counter()
+    replay_input = _load_replay_input(input_path)
+    cli_override = _load_override_input(override_json)
     override_payload = _effective_override_payload(
         replay_input,
         cli_override=cli_override,
@@ -1113,6 +1119,7 @@ async def _run() -> int:
         replay_input,
         override_payload=override_payload,
     )
+    loaded = time.perf_counter()
     (
         replay_params_dump,
         replay_calculation_metrics,
@@ -1121,6 +1128,7 @@ async def _run() -> int:
     ) = _replay_valuation(
         replay_input=replay_input,
     )
+    replayed = time.perf_counter()
 
     report = _build_report(
         replay_input=replay_input,
@@ -1129,6 +1137,71 @@ async def _run() -> int:
         replay_assumptions=replay_assumptions,
         replay_metadata=replay_metadata,
         override_payload=override_payload,
+        abs_tol=abs_tol,
+        rel_tol=rel_tol,
+    )
+    finished = time.perf_counter()
+    report["replay_timing_ms"] = {
+        "input_load": round((loaded - started) * 1000.0, 3),
+        "valuation": round((replayed - loaded) * 1000.0, 3),
+        "report": round((finished - replayed) * 1000.0, 3),
+    }
+    return report
+
+
+def run_replay_case(
+    *,
+    input_path: Path,
+    abs_tol: float,
+    rel_tol: float,
+    override_json: Path | None = None,
+) -> tuple[int, JSONObject]:
+    """
+    In-process equivalent of running this script for one input: returns the
+    exit code and the JSON object the script would print.
+    """
+    try:
+        return 0, build_replay_report(
+            input_path=input_path,
+            override_json=override_json,
+            abs_tol=abs_tol,
+            rel_tol=rel_tol,
+        )
+    except ReplayContractError as exc:
+        return 1, _error_payload(error_code=exc.error_code, error=str(exc))
+    except Exception as exc:  # noqa: BLE001
+        return 1, _error_payload(
+            error_code=ReplayErrorCode.REPLAY_RUNTIME_ERROR.value, error=str(exc)
+        )
+
+
+def run_replay_case_timed(
+    *,
+    input_path: Path,
+    abs_tol: float,
+    rel_tol: float,
+) -> tuple[int, JSONObject, float]:
+    started = time.perf_counter()
+    return_code, payload = run_replay_case(
+        input_path=input_path, abs_tol=abs_tol, rel_tol=rel_tol
+    )
+    return return_code, payload, (time.perf_counter() - started) * 1000.0
+
+
+def _error_payload(*, error_code: str, error: str) -> JSONObject:
+    return {
+        "status": "error",
+        "error_code": error_code,
+        "error": error,
+    }
+
+
+async def _run() -> int:
+    args = parse_args()
+
+    report = build_replay_report(
+        input_path=args.input,
+        override_json=args.override_json,
         abs_tol=args.abs_tol,
         rel_tol=args.rel_tol,
     )
@@ -1146,19 +1219,13 @@ def main() -> int:
     try:
         return asyncio.run(_run())
     except ReplayContractError as exc:
-        error_payload = {
-            "status": "error",
-            "error_code": exc.error_code,
-            "error": str(exc),
-        }
+        error_payload = _error_payload(error_code=exc.error_code, error=str(exc))
         print(json.dumps(error_payload, ensure_ascii=False))
         return 1
     except Exception as exc:  # noqa: BLE001
-        error_payload = {
-            "status": "error",
-            "error_code": ReplayErrorCode.REPLAY_RUNTIME_ERROR.value,
-            "error": str(exc),
-        }
+        error_payload = _error_payload(
+            error_code=ReplayErrorCode.REPLAY_RUNTIME_ERROR.value, error=str(exc)
+        )
         print(json.dumps(error_payload, ensure_ascii=False))
         return 1
 
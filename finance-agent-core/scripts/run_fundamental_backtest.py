@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from collections.abc import Mapping
 from pathlib import Path
@@ -12,12 +13,15 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from src.agents.fundamental.subdomains.core_valuation.domain.backtest import (  # noqa: E402
     BacktestConfig,
+    BacktestResultCache,
+    CaseRunTiming,
     build_baseline_payload,
     build_report_payload,
     compare_with_baseline,
     load_baseline,
     load_cases,
-    run_cases,
+    resolve_backtest_workers,
+    run_cases_with_timings,
 )
 from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.forward_signal_calibration_mapping_service import (  # noqa: E402
     load_forward_signal_calibration_mapping,
@@ -36,6 +40,20 @@ def _default_report_path() -> Path:
     return PROJECT_ROOT / "reports" / "fundamental_backtest_report.json"
 
 
+def _default_cache_dir() -> Path | None:
+    raw = os.getenv("FUNDAMENTAL_BACKTEST_CACHE_DIR", "").strip()
+    return Path(raw) if raw else None
+
+
+def _print_case_progress(done: int, total: int, timing: CaseRunTiming) -> None:
+    print(
+        f"[backtest] case {done}/{total} id={timing.case_id} model={timing.model} "
+        f"status={timing.status} cached={str(timing.cached).lower()} "
+        f"elapsed_ms={timing.elapsed_ms:.1f}",
+        file=sys.stderr,
+    )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run fundamental valuation backtest against golden baseline."
@@ -63,6 +81,28 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Update baseline file with current run results.",
     )
+    parser.add_argument(
+        "--workers",
+        default=os.getenv("FUNDAMENTAL_BACKTEST_WORKERS", "auto"),
+        help=(
+            "Worker processes for case evaluation: a count, or 'auto' "
+            "(one per eight cases, capped at CPU count)."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=_default_cache_dir(),
+        help=(
+            "Directory for cached case results keyed by case inputs, model and "
+            "calculator code version. Disabled when omitted."
+        ),
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress per-case progress lines.",
+    )
     parser.add_argument(
         "--abs-tol",
         type=float,
@@ -193,7 +233,14 @@ def main() -> int:
         raise FileNotFoundError(f"Backtest dataset not found: {args.dataset}")
 
     cases = load_cases(args.dataset)
-    results = run_cases(cases)
+    results, timings = run_cases_with_timings(
+        cases,
+        workers=resolve_backtest_workers(args.workers, case_count=len(cases)),
+        cache=(
+            BacktestResultCache(args.cache_dir) if args.cache_dir is not None else None
+        ),
+        progress=None if args.quiet else _print_case_progress,
+    )
     calibration_result = load_forward_signal_calibration_mapping()
     calibration_issue = (
         None
@@ -249,6 +296,7 @@ def main() -> int:
         issues=issues,
         baseline_updated=baseline_updated,
         calibration=calibration_metadata,
+        timings=timings,
     )
     if not baseline_updated:
         monitoring_issues = _evaluate_monitoring_gates(
@@ -279,6 +327,7 @@ def main() -> int:
                 issues=issues,
                 baseline_updated=baseline_updated,
                 calibration=calibration_metadata,
+                timings=timings,
             )
     args.report.parent.mkdir(parents=True, exist_ok=True)
     args.report.write_text(
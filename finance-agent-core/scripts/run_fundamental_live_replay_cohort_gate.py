@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import importlib
+import io
 import json
+import logging
 import os
 import subprocess
 import sys
 from collections.abc import Callable, Mapping, Sequence
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime, timezone
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 DEFAULT_CONFIG_PATH = (
     PROJECT_ROOT / "config" / "fundamental_live_replay_cohort_config.json"
 )
+_STEP_MODES = ("in_process", "subprocess")
 
 
 def parse_args() -> argparse.Namespace:
@@ -46,6 +52,21 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional override for discovery root path.",
     )
+    parser.add_argument(
+        "--step-mode",
+        choices=_STEP_MODES,
+        default=os.getenv("FUNDAMENTAL_LIVE_REPLAY_STEP_MODE", "in_process"),
+        help=(
+            "in_process runs manifest build, replay checks and cohort gate in this "
+            "interpreter; subprocess runs each step as a separate script."
+        ),
+    )
+    parser.add_argument(
+        "--replay-workers",
+        type=int,
+        default=None,
+        help="Worker processes for replay checks (passed as --workers).",
+    )
     return parser.parse_args()
 
 
@@ -122,10 +143,10 @@ def main() -> int:
     cohort_gate_path = output_dir / f"fundamental_replay_cohort_gate_{cycle_tag}.json"
     run_path = output_dir / f"fundamental_live_replay_cohort_run_{cycle_tag}.json"
 
-    _run_command(
+    step_mode = getattr(args, "step_mode", "in_process")
+    _run_script(
+        "build_fundamental_replay_manifest",
         [
-            sys.executable,
-            str(PROJECT_ROOT / "scripts" / "build_fundamental_replay_manifest.py"),
             "--discover-root",
             str(discover_root),
             "--discover-glob",
@@ -138,7 +159,8 @@ def main() -> int:
             str(manifest_path),
         ]
         + (["--discover-recursive"] if discover_recursive else [])
-        + (["--latest-per-ticker"] if latest_per_ticker else [])
+        + (["--latest-per-ticker"] if latest_per_ticker else []),
+        step_mode=step_mode,
     )
 
     prewarm_summary = _run_xbrl_prewarm_from_manifest(
@@ -147,20 +169,20 @@ def main() -> int:
         enabled=enable_prewarm,
     )
 
-    _run_command(
+    replay_workers = getattr(args, "replay_workers", None)
+    _run_script(
+        "run_fundamental_replay_checks",
         [
-            sys.executable,
-            str(PROJECT_ROOT / "scripts" / "run_fundamental_replay_checks.py"),
             "--manifest",
             str(manifest_path),
             "--report",
             str(replay_report_path),
         ]
+        + (["--workers", str(replay_workers)] if replay_workers else []),
+        step_mode=step_mode,
     )
 
     cohort_gate_cmd = [
-        sys.executable,
-        str(PROJECT_ROOT / "scripts" / "validate_fundamental_replay_cohort_gate.py"),
         "--manifest",
         str(manifest_path),
         "--report",
@@ -232,7 +254,12 @@ def main() -> int:
                 str(max_validation_rule_drift_count),
             ]
         )
-    gate_output = _run_command(cohort_gate_cmd, capture_stdout=True)
+    gate_output = _run_script(
+        "validate_fundamental_replay_cohort_gate",
+        cohort_gate_cmd,
+        capture_stdout=True,
+        step_mode=step_mode,
+    )
     cohort_gate_path.write_text(gate_output + "\n", encoding="utf-8")
 
     gate_payload = json.loads(gate_output)
@@ -270,6 +297,75 @@ def main() -> int:
     return 1
 
 
+def _run_script(
+    script_name: str,
+    script_args: list[str],
+    *,
+    step_mode: str,
+    capture_stdout: bool = False,
+) -> str:
+    if step_mode == "subprocess":
+        return _run_command(
+            [sys.executable, str(SCRIPTS_DIR / f"{script_name}.py"), *script_args],
+            capture_stdout=capture_stdout,
+        )
+    return _run_script_in_process(
+        script_name, script_args, capture_stdout=capture_stdout
+    )
+
+
+def _run_script_in_process(
+    script_name: str,
+    script_args: list[str],
+    *,
+    capture_stdout: bool = False,
+) -> str:
+    """
+    Run a sibling script's main() in this interpreter, with the same exit-code
+    and output contract as _run_command. Imports, the model registry and
+    in-memory caches are paid for once and shared by every step.
+    """
+    for path in (PROJECT_ROOT, SCRIPTS_DIR):
+        if str(path) not in sys.path:
+            sys.path.append(str(path))
+    from src.shared.kernel.tools.logger import configure_logging
+
+    configure_logging()
+    module = importlib.import_module(script_name)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    # Step logs go with the step's stderr, so this script's own stdout stays a
+    # single JSON document, as it is when each step is a subprocess.
+    log_handlers = [
+        handler
+        for handler in logging.getLogger().handlers
+        if isinstance(handler, logging.StreamHandler)
+        and handler.stream in (sys.stdout, sys.stderr)
+    ]
+    previous_streams = [handler.setStream(stderr) for handler in log_handlers]
+    previous_argv = sys.argv
+    sys.argv = [str(SCRIPTS_DIR / f"{script_name}.py"), *script_args]
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                return_code = module.main()
+            except SystemExit as exc:
+                return_code = exc.code if isinstance(exc.code, int) else 1
+    finally:
+        sys.argv = previous_argv
+        for handler, stream in zip(log_handlers, previous_streams, strict=True):
+            handler.setStream(stream)
+    if return_code != 0:
+        raise RuntimeError(
+            "command failed: "
+            + " ".join([script_name, *script_args])
+            + f"\nstdout:\n{stdout.getvalue()}\nstderr:\n{stderr.getvalue()}"
+        )
+    if capture_stdout:
+        return stdout.getvalue().strip()
+    return ""
+
+
 def _run_command(command: list[str], *, capture_stdout: bool = False) -> str:
     completed = subprocess.run(
         command,
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import importlib.metadata
 import json
+import multiprocessing
 import os
 import subprocess
 import sys
 import time
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
+from types import ModuleType
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
+# The replay engine is imported by module name from here, so spawn workers
+# (which inherit sys.path) can unpickle tasks that reference it.
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(SCRIPTS_DIR))
 
 from src.agents.fundamental.subdomains.core_valuation.interface.replay_contracts import (  # noqa: E402
     ValuationReplayCaseRefModel,
@@ -31,6 +40,10 @@ _PLUGINS_ENV = "FUNDAMENTAL_XBRL_ARELLE_PLUGINS"
 _PACKAGES_ENV = "FUNDAMENTAL_XBRL_ARELLE_PACKAGES"
 _EXPECTED_RULE_SIGNATURE_ENV = "FUNDAMENTAL_XBRL_EXPECTED_RULE_SIGNATURE"
 _VALIDATION_RULE_DRIFT_ERROR_CODE = "validation_rule_version_drift"
+_REPLAY_ENGINE_MODULE = "replay_fundamental_valuation"
+_REPLAY_MODES = ("in_process", "subprocess")
+_WORKERS_ENV = "FUNDAMENTAL_REPLAY_CHECKS_WORKERS"
+_REPLAY_MODE_ENV = "FUNDAMENTAL_REPLAY_CHECKS_MODE"
 
 
 class ReplayChecksError(ValueError):
@@ -78,9 +91,40 @@ def parse_args() -> argparse.Namespace:
         default=1e-4,
         help="Relative tolerance passed to replay script.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_default_workers(),
+        help=(
+            "Worker processes for in-process replay fan-out "
+            f"(default from {_WORKERS_ENV}, else 1 = current process)."
+        ),
+    )
+    parser.add_argument(
+        "--replay-mode",
+        choices=_REPLAY_MODES,
+        default=_default_replay_mode(),
+        help=(
+            "in_process replays cases with a shared engine and model registry; "
+            "subprocess runs replay_fundamental_valuation.py once per case."
+        ),
+    )
     return parser.parse_args()
 
 
+def _default_workers() -> int:
+    raw = os.getenv(_WORKERS_ENV, "").strip()
+    try:
+        return max(int(raw), 1) if raw else 1
+    except ValueError:
+        return 1
+
+
+def _default_replay_mode() -> str:
+    raw = os.getenv(_REPLAY_MODE_ENV, "").strip().lower()
+    return raw if raw in _REPLAY_MODES else "in_process"
+
+
 def _load_manifest(path: Path) -> ValuationReplayManifestModel:
     if not path.exists():
         raise ReplayChecksError(
@@ -127,15 +171,32 @@ def _extract_last_json_object(text: str) -> dict[str, object] | None:
     return parsed_objects[-1]
 
 
+def _load_replay_engine() -> ModuleType:
+    return importlib.import_module(_REPLAY_ENGINE_MODULE)
+
+
 def _run_replay_case(
     *,
     input_path: Path,
     abs_tol: float,
     rel_tol: float,
+) -> tuple[int, dict[str, object] | None]:
+    return _load_replay_engine().run_replay_case(
+        input_path=input_path,
+        abs_tol=abs_tol,
+        rel_tol=rel_tol,
+    )
+
+
+def _run_replay_case_subprocess(
+    *,
+    input_path: Path,
+    abs_tol: float,
+    rel_tol: float,
 ) -> tuple[int, dict[str, object] | None]:
     command = [
         sys.executable,
-        str(PROJECT_ROOT / "scripts" / "replay_fundamental_valuation.py"),
+        str(SCRIPTS_DIR / f"{_REPLAY_ENGINE_MODULE}.py"),
         "--input",
         str(input_path),
         "--abs-tol",
@@ -156,6 +217,53 @@ def _run_replay_case(
     return completed.returncode, payload
 
 
+def _replay_cases(
+    *,
+    input_paths: Sequence[Path],
+    abs_tol: float,
+    rel_tol: float,
+    replay_mode: str,
+    workers: int,
+) -> list[tuple[int, dict[str, object] | None, float]]:
+    """
+    Replay every input and return (exit code, payload, duration ms) in input
+    order. In-process replay with workers > 1 fans out over a spawn pool; each
+    worker imports the engine once and reuses it for all of its cases.
+    """
+    if replay_mode == "in_process" and workers > 1 and len(input_paths) > 1:
+        engine = _load_replay_engine()
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(input_paths)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    engine.run_replay_case_timed,
+                    input_path=input_path,
+                    abs_tol=abs_tol,
+                    rel_tol=rel_tol,
+                )
+                for input_path in input_paths
+            ]
+            return [future.result() for future in futures]
+
+    run_case = (
+        _run_replay_case if replay_mode == "in_process" else _run_replay_case_subprocess
+    )
+    outcomes: list[tuple[int, dict[str, object] | None, float]] = []
+    for input_path in input_paths:
+        started = time.perf_counter()
+        return_code, payload = run_case(
+            input_path=input_path,
+            abs_tol=abs_tol,
+            rel_tol=rel_tol,
+        )
+        outcomes.append(
+            (return_code, payload, (time.perf_counter() - started) * 1000.0)
+        )
+    return outcomes
+
+
 def _load_replay_input(
     *,
     input_path: Path,
@@ -291,6 +399,11 @@ def _build_case_result(
         "latency_ms": latency_ms,
         "latency_source": latency_source,
     }
+    replay_timing_raw = (
+        payload.get("replay_timing_ms") if isinstance(payload, Mapping) else None
+    )
+    if isinstance(replay_timing_raw, Mapping):
+        output["replay_timing_ms"] = dict(replay_timing_raw)
     if cache_hit is not None:
         output["xbrl_cache_hit"] = cache_hit
     if xbrl_total_latency_ms is not None:
@@ -842,27 +955,36 @@ def main() -> int:
     args = parse_args()
     try:
         manifest = _load_manifest(args.manifest)
-        results: list[JSONObject] = []
-        for case in manifest.cases:
-            input_path = _resolve_input_path(
+        replay_mode = getattr(args, "replay_mode", "in_process")
+        workers = max(int(getattr(args, "workers", 1)), 1)
+        input_paths = [
+            _resolve_input_path(
                 manifest_path=args.manifest,
                 input_path=case.input_path,
             )
+            for case in manifest.cases
+        ]
+        replay_started = time.perf_counter()
+        outcomes = _replay_cases(
+            input_paths=input_paths,
+            abs_tol=float(args.abs_tol),
+            rel_tol=float(args.rel_tol),
+            replay_mode=replay_mode,
+            workers=workers,
+        )
+        replay_wall_ms = round((time.perf_counter() - replay_started) * 1000.0, 3)
+        results: list[JSONObject] = []
+        for case, input_path, (return_code, payload, duration_ms) in zip(
+            manifest.cases, input_paths, outcomes, strict=True
+        ):
             replay_input = _load_replay_input(input_path=input_path)
             case_hints = _extract_case_hints(replay_input)
-            started = time.perf_counter()
-            return_code, payload = _run_replay_case(
-                input_path=input_path,
-                abs_tol=float(args.abs_tol),
-                rel_tol=float(args.rel_tol),
-            )
-            runtime_duration_ms = round((time.perf_counter() - started) * 1000.0, 3)
             result_item = _build_case_result(
                 case=case,
                 input_path=input_path,
                 return_code=return_code,
                 payload=payload,
-                runtime_duration_ms=runtime_duration_ms,
+                runtime_duration_ms=round(duration_ms, 3),
                 case_hints=case_hints,
             )
             results.append(result_item)
@@ -930,6 +1052,9 @@ def main() -> int:
         )
 
         summary: JSONObject = {
+            "replay_mode": replay_mode,
+            "replay_workers": workers,
+            "replay_wall_ms": replay_wall_ms,
             "total_cases": len(results),
             "passed_cases": passed_count,
             "failed_cases": failed_count,
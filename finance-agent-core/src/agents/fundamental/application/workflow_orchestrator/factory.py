@@ -115,6 +115,55 @@ def build_fundamental_orchestrator(
     )
 
 
+@dataclass(frozen=True)
+class _MarketDataParamsBuilder:
+    # Module-level and holding only the prefetched snapshot, so it pickles
+    # into a valuation compute worker process.
+    market_snapshot: dict[str, object] | None
+
+    def __call__(
+        self,
+        model_type: str,
+        ticker: str | None,
+        reports_raw: list[dict[str, object]],
+        forward_signals: list[ForwardSignalPayload] | None,
+    ) -> ParamBuildResult:
+        canonical_reports = parse_financial_reports_model(
+            reports_raw,
+            context="valuation.financial_reports",
+            inject_default_provenance=True,
+        )
+        market_snapshot = (
+            dict(self.market_snapshot) if self.market_snapshot is not None else None
+        )
+        if market_snapshot is None and forward_signals:
+            market_snapshot = {}
+        if isinstance(market_snapshot, dict) and forward_signals:
+            serialized_signals = serialize_forward_signals(forward_signals)
+            if serialized_signals is not None:
+                market_snapshot["forward_signals"] = serialized_signals
+        build_result = build_params(
+            model_type,
+            ticker,
+            canonical_reports,
+            market_snapshot=market_snapshot,
+        )
+        if not isinstance(market_snapshot, dict):
+            return build_result
+
+        replay_metadata: dict[str, object] = {}
+        if isinstance(build_result.metadata, Mapping):
+            replay_metadata.update(dict(build_result.metadata))
+        replay_metadata[INTERNAL_REPLAY_MARKET_SNAPSHOT_KEY] = dict(market_snapshot)
+        return ParamBuildResult(
+            params=build_result.params,
+            trace_inputs=build_result.trace_inputs,
+            missing=build_result.missing,
+            assumptions=build_result.assumptions,
+            metadata=replay_metadata,
+        )
+
+
 @dataclass(frozen=True)
 class FundamentalWorkflowRunner:
     orchestrator: FundamentalOrchestrator
@@ -167,52 +216,11 @@ class FundamentalWorkflowRunner:
             )
             market_snapshot_override = snapshot.to_mapping()
 
-        def _build_params_with_market_data(
-            model_type: str,
-            ticker: str | None,
-            reports_raw: list[dict[str, object]],
-            forward_signals: list[ForwardSignalPayload] | None,
-        ) -> ParamBuildResult:
-            canonical_reports = parse_financial_reports_model(
-                reports_raw,
-                context="valuation.financial_reports",
-                inject_default_provenance=True,
-            )
-            market_snapshot: dict[str, object] | None = market_snapshot_override
-            if market_snapshot is None and ticker:
-                market_snapshot = self.market_data_service.get_market_snapshot(
-                    ticker
-                ).to_mapping()
-            if market_snapshot is None and forward_signals:
-                market_snapshot = {}
-            if isinstance(market_snapshot, dict) and forward_signals:
-                serialized_signals = serialize_forward_signals(forward_signals)
-                if serialized_signals is not None:
-                    market_snapshot["forward_signals"] = serialized_signals
-            build_result = build_params(
-                model_type,
-                ticker,
-                canonical_reports,
-                market_snapshot=market_snapshot,
-            )
-            if not isinstance(market_snapshot, dict):
-                return build_result
-
-            replay_metadata: dict[str, object] = {}
-            if isinstance(build_result.metadata, Mapping):
-                replay_metadata.update(dict(build_result.metadata))
-            replay_metadata[INTERNAL_REPLAY_MARKET_SNAPSHOT_KEY] = dict(market_snapshot)
-            return ParamBuildResult(
-                params=build_result.params,
-                trace_inputs=build_result.trace_inputs,
-                missing=build_result.missing,
-                assumptions=build_result.assumptions,
-                metadata=replay_metadata,
-            )
-
         return await self.orchestrator.run_valuation(
             state,
-            build_params_fn=_build_params_with_market_data,
+            build_params_fn=_MarketDataParamsBuilder(
+                market_snapshot=market_snapshot_override
+            ),
             get_model_runtime_fn=ValuationModelRegistry.get_model_runtime,
         )
 
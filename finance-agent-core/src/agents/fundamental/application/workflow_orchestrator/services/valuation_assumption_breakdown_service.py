@@ -105,6 +105,10 @@ def build_assumption_breakdown(
                 "corr_pearson_max_abs_error",
                 "corr_spearman_mae",
                 "corr_spearman_max_abs_error",
+                "corr_sample_size",
+                "corr_subsampled",
+                "corr_pearson_error_bar",
+                "corr_spearman_error_bar",
             )
             for field in mc_diagnostic_fields:
                 value = diagnostics.get(field)
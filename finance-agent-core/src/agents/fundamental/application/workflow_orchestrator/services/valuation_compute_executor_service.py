@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+
+from src.shared.kernel.tools.logger import (
+    get_log_context,
+    get_logger,
+    log_context,
+    log_event,
+)
+
+logger = get_logger(__name__)
+
+VALUATION_COMPUTE_EXECUTOR_ENV = "FUNDAMENTAL_VALUATION_COMPUTE_EXECUTOR"
+VALUATION_COMPUTE_WORKERS_ENV = "FUNDAMENTAL_VALUATION_COMPUTE_WORKERS"
+VALUATION_COMPUTE_MAX_TASKS_ENV = "FUNDAMENTAL_VALUATION_COMPUTE_MAX_TASKS_PER_WORKER"
+
+_EXECUTOR_MODES = ("process", "thread")
+_DEFAULT_EXECUTOR_MODE = "process"
+_DEFAULT_WORKERS = 2
+_DEFAULT_MAX_TASKS_PER_WORKER = 64
+
+
+@dataclass(frozen=True)
+class ValuationComputeMetrics:
+    mode: str
+    workers: int
+    max_tasks_per_worker: int
+    queue_depth: int
+    max_queue_depth: int
+    in_flight: int
+    submitted: int
+    completed: int
+    failed: int
+    thread_fallbacks: int
+    pool_restarts: int
+    wait_ms_total: float
+    wait_ms_max: float
+    run_ms_total: float
+
+
+def resolve_valuation_compute_executor_mode() -> str:
+    raw = os.getenv(VALUATION_COMPUTE_EXECUTOR_ENV)
+    if raw is None:
+        return _DEFAULT_EXECUTOR_MODE
+    normalized = raw.strip().lower()
+    return normalized if normalized in _EXECUTOR_MODES else _DEFAULT_EXECUTOR_MODE
+
+
+def resolve_valuation_compute_workers() -> int:
+    return _resolve_positive_int(VALUATION_COMPUTE_WORKERS_ENV, _DEFAULT_WORKERS)
+
+
+def resolve_valuation_compute_max_tasks_per_worker() -> int:
+    return _resolve_positive_int(
+        VALUATION_COMPUTE_MAX_TASKS_ENV, _DEFAULT_MAX_TASKS_PER_WORKER
+    )
+
+
+def _resolve_positive_int(env_name: str, default: int) -> int:
+    raw = os.getenv(env_name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        parsed = int(raw.strip())
+    except ValueError:
+        return default
+    return max(parsed, 1)
+
+
+class ValuationComputeExecutor:
+    """
+    Runs CPU-bound valuation compute off the event loop.
+    Process mode keeps a warm spawn pool and recycles each worker after
+    max_tasks_per_worker tasks. Calls whose payload cannot be pickled, and
+    calls that hit a broken pool, run on a thread instead. Admission is
+    bounded by a semaphore sized to the worker count, so queue depth and wait
+    time measure callers waiting for a compute slot.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: str = _DEFAULT_EXECUTOR_MODE,
+        workers: int = _DEFAULT_WORKERS,
+        max_tasks_per_worker: int = _DEFAULT_MAX_TASKS_PER_WORKER,
+    ) -> None:
+        if mode not in _EXECUTOR_MODES:
+            raise ValueError(f"Unsupported valuation compute executor mode: {mode}")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if max_tasks_per_worker < 1:
+            raise ValueError("max_tasks_per_worker must be >= 1")
+        self.mode = mode
+        self.workers = workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._thread_fallbacks = 0
+        self._pool_restarts = 0
+        self._wait_ms_total = 0.0
+        self._wait_ms_max = 0.0
+        self._run_ms_total = 0.0
+
+    async def run(
+        self,
+        func: Callable[..., object],
+        /,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        self._submitted += 1
+        self._queue_depth += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        queued_at = time.perf_counter()
+        async with self._get_semaphore():
+            wait_ms = (time.perf_counter() - queued_at) * 1000.0
+            self._queue_depth -= 1
+            self._in_flight += 1
+            self._wait_ms_total += wait_ms
+            self._wait_ms_max = max(self._wait_ms_max, wait_ms)
+            started = time.perf_counter()
+            backend = self.mode
+            fallback_reason: str | None = None
+            status = "ok"
+            try:
+                if self.mode == "process":
+                    result, backend, fallback_reason = await self._run_in_process(
+                        func, args, kwargs
+                    )
+                else:
+                    result = await asyncio.to_thread(func, *args, **kwargs)
+                self._completed += 1
+                return result
+            except BaseException:
+                status = "error"
+                self._failed += 1
+                raise
+            finally:
+                run_ms = (time.perf_counter() - started) * 1000.0
+                self._in_flight -= 1
+                self._run_ms_total += run_ms
+                log_event(
+                    logger,
+                    event="fundamental_valuation_compute_finished",
+                    message="valuation compute task finished",
+                    level=logging.DEBUG if status == "ok" else logging.WARNING,
+                    fields={
+                        "status": status,
+                        "backend": backend,
+                        "fallback_reason": fallback_reason,
+                        "wait_ms": round(wait_ms, 3),
+                        "run_ms": round(run_ms, 3),
+                        "queue_depth": self._queue_depth,
+                        "in_flight": self._in_flight,
+                    },
+                )
+
+    def warmup(self) -> dict[str, object]:
+        """Start every worker and import the valuation stack in each of them."""
+        started = time.perf_counter()
+        if self.mode == "process":
+            pool = self._get_pool()
+            futures = [pool.submit(_warm_worker) for _ in range(self.workers)]
+            for future in futures:
+                future.result()
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "warmup_ms": round((time.perf_counter() - started) * 1000.0, 3),
+        }
+
+    def metrics(self) -> ValuationComputeMetrics:
+        return ValuationComputeMetrics(
+            mode=self.mode,
+            workers=self.workers,
+            max_tasks_per_worker=self.max_tasks_per_worker,
+            queue_depth=self._queue_depth,
+            max_queue_depth=self._max_queue_depth,
+            in_flight=self._in_flight,
+            submitted=self._submitted,
+            completed=self._completed,
+            failed=self._failed,
+            thread_fallbacks=self._thread_fallbacks,
+            pool_restarts=self._pool_restarts,
+            wait_ms_total=self._wait_ms_total,
+            wait_ms_max=self._wait_ms_max,
+            run_ms_total=self._run_ms_total,
+        )
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    async def _run_in_process(
+        self,
+        func: Callable[..., object],
+        args: tuple[object, ...],
+        kwargs: dict[str, object],
+    ) -> tuple[object, str, str | None]:
+        # Pickle once in the parent: an unpicklable payload (e.g. a closure)
+        # is detected before it reaches the pool and runs on a thread instead.
+        try:
+            payload = pickle.dumps(
+                (func, args, kwargs, dict(get_log_context())),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as exc:
+            return await self._run_in_thread_fallback(
+                func, args, kwargs, reason=f"payload is not picklable: {exc}"
+            )
+        pool = self._get_pool()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                pool, _run_pickled_task, payload
+            )
+        except BrokenProcessPool:
+            self._discard_pool(pool)
+            return await self._run_in_thread_fallback(
+                func, args, kwargs, reason="process pool broken"
+            )
+        return result, "process", None
+
+    async def _run_in_thread_fallback(
+        self,
+        func: Callable[..., object],
+        args: tuple[object, ...],
+        kwargs: dict[str, object],
+        *,
+        reason: str,
+    ) -> tuple[object, str, str | None]:
+        self._thread_fallbacks += 1
+        log_event(
+            logger,
+            event="fundamental_valuation_compute_thread_fallback",
+            message="valuation compute fell back to thread offload",
+            level=logging.WARNING,
+            fields={"reason": reason, "func": getattr(func, "__qualname__", None)},
+        )
+        result = await asyncio.to_thread(func, *args, **kwargs)
+        return result, "thread", reason
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+        return self._semaphore
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Spawn avoids forking a threaded parent; workers stay warm across
+        # requests and are replaced after max_tasks_per_worker tasks.
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                    max_tasks_per_child=self.max_tasks_per_worker,
+                )
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+                self._pool_restarts += 1
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTOR: ValuationComputeExecutor | None = None
+
+
+def get_valuation_compute_executor() -> ValuationComputeExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ValuationComputeExecutor(
+                mode=resolve_valuation_compute_executor_mode(),
+                workers=resolve_valuation_compute_workers(),
+                max_tasks_per_worker=resolve_valuation_compute_max_tasks_per_worker(),
+            )
+        return _EXECUTOR
+
+
+def warmup_valuation_compute_executor() -> dict[str, object]:
+    return get_valuation_compute_executor().warmup()
+
+
+def get_valuation_compute_metrics() -> dict[str, object]:
+    return asdict(get_valuation_compute_executor().metrics())
+
+
+def shutdown_valuation_compute_executor() -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor = _EXECUTOR
+        _EXECUTOR = None
+    if executor is not None:
+        executor.shutdown()
+
+
+def _warm_worker() -> None:
+    # Importing the registry pulls in every calculator, graph and schema, so
+    # the first real task does not pay for module import in a fresh worker.
+    from src.agents.fundamental.subdomains.core_valuation.domain import (  # noqa: F401
+        valuation_model_registry,
+    )
+
+
+def _run_pickled_task(payload: bytes) -> object:
+    func, args, kwargs, context = pickle.loads(payload)
+    with log_context(**context):
+        return func(*args, **kwargs)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from typing import Protocol
 
 from src.agents.fundamental.application.workflow_orchestrator.services.valuation_completion_fields_service import (
     build_forward_signal_completion_fields,
     build_monte_carlo_completion_fields,
 )
+from src.agents.fundamental.application.workflow_orchestrator.services.valuation_compute_executor_service import (
+    get_valuation_compute_executor,
+)
 from src.agents.fundamental.application.workflow_orchestrator.services.valuation_distribution_preview_service import (
     coerce_float,
     extract_distribution_summary,
@@ -41,8 +44,6 @@ from src.shared.kernel.workflow_contracts import WorkflowNodeResult
 
 logger = get_logger(__name__)
 FundamentalNodeResult = WorkflowNodeResult
-_VALUATION_COMPUTE_CONCURRENCY_LIMIT = 2
-_valuation_compute_semaphore: asyncio.Semaphore | None = None
 _XBRL_QUALITY_BLOCKED_CODE = "FUNDAMENTAL_XBRL_QUALITY_BLOCKED"
 _WARN_ONLY_MISSING_INPUT_FIELDS = (
     "tax_rate",
@@ -92,23 +93,13 @@ class ValuationRuntime(Protocol):
     def build_valuation_error_update(self, error: str) -> JSONObject: ...
 
 
-def _get_valuation_compute_semaphore() -> asyncio.Semaphore:
-    global _valuation_compute_semaphore
-    if _valuation_compute_semaphore is None:
-        _valuation_compute_semaphore = asyncio.Semaphore(
-            _VALUATION_COMPUTE_CONCURRENCY_LIMIT
-        )
-    return _valuation_compute_semaphore
-
-
 async def _offload_valuation_compute(
     func: Callable[..., object],
     /,
     *args: object,
     **kwargs: object,
 ) -> object:
-    async with _get_valuation_compute_semaphore():
-        return await asyncio.to_thread(func, *args, **kwargs)
+    return await get_valuation_compute_executor().run(func, *args, **kwargs)
 
 
 def _extract_numeric_metric(
@@ -1389,6 +1380,37 @@ def _quality_status_token(quality_gates: Mapping[str, object] | None) -> str:
     return token if token else "unknown"
 
 
+@dataclass(frozen=True)
+class _MissingPolicyParamsBuilder:
+    # A module-level callable rather than a closure, so the valuation compute
+    # payload stays picklable whenever build_params_fn itself is.
+    build_params_fn: Callable[
+        [str, str | None, list[JSONObject], list[ForwardSignalPayload] | None],
+        ParamBuildResult,
+    ]
+    quality_gates: Mapping[str, object] | None
+
+    def __call__(
+        self,
+        model_type_raw: str,
+        ticker_raw: str | None,
+        reports_raw: list[JSONObject],
+        forward_signals_raw: list[ForwardSignalPayload] | None,
+    ) -> ParamBuildResult:
+        base_result = self.build_params_fn(
+            model_type_raw,
+            ticker_raw,
+            reports_raw,
+            forward_signals_raw,
+        )
+        return _apply_missing_input_policy(
+            build_result=base_result,
+            quality_gates=self.quality_gates,
+            model_type=model_type_raw,
+            ticker=ticker_raw,
+        )
+
+
 def _apply_missing_input_policy(
     *,
     build_result: ParamBuildResult,
@@ -1538,29 +1560,13 @@ async def run_valuation_flow(
                 goto="END",
             )
 
-        def _build_params_with_missing_policy(
-            model_type_raw: str,
-            ticker_raw: str | None,
-            reports_raw: list[JSONObject],
-            forward_signals_raw: list[ForwardSignalPayload] | None,
-        ) -> ParamBuildResult:
-            base_result = build_params_fn(
-                model_type_raw,
-                ticker_raw,
-                reports_raw,
-                forward_signals_raw,
-            )
-            return _apply_missing_input_policy(
-                build_result=base_result,
-                quality_gates=quality_gates,
-                model_type=model_type_raw,
-                ticker=ticker_raw,
-            )
-
         execution_result = await _offload_valuation_compute(
             execute_valuation_calculation,
             context=execution_context,
-            build_params_fn=_build_params_with_missing_policy,
+            build_params_fn=_MissingPolicyParamsBuilder(
+                build_params_fn=build_params_fn,
+                quality_gates=quality_gates,
+            ),
         )
         build_result = execution_result.build_result
         base_metadata = (
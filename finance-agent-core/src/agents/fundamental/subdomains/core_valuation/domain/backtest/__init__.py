@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from .cache_service import BacktestResultCache, resolve_calculator_code_version
 from .contracts import (
     BacktestCase,
     BacktestConfig,
     BaselineCase,
     CaseResult,
+    CaseRunTiming,
     MetricDrift,
 )
 from .drift_service import compare_backtest_results_with_baseline
@@ -13,11 +15,16 @@ from .report_service import (
     build_backtest_baseline_payload,
     build_backtest_report_payload,
 )
-from .runtime_service import run_backtest_cases
+from .runtime_service import (
+    resolve_backtest_workers,
+    run_backtest_cases,
+    run_backtest_cases_with_timings,
+)
 
 load_cases = load_backtest_cases
 load_baseline = load_backtest_baseline
 run_cases = run_backtest_cases
+run_cases_with_timings = run_backtest_cases_with_timings
 compare_with_baseline = compare_backtest_results_with_baseline
 build_baseline_payload = build_backtest_baseline_payload
 build_report_payload = build_backtest_report_payload
@@ -25,13 +32,18 @@ build_report_payload = build_backtest_report_payload
 __all__ = [
     "BacktestCase",
     "BacktestConfig",
+    "BacktestResultCache",
     "BaselineCase",
     "CaseResult",
+    "CaseRunTiming",
     "MetricDrift",
     "build_baseline_payload",
     "build_report_payload",
     "compare_with_baseline",
     "load_baseline",
     "load_cases",
+    "resolve_backtest_workers",
+    "resolve_calculator_code_version",
     "run_cases",
+    "run_cases_with_timings",
 ]
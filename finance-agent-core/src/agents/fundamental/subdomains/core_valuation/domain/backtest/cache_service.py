@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from src.shared.kernel.types import JSONObject
+
+from ..engine.dcf_kernels import resolve_dcf_kernel_dtype
+from ..engine.monte_carlo_parallel_service import resolve_monte_carlo_workers
+from ..engine.monte_carlo_precision_service import (
+    resolve_monte_carlo_convergence_mode,
+    resolve_monte_carlo_quantile_precision,
+)
+from ..engine.monte_carlo_sketch_service import resolve_monte_carlo_summary_backend
+from .contracts import BacktestCase, CaseResult
+
+_CACHE_SCHEMA_VERSION = "v1"
+_CORE_VALUATION_DOMAIN_ROOT = Path(__file__).resolve().parents[1]
+_FUNDAMENTAL_SHARED_DOMAIN_ROOT = (
+    Path(__file__).resolve().parents[4] / "domain" / "shared"
+)
+# Everything a calculator run can depend on: calculators, graphs, engine,
+# policies, model contracts, the metric extraction in this package, and the
+# shared traceable contracts.
+_CALCULATOR_SOURCE_ROOTS = (
+    _CORE_VALUATION_DOMAIN_ROOT,
+    _FUNDAMENTAL_SHARED_DOMAIN_ROOT,
+)
+_CALCULATOR_SOURCE_SUFFIXES = (".py", ".json")
+
+
+@lru_cache(maxsize=1)
+def resolve_calculator_code_version() -> str:
+    digest = hashlib.sha256()
+    for root in _CALCULATOR_SOURCE_ROOTS:
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob("*")):
+            if path.suffix not in _CALCULATOR_SOURCE_SUFFIXES or not path.is_file():
+                continue
+            if "__pycache__" in path.parts:
+                continue
+            digest.update(path.relative_to(root.parent).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def resolve_calculator_settings() -> JSONObject:
+    # Environment knobs the engine reads at run time that change the metrics.
+    # Variance reduction, sampler, seed and iterations come from case params.
+    return {
+        "dcf_kernel_dtype": resolve_dcf_kernel_dtype(),
+        "monte_carlo_summary_backend": resolve_monte_carlo_summary_backend(),
+        "monte_carlo_convergence_mode": resolve_monte_carlo_convergence_mode(),
+        "monte_carlo_quantile_precision": resolve_monte_carlo_quantile_precision(),
+        "monte_carlo_workers": resolve_monte_carlo_workers(),
+    }
+
+
+def build_backtest_case_cache_key(case: BacktestCase, *, code_version: str) -> str:
+    # case_id is deliberately left out: a renamed case with unchanged inputs
+    # reuses the cached result.
+    payload: JSONObject = {
+        "schema_version": _CACHE_SCHEMA_VERSION,
+        "code_version": code_version,
+        "settings": resolve_calculator_settings(),
+        "model": case.model,
+        "params": case.params,
+        "required_metrics": list(case.required_metrics),
+        "consensus_target_price_median": case.consensus_target_price_median,
+        "target_consensus_quality_bucket": case.target_consensus_quality_bucket,
+        "target_consensus_confidence_weight": case.target_consensus_confidence_weight,
+        "target_consensus_warning_codes": list(case.target_consensus_warning_codes),
+    }
+    canonical = json.dumps(
+        payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class BacktestResultCache:
+    """
+    On-disk case result cache, one JSON file per key.
+    Keys cover the case inputs, the model id, the calculator code version and
+    the engine settings resolved from the environment, so any change to
+    valuation code or to a result-affecting setting misses the cache.
+    """
+
+    def __init__(self, directory: Path, *, code_version: str | None = None) -> None:
+        self.directory = directory
+        self.code_version = code_version or resolve_calculator_code_version()
+
+    def key_for(self, case: BacktestCase) -> str:
+        return build_backtest_case_cache_key(case, code_version=self.code_version)
+
+    def get(self, case: BacktestCase) -> CaseResult | None:
+        path = self._path(self.key_for(case))
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("model") != case.model:
+            return None
+        status = payload.get("status")
+        metrics = payload.get("metrics")
+        error = payload.get("error")
+        if not isinstance(status, str):
+            return None
+        return CaseResult(
+            case_id=case.case_id,
+            model=case.model,
+            status=status,
+            metrics=metrics if isinstance(metrics, dict) else None,
+            error=error if isinstance(error, str) else None,
+        )
+
+    def put(self, case: BacktestCase, result: CaseResult) -> None:
+        path = self._path(self.key_for(case))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload: JSONObject = {
+            "model": result.model,
+            "status": result.status,
+            "metrics": result.metrics,
+            "error": result.error,
+        }
+        # Write-then-rename so a concurrent reader never sees a partial entry.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
@@ -46,3 +46,12 @@ class CaseResult:
 class BaselineCase:
     model: str
     metrics: JSONObject
+
+
+@dataclass(frozen=True)
+class CaseRunTiming:
+    case_id: str
+    model: str
+    status: str
+    cached: bool
+    elapsed_ms: float
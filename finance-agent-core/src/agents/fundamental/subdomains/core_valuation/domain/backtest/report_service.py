@@ -6,7 +6,7 @@ from pathlib import Path
 
 from src.shared.kernel.types import JSONObject
 
-from .contracts import CaseResult, MetricDrift
+from .contracts import CaseResult, CaseRunTiming, MetricDrift
 
 
 def build_backtest_baseline_payload(results: Sequence[CaseResult]) -> JSONObject:
@@ -33,6 +33,7 @@ def build_backtest_report_payload(
     issues: Sequence[str],
     baseline_updated: bool,
     calibration: JSONObject | None = None,
+    timings: Sequence[CaseRunTiming] | None = None,
 ) -> JSONObject:
     ok_count = sum(1 for item in results if item.status == "ok")
     error_count = sum(1 for item in results if item.status == "error")
@@ -70,7 +71,7 @@ def build_backtest_report_payload(
         gate_value = calibration.get("gate_passed")
         calibration_gate_passed = isinstance(gate_value, bool) and gate_value
 
-    return {
+    report: JSONObject = {
         "generated_at": _utc_now_iso(),
         "dataset_path": str(dataset_path),
         "baseline_path": str(baseline_path),
@@ -127,6 +128,34 @@ def build_backtest_report_payload(
         ],
         "issues": list(issues),
     }
+    if timings is not None:
+        report["timing"] = build_backtest_timing_payload(timings)
+    return report
+
+
+def build_backtest_timing_payload(timings: Sequence[CaseRunTiming]) -> JSONObject:
+    computed_ms = [item.elapsed_ms for item in timings if not item.cached]
+    slowest = sorted(timings, key=lambda item: item.elapsed_ms, reverse=True)
+    return {
+        "case_count": len(timings),
+        "cache_hits": sum(1 for item in timings if item.cached),
+        "cache_misses": len(computed_ms),
+        "computed_ms_total": float(sum(computed_ms)),
+        "computed_ms_p50": (
+            _percentile(sorted(computed_ms), 50.0) if computed_ms else 0.0
+        ),
+        "slowest_case_ids": [item.case_id for item in slowest[:5]],
+        "cases": [
+            {
+                "id": item.case_id,
+                "model": item.model,
+                "status": item.status,
+                "cached": item.cached,
+                "elapsed_ms": item.elapsed_ms,
+            }
+            for item in timings
+        ],
+    }
 
 
 def _utc_now_iso() -> str:
@@ -1,104 +1,229 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from src.shared.kernel.types import JSONObject
 
+from ..engine.monte_carlo_sample_store_service import (
+    MonteCarloSampleStore,
+    use_monte_carlo_sample_store,
+)
 from ..valuation_model_registry import ValuationModelRegistry
-from .contracts import BacktestCase, CaseResult
+from .cache_service import BacktestResultCache
+from .contracts import BacktestCase, CaseResult, CaseRunTiming
 from .io_service import coerce_mapping
 
+BacktestProgressCallback = Callable[[int, int, CaseRunTiming], None]
 
-def run_backtest_cases(cases: Sequence[BacktestCase]) -> list[CaseResult]:
-    results: list[CaseResult] = []
-    for case in cases:
-        model_runtime = ValuationModelRegistry.get_model_runtime(case.model)
-        if not isinstance(model_runtime, Mapping):
-            results.append(
-                CaseResult(
-                    case_id=case.case_id,
-                    model=case.model,
-                    status="error",
-                    error=f"Unknown valuation model: {case.model}",
-                )
-            )
-            continue
+_AUTO_CASES_PER_WORKER = 8
 
-        schema_raw = model_runtime.get("schema")
-        calculator_raw = model_runtime.get("calculator")
-        if not callable(schema_raw) or not callable(calculator_raw):
-            results.append(
-                CaseResult(
-                    case_id=case.case_id,
-                    model=case.model,
-                    status="error",
-                    error=f"Incomplete model runtime for model: {case.model}",
-                )
-            )
+
+def run_backtest_cases(
+    cases: Sequence[BacktestCase],
+    *,
+    workers: int = 1,
+    cache: BacktestResultCache | None = None,
+    progress: BacktestProgressCallback | None = None,
+) -> list[CaseResult]:
+    results, _ = run_backtest_cases_with_timings(
+        cases, workers=workers, cache=cache, progress=progress
+    )
+    return results
+
+
+def run_backtest_cases_with_timings(
+    cases: Sequence[BacktestCase],
+    *,
+    workers: int = 1,
+    cache: BacktestResultCache | None = None,
+    progress: BacktestProgressCallback | None = None,
+) -> tuple[list[CaseResult], list[CaseRunTiming]]:
+    """
+    Evaluate cases in dataset order. Cached results are reused; the rest run
+    in-process or, with workers > 1, on a spawn process pool. Results and
+    timings are returned in case order whatever the completion order.
+    """
+    results: list[CaseResult | None] = [None] * len(cases)
+    timings: list[CaseRunTiming | None] = [None] * len(cases)
+    completed = 0
+
+    def _record(
+        index: int, result: CaseResult, *, cached: bool, elapsed_ms: float
+    ) -> None:
+        nonlocal completed
+        results[index] = result
+        timing = CaseRunTiming(
+            case_id=result.case_id,
+            model=result.model,
+            status=result.status,
+            cached=cached,
+            elapsed_ms=elapsed_ms,
+        )
+        timings[index] = timing
+        completed += 1
+        if progress is not None:
+            progress(completed, len(cases), timing)
+
+    pending: list[int] = []
+    for index, case in enumerate(cases):
+        started = time.perf_counter()
+        cached_result = cache.get(case) if cache is not None else None
+        if cached_result is None:
+            pending.append(index)
             continue
+        _record(
+            index,
+            cached_result,
+            cached=True,
+            elapsed_ms=(time.perf_counter() - started) * 1000.0,
+        )
 
-        try:
-            params_obj = schema_raw(**case.params)
-            raw_result = calculator_raw(params_obj)
-            result_mapping = coerce_mapping(
-                raw_result, f"calculation result for case '{case.case_id}'"
-            )
+    pool_workers = min(workers, len(pending))
+    if pool_workers <= 1:
+        # One sample store per run: cases sharing Monte Carlo settings reuse
+        # draws, and models are compared on common random numbers.
+        with use_monte_carlo_sample_store():
+            for index in pending:
+                result, elapsed_ms = _run_backtest_case_timed(cases[index])
+                _record(index, result, cached=False, elapsed_ms=elapsed_ms)
+                if cache is not None:
+                    cache.put(cases[index], result)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=pool_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_backtest_worker,
+        ) as pool:
+            futures = {
+                pool.submit(_run_backtest_case_in_worker, cases[index]): index
+                for index in pending
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                result, elapsed_ms = future.result()
+                _record(index, result, cached=False, elapsed_ms=elapsed_ms)
+                if cache is not None:
+                    cache.put(cases[index], result)
 
-            error_raw = result_mapping.get("error")
-            if isinstance(error_raw, str) and error_raw:
-                results.append(
-                    CaseResult(
-                        case_id=case.case_id,
-                        model=case.model,
-                        status="error",
-                        error=error_raw,
-                    )
-                )
-                continue
-
-            metrics = extract_backtest_metrics(result_mapping)
-            _attach_consensus_anchor_metrics(
-                metrics=metrics,
-                consensus_target_price_median=case.consensus_target_price_median,
-                target_consensus_quality_bucket=case.target_consensus_quality_bucket,
-                target_consensus_confidence_weight=case.target_consensus_confidence_weight,
-                target_consensus_warning_codes=case.target_consensus_warning_codes,
-            )
-            missing_required = [
-                metric
-                for metric in case.required_metrics
-                if _lookup_numeric_metric(metrics, metric) is None
-            ]
-            if missing_required:
-                results.append(
-                    CaseResult(
-                        case_id=case.case_id,
-                        model=case.model,
-                        status="error",
-                        error="Missing required metrics: "
-                        + ", ".join(sorted(missing_required)),
-                    )
-                )
-                continue
-
-            results.append(
-                CaseResult(
-                    case_id=case.case_id,
-                    model=case.model,
-                    status="ok",
-                    metrics=metrics,
-                )
+    return (
+        [item for item in results if item is not None],
+        [item for item in timings if item is not None],
+    )
+
+
+def resolve_backtest_workers(raw: str | int | None, *, case_count: int) -> int:
+    """
+    "auto" uses one worker per eight cases, capped at the CPU count, so small
+    datasets stay in-process instead of paying for worker start-up.
+    """
+    if raw is None:
+        return 1
+    if isinstance(raw, int):
+        return max(raw, 1)
+    normalized = raw.strip().lower()
+    if normalized == "auto":
+        by_cases = -(-case_count // _AUTO_CASES_PER_WORKER)
+        return max(min(os.cpu_count() or 1, by_cases), 1)
+    try:
+        return max(int(normalized), 1)
+    except ValueError:
+        return 1
+
+
+_WORKER_SAMPLE_STORE: MonteCarloSampleStore | None = None
+
+
+def _init_backtest_worker() -> None:
+    global _WORKER_SAMPLE_STORE
+    _WORKER_SAMPLE_STORE = MonteCarloSampleStore()
+
+
+def _run_backtest_case_in_worker(case: BacktestCase) -> tuple[CaseResult, float]:
+    with use_monte_carlo_sample_store(_WORKER_SAMPLE_STORE):
+        return _run_backtest_case_timed(case)
+
+
+def _run_backtest_case_timed(case: BacktestCase) -> tuple[CaseResult, float]:
+    started = time.perf_counter()
+    result = run_backtest_case(case)
+    return result, (time.perf_counter() - started) * 1000.0
+
+
+def run_backtest_case(case: BacktestCase) -> CaseResult:
+    model_runtime = ValuationModelRegistry.get_model_runtime(case.model)
+    if not isinstance(model_runtime, Mapping):
+        return CaseResult(
+            case_id=case.case_id,
+            model=case.model,
+            status="error",
+            error=f"Unknown valuation model: {case.model}",
+        )
+
+    schema_raw = model_runtime.get("schema")
+    calculator_raw = model_runtime.get("calculator")
+    if not callable(schema_raw) or not callable(calculator_raw):
+        return CaseResult(
+            case_id=case.case_id,
+            model=case.model,
+            status="error",
+            error=f"Incomplete model runtime for model: {case.model}",
+        )
+
+    try:
+        params_obj = schema_raw(**case.params)
+        raw_result = calculator_raw(params_obj)
+        result_mapping = coerce_mapping(
+            raw_result, f"calculation result for case '{case.case_id}'"
+        )
+
+        error_raw = result_mapping.get("error")
+        if isinstance(error_raw, str) and error_raw:
+            return CaseResult(
+                case_id=case.case_id,
+                model=case.model,
+                status="error",
+                error=error_raw,
             )
-        except Exception as exc:  # noqa: BLE001
-            results.append(
-                CaseResult(
-                    case_id=case.case_id,
-                    model=case.model,
-                    status="error",
-                    error=str(exc),
-                )
+
+        metrics = extract_backtest_metrics(result_mapping)
+        _attach_consensus_anchor_metrics(
+            metrics=metrics,
+            consensus_target_price_median=case.consensus_target_price_median,
+            target_consensus_quality_bucket=case.target_consensus_quality_bucket,
+            target_consensus_confidence_weight=case.target_consensus_confidence_weight,
+            target_consensus_warning_codes=case.target_consensus_warning_codes,
+        )
+        missing_required = [
+            metric
+            for metric in case.required_metrics
+            if _lookup_numeric_metric(metrics, metric) is None
+        ]
+        if missing_required:
+            return CaseResult(
+                case_id=case.case_id,
+                model=case.model,
+                status="error",
+                error="Missing required metrics: "
+                + ", ".join(sorted(missing_required)),
             )
-    return results
+
+        return CaseResult(
+            case_id=case.case_id,
+            model=case.model,
+            status="ok",
+            metrics=metrics,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return CaseResult(
+            case_id=case.case_id,
+            model=case.model,
+            status="error",
+            error=str(exc),
+        )
 
 
 def extract_backtest_metrics(result: Mapping[str, object]) -> JSONObject:
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from .contracts import (
+    BatchModelThroughput,
+    BatchThroughputReport,
+    BatchValuationCase,
+    BatchValuationResult,
+    BatchValuationRun,
+)
+from .report_service import build_batch_valuation_payload
+from .runtime_service import run_batch_valuation
+
+__all__ = [
+    "BatchModelThroughput",
+    "BatchThroughputReport",
+    "BatchValuationCase",
+    "BatchValuationResult",
+    "BatchValuationRun",
+    "build_batch_valuation_payload",
+    "run_batch_valuation",
+]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+from src.shared.kernel.types import JSONObject
+
+BatchValuationPath = Literal["packed", "calculator", "validation"]
+
+
+@dataclass(frozen=True)
+class BatchValuationCase:
+    ticker: str
+    model: str
+    params: JSONObject
+
+
+@dataclass(frozen=True)
+class BatchValuationResult:
+    ticker: str
+    model: str
+    status: str
+    path: BatchValuationPath
+    intrinsic_value: float | None = None
+    upside_potential: float | None = None
+    equity_value: float | None = None
+    enterprise_value: float | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchModelThroughput:
+    model: str
+    case_count: int
+    packed_count: int
+    calculator_count: int
+    pack_count: int
+    elapsed_ms: float
+
+
+@dataclass(frozen=True)
+class BatchThroughputReport:
+    case_count: int
+    ok_count: int
+    error_count: int
+    packed_count: int
+    calculator_count: int
+    elapsed_ms: float
+    cases_per_second: float
+    models: tuple[BatchModelThroughput, ...]
+
+
+@dataclass(frozen=True)
+class BatchValuationRun:
+    results: tuple[BatchValuationResult, ...]
+    report: BatchThroughputReport
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from src.shared.kernel.types import JSONObject
+
+from .contracts import BatchValuationRun
+
+
+def build_batch_valuation_payload(run: BatchValuationRun) -> JSONObject:
+    report = asdict(run.report)
+    report["models"] = [asdict(item) for item in run.report.models]
+    return {
+        "results": [asdict(item) for item in run.results],
+        "throughput": report,
+    }
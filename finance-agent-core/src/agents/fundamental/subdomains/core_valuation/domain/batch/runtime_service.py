@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.agents.fundamental.domain.shared.contracts.traceable import TraceableField
+
+from ..calculators.calculator_runtime_support import (
+    apply_trace_inputs,
+    compute_upside,
+)
+from ..calculators.dcf_variant_contracts import DcfGraphFactory, DcfVariantParams
+from ..calculators.dcf_variant_result_service import build_dcf_variant_raw_inputs
+from ..calculators.dcf_variant_validation_service import (
+    validate_dcf_variant_projection_lengths,
+)
+from ..engine.graphs.dcf_common import batch_guard_mask
+from ..engine.graphs.dcf_growth import create_dcf_growth_graph
+from ..engine.graphs.dcf_standard import create_dcf_standard_graph
+from ..engine.monte_carlo_sample_store_service import use_monte_carlo_sample_store
+from ..valuation_model_registry import ValuationModelRegistry
+from .contracts import (
+    BatchModelThroughput,
+    BatchThroughputReport,
+    BatchValuationCase,
+    BatchValuationPath,
+    BatchValuationResult,
+    BatchValuationRun,
+)
+
+_PACKED_OUTPUTS = ("enterprise_value", "equity_value", "intrinsic_value")
+
+
+@dataclass(frozen=True)
+class _PackedModel:
+    graph_factory: DcfGraphFactory
+    build_raw_inputs: Callable[[DcfVariantParams], dict[str, object]]
+    validate: Callable[[DcfVariantParams], str | None]
+    # Rows the batch kernels accept; the rest would fail the whole pack.
+    guard_mask: Callable[[Mapping[str, np.ndarray]], np.ndarray]
+
+
+def _dcf_guard_mask(inputs: Mapping[str, np.ndarray]) -> np.ndarray:
+    return batch_guard_mask(
+        initial_revenue=inputs["initial_revenue"],
+        wacc=inputs["wacc"],
+        shares_outstanding=inputs["shares_outstanding"],
+    )
+
+
+# Models whose full deterministic graph has NumPy batch kernels. Everything
+# else is evaluated case by case through its registry calculator.
+_PACKED_MODELS: dict[str, _PackedModel] = {
+    "dcf_standard": _PackedModel(
+        graph_factory=create_dcf_standard_graph,
+        build_raw_inputs=build_dcf_variant_raw_inputs,
+        validate=validate_dcf_variant_projection_lengths,
+        guard_mask=_dcf_guard_mask,
+    ),
+    "dcf_growth": _PackedModel(
+        graph_factory=create_dcf_growth_graph,
+        build_raw_inputs=build_dcf_variant_raw_inputs,
+        validate=validate_dcf_variant_projection_lengths,
+        guard_mask=_dcf_guard_mask,
+    ),
+}
+
+
+def run_batch_valuation(
+    cases: Sequence[BatchValuationCase],
+    *,
+    packed: bool = True,
+) -> BatchValuationRun:
+    """
+    Value many tickers without the agent workflow. Same-model cases with the
+    same projection horizon are packed into (N,) / (N, Y) arrays and run
+    through one vectorized graph evaluation; that path is deterministic only
+    (no Monte Carlo or sensitivity). Models without batch kernels, cases that
+    fail validation, and pack members the kernel guards reject or that come
+    out non-finite fall back to the registry calculator; the rest of the pack
+    stays packed. Results come back in case order.
+    """
+    started = time.perf_counter()
+    results: list[BatchValuationResult | None] = [None] * len(cases)
+    model_indices: dict[str, list[int]] = {}
+    for index, case in enumerate(cases):
+        model_indices.setdefault(case.model, []).append(index)
+
+    model_reports: list[BatchModelThroughput] = []
+    # Calculator fallbacks share Monte Carlo draws across the run.
+    with use_monte_carlo_sample_store():
+        for model, indices in model_indices.items():
+            model_started = time.perf_counter()
+            pack_count = _run_model_group(
+                model,
+                [(index, cases[index]) for index in indices],
+                results=results,
+                packed=packed,
+            )
+            group = [results[index] for index in indices]
+            model_reports.append(
+                BatchModelThroughput(
+                    model=model,
+                    case_count=len(indices),
+                    packed_count=sum(
+                        1
+                        for item in group
+                        if item is not None and item.path == "packed"
+                    ),
+                    calculator_count=sum(
+                        1
+                        for item in group
+                        if item is not None and item.path == "calculator"
+                    ),
+                    pack_count=pack_count,
+                    elapsed_ms=(time.perf_counter() - model_started) * 1000.0,
+                )
+            )
+
+    ordered = tuple(item for item in results if item is not None)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    ok_count = sum(1 for item in ordered if item.status == "ok")
+    report = BatchThroughputReport(
+        case_count=len(ordered),
+        ok_count=ok_count,
+        error_count=len(ordered) - ok_count,
+        packed_count=sum(item.packed_count for item in model_reports),
+        calculator_count=sum(item.calculator_count for item in model_reports),
+        elapsed_ms=elapsed_ms,
+        cases_per_second=(
+            len(ordered) / (elapsed_ms / 1000.0) if elapsed_ms > 0 else 0.0
+        ),
+        models=tuple(model_reports),
+    )
+    return BatchValuationRun(results=ordered, report=report)
+
+
+def _run_model_group(
+    model: str,
+    indexed_cases: list[tuple[int, BatchValuationCase]],
+    *,
+    results: list[BatchValuationResult | None],
+    packed: bool,
+) -> int:
+    model_runtime = ValuationModelRegistry.get_model_runtime(model)
+    schema_raw = (
+        model_runtime.get("schema") if isinstance(model_runtime, Mapping) else None
+    )
+    calculator_raw = (
+        model_runtime.get("calculator") if isinstance(model_runtime, Mapping) else None
+    )
+    if not callable(schema_raw) or not callable(calculator_raw):
+        error = (
+            f"Unknown valuation model: {model}"
+            if model_runtime is None
+            else f"Incomplete model runtime for model: {model}"
+        )
+        for index, case in indexed_cases:
+            results[index] = _error_result(case, error, path="validation")
+        return 0
+
+    validated: list[tuple[int, BatchValuationCase, object]] = []
+    for index, case in indexed_cases:
+        try:
+            params_obj = schema_raw(**case.params)
+        except Exception as exc:  # noqa: BLE001
+            results[index] = _error_result(case, str(exc), path="validation")
+            continue
+        validated.append((index, case, params_obj))
+
+    packed_model = _PACKED_MODELS.get(model) if packed else None
+    calculator_cases = validated
+    pack_count = 0
+    if packed_model is not None:
+        calculator_cases = []
+        packs: dict[int, list[tuple[int, BatchValuationCase, DcfVariantParams]]] = {}
+        for index, case, params_obj in validated:
+            # Invalid members go to the calculator so their error text matches
+            # the interactive path.
+            if packed_model.validate(params_obj) is not None:
+                calculator_cases.append((index, case, params_obj))
+                continue
+            years = len(params_obj.growth_rates)
+            packs.setdefault(years, []).append((index, case, params_obj))
+        for members in packs.values():
+            evaluated = _evaluate_pack(packed_model, members)
+            if evaluated is None:
+                calculator_cases.extend(members)
+                continue
+            pack_results, rejected = evaluated
+            calculator_cases.extend(rejected)
+            if pack_results:
+                pack_count += 1
+            for index, result in pack_results.items():
+                results[index] = result
+
+    for index, case, params_obj in sorted(calculator_cases, key=lambda item: item[0]):
+        results[index] = _run_calculator_case(case, params_obj, calculator_raw)
+    return pack_count
+
+
+_PackMember = tuple[int, BatchValuationCase, DcfVariantParams]
+
+
+def _evaluate_pack(
+    packed_model: _PackedModel,
+    members: list[_PackMember],
+) -> tuple[dict[int, BatchValuationResult], list[_PackMember]] | None:
+    """
+    Packed results by case index, plus the members to re-run through the
+    calculator: rows the kernel guards reject and rows with non-finite
+    outputs. None when the whole pack has to go to the calculator.
+    """
+    rows = [
+        apply_trace_inputs(
+            packed_model.build_raw_inputs(params_obj), params_obj.trace_inputs
+        )
+        for _, _, params_obj in members
+    ]
+    names = tuple(rows[0])
+    try:
+        packed_inputs = {
+            name: np.asarray([_unwrap_input(row[name]) for row in rows], dtype=float)
+            for name in names
+        }
+        accepted = np.asarray(packed_model.guard_mask(packed_inputs), dtype=bool)
+        rejected = [
+            member for member, ok in zip(members, accepted, strict=True) if not ok
+        ]
+        members = [member for member, ok in zip(members, accepted, strict=True) if ok]
+        if not members:
+            return {}, rejected
+        plan = packed_model.graph_factory().compile(
+            inputs=names, outputs=_PACKED_OUTPUTS
+        )
+        if not plan.supports_batch:
+            return None
+        outputs = plan.calculate_batch(
+            {name: values[accepted] for name, values in packed_inputs.items()}
+        )
+        columns = {
+            name: np.broadcast_to(
+                np.asarray(outputs[name], dtype=float), (len(members),)
+            )
+            for name in _PACKED_OUTPUTS
+        }
+    except Exception:  # noqa: BLE001
+        # Guarded rows are already filtered out; anything else is unexpected,
+        # so the calculator re-runs every member and reports the error.
+        return None
+    finite = np.logical_and.reduce([np.isfinite(c) for c in columns.values()])
+
+    pack_results: dict[int, BatchValuationResult] = {}
+    for position, member in enumerate(members):
+        index, case, params_obj = member
+        if not finite[position]:
+            rejected.append(member)
+            continue
+        intrinsic_value = float(columns["intrinsic_value"][position])
+        pack_results[index] = BatchValuationResult(
+            ticker=case.ticker,
+            model=case.model,
+            status="ok",
+            path="packed",
+            intrinsic_value=intrinsic_value,
+            upside_potential=compute_upside(intrinsic_value, params_obj.current_price),
+            equity_value=float(columns["equity_value"][position]),
+            enterprise_value=float(columns["enterprise_value"][position]),
+        )
+    return pack_results, rejected
+
+
+def _run_calculator_case(
+    case: BatchValuationCase,
+    params_obj: object,
+    calculator: Callable[[object], object],
+) -> BatchValuationResult:
+    try:
+        raw_result = calculator(params_obj)
+    except Exception as exc:  # noqa: BLE001
+        return _error_result(case, str(exc), path="calculator")
+    if not isinstance(raw_result, Mapping):
+        return _error_result(
+            case,
+            f"calculation result for '{case.ticker}' must be an object",
+            path="calculator",
+        )
+    error_raw = raw_result.get("error")
+    if isinstance(error_raw, str) and error_raw:
+        return _error_result(case, error_raw, path="calculator")
+    return BatchValuationResult(
+        ticker=case.ticker,
+        model=case.model,
+        status="ok",
+        path="calculator",
+        intrinsic_value=_optional_float(raw_result.get("intrinsic_value")),
+        upside_potential=_optional_float(raw_result.get("upside_potential")),
+        equity_value=_optional_float(raw_result.get("equity_value")),
+        enterprise_value=_optional_float(raw_result.get("enterprise_value")),
+    )
+
+
+def _error_result(
+    case: BatchValuationCase,
+    error: str,
+    *,
+    path: BatchValuationPath,
+) -> BatchValuationResult:
+    return BatchValuationResult(
+        ticker=case.ticker,
+        model=case.model,
+        status="error",
+        path=path,
+        error=error,
+    )
+
+
+def _unwrap_input(value: object) -> object:
+    if isinstance(value, TraceableField):
+        return value.value
+    return value
+
+
+def _optional_float(value: object) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
@@ -1,14 +1,28 @@
 from collections.abc import Mapping
+from dataclasses import dataclass
 
 import numpy as np
 
-from ..engine.graphs.bank_ddm import create_bank_graph
+from ..engine.calculation_plan import CalculationPlan
+from ..engine.core import CalculationGraph
+from ..engine.dcf_kernels import (
+    KernelDtype,
+    guard_terminal_growth,
+    resolve_dcf_kernel_dtype,
+)
+from ..engine.graphs.bank_ddm import calculate_cost_of_equity, create_bank_graph
 from ..engine.monte_carlo import (
     CorrelationGroup,
     DistributionSpec,
     MonteCarloConfig,
     MonteCarloEngine,
 )
+from ..engine.monte_carlo_parallel_service import resolve_monte_carlo_workers
+from ..engine.monte_carlo_precision_service import (
+    resolve_monte_carlo_convergence_mode,
+    resolve_monte_carlo_quantile_precision,
+)
+from ..engine.monte_carlo_sketch_service import resolve_monte_carlo_summary_backend
 from ..models.bank.contracts import BankParams
 from .calculator_runtime_support import (
     apply_trace_inputs,
@@ -17,8 +31,63 @@ from .calculator_runtime_support import (
 )
 
 
+@dataclass(frozen=True)
+class _BankBatchEvaluator:
+    plan: CalculationPlan
+    static_plan_inputs: Mapping[str, object]
+    base_growth_rates: np.ndarray
+    growth_lower: np.ndarray
+    growth_upper: np.ndarray
+    initial_net_income: float
+    provision_denominator: float
+    beta: float
+    market_risk_premium: float
+    cost_of_equity_override: float | None
+    kernel_dtype: KernelDtype = "float64"
+
+    def __call__(
+        self, sampled_batch: dict[str, np.ndarray], _base_numeric: Mapping[str, float]
+    ) -> np.ndarray:
+        provision_rate = np.asarray(sampled_batch["provision_rate"], dtype=float)
+        income_growth_shock = np.asarray(
+            sampled_batch["income_growth_shock"], dtype=float
+        )
+        sampled_risk_free = np.asarray(sampled_batch["risk_free_rate"], dtype=float)
+        sampled_terminal = np.asarray(sampled_batch["terminal_growth"], dtype=float)
+
+        provision_multiplier = (1.0 - provision_rate) / self.provision_denominator
+        growth_rates = np.clip(
+            self.base_growth_rates[np.newaxis, :] + income_growth_shock[:, np.newaxis],
+            self.growth_lower,
+            self.growth_upper,
+        )
+        cost_of_equity = np.broadcast_to(
+            calculate_cost_of_equity(
+                sampled_risk_free,
+                self.beta,
+                self.market_risk_premium,
+                self.cost_of_equity_override,
+            ),
+            sampled_risk_free.shape,
+        )
+        results = self.plan.calculate_batch(
+            {
+                **self.static_plan_inputs,
+                "initial_net_income": self.initial_net_income * provision_multiplier,
+                "income_growth_rates": growth_rates,
+                "cost_of_equity": cost_of_equity,
+                "terminal_growth": guard_terminal_growth(
+                    sampled_terminal, cost_of_equity, spread=0.001
+                ),
+            },
+            dtype=self.kernel_dtype,
+        )
+        return np.asarray(results["intrinsic_value"], dtype=float)
+
+
 def _run_bank_monte_carlo(
     *,
+    graph: CalculationGraph,
     base_inputs: dict[str, float | list[float] | None],
     params: BankParams,
 ) -> dict[str, object]:
@@ -26,6 +95,10 @@ def _run_bank_monte_carlo(
         iterations=params.monte_carlo_iterations,
         seed=params.monte_carlo_seed,
         sampler_type=params.monte_carlo_sampler,
+        workers=resolve_monte_carlo_workers(),
+        summary_backend=resolve_monte_carlo_summary_backend(),
+        convergence_mode=resolve_monte_carlo_convergence_mode(),
+        quantile_precision_target=resolve_monte_carlo_quantile_precision(),
     )
     engine = MonteCarloEngine(config=config)
 
@@ -78,75 +151,49 @@ def _run_bank_monte_carlo(
 
     base_growth_rates = np.asarray(base_inputs["income_growth_rates"], dtype=float)
     initial_net_income = float(params.initial_net_income)
-    rwa_intensity = float(base_inputs["rwa_intensity"])
-    tier1_target_ratio = float(base_inputs["tier1_target_ratio"])
-    initial_capital = float(base_inputs["initial_capital"])
-    beta = float(base_inputs["beta"])
-    market_risk_premium = float(base_inputs["market_risk_premium"])
-    shares_outstanding = float(base_inputs["shares_outstanding"])
     provision_rate_mean = float(params.provision_rate_mean)
     provision_denominator = max(1.0 - provision_rate_mean, 1e-6)
+    static_plan_inputs: dict[str, object] = {
+        "rwa_intensity": float(base_inputs["rwa_intensity"]),
+        "tier1_target_ratio": float(base_inputs["tier1_target_ratio"]),
+        "initial_capital": float(base_inputs["initial_capital"]),
+        "shares_outstanding": float(base_inputs["shares_outstanding"]),
+    }
+    beta = float(base_inputs["beta"])
+    market_risk_premium = float(base_inputs["market_risk_premium"])
     use_override = (
         params.cost_of_equity_strategy == "override"
         and params.cost_of_equity_override is not None
     )
-    override_cost = float(params.cost_of_equity_override or 0.0)
-    projection_years = base_growth_rates.shape[0]
-    discount_years = np.arange(1, projection_years + 1, dtype=float)
-
-    def batch_evaluate(
-        sampled_batch: dict[str, np.ndarray], _base_numeric: Mapping[str, float]
-    ) -> np.ndarray:
-        provision_rate = np.asarray(sampled_batch["provision_rate"], dtype=float)
-        income_growth_shock = np.asarray(
-            sampled_batch["income_growth_shock"], dtype=float
-        )
-        sampled_risk_free = np.asarray(sampled_batch["risk_free_rate"], dtype=float)
-        sampled_terminal = np.asarray(sampled_batch["terminal_growth"], dtype=float)
-
-        batch_size = provision_rate.shape[0]
+    cost_of_equity_override = (
+        float(params.cost_of_equity_override) if use_override else None
+    )
+    # cost_of_equity is resolved ahead of the plan because the terminal growth
+    # guard depends on it; the plan then evaluates dividends and PV nodes.
+    plan = graph.compile(
+        inputs=(
+            *static_plan_inputs,
+            "initial_net_income",
+            "income_growth_rates",
+            "cost_of_equity",
+            "terminal_growth",
+        ),
+        outputs=("intrinsic_value",),
+    )
 
-        provision_multiplier = (1.0 - provision_rate) / provision_denominator
-        adjusted_initial_income = initial_net_income * provision_multiplier
-        growth_base = base_growth_rates[np.newaxis, :]
-        growth_lower = growth_base - 0.30
-        growth_upper = growth_base + 0.30
-        growth_rates = np.clip(
-            growth_base + income_growth_shock[:, np.newaxis],
-            growth_lower,
-            growth_upper,
-        )
-        net_income = np.empty((batch_size, projection_years), dtype=float)
-        income_level = adjusted_initial_income.copy()
-        for year_idx in range(projection_years):
-            income_level *= 1.0 + growth_rates[:, year_idx]
-            net_income[:, year_idx] = income_level
-
-        rwa = net_income / rwa_intensity
-        required_capital = rwa * tier1_target_ratio
-        previous_capital = np.empty_like(required_capital)
-        previous_capital[:, 0] = initial_capital
-        previous_capital[:, 1:] = required_capital[:, :-1]
-        delta_capital = required_capital - previous_capital
-        dividends = net_income - delta_capital
-
-        if use_override:
-            cost_of_equity = np.full(batch_size, override_cost, dtype=float)
-        else:
-            cost_of_equity = sampled_risk_free + (beta * market_risk_premium)
-        terminal_growth = np.minimum(sampled_terminal, cost_of_equity - 0.001)
-
-        discount_curve = np.power(
-            1.0 + cost_of_equity[:, np.newaxis], discount_years[np.newaxis, :]
-        )
-        pv_dividends = np.sum(dividends / discount_curve, axis=1)
-        last_dividend = dividends[:, -1]
-        terminal_value = (
-            last_dividend * (1.0 + terminal_growth) / (cost_of_equity - terminal_growth)
-        )
-        pv_terminal = terminal_value / np.power(1.0 + cost_of_equity, projection_years)
-        equity_value = pv_dividends + pv_terminal
-        return equity_value / shares_outstanding
+    batch_evaluate = _BankBatchEvaluator(
+        plan=plan,
+        static_plan_inputs=static_plan_inputs,
+        base_growth_rates=base_growth_rates,
+        growth_lower=base_growth_rates - 0.30,
+        growth_upper=base_growth_rates + 0.30,
+        initial_net_income=initial_net_income,
+        provision_denominator=provision_denominator,
+        beta=beta,
+        market_risk_premium=market_risk_premium,
+        cost_of_equity_override=cost_of_equity_override,
+        kernel_dtype=resolve_dcf_kernel_dtype(),
+    )
 
     base_case_inputs = {
         key: np.asarray([value], dtype=float)
@@ -222,14 +269,16 @@ def calculate_bank_valuation(
 
     try:
         inputs = apply_trace_inputs(raw_inputs, params.trace_inputs)
-        results = graph.calculate(inputs, trace=True)
+        trace = graph.calculate_compact(inputs)
+        results = trace.raw_values()
         intrinsic_value = float(
             unwrap_traceable_value(results.get("intrinsic_value", 0.0))
         )
         upside = compute_upside(intrinsic_value, params.current_price)
-        details: dict[str, object] = {"trace": results}
+        details: dict[str, object] = {"trace": trace}
         if params.monte_carlo_iterations > 0:
             details["distribution_summary"] = _run_bank_monte_carlo(
+                graph=graph,
                 # MC evaluator expects numeric/list values (not TraceableField wrappers).
                 base_inputs=raw_inputs,
                 params=params,
@@ -246,7 +295,7 @@ def calculate_bank_valuation(
             ),
             "shares_outstanding_used": params.shares_outstanding,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
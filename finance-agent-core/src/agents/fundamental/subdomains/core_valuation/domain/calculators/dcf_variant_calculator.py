@@ -18,6 +18,7 @@ from .dcf_variant_result_service import (
     build_dcf_variant_static_inputs,
     extract_dcf_variant_converged_inputs,
 )
+from .dcf_variant_sensitivity_contracts import DcfSensitivitySurfaceSpec
 from .dcf_variant_sensitivity_service import run_dcf_variant_sensitivity
 from .dcf_variant_validation_service import validate_dcf_variant_projection_lengths
 
@@ -39,7 +40,8 @@ def calculate_dcf_variant_valuation(
             build_dcf_variant_raw_inputs(params),
             params.trace_inputs,
         )
-        results = graph.calculate(inputs, trace=True)
+        trace = graph.calculate_compact(inputs)
+        results = trace.raw_values()
 
         intrinsic_value = float(
             unwrap_traceable_value(results.get("intrinsic_value", 0.0))
@@ -64,6 +66,7 @@ def calculate_dcf_variant_valuation(
 
         if params.monte_carlo_iterations > 0:
             details["distribution_summary"] = run_dcf_variant_monte_carlo(
+                graph=graph,
                 params=params,
                 converged_inputs=converged_inputs,
                 static_inputs=static_inputs,
@@ -81,7 +84,7 @@ def calculate_dcf_variant_valuation(
             "intrinsic_value": intrinsic_value,
             "upside_potential": upside,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
@@ -105,6 +108,7 @@ def _attach_dcf_variant_sensitivity(
             base_wacc=float(wacc),
             base_terminal_growth=float(terminal_growth),
             policy=policy,
+            surface_spec=DcfSensitivitySurfaceSpec(),
         )
     except Exception as exc:  # noqa: BLE001
         details["sensitivity_summary"] = {
@@ -122,6 +126,7 @@ def _attach_dcf_variant_sensitivity(
         "top_drivers": sensitivity["top_drivers"],
     }
     details["sensitivity_cases"] = sensitivity["cases"]
+    details["sensitivity_surface"] = sensitivity["surface"]
 
 
 __all__ = [
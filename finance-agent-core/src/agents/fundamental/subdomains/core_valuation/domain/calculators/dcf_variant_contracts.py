@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Protocol
 
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.calculation_plan import (
+    CalculationPlan,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.compact_trace import (
+    CompactTrace,
+)
 from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.types import (
     TraceInput,
 )
@@ -16,6 +22,17 @@ class DcfGraph(Protocol):
         trace: bool = False,
     ) -> dict[str, object]: ...
 
+    def calculate_compact(
+        self,
+        inputs: dict[str, object],
+    ) -> CompactTrace: ...
+
+    def compile(
+        self,
+        inputs: Iterable[str] | None = None,
+        outputs: Iterable[str] | None = None,
+    ) -> CalculationPlan: ...
+
 
 class DcfVariantParams(Protocol):
     ticker: str
@@ -60,6 +77,8 @@ class DcfMonteCarloPolicy:
     wacc_max: float
     terminal_min: float
     terminal_max: float
+    antithetic: bool = False
+    control_variate: bool = False
 
 
 DcfGraphFactory = Callable[[], DcfGraph]
@@ -1,20 +1,75 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 
 import numpy as np
 
+from ..engine.calculation_plan import CalculationPlan
+from ..engine.dcf_kernels import KernelDtype, resolve_dcf_kernel_dtype
 from ..engine.monte_carlo import (
     CorrelationGroup,
     DistributionSpec,
     MonteCarloConfig,
     MonteCarloEngine,
 )
-from .dcf_variant_contracts import DcfMonteCarloPolicy, DcfVariantParams
+from ..engine.monte_carlo_parallel_service import resolve_monte_carlo_workers
+from ..engine.monte_carlo_precision_service import (
+    resolve_monte_carlo_convergence_mode,
+    resolve_monte_carlo_quantile_precision,
+)
+from ..engine.monte_carlo_sketch_service import resolve_monte_carlo_summary_backend
+from .dcf_variant_contracts import DcfGraph, DcfMonteCarloPolicy, DcfVariantParams
+
+
+@dataclass(frozen=True)
+class _DcfVariantBatchEvaluator:
+    plan: CalculationPlan
+    static_plan_inputs: Mapping[str, object]
+    base_growth: np.ndarray
+    base_margin: np.ndarray
+    growth_lower: np.ndarray
+    growth_upper: np.ndarray
+    margin_lower: np.ndarray
+    margin_upper: np.ndarray
+    kernel_dtype: KernelDtype = "float64"
+
+    def __call__(
+        self,
+        sampled_batch: dict[str, np.ndarray],
+        _base: Mapping[str, float],
+    ) -> np.ndarray:
+        growth_shock = np.asarray(sampled_batch["growth_shock"], dtype=float)
+        margin_shock = np.asarray(sampled_batch["margin_shock"], dtype=float)
+
+        growth_rates = np.clip(
+            self.base_growth[np.newaxis, :] + growth_shock[:, np.newaxis],
+            self.growth_lower,
+            self.growth_upper,
+        )
+        margins = np.clip(
+            self.base_margin[np.newaxis, :] + margin_shock[:, np.newaxis],
+            self.margin_lower,
+            self.margin_upper,
+        )
+        results = self.plan.calculate_batch(
+            {
+                **self.static_plan_inputs,
+                "growth_rates_converged": growth_rates,
+                "operating_margins_converged": margins,
+                "wacc": np.asarray(sampled_batch["wacc"], dtype=float),
+                "terminal_growth": np.asarray(
+                    sampled_batch["terminal_growth"], dtype=float
+                ),
+            },
+            dtype=self.kernel_dtype,
+        )
+        return np.asarray(results["intrinsic_value"], dtype=float)
 
 
 def run_dcf_variant_monte_carlo(
     *,
+    graph: DcfGraph,
     params: DcfVariantParams,
     converged_inputs: Mapping[str, list[float]],
     static_inputs: Mapping[str, float],
@@ -24,6 +79,12 @@ def run_dcf_variant_monte_carlo(
         iterations=params.monte_carlo_iterations,
         seed=params.monte_carlo_seed,
         sampler_type=params.monte_carlo_sampler,
+        workers=resolve_monte_carlo_workers(),
+        summary_backend=resolve_monte_carlo_summary_backend(),
+        convergence_mode=resolve_monte_carlo_convergence_mode(),
+        quantile_precision_target=resolve_monte_carlo_quantile_precision(),
+        antithetic=policy.antithetic,
+        control_variate=policy.control_variate,
     )
     engine = MonteCarloEngine(config=config)
 
@@ -89,76 +150,47 @@ def run_dcf_variant_monte_carlo(
     base_margin = np.asarray(
         converged_inputs["operating_margins_converged"], dtype=float
     )
-    da_rates = np.asarray(converged_inputs["da_rates_converged"], dtype=float)
-    capex_rates = np.asarray(converged_inputs["capex_rates_converged"], dtype=float)
-    wc_rates = np.asarray(converged_inputs["wc_rates_converged"], dtype=float)
-
-    initial_revenue = static_inputs["initial_revenue"]
-    tax_rate = static_inputs["tax_rate"]
-    cash = static_inputs["cash"]
-    total_debt = static_inputs["total_debt"]
-    preferred_stock = static_inputs["preferred_stock"]
-    shares_outstanding = static_inputs["shares_outstanding"]
-    years = base_growth.shape[0]
-    discount_years = np.arange(1, years + 1, dtype=float)
-
-    def batch_evaluate(
-        sampled_batch: dict[str, np.ndarray],
-        _base: Mapping[str, float],
-    ) -> np.ndarray:
-        growth_shock = np.asarray(sampled_batch["growth_shock"], dtype=float)
-        margin_shock = np.asarray(sampled_batch["margin_shock"], dtype=float)
-        wacc = np.asarray(sampled_batch["wacc"], dtype=float)
-        sampled_terminal = np.asarray(sampled_batch["terminal_growth"], dtype=float)
-        terminal_growth = np.minimum(sampled_terminal, wacc - 0.005)
-
-        batch_size = growth_shock.shape[0]
-
-        growth_base = base_growth[np.newaxis, :]
-        margin_base = base_margin[np.newaxis, :]
-        growth_lower = growth_base + policy.growth_clip_min
-        growth_upper = growth_base + policy.growth_clip_max
-        margin_lower = margin_base + policy.margin_clip_min
-        margin_upper = margin_base + policy.margin_clip_max
-
-        growth_rates = np.clip(
-            growth_base + growth_shock[:, np.newaxis],
-            growth_lower,
-            growth_upper,
-        )
-        margins = np.clip(
-            margin_base + margin_shock[:, np.newaxis],
-            margin_lower,
-            margin_upper,
-        )
-
-        projected_revenue = np.empty((batch_size, years), dtype=float)
-        revenue_level = np.full(batch_size, initial_revenue, dtype=float)
-        for index in range(years):
-            revenue_level *= 1.0 + growth_rates[:, index]
-            projected_revenue[:, index] = revenue_level
-
-        ebit = projected_revenue * margins
-        nopat = ebit * (1.0 - tax_rate)
-        da = projected_revenue * da_rates[np.newaxis, :]
-        capex = projected_revenue * capex_rates[np.newaxis, :]
-        previous_revenue = np.empty_like(projected_revenue)
-        previous_revenue[:, 0] = initial_revenue
-        previous_revenue[:, 1:] = projected_revenue[:, :-1]
-        delta_wc = (projected_revenue - previous_revenue) * wc_rates[np.newaxis, :]
-        fcff = nopat + da - capex - delta_wc
-
-        discount_curve = np.power(
-            1.0 + wacc[:, np.newaxis], discount_years[np.newaxis, :]
-        )
-        pv_fcff = np.sum(fcff / discount_curve, axis=1)
-        final_fcff = fcff[:, -1]
-        terminal_value = final_fcff * (1.0 + terminal_growth) / (wacc - terminal_growth)
-        pv_terminal = terminal_value / np.power(1.0 + wacc, years)
+    static_plan_inputs: dict[str, object] = {
+        "da_rates_converged": np.asarray(
+            converged_inputs["da_rates_converged"], dtype=float
+        ),
+        "capex_rates_converged": np.asarray(
+            converged_inputs["capex_rates_converged"], dtype=float
+        ),
+        "wc_rates_converged": np.asarray(
+            converged_inputs["wc_rates_converged"], dtype=float
+        ),
+        "sbc_rates_converged": np.asarray(
+            converged_inputs["sbc_rates_converged"], dtype=float
+        ),
+        "projection_years": base_growth.shape[0],
+        **{key: float(value) for key, value in static_inputs.items()},
+    }
+    # Shocked series enter the graph post-convergence, so the plan skips the
+    # converge_* nodes and evaluates the same projection/discount nodes as the
+    # deterministic valuation.
+    plan = graph.compile(
+        inputs=(
+            *static_plan_inputs,
+            "growth_rates_converged",
+            "operating_margins_converged",
+            "wacc",
+            "terminal_growth",
+        ),
+        outputs=("intrinsic_value",),
+    )
 
-        enterprise_value = pv_fcff + pv_terminal
-        equity_value = enterprise_value + cash - total_debt - preferred_stock
-        return equity_value / shares_outstanding
+    batch_evaluate = _DcfVariantBatchEvaluator(
+        plan=plan,
+        static_plan_inputs=static_plan_inputs,
+        base_growth=base_growth,
+        base_margin=base_margin,
+        growth_lower=base_growth + policy.growth_clip_min,
+        growth_upper=base_growth + policy.growth_clip_max,
+        margin_lower=base_margin + policy.margin_clip_min,
+        margin_upper=base_margin + policy.margin_clip_max,
+        kernel_dtype=resolve_dcf_kernel_dtype(),
+    )
 
     base_case_inputs = {
         key: np.asarray([value], dtype=float)
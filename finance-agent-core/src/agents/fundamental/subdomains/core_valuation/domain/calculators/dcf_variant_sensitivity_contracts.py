@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Literal, TypedDict
 
 ShockDimension = Literal[
@@ -19,6 +20,46 @@ class DcfSensitivityCase(TypedDict):
     guard_applied: bool
 
 
+@dataclass(frozen=True)
+class DcfSensitivitySurfaceSpec:
+    wacc_shocks_bp: tuple[int, ...] = (-200, -150, -100, -50, 0, 50, 100, 150, 200)
+    terminal_growth_shocks_bp: tuple[int, ...] = (
+        -100,
+        -75,
+        -50,
+        -25,
+        0,
+        25,
+        50,
+        75,
+        100,
+    )
+    # Empty level axes keep the surface 2-D; set either for a 3-D/4-D grid.
+    growth_level_shocks_bp: tuple[int, ...] = ()
+    margin_level_shocks_bp: tuple[int, ...] = ()
+
+
+class DcfSensitivitySurfaceAxis(TypedDict):
+    dimension: ShockDimension
+    shock_values_bp: list[int]
+    # Absolute rates after policy clamps (wacc/terminal_growth); level shocks
+    # shift whole series, so they have no single absolute value.
+    values: list[float] | None
+
+
+class DcfSensitivitySurface(TypedDict):
+    axes: list[DcfSensitivitySurfaceAxis]
+    shape: list[int]
+    point_count: int
+    # Nested lists indexed in `axes` order.
+    intrinsic_values: list[object]
+    delta_pct_vs_base: list[object]
+    # Terminal guard depends only on (wacc, terminal_growth).
+    guard_applied: list[list[bool]]
+    max_upside_delta_pct: float
+    max_downside_delta_pct: float
+
+
 class DcfSensitivitySummary(TypedDict):
     base_intrinsic_value: float
     scenario_count: int
@@ -26,3 +67,4 @@ class DcfSensitivitySummary(TypedDict):
     max_downside_delta_pct: float
     top_drivers: list[DcfSensitivityCase]
     cases: list[DcfSensitivityCase]
+    surface: DcfSensitivitySurface | None
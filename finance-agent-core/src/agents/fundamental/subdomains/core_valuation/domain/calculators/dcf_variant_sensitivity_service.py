@@ -2,10 +2,21 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
+import numpy as np
+
+from ..engine.dcf_kernels import (
+    compound_levels,
+    discount_curve,
+    guard_terminal_growth,
+    lag_series,
+)
 from .dcf_variant_contracts import DcfMonteCarloPolicy
 from .dcf_variant_sensitivity_contracts import (
     DcfSensitivityCase,
     DcfSensitivitySummary,
+    DcfSensitivitySurface,
+    DcfSensitivitySurfaceAxis,
+    DcfSensitivitySurfaceSpec,
     ShockDimension,
 )
 
@@ -29,6 +40,7 @@ def run_dcf_variant_sensitivity(
     base_wacc: float,
     base_terminal_growth: float,
     policy: DcfMonteCarloPolicy,
+    surface_spec: DcfSensitivitySurfaceSpec | None = None,
 ) -> DcfSensitivitySummary:
     growth_rates = _require_series(converged_inputs, "growth_rates_converged")
     operating_margins = _require_series(converged_inputs, "operating_margins_converged")
@@ -148,6 +160,27 @@ def run_dcf_variant_sensitivity(
     )
     top_drivers = ranked[:_TOP_DRIVER_COUNT]
 
+    surface: DcfSensitivitySurface | None = None
+    if surface_spec is not None:
+        surface = _build_sensitivity_surface(
+            spec=surface_spec,
+            base_intrinsic_value=base_intrinsic_value,
+            growth_rates=growth_rates,
+            operating_margins=operating_margins,
+            da_rates=da_rates,
+            capex_rates=capex_rates,
+            wc_rates=wc_rates,
+            initial_revenue=initial_revenue,
+            tax_rate=tax_rate,
+            cash=cash,
+            total_debt=total_debt,
+            preferred_stock=preferred_stock,
+            shares_outstanding=shares_outstanding,
+            base_wacc=base_wacc,
+            base_terminal_growth=base_terminal_growth,
+            policy=policy,
+        )
+
     return {
         "base_intrinsic_value": float(base_intrinsic_value),
         "scenario_count": len(scenarios),
@@ -155,6 +188,122 @@ def run_dcf_variant_sensitivity(
         "max_downside_delta_pct": max_downside,
         "top_drivers": top_drivers,
         "cases": scenarios,
+        "surface": surface,
+    }
+
+
+def _build_sensitivity_surface(
+    *,
+    spec: DcfSensitivitySurfaceSpec,
+    base_intrinsic_value: float,
+    growth_rates: list[float],
+    operating_margins: list[float],
+    da_rates: list[float],
+    capex_rates: list[float],
+    wc_rates: list[float],
+    initial_revenue: float,
+    tax_rate: float,
+    cash: float,
+    total_debt: float,
+    preferred_stock: float,
+    shares_outstanding: float,
+    base_wacc: float,
+    base_terminal_growth: float,
+    policy: DcfMonteCarloPolicy,
+) -> DcfSensitivitySurface:
+    if not spec.wacc_shocks_bp or not spec.terminal_growth_shocks_bp:
+        raise ValueError("sensitivity surface requires wacc and terminal axes")
+    wacc_values = np.clip(
+        base_wacc + _bp_to_rates(spec.wacc_shocks_bp),
+        policy.wacc_min,
+        policy.wacc_max,
+    )
+    terminal_values = np.clip(
+        base_terminal_growth + _bp_to_rates(spec.terminal_growth_shocks_bp),
+        policy.terminal_min,
+        policy.terminal_max,
+    )
+    terminal_grid, guard_grid = _guard_terminal_growth_grid(
+        wacc=wacc_values,
+        terminal_growth=terminal_values,
+        policy=policy,
+    )
+    growth_shocks = spec.growth_level_shocks_bp or (0,)
+    margin_shocks = spec.margin_level_shocks_bp or (0,)
+    shocked_growth = np.clip(
+        np.asarray(growth_rates)[np.newaxis, :]
+        + _bp_to_rates(growth_shocks)[:, np.newaxis],
+        _GROWTH_FLOOR,
+        _GROWTH_CEIL,
+    )
+    shocked_margins = np.clip(
+        np.asarray(operating_margins)[np.newaxis, :]
+        + _bp_to_rates(margin_shocks)[:, np.newaxis],
+        _MARGIN_FLOOR,
+        _MARGIN_CEIL,
+    )
+
+    # One broadcast pass over (wacc, terminal_growth, growth, margin).
+    intrinsic_grid = _evaluate_intrinsic_value_grid(
+        growth_rates=shocked_growth,
+        operating_margins=shocked_margins,
+        da_rates=np.asarray(da_rates),
+        capex_rates=np.asarray(capex_rates),
+        wc_rates=np.asarray(wc_rates),
+        initial_revenue=initial_revenue,
+        tax_rate=tax_rate,
+        wacc=wacc_values,
+        terminal_growth=terminal_grid,
+        cash=cash,
+        total_debt=total_debt,
+        preferred_stock=preferred_stock,
+        shares_outstanding=shares_outstanding,
+    )
+
+    axes: list[DcfSensitivitySurfaceAxis] = [
+        {
+            "dimension": "wacc",
+            "shock_values_bp": list(spec.wacc_shocks_bp),
+            "values": [float(value) for value in wacc_values],
+        },
+        {
+            "dimension": "terminal_growth",
+            "shock_values_bp": list(spec.terminal_growth_shocks_bp),
+            "values": [float(value) for value in terminal_values],
+        },
+    ]
+    shape = [len(spec.wacc_shocks_bp), len(spec.terminal_growth_shocks_bp)]
+    if spec.growth_level_shocks_bp:
+        axes.append(
+            {
+                "dimension": "growth_level",
+                "shock_values_bp": list(spec.growth_level_shocks_bp),
+                "values": None,
+            }
+        )
+        shape.append(len(spec.growth_level_shocks_bp))
+    if spec.margin_level_shocks_bp:
+        axes.append(
+            {
+                "dimension": "margin_level",
+                "shock_values_bp": list(spec.margin_level_shocks_bp),
+                "values": None,
+            }
+        )
+        shape.append(len(spec.margin_level_shocks_bp))
+
+    intrinsic_grid = intrinsic_grid.reshape(shape)
+    denominator = abs(base_intrinsic_value) if abs(base_intrinsic_value) > 1e-9 else 1.0
+    delta_grid = (intrinsic_grid - base_intrinsic_value) / denominator
+    return {
+        "axes": axes,
+        "shape": shape,
+        "point_count": int(intrinsic_grid.size),
+        "intrinsic_values": intrinsic_grid.tolist(),
+        "delta_pct_vs_base": delta_grid.tolist(),
+        "guard_applied": guard_grid.tolist(),
+        "max_upside_delta_pct": max(float(np.max(delta_grid)), 0.0),
+        "max_downside_delta_pct": min(float(np.min(delta_grid)), 0.0),
     }
 
 
@@ -411,34 +560,80 @@ def _evaluate_intrinsic_value(
     preferred_stock: float,
     shares_outstanding: float,
 ) -> float:
-    years = len(growth_rates)
-    projected_revenue: list[float] = []
-    revenue = float(initial_revenue)
-    for growth_rate in growth_rates:
-        revenue *= 1.0 + growth_rate
-        projected_revenue.append(revenue)
-
-    fcff: list[float] = []
-    previous_revenue = float(initial_revenue)
-    for index in range(years):
-        current_revenue = projected_revenue[index]
-        ebit = current_revenue * operating_margins[index]
-        nopat = ebit * (1.0 - tax_rate)
-        da = current_revenue * da_rates[index]
-        capex = current_revenue * capex_rates[index]
-        delta_wc = (current_revenue - previous_revenue) * wc_rates[index]
-        fcff.append(nopat + da - capex - delta_wc)
-        previous_revenue = current_revenue
-
-    pv_fcff = 0.0
-    for index, cash_flow in enumerate(fcff, start=1):
-        pv_fcff += cash_flow / ((1.0 + wacc) ** index)
-
-    final_fcff = fcff[-1]
-    terminal_value = final_fcff * (1.0 + terminal_growth) / (wacc - terminal_growth)
-    pv_terminal = terminal_value / ((1.0 + wacc) ** years)
-
-    enterprise_value = pv_fcff + pv_terminal
+    intrinsic_grid = _evaluate_intrinsic_value_grid(
+        growth_rates=np.asarray([growth_rates], dtype=float),
+        operating_margins=np.asarray([operating_margins], dtype=float),
+        da_rates=np.asarray(da_rates, dtype=float),
+        capex_rates=np.asarray(capex_rates, dtype=float),
+        wc_rates=np.asarray(wc_rates, dtype=float),
+        initial_revenue=initial_revenue,
+        tax_rate=tax_rate,
+        wacc=np.asarray([wacc], dtype=float),
+        terminal_growth=np.asarray([[terminal_growth]], dtype=float),
+        cash=cash,
+        total_debt=total_debt,
+        preferred_stock=preferred_stock,
+        shares_outstanding=shares_outstanding,
+    )
+    return float(intrinsic_grid[0, 0, 0, 0])
+
+
+def _evaluate_intrinsic_value_grid(
+    *,
+    growth_rates: np.ndarray,
+    operating_margins: np.ndarray,
+    da_rates: np.ndarray,
+    capex_rates: np.ndarray,
+    wc_rates: np.ndarray,
+    initial_revenue: float,
+    tax_rate: float,
+    wacc: np.ndarray,
+    terminal_growth: np.ndarray,
+    cash: float,
+    total_debt: float,
+    preferred_stock: float,
+    shares_outstanding: float,
+) -> np.ndarray:
+    """
+    Intrinsic value per share on a (W, T, G, M) grid.
+    growth_rates is (G, Y), operating_margins (M, Y), wacc (W,) and
+    terminal_growth (W, T) since the terminal guard depends on wacc.
+    Projections are computed once per growth/margin scenario and only the
+    discounting broadcasts over the rate axes.
+    """
+    years = growth_rates.shape[-1]
+    projected_revenue = compound_levels(float(initial_revenue), growth_rates)
+    previous_revenue = lag_series(projected_revenue, float(initial_revenue))
+    # (G, M, Y): only EBIT depends on the margin scenario.
+    ebit = projected_revenue[:, np.newaxis, :] * operating_margins[np.newaxis, :, :]
+    nopat = ebit * (1.0 - tax_rate)
+    da = projected_revenue * da_rates
+    capex = projected_revenue * capex_rates
+    delta_wc = (projected_revenue - previous_revenue) * wc_rates
+    fcff = (
+        nopat
+        + da[:, np.newaxis, :]
+        - capex[:, np.newaxis, :]
+        - delta_wc[:, np.newaxis, :]
+    )
+
+    # (W, Y) discount curve, then (W, G, M) PV of explicit cash flows.
+    discount = discount_curve(wacc, years)
+    pv_fcff = np.einsum("gmy,wy->wgm", fcff, 1.0 / discount)
+
+    final_fcff = fcff[:, :, -1]
+    terminal_multiple = (1.0 + terminal_growth) / (
+        wacc[:, np.newaxis] - terminal_growth
+    )
+    terminal_value = (
+        final_fcff[np.newaxis, np.newaxis, :, :]
+        * terminal_multiple[:, :, np.newaxis, np.newaxis]
+    )
+    pv_terminal = (
+        terminal_value / discount[:, -1][:, np.newaxis, np.newaxis, np.newaxis]
+    )
+
+    enterprise_value = pv_fcff[:, np.newaxis, :, :] + pv_terminal
     equity_value = enterprise_value + cash - total_debt - preferred_stock
     return equity_value / shares_outstanding
 
@@ -470,12 +665,36 @@ def _guard_terminal_growth(
     terminal_growth: float,
     policy: DcfMonteCarloPolicy,
 ) -> tuple[float, bool]:
-    guarded = _clamp(terminal_growth, policy.terminal_min, policy.terminal_max)
-    max_allowed = wacc - _TERMINAL_BUFFER
-    if guarded <= max_allowed:
-        return guarded, False
-    adjusted = _clamp(max_allowed, policy.terminal_min, policy.terminal_max)
-    return adjusted, True
+    guarded, guard_applied = _guard_terminal_growth_grid(
+        wacc=np.asarray([wacc], dtype=float),
+        terminal_growth=np.asarray([terminal_growth], dtype=float),
+        policy=policy,
+    )
+    return float(guarded[0, 0]), bool(guard_applied[0, 0])
+
+
+def _guard_terminal_growth_grid(
+    *,
+    wacc: np.ndarray,
+    terminal_growth: np.ndarray,
+    policy: DcfMonteCarloPolicy,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (wacc, terminal) grid of guarded terminal growth through the shared DCF
+    kernel guard. Policy bounds still win over the WACC buffer, so a rate
+    pushed below the floor by a low WACC is clipped back to the floor.
+    """
+    bounded = np.clip(terminal_growth, policy.terminal_min, policy.terminal_max)[
+        np.newaxis, :
+    ]
+    limited = guard_terminal_growth(
+        bounded, wacc[:, np.newaxis], spread=_TERMINAL_BUFFER
+    )
+    guard_applied = limited < bounded
+    return (
+        np.clip(limited, policy.terminal_min, policy.terminal_max),
+        guard_applied,
+    )
 
 
 def _pct_delta(*, base_value: float, shifted_value: float) -> float:
@@ -487,6 +706,10 @@ def _bp_to_rate(shock_bp: int) -> float:
     return float(shock_bp) / 10_000.0
 
 
+def _bp_to_rates(shocks_bp: tuple[int, ...]) -> np.ndarray:
+    return np.asarray(shocks_bp, dtype=float) / 10_000.0
+
+
 def _require_series(payload: Mapping[str, list[float]], key: str) -> list[float]:
     value = payload.get(key)
     if not isinstance(value, list) or not value:
@@ -43,7 +43,8 @@ def calculate_ev_multiple_variant_valuation(
 
     try:
         traced_inputs = apply_trace_inputs(inputs, params.trace_inputs)
-        results = graph.calculate(traced_inputs, trace=True)
+        trace = graph.calculate_compact(traced_inputs)
+        results = trace.raw_values()
         intrinsic_value = float(
             unwrap_traceable_value(results.get("intrinsic_value", 0.0))
         )
@@ -65,7 +66,7 @@ def calculate_ev_multiple_variant_valuation(
             "intrinsic_value": intrinsic_value,
             "upside_potential": upside,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
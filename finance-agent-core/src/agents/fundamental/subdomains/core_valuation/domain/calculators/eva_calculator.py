@@ -34,7 +34,8 @@ def calculate_eva_valuation(
 
     try:
         inputs = apply_trace_inputs(inputs, params.trace_inputs)
-        results = graph.calculate(inputs, trace=True)
+        trace = graph.calculate_compact(inputs)
+        results = trace.raw_values()
         intrinsic_value = float(
             unwrap_traceable_value(results.get("intrinsic_value", 0.0))
         )
@@ -61,7 +62,7 @@ def calculate_eva_valuation(
             "intrinsic_value": intrinsic_value,
             "upside_potential": upside,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
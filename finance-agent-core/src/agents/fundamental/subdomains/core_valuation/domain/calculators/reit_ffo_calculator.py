@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Literal, Protocol
 
 import numpy as np
@@ -9,6 +10,7 @@ from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.ty
     TraceInput,
 )
 
+from ..engine.dcf_kernels import KernelDtype, resolve_dcf_kernel_dtype
 from ..engine.graphs.reit_ffo import create_reit_ffo_graph
 from ..engine.monte_carlo import (
     CorrelationGroup,
@@ -16,6 +18,12 @@ from ..engine.monte_carlo import (
     MonteCarloConfig,
     MonteCarloEngine,
 )
+from ..engine.monte_carlo_parallel_service import resolve_monte_carlo_workers
+from ..engine.monte_carlo_precision_service import (
+    resolve_monte_carlo_convergence_mode,
+    resolve_monte_carlo_quantile_precision,
+)
+from ..engine.monte_carlo_sketch_service import resolve_monte_carlo_summary_backend
 from .calculator_runtime_support import (
     apply_trace_inputs,
     compute_upside,
@@ -45,6 +53,42 @@ class ReitFfoCalculatorParams(Protocol):
     corr_occupancy_cap_rate: float
 
 
+@dataclass(frozen=True)
+class _ReitBatchEvaluator:
+    base_ffo: float
+    depreciation_and_amortization: float
+    maintenance_capex_ratio: float
+    cash: float
+    total_debt: float
+    preferred_stock: float
+    shares_outstanding: float
+    occupancy_mode: float
+    kernel_dtype: KernelDtype = "float64"
+
+    def __call__(
+        self,
+        sampled_batch: dict[str, np.ndarray],
+        _base_numeric: Mapping[str, float],
+    ) -> np.ndarray:
+        occupancy_rate = np.asarray(
+            sampled_batch["occupancy_rate"], dtype=self.kernel_dtype
+        )
+        cap_rate = np.asarray(sampled_batch["cap_rate"], dtype=self.kernel_dtype)
+        cap_rate = np.maximum(cap_rate, 1e-6)
+        # Anchor Monte Carlo base case to deterministic valuation at occupancy mode.
+        occupancy_multiplier = occupancy_rate / self.occupancy_mode
+        ffo = self.base_ffo * occupancy_multiplier
+        maintenance_capex = (
+            self.depreciation_and_amortization * self.maintenance_capex_ratio
+        )
+        affo = ffo - maintenance_capex
+        enterprise_value = affo / cap_rate
+        equity_value = (
+            enterprise_value + self.cash - self.total_debt - self.preferred_stock
+        )
+        return np.asarray(equity_value / self.shares_outstanding, dtype=float)
+
+
 def _run_reit_monte_carlo(
     *,
     base_inputs: dict[str, float],
@@ -54,6 +98,10 @@ def _run_reit_monte_carlo(
         iterations=params.monte_carlo_iterations,
         seed=params.monte_carlo_seed,
         sampler_type=params.monte_carlo_sampler,
+        workers=resolve_monte_carlo_workers(),
+        summary_backend=resolve_monte_carlo_summary_backend(),
+        convergence_mode=resolve_monte_carlo_convergence_mode(),
+        quantile_precision_target=resolve_monte_carlo_quantile_precision(),
     )
     engine = MonteCarloEngine(config=config)
 
@@ -90,30 +138,19 @@ def _run_reit_monte_carlo(
         "cap_rate": base_cap_rate,
     }
 
-    base_ffo = float(base_inputs["ffo"])
-    depreciation_and_amortization = float(base_inputs["depreciation_and_amortization"])
-    maintenance_capex_ratio = float(base_inputs["maintenance_capex_ratio"])
-    cash = float(base_inputs["cash"])
-    total_debt = float(base_inputs["total_debt"])
-    preferred_stock = float(base_inputs["preferred_stock"])
-    shares_outstanding = float(base_inputs["shares_outstanding"])
-    occupancy_mode = max(float(params.occupancy_rate_mode), 1e-6)
-
-    def batch_evaluate(
-        sampled_batch: dict[str, np.ndarray],
-        _base_numeric: Mapping[str, float],
-    ) -> np.ndarray:
-        occupancy_rate = np.asarray(sampled_batch["occupancy_rate"], dtype=float)
-        cap_rate = np.asarray(sampled_batch["cap_rate"], dtype=float)
-        cap_rate = np.maximum(cap_rate, 1e-6)
-        # Anchor Monte Carlo base case to deterministic valuation at occupancy mode.
-        occupancy_multiplier = occupancy_rate / occupancy_mode
-        ffo = base_ffo * occupancy_multiplier
-        maintenance_capex = depreciation_and_amortization * maintenance_capex_ratio
-        affo = ffo - maintenance_capex
-        enterprise_value = affo / cap_rate
-        equity_value = enterprise_value + cash - total_debt - preferred_stock
-        return equity_value / shares_outstanding
+    batch_evaluate = _ReitBatchEvaluator(
+        base_ffo=float(base_inputs["ffo"]),
+        depreciation_and_amortization=float(
+            base_inputs["depreciation_and_amortization"]
+        ),
+        maintenance_capex_ratio=float(base_inputs["maintenance_capex_ratio"]),
+        cash=float(base_inputs["cash"]),
+        total_debt=float(base_inputs["total_debt"]),
+        preferred_stock=float(base_inputs["preferred_stock"]),
+        shares_outstanding=float(base_inputs["shares_outstanding"]),
+        occupancy_mode=max(float(params.occupancy_rate_mode), 1e-6),
+        kernel_dtype=resolve_dcf_kernel_dtype(),
+    )
 
     base_case_inputs = {
         key: np.asarray([value], dtype=float)
@@ -156,7 +193,8 @@ def calculate_reit_ffo_valuation(
 
     try:
         traced_inputs = apply_trace_inputs(raw_inputs, params.trace_inputs)
-        results = graph.calculate(traced_inputs, trace=True)
+        trace = graph.calculate_compact(traced_inputs)
+        results = trace.raw_values()
         intrinsic_value = float(
             unwrap_traceable_value(results.get("intrinsic_value", 0.0))
         )
@@ -188,7 +226,7 @@ def calculate_reit_ffo_valuation(
             "intrinsic_value": intrinsic_value,
             "upside_potential": upside,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
@@ -48,7 +48,8 @@ def calculate_residual_income_valuation(
 
     try:
         traced_inputs = apply_trace_inputs(inputs, params.trace_inputs)
-        results = graph.calculate(traced_inputs, trace=True)
+        trace = graph.calculate_compact(traced_inputs)
+        results = trace.raw_values()
         intrinsic_value = float(
             unwrap_traceable_value(results.get("intrinsic_value", 0.0))
         )
@@ -74,7 +75,7 @@ def calculate_residual_income_valuation(
             "intrinsic_value": intrinsic_value,
             "upside_potential": upside,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 
 import numpy as np
 
+from ..engine.calculation_plan import CalculationPlan
+from ..engine.core import CalculationGraph
+from ..engine.dcf_kernels import (
+    KernelDtype,
+    guard_terminal_growth,
+    resolve_dcf_kernel_dtype,
+)
 from ..engine.graphs.saas_fcff import create_saas_graph
 from ..engine.monte_carlo import (
     CorrelationGroup,
@@ -11,6 +19,12 @@ from ..engine.monte_carlo import (
     MonteCarloConfig,
     MonteCarloEngine,
 )
+from ..engine.monte_carlo_parallel_service import resolve_monte_carlo_workers
+from ..engine.monte_carlo_precision_service import (
+    resolve_monte_carlo_convergence_mode,
+    resolve_monte_carlo_quantile_precision,
+)
+from ..engine.monte_carlo_sketch_service import resolve_monte_carlo_summary_backend
 from ..models.saas.contracts import SaaSParams
 from .calculator_runtime_support import (
     apply_trace_inputs,
@@ -59,8 +73,53 @@ def _calculate_fcfe_valuation(
     }
 
 
+@dataclass(frozen=True)
+class _SaasBatchEvaluator:
+    plan: CalculationPlan
+    static_plan_inputs: Mapping[str, object]
+    base_growth_rates: np.ndarray
+    base_operating_margins: np.ndarray
+    growth_lower: np.ndarray
+    growth_upper: np.ndarray
+    margin_lower: np.ndarray
+    margin_upper: np.ndarray
+    kernel_dtype: KernelDtype = "float64"
+
+    def __call__(
+        self, sampled_batch: dict[str, np.ndarray], _base_numeric: Mapping[str, float]
+    ) -> np.ndarray:
+        growth_shock = np.asarray(sampled_batch["growth_shock"], dtype=float)
+        margin_shock = np.asarray(sampled_batch["margin_shock"], dtype=float)
+        wacc = np.asarray(sampled_batch["wacc"], dtype=float)
+        sampled_terminal = np.asarray(sampled_batch["terminal_growth"], dtype=float)
+        terminal_growth = guard_terminal_growth(sampled_terminal, wacc, spread=0.001)
+
+        growth_rates = np.clip(
+            self.base_growth_rates[np.newaxis, :] + growth_shock[:, np.newaxis],
+            self.growth_lower,
+            self.growth_upper,
+        )
+        operating_margins = np.clip(
+            self.base_operating_margins[np.newaxis, :] + margin_shock[:, np.newaxis],
+            self.margin_lower,
+            self.margin_upper,
+        )
+        results = self.plan.calculate_batch(
+            {
+                **self.static_plan_inputs,
+                "growth_rates": growth_rates,
+                "operating_margins": operating_margins,
+                "wacc": wacc,
+                "terminal_growth": terminal_growth,
+            },
+            dtype=self.kernel_dtype,
+        )
+        return np.asarray(results["intrinsic_value"], dtype=float)
+
+
 def _run_saas_monte_carlo(
     *,
+    graph: CalculationGraph,
     base_inputs: dict[str, float | list[float]],
     params: SaaSParams,
 ) -> dict[str, object]:
@@ -68,6 +127,12 @@ def _run_saas_monte_carlo(
         iterations=params.monte_carlo_iterations,
         seed=params.monte_carlo_seed,
         sampler_type=params.monte_carlo_sampler,
+        workers=resolve_monte_carlo_workers(),
+        summary_backend=resolve_monte_carlo_summary_backend(),
+        convergence_mode=resolve_monte_carlo_convergence_mode(),
+        quantile_precision_target=resolve_monte_carlo_quantile_precision(),
+        antithetic=params.monte_carlo_antithetic,
+        control_variate=params.monte_carlo_control_variate,
     )
     engine = MonteCarloEngine(config=config)
 
@@ -128,75 +193,40 @@ def _run_saas_monte_carlo(
 
     base_growth_rates = np.asarray(base_inputs["growth_rates"], dtype=float)
     base_operating_margins = np.asarray(base_inputs["operating_margins"], dtype=float)
-    da_rates = np.asarray(base_inputs["da_rates"], dtype=float)
-    capex_rates = np.asarray(base_inputs["capex_rates"], dtype=float)
-    wc_rates = np.asarray(base_inputs["wc_rates"], dtype=float)
-    initial_revenue = float(base_inputs["initial_revenue"])
-    tax_rate = float(base_inputs["tax_rate"])
-    cash = float(base_inputs["cash"])
-    total_debt = float(base_inputs["total_debt"])
-    preferred_stock = float(base_inputs["preferred_stock"])
-    shares_outstanding = float(base_inputs["shares_outstanding"])
-    projection_years = base_growth_rates.shape[0]
-    discount_years = np.arange(1, projection_years + 1, dtype=float)
-
-    def batch_evaluate(
-        sampled_batch: dict[str, np.ndarray], _base_numeric: Mapping[str, float]
-    ) -> np.ndarray:
-        growth_shock = np.asarray(sampled_batch["growth_shock"], dtype=float)
-        margin_shock = np.asarray(sampled_batch["margin_shock"], dtype=float)
-        wacc = np.asarray(sampled_batch["wacc"], dtype=float)
-        sampled_terminal = np.asarray(sampled_batch["terminal_growth"], dtype=float)
-        terminal_growth = np.minimum(sampled_terminal, wacc - 0.001)
-
-        batch_size = growth_shock.shape[0]
-
-        growth_base = base_growth_rates[np.newaxis, :]
-        margin_base = base_operating_margins[np.newaxis, :]
-        growth_lower = growth_base - 0.30
-        growth_upper = growth_base + 0.30
-        margin_lower = margin_base - 0.20
-        margin_upper = margin_base + 0.20
-
-        growth_rates = np.clip(
-            growth_base + growth_shock[:, np.newaxis],
-            growth_lower,
-            growth_upper,
-        )
-        operating_margins = np.clip(
-            margin_base + margin_shock[:, np.newaxis],
-            margin_lower,
-            margin_upper,
-        )
-
-        projected_revenue = np.empty((batch_size, projection_years), dtype=float)
-        revenue_level = np.full(batch_size, initial_revenue, dtype=float)
-        for year_idx in range(projection_years):
-            revenue_level *= 1.0 + growth_rates[:, year_idx]
-            projected_revenue[:, year_idx] = revenue_level
-
-        ebit = projected_revenue * operating_margins
-        nopat = ebit * (1.0 - tax_rate)
-        da = projected_revenue * da_rates[np.newaxis, :]
-        capex = projected_revenue * capex_rates[np.newaxis, :]
-        previous_revenue = np.empty_like(projected_revenue)
-        previous_revenue[:, 0] = initial_revenue
-        previous_revenue[:, 1:] = projected_revenue[:, :-1]
-        delta_revenue = projected_revenue - previous_revenue
-        delta_wc = delta_revenue * wc_rates[np.newaxis, :]
-        fcff = nopat + da - capex - delta_wc
-
-        discount_curve = np.power(
-            1.0 + wacc[:, np.newaxis], discount_years[np.newaxis, :]
-        )
-        pv_fcff = np.sum(fcff / discount_curve, axis=1)
+    static_plan_inputs: dict[str, object] = {
+        "initial_revenue": float(base_inputs["initial_revenue"]),
+        "tax_rate": float(base_inputs["tax_rate"]),
+        "da_rates": np.asarray(base_inputs["da_rates"], dtype=float),
+        "capex_rates": np.asarray(base_inputs["capex_rates"], dtype=float),
+        "wc_rates": np.asarray(base_inputs["wc_rates"], dtype=float),
+        "sbc_rates": np.asarray(base_inputs["sbc_rates"], dtype=float),
+        "cash": float(base_inputs["cash"]),
+        "total_debt": float(base_inputs["total_debt"]),
+        "preferred_stock": float(base_inputs["preferred_stock"]),
+        "shares_outstanding": float(base_inputs["shares_outstanding"]),
+    }
+    plan = graph.compile(
+        inputs=(
+            *static_plan_inputs,
+            "growth_rates",
+            "operating_margins",
+            "wacc",
+            "terminal_growth",
+        ),
+        outputs=("intrinsic_value",),
+    )
 
-        final_fcff = fcff[:, -1]
-        terminal_value = final_fcff * (1.0 + terminal_growth) / (wacc - terminal_growth)
-        pv_terminal = terminal_value / np.power(1.0 + wacc, projection_years)
-        enterprise_value = pv_fcff + pv_terminal
-        equity_value = enterprise_value + cash - total_debt - preferred_stock
-        return equity_value / shares_outstanding
+    batch_evaluate = _SaasBatchEvaluator(
+        plan=plan,
+        static_plan_inputs=static_plan_inputs,
+        base_growth_rates=base_growth_rates,
+        base_operating_margins=base_operating_margins,
+        growth_lower=base_growth_rates - 0.30,
+        growth_upper=base_growth_rates + 0.30,
+        margin_lower=base_operating_margins - 0.20,
+        margin_upper=base_operating_margins + 0.20,
+        kernel_dtype=resolve_dcf_kernel_dtype(),
+    )
 
     base_case_inputs = {
         key: np.asarray([value], dtype=float)
@@ -246,7 +276,8 @@ def calculate_saas_valuation(params: SaaSParams) -> CalcResult:
 
     try:
         inputs = apply_trace_inputs(raw_inputs, params.trace_inputs)
-        results = graph.calculate(inputs, trace=True)
+        trace = graph.calculate_compact(inputs)
+        results = trace.raw_values()
         intrinsic_value_raw = results.get("intrinsic_value", 0.0)
         intrinsic_value = float(unwrap_traceable_value(intrinsic_value_raw))
         upside = compute_upside(intrinsic_value, params.current_price)
@@ -282,6 +313,7 @@ def calculate_saas_valuation(params: SaaSParams) -> CalcResult:
 
         if params.monte_carlo_iterations > 0:
             details["distribution_summary"] = _run_saas_monte_carlo(
+                graph=graph,
                 # MC evaluator requires plain numeric/list inputs.
                 # TraceableField wrappers are only for deterministic trace output.
                 base_inputs=raw_inputs,
@@ -299,7 +331,7 @@ def calculate_saas_valuation(params: SaaSParams) -> CalcResult:
             "intrinsic_value": intrinsic_value,
             "upside_potential": upside,
             "details": details,
-            "trace": results,
+            "trace": trace,
         }
     except Exception as exc:  # noqa: BLE001
         return {"error": str(exc)}
@@ -1,3 +1,10 @@
+from .calculation_plan import CalculationPlan, RecalculationStats
+from .compact_trace import CompactTrace
 from .core import CalculationGraph
 
-__all__ = ["CalculationGraph"]
+__all__ = [
+    "CalculationGraph",
+    "CalculationPlan",
+    "CompactTrace",
+    "RecalculationStats",
+]
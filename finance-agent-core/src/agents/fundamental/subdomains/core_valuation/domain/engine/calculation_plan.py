@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from time import perf_counter
+
+import numpy as np
+
+from src.agents.fundamental.domain.shared.contracts.traceable import (
+    ComputedProvenance,
+    ManualProvenance,
+    TraceableField,
+)
+from src.shared.kernel.tools.logger import get_logger, log_event
+
+from .compact_trace import CompactTrace
+from .dcf_kernels import KernelDtype
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    node: str
+    func: Callable[..., object]
+    batch_func: Callable[..., object] | None
+    params: tuple[str, ...]
+    arg_slots: tuple[int, ...]
+    output_slot: int
+
+
+@dataclass(frozen=True)
+class RecalculationStats:
+    changed_inputs: tuple[str, ...]
+    recomputed_nodes: tuple[str, ...]
+    reused_nodes: tuple[str, ...]
+    elapsed_ms: float
+
+    @property
+    def recomputed_count(self) -> int:
+        return len(self.recomputed_nodes)
+
+    @property
+    def reused_count(self) -> int:
+        return len(self.reused_nodes)
+
+
+@dataclass(frozen=True)
+class CalculationPlan:
+    """
+    Frozen execution plan for a CalculationGraph.
+    Topological order and argument slots are resolved once at compile time,
+    so repeated evaluations only index into a flat value list.
+    """
+
+    graph_name: str
+    slot_names: tuple[str, ...]
+    input_slots: tuple[tuple[str, int], ...]
+    steps: tuple[PlanStep, ...]
+
+    @property
+    def output_names(self) -> tuple[str, ...]:
+        return tuple(step.node for step in self.steps)
+
+    @property
+    def supports_batch(self) -> bool:
+        return all(step.batch_func is not None for step in self.steps)
+
+    @cached_property
+    def slot_dependents(self) -> dict[int, tuple[int, ...]]:
+        """Slot -> indices of the steps that read it directly."""
+        dependents: dict[int, list[int]] = {}
+        for index, step in enumerate(self.steps):
+            for slot in dict.fromkeys(step.arg_slots):
+                dependents.setdefault(slot, []).append(index)
+        return {slot: tuple(indices) for slot, indices in dependents.items()}
+
+    def calculate(
+        self,
+        inputs: Mapping[str, object],
+        trace: bool = False,
+    ) -> dict[str, object]:
+        values = self._load_inputs(inputs)
+        if trace:
+            for name, slot in self.input_slots:
+                values[slot] = _to_traceable(name, values[slot])
+        for step in self.steps:
+            values[step.output_slot] = self._run_step(step, values, trace)
+        return self._collect(values)
+
+    def calculate_compact(self, inputs: Mapping[str, object]) -> CompactTrace:
+        """
+        Traced run that records provenance as flat node/edge arrays instead of
+        nested TraceableField trees; see CompactTrace.materialize().
+        """
+        values = self._load_inputs(inputs)
+        fields: dict[str, TraceableField] = {}
+        for name, slot in self.input_slots:
+            value = values[slot]
+            if isinstance(value, TraceableField):
+                fields[name] = value
+                values[slot] = value.value
+        expressions: list[str | None] = [None] * len(self.slot_names)
+        edge_offsets = [0] * (len(self.slot_names) + 1)
+        edge_sources: list[int] = []
+        # Input slots come first and have no edges; steps follow in slot order.
+        for step in self.steps:
+            output = self._execute(
+                step, step.func, [values[slot] for slot in step.arg_slots]
+            )
+            if isinstance(output, TraceableField):
+                fields[step.node] = output
+                output = output.value
+            values[step.output_slot] = output
+            expressions[step.output_slot] = step.func.__name__
+            edge_sources.extend(step.arg_slots)
+            edge_offsets[step.output_slot + 1] = len(edge_sources)
+        return CompactTrace(
+            graph_name=self.graph_name,
+            nodes=list(self.slot_names),
+            values=values,
+            expressions=expressions,
+            edge_offsets=edge_offsets,
+            edge_sources=edge_sources,
+            fields=fields,
+        )
+
+    def recalculate(
+        self,
+        previous: Mapping[str, object],
+        delta_inputs: Mapping[str, object],
+        trace: bool = False,
+    ) -> tuple[dict[str, object], RecalculationStats]:
+        """
+        Update the results of a previous calculate() for changed inputs only.
+        Steps run in plan (topological) order and only when an argument slot
+        changed; a step whose output compares equal to its previous value does
+        not mark its dependents dirty.
+        """
+        started = perf_counter()
+        input_lookup = dict(self.input_slots)
+        unknown = [name for name in delta_inputs if name not in input_lookup]
+        if unknown:
+            raise ValueError(
+                f"Unknown plan inputs for {self.graph_name}: {', '.join(unknown)}"
+            )
+        values = [previous[name] for name in self.slot_names]
+        dependents = self.slot_dependents
+        dirty_steps: set[int] = set()
+        changed_inputs: list[str] = []
+        for name, value in delta_inputs.items():
+            slot = input_lookup[name]
+            updated = _to_traceable(name, value) if trace else value
+            if _same_value(values[slot], updated):
+                continue
+            values[slot] = updated
+            changed_inputs.append(name)
+            dirty_steps.update(dependents.get(slot, ()))
+
+        recomputed: list[str] = []
+        reused: list[str] = []
+        for index, step in enumerate(self.steps):
+            if index not in dirty_steps:
+                reused.append(step.node)
+                continue
+            recomputed.append(step.node)
+            output = self._run_step(step, values, trace)
+            if _same_value(values[step.output_slot], output):
+                continue
+            values[step.output_slot] = output
+            dirty_steps.update(dependents.get(step.output_slot, ()))
+
+        stats = RecalculationStats(
+            changed_inputs=tuple(changed_inputs),
+            recomputed_nodes=tuple(recomputed),
+            reused_nodes=tuple(reused),
+            elapsed_ms=(perf_counter() - started) * 1000.0,
+        )
+        return self._collect(values), stats
+
+    def calculate_batch(
+        self,
+        inputs: Mapping[str, object],
+        *,
+        dtype: KernelDtype = "float64",
+    ) -> dict[str, object]:
+        """
+        Evaluate the plan over NumPy arrays of scenarios.
+        Scalars broadcast as shape (N,) or plain floats, series as (Y,) or (N, Y).
+        dtype="float32" casts floating inputs down so the kernels run in float32.
+        """
+        missing = [step.node for step in self.steps if step.batch_func is None]
+        if missing:
+            raise ValueError(
+                f"Graph {self.graph_name} has no batch implementation for nodes: "
+                f"{', '.join(missing)}"
+            )
+        values = [_to_batch_value(value, dtype) for value in self._load_inputs(inputs)]
+        for step in self.steps:
+            args = [values[slot] for slot in step.arg_slots]
+            values[step.output_slot] = self._execute(step, step.batch_func, args)
+        return self._collect(values)
+
+    def _run_step(self, step: PlanStep, values: list[object], trace: bool) -> object:
+        args: list[object] = []
+        trace_inputs: dict[str, TraceableField] = {}
+        for param, slot in zip(step.params, step.arg_slots, strict=True):
+            param_value = values[slot]
+            if isinstance(param_value, TraceableField):
+                trace_inputs[param] = param_value
+                args.append(param_value.value)
+            else:
+                if trace:
+                    trace_inputs[param] = _to_traceable(param, param_value)
+                args.append(param_value)
+        output = self._execute(step, step.func, args)
+        return _wrap_output(step, output, trace_inputs)
+
+    def _load_inputs(self, inputs: Mapping[str, object]) -> list[object]:
+        values: list[object] = [None] * len(self.slot_names)
+        for name, slot in self.input_slots:
+            if name not in inputs:
+                raise ValueError(f"Missing plan input '{name}' for {self.graph_name}")
+            values[slot] = inputs[name]
+        return values
+
+    def _collect(self, values: list[object]) -> dict[str, object]:
+        return dict(zip(self.slot_names, values, strict=True))
+
+    def _execute(
+        self,
+        step: PlanStep,
+        func: Callable[..., object] | None,
+        args: list[object],
+    ) -> object:
+        if func is None:
+            raise ValueError(f"Node '{step.node}' has no executable function")
+        try:
+            return func(*args)
+        except Exception as e:
+            log_event(
+                logger,
+                event="calculation_graph_node_failed",
+                message="calculation graph node execution failed",
+                fields={
+                    "graph_name": self.graph_name,
+                    "node": step.node,
+                    "exception": str(e),
+                },
+            )
+            raise RuntimeError(f"Error calculating node '{step.node}': {str(e)}") from e
+
+
+def _to_traceable(name: str, value: object) -> TraceableField:
+    if isinstance(value, TraceableField):
+        return value
+    return TraceableField(
+        name=name,
+        value=value,
+        provenance=ManualProvenance(description="Input provided"),
+    )
+
+
+def _wrap_output(
+    step: PlanStep,
+    output: object,
+    trace_inputs: dict[str, TraceableField],
+) -> object:
+    if isinstance(output, TraceableField):
+        return output
+    if not trace_inputs:
+        return output
+
+    provenance = ComputedProvenance(
+        op_code=step.node,
+        expression=step.func.__name__,
+        inputs=trace_inputs,
+    )
+    return TraceableField(name=step.node, value=output, provenance=provenance)
+
+
+def _same_value(previous: object, current: object) -> bool:
+    if previous is current:
+        return True
+    if type(previous) is not type(current):
+        return False
+    if isinstance(previous, np.ndarray):
+        return bool(np.array_equal(previous, current))
+    try:
+        return bool(previous == current)
+    except ValueError:
+        # Ambiguous element-wise comparison (e.g. a field holding an array):
+        # treat as changed rather than guess.
+        return False
+
+
+def _to_batch_value(value: object, dtype: KernelDtype) -> object:
+    if isinstance(value, TraceableField):
+        value = value.value
+    if value is None:
+        return value
+    if isinstance(value, np.ndarray):
+        if value.dtype != dtype and np.issubdtype(value.dtype, np.floating):
+            return value.astype(dtype)
+        return value
+    return np.asarray(value, dtype=dtype)
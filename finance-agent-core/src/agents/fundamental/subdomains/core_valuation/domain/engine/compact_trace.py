@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, PrivateAttr
+
+from src.agents.fundamental.domain.shared.contracts.traceable import (
+    ComputedProvenance,
+    ManualProvenance,
+    TraceableField,
+)
+
+
+class CompactTrace(BaseModel):
+    """
+    Flat provenance for one traced graph run.
+    Node i has value values[i]. Its direct inputs are the nodes listed in
+    edge_sources[edge_offsets[i]:edge_offsets[i + 1]]. Inputs have no edges
+    and no expression.
+    TraceableField trees are built only by materialize(). They are memoized,
+    so shared subtrees are built once, exactly as full trace mode shares them.
+    """
+
+    graph_name: str
+    nodes: list[str]
+    values: list[object]
+    expressions: list[str | None]
+    edge_offsets: list[int]
+    edge_sources: list[int]
+    # Fields supplied by the caller (e.g. XBRL-sourced inputs) or returned
+    # as TraceableField by a node function; materialized as-is.
+    fields: dict[str, TraceableField] = {}
+
+    _index: dict[str, int] | None = PrivateAttr(default=None)
+    _materialized: dict[int, TraceableField] = PrivateAttr(default_factory=dict)
+
+    def raw_values(self) -> dict[str, object]:
+        return dict(zip(self.nodes, self.values, strict=True))
+
+    def value(self, name: str) -> object:
+        return self.values[self._node_index(name)]
+
+    def materialize(self, name: str) -> TraceableField:
+        return self._materialize(self._node_index(name))
+
+    def materialize_all(self) -> dict[str, TraceableField]:
+        """Same mapping calculate(..., trace=True) returns."""
+        return {name: self._materialize(idx) for idx, name in enumerate(self.nodes)}
+
+    def explain(self, name: str) -> None:
+        self.materialize(name).explain()
+
+    def _node_index(self, name: str) -> int:
+        if self._index is None:
+            self._index = {node: idx for idx, node in enumerate(self.nodes)}
+        index = self._index.get(name)
+        if index is None:
+            raise KeyError(f"Node '{name}' is not part of trace {self.graph_name}")
+        return index
+
+    def _materialize(self, index: int) -> TraceableField:
+        cached = self._materialized.get(index)
+        if cached is not None:
+            return cached
+        name = self.nodes[index]
+        field = self.fields.get(name)
+        if field is None:
+            expression = self.expressions[index]
+            if expression is None:
+                field = TraceableField(
+                    name=name,
+                    value=self.values[index],
+                    provenance=ManualProvenance(description="Input provided"),
+                )
+            else:
+                sources = self.edge_sources[
+                    self.edge_offsets[index] : self.edge_offsets[index + 1]
+                ]
+                field = TraceableField(
+                    name=name,
+                    value=self.values[index],
+                    provenance=ComputedProvenance(
+                        op_code=name,
+                        expression=expression,
+                        inputs={
+                            self.nodes[source]: self._materialize(source)
+                            for source in sources
+                        },
+                    ),
+                )
+        self._materialized[index] = field
+        return field
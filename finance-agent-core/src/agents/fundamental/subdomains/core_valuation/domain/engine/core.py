@@ -1,15 +1,14 @@
 import inspect
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 
 import networkx as nx
 
-from src.agents.fundamental.domain.shared.contracts.traceable import (
-    ComputedProvenance,
-    ManualProvenance,
-    TraceableField,
-)
+from src.agents.fundamental.domain.shared.contracts.traceable import TraceableField
 from src.shared.kernel.tools.logger import get_logger, log_event
 
+from .calculation_plan import CalculationPlan, PlanStep, RecalculationStats
+from .compact_trace import CompactTrace
+
 Scalar = float | int
 Vector = list[float]
 TraceScalar = TraceableField[float]
@@ -30,21 +29,47 @@ class CalculationGraph:
         self.graph = nx.DiGraph()
         self.functions: dict[str, Callable[..., CalcValue]] = {}
         self.node_dependencies: dict[str, tuple[str, ...]] = {}
+        self.batch_functions: dict[str, Callable[..., object]] = {}
+        self._topological_order: tuple[str, ...] | None = None
+        self._plan_cache: dict[
+            tuple[frozenset[str], tuple[str, ...] | None], CalculationPlan
+        ] = {}
+        # Last calculate()/recalculate() state: plan, results and trace flag.
+        self._last_run: tuple[CalculationPlan, dict[str, CalcValue], bool] | None = None
+        self.last_recalculation: RecalculationStats | None = None
 
-    def add_node(self, name: str, func: Callable[..., CalcValue] | None = None):
+    def add_node(
+        self,
+        name: str,
+        func: Callable[..., CalcValue] | None = None,
+        batch_func: Callable[..., object] | None = None,
+    ):
         """
         Add a node to the graph.
         If func is provided, it's a calculated node.
         If func is None, it's an input node (value must be provided at runtime).
+        batch_func is the NumPy implementation used by calculate_batch; it must
+        take the same parameters as func.
         """
         self.graph.add_node(name)
+        self._topological_order = None
+        self._plan_cache.clear()
+        self._last_run = None
         if func:
             self.functions[name] = func
             # Cache dependencies once to avoid repeated inspect.signature at runtime.
-            params = tuple(inspect.signature(func).parameters.keys())
+            params = _positional_params(name, func)
             self.node_dependencies[name] = params
             for param in params:
                 self.graph.add_edge(param, name)
+            if batch_func is not None:
+                batch_params = _positional_params(name, batch_func)
+                if batch_params != params:
+                    raise ValueError(
+                        f"batch_func for node '{name}' must take {params}, "
+                        f"got {batch_params}"
+                    )
+                self.batch_functions[name] = batch_func
 
     def validate(self):
         """Check for cycles and missing dependencies."""
@@ -90,123 +115,235 @@ class CalculationGraph:
                 },
             )
 
-        if trace:
-            results: dict[str, CalcValue] = {
-                k: self._to_traceable(k, v) for k, v in inputs.items()
-            }
-        else:
-            results = inputs.copy()
+        plan = self.compile(inputs=inputs.keys())
+        results = plan.calculate(inputs, trace=trace)
+        self._last_run = (plan, dict(results), trace)
 
-        # Get topological sort of the graph
-        try:
-            execution_order = list(nx.topological_sort(self.graph))
-        except nx.NetworkXUnfeasible as e:
+        if emit_lifecycle_events:
             log_event(
                 logger,
-                event="calculation_graph_topology_failed",
-                message="calculation graph execution failed due to cycle",
-                fields={"graph_name": self.name},
+                event="calculation_graph_completed",
+                message="calculation graph execution completed",
+                fields={"graph_name": self.name, "result_count": len(results)},
             )
-            raise ValueError("Graph contains cycles, cannot execute.") from e
+        return results
+
+    def calculate_compact(
+        self,
+        inputs: dict[str, CalcValue],
+        emit_lifecycle_events: bool = True,
+    ) -> CompactTrace:
+        """
+        Traced execution with lazy provenance.
+        Returns a CompactTrace whose raw_values() match calculate(inputs) and
+        whose materialize()/explain() rebuild the trace=True TraceableFields.
+        """
+        if emit_lifecycle_events:
+            log_event(
+                logger,
+                event="calculation_graph_started",
+                message="calculation graph execution started",
+                fields={
+                    "graph_name": self.name,
+                    "trace": "compact",
+                    "input_count": len(inputs),
+                },
+            )
+
+        plan = self.compile(inputs=inputs.keys())
+        compact = plan.calculate_compact(inputs)
+        self._last_run = (plan, compact.raw_values(), False)
+
+        if emit_lifecycle_events:
+            log_event(
+                logger,
+                event="calculation_graph_completed",
+                message="calculation graph execution completed",
+                fields={"graph_name": self.name, "result_count": len(compact.nodes)},
+            )
+        return compact
+
+    def recalculate(
+        self,
+        delta_inputs: Mapping[str, CalcValue],
+        emit_lifecycle_events: bool = True,
+    ) -> dict[str, CalcValue]:
+        """
+        What-if update of the last calculate() run.
+        Only nodes downstream of inputs whose values changed are recomputed;
+        everything else is reused. Counts are kept on last_recalculation.
+        :param delta_inputs: Changed input values (names must be run inputs).
+        :return: Dictionary containing all calculated values.
+        """
+        if self._last_run is None:
+            raise ValueError(
+                f"Graph {self.name} has no previous calculation to recalculate"
+            )
+        plan, previous, trace = self._last_run
+        results, stats = plan.recalculate(previous, delta_inputs, trace=trace)
+        self._last_run = (plan, dict(results), trace)
+        self.last_recalculation = stats
 
+        if emit_lifecycle_events:
+            log_event(
+                logger,
+                event="calculation_graph_recalculated",
+                message="calculation graph recalculated incrementally",
+                fields={
+                    "graph_name": self.name,
+                    "changed_inputs": list(stats.changed_inputs),
+                    "recomputed_count": stats.recomputed_count,
+                    "reused_count": stats.reused_count,
+                    "elapsed_ms": round(stats.elapsed_ms, 3),
+                },
+            )
+        return results
+
+    def calculate_batch(
+        self,
+        inputs: Mapping[str, object],
+        outputs: Iterable[str] | None = None,
+    ) -> dict[str, object]:
+        """
+        Evaluate the graph over N scenarios at once.
+        Every computed node must be registered with a batch implementation;
+        nodes supplied in inputs (e.g. pre-converged series) are skipped.
+        """
+        plan = self.compile(inputs=inputs.keys(), outputs=outputs)
+        return plan.calculate_batch(inputs)
+
+    def compile(
+        self,
+        inputs: Iterable[str] | None = None,
+        outputs: Iterable[str] | None = None,
+    ) -> CalculationPlan:
+        """
+        Freeze topological order and argument slots into a reusable plan.
+        :param inputs: Node names supplied at runtime (default: graph leaf nodes).
+        :param outputs: Nodes to compute (default: every reachable calculated node).
+        """
+        input_names = (
+            tuple(dict.fromkeys(inputs))
+            if inputs is not None
+            else tuple(self.get_inputs())
+        )
+        output_names = tuple(dict.fromkeys(outputs)) if outputs is not None else None
+        cache_key = (frozenset(input_names), output_names)
+        cached = self._plan_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        execution_order = self._execution_order()
+        provided = set(input_names)
+        if output_names is None:
+            required = {
+                node
+                for node in execution_order
+                if node in self.functions and node not in provided
+            }
+        else:
+            required = self._collect_required(output_names, provided)
+
+        slots: dict[str, int] = {name: index for index, name in enumerate(input_names)}
+        steps: list[PlanStep] = []
         for node in execution_order:
-            if node in results:
-                continue  # Already provided in inputs
-
-            if node in self.functions:
-                func = self.functions[node]
-                params = self.node_dependencies.get(node)
-                if params is None:
-                    params = tuple(inspect.signature(func).parameters.keys())
-                    self.node_dependencies[node] = params
-
-                # Gather arguments
-                args: dict[str, CalcValue] = {}
-                trace_inputs: dict[str, TraceableField] = {}
-                for param in params:
-                    if param not in results:
-                        log_event(
-                            logger,
-                            event="calculation_graph_missing_dependency",
-                            message="calculation graph missing dependency",
-                            fields={
-                                "graph_name": self.name,
-                                "node": node,
-                                "dependency": param,
-                            },
-                        )
-                        raise ValueError(
-                            f"Missing dependency '{param}' for node '{node}'"
-                        )
-                    param_value = results[param]
-                    if isinstance(param_value, TraceableField):
-                        trace_inputs[param] = param_value
-                        args[param] = param_value.value  # unwrap
-                    else:
-                        if trace:
-                            trace_inputs[param] = self._to_traceable(param, param_value)
-                        args[param] = param_value
-
-                # Execute function
-                try:
-                    output = func(**args)
-                except Exception as e:
+            if node not in required:
+                continue
+            params = self.node_dependencies[node]
+            for param in params:
+                if param not in slots:
                     log_event(
                         logger,
-                        event="calculation_graph_node_failed",
-                        message="calculation graph node execution failed",
+                        event="calculation_graph_missing_dependency",
+                        message="calculation graph missing dependency",
                         fields={
                             "graph_name": self.name,
                             "node": node,
-                            "exception": str(e),
+                            "dependency": param,
                         },
                     )
-                    raise RuntimeError(
-                        f"Error calculating node '{node}': {str(e)}"
-                    ) from e
-                results[node] = self._wrap_output(node, output, trace_inputs)
-            else:
-                # If it's not a function calculation, it SHOULD have been in inputs
-                pass
+                    raise ValueError(f"Missing dependency '{param}' for node '{node}'")
+            slots[node] = len(slots)
+            steps.append(
+                PlanStep(
+                    node=node,
+                    func=self.functions[node],
+                    batch_func=self.batch_functions.get(node),
+                    params=params,
+                    arg_slots=tuple(slots[param] for param in params),
+                    output_slot=slots[node],
+                )
+            )
 
-        if emit_lifecycle_events:
+        plan = CalculationPlan(
+            graph_name=self.name,
+            slot_names=tuple(slots),
+            input_slots=tuple((name, slots[name]) for name in input_names),
+            steps=tuple(steps),
+        )
+        self._plan_cache[cache_key] = plan
+        log_event(
+            logger,
+            event="calculation_graph_compiled",
+            message="calculation graph compiled",
+            fields={
+                "graph_name": self.name,
+                "input_count": len(input_names),
+                "step_count": len(steps),
+                "supports_batch": plan.supports_batch,
+            },
+        )
+        return plan
+
+    def _execution_order(self) -> tuple[str, ...]:
+        if self._topological_order is not None:
+            return self._topological_order
+        try:
+            self._topological_order = tuple(nx.topological_sort(self.graph))
+        except nx.NetworkXUnfeasible as e:
             log_event(
                 logger,
-                event="calculation_graph_completed",
-                message="calculation graph execution completed",
-                fields={"graph_name": self.name, "result_count": len(results)},
+                event="calculation_graph_topology_failed",
+                message="calculation graph execution failed due to cycle",
+                fields={"graph_name": self.name},
             )
-        return results
+            raise ValueError("Graph contains cycles, cannot execute.") from e
+        return self._topological_order
+
+    def _collect_required(
+        self, outputs: tuple[str, ...], provided: set[str]
+    ) -> set[str]:
+        required: set[str] = set()
+        pending = [node for node in outputs if node not in provided]
+        while pending:
+            node = pending.pop()
+            if node in required:
+                continue
+            if node not in self.functions:
+                raise ValueError(f"Output '{node}' is neither an input nor a node")
+            required.add(node)
+            pending.extend(
+                param
+                for param in self.node_dependencies[node]
+                if param not in provided and param in self.functions
+            )
+        return required
 
     def get_inputs(self) -> list[str]:
         """Return a list of required input nodes (nodes with 0 in-degree)."""
         return [n for n, d in self.graph.in_degree() if d == 0]
 
-    @staticmethod
-    def _to_traceable(name: str, value: CalcValue) -> TraceableField:
-        if isinstance(value, TraceableField):
-            return value
-        return TraceableField(
-            name=name,
-            value=value,
-            provenance=ManualProvenance(description="Input provided"),
-        )
 
-    def _wrap_output(
-        self,
-        node: str,
-        output: CalcValue,
-        trace_inputs: dict[str, TraceableField],
-    ) -> CalcValue:
-        if isinstance(output, TraceableField):
-            return output
-        if not trace_inputs:
-            return output
-
-        expression = self.functions[node].__name__
-        provenance = ComputedProvenance(
-            op_code=node,
-            expression=expression,
-            inputs=trace_inputs,
-        )
-        return TraceableField(name=node, value=output, provenance=provenance)
+def _positional_params(node: str, func: Callable[..., object]) -> tuple[str, ...]:
+    # Compiled plans call node functions positionally from argument slots.
+    parameters = inspect.signature(func).parameters.values()
+    for parameter in parameters:
+        if parameter.kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            raise ValueError(
+                f"Node '{node}' function parameters must be positional "
+                f"(got {parameter.kind.description} '{parameter.name}')"
+            )
+    return tuple(parameter.name for parameter in parameters)
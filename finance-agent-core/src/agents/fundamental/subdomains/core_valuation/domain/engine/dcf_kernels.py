@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Literal
+
+import numpy as np
+
+DCF_KERNEL_DTYPE_ENV = "FUNDAMENTAL_DCF_KERNEL_DTYPE"
+
+KernelDtype = Literal["float64", "float32"]
+
+# Work buffers are cached per thread and per (slot, shape, dtype), so a Monte
+# Carlo run reuses the same arrays for every batch of a given size. Kernels
+# never return views into these buffers.
+_MAX_WORK_BUFFERS = 16
+_WORKSPACE = threading.local()
+
+
+def resolve_dcf_kernel_dtype() -> KernelDtype:
+    raw = os.getenv(DCF_KERNEL_DTYPE_ENV)
+    if raw is None:
+        return "float64"
+    normalized = raw.strip().lower()
+    if normalized == "float32":
+        return "float32"
+    return "float64"
+
+
+def as_kernel_array(value: object) -> np.ndarray:
+    """Floating arrays keep their dtype (float32 opt-in); anything else is float64."""
+    if isinstance(value, np.ndarray) and np.issubdtype(value.dtype, np.floating):
+        return value
+    return np.asarray(value, dtype=float)
+
+
+def compound_levels(
+    initial_level: np.ndarray | float, growth_rates: np.ndarray
+) -> np.ndarray:
+    """
+    Project (..., Y) levels from an initial level and per-year growth rates.
+    The cumulative product runs over [initial, 1 + g_1, ..., 1 + g_Y], which
+    multiplies in the same order as a year-by-year loop.
+    """
+    growth = as_kernel_array(growth_rates)
+    level = as_kernel_array(initial_level)
+    batch_shape = np.broadcast_shapes(growth.shape[:-1], level.shape)
+    years = growth.shape[-1]
+    path = _work_buffer(
+        "compound_levels",
+        (*batch_shape, years + 1),
+        np.result_type(growth, level),
+    )
+    path[..., 0] = level
+    np.add(1.0, growth, out=path[..., 1:])
+    np.cumprod(path, axis=-1, out=path)
+    return path[..., 1:].copy()
+
+
+def lag_series(series: np.ndarray, initial_value: np.ndarray | float) -> np.ndarray:
+    """Shift (..., Y) right by one year, seeding year one with initial_value."""
+    previous = np.empty_like(series)
+    previous[..., 0] = initial_value
+    previous[..., 1:] = series[..., :-1]
+    return previous
+
+
+def discount_curve(discount_rate: np.ndarray | float, years: int) -> np.ndarray:
+    """(..., Y) compounding factors (1 + r) ** t for t = 1..Y."""
+    rate = as_kernel_array(discount_rate)
+    periods = np.arange(1, years + 1, dtype=rate.dtype)
+    return np.power(1.0 + rate[..., np.newaxis], periods)
+
+
+def present_value(
+    cash_flows: np.ndarray, discount_rate: np.ndarray | float
+) -> np.ndarray:
+    """Sum of (..., Y) cash flows discounted at a per-scenario rate."""
+    flows = as_kernel_array(cash_flows)
+    rate = as_kernel_array(discount_rate)[..., np.newaxis]
+    years = flows.shape[-1]
+    dtype = np.result_type(flows, rate)
+    periods = np.arange(1, years + 1, dtype=dtype)
+    shape = np.broadcast_shapes(flows.shape, (*rate.shape[:-1], years))
+    discounted = _work_buffer("present_value", shape, dtype)
+    np.power(1.0 + rate, periods, out=discounted)
+    np.divide(flows, discounted, out=discounted)
+    return np.sum(discounted, axis=-1)
+
+
+def guard_terminal_growth(
+    terminal_growth: np.ndarray | float,
+    discount_rate: np.ndarray | float,
+    *,
+    spread: float,
+    floor: float | None = None,
+    cap: float | None = None,
+) -> np.ndarray:
+    """
+    Bound terminal growth to [floor, cap] and keep it at least `spread` below
+    the discount rate so the Gordon denominator stays positive.
+    """
+    growth = as_kernel_array(terminal_growth)
+    if floor is not None or cap is not None:
+        growth = np.clip(growth, floor, cap)
+    return np.minimum(growth, as_kernel_array(discount_rate) - spread)
+
+
+def gordon_terminal_value(
+    final_cash_flow: np.ndarray | float,
+    discount_rate: np.ndarray | float,
+    terminal_growth: np.ndarray | float,
+) -> np.ndarray:
+    return (final_cash_flow * (1.0 + terminal_growth)) / (
+        discount_rate - terminal_growth
+    )
+
+
+def discount_terminal_value(
+    terminal_value: np.ndarray | float,
+    discount_rate: np.ndarray | float,
+    years: int,
+) -> np.ndarray:
+    return terminal_value / ((1.0 + discount_rate) ** years)
+
+
+def clear_dcf_kernel_workspace() -> None:
+    _WORKSPACE.__dict__.clear()
+
+
+def _work_buffer(slot: str, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    buffers: dict[tuple[str, tuple[int, ...], str], np.ndarray] | None = getattr(
+        _WORKSPACE, "buffers", None
+    )
+    if buffers is None:
+        buffers = {}
+        _WORKSPACE.buffers = buffers
+    key = (slot, tuple(shape), np.dtype(dtype).str)
+    buffer = buffers.get(key)
+    if buffer is None:
+        if len(buffers) >= _MAX_WORK_BUFFERS:
+            buffers.pop(next(iter(buffers)))
+        buffer = np.empty(shape, dtype=dtype)
+        buffers[key] = buffer
+    return buffer
@@ -1,4 +1,14 @@
+import numpy as np
+
 from ..core import CalculationGraph
+from ..dcf_kernels import (
+    as_kernel_array,
+    compound_levels,
+    discount_terminal_value,
+    gordon_terminal_value,
+    lag_series,
+    present_value,
+)
 
 
 def project_net_income(
@@ -91,27 +101,76 @@ def calculate_cost_of_equity(
     return risk_free_rate + (beta * market_risk_premium)
 
 
+def project_net_income_batch(
+    initial_net_income: np.ndarray, income_growth_rates: np.ndarray
+) -> np.ndarray:
+    return compound_levels(initial_net_income, income_growth_rates)
+
+
+def calculate_rwa_batch(
+    net_income: np.ndarray, rwa_intensity: np.ndarray
+) -> np.ndarray:
+    return net_income / as_kernel_array(rwa_intensity)[..., np.newaxis]
+
+
+def calculate_required_capital_batch(
+    rwa: np.ndarray, tier1_target_ratio: np.ndarray
+) -> np.ndarray:
+    return rwa * as_kernel_array(tier1_target_ratio)[..., np.newaxis]
+
+
+def calculate_dividends_batch(
+    net_income: np.ndarray, required_capital: np.ndarray, initial_capital: np.ndarray
+) -> np.ndarray:
+    previous_capital = lag_series(required_capital, initial_capital)
+    return net_income - (required_capital - previous_capital)
+
+
+def calculate_pv_batch(
+    dividends: np.ndarray, cost_of_equity: np.ndarray, terminal_growth: np.ndarray
+) -> np.ndarray:
+    if np.any(cost_of_equity <= terminal_growth):
+        raise ValueError("Cost of equity must be greater than terminal growth")
+    pv = present_value(dividends, cost_of_equity)
+    tv = gordon_terminal_value(dividends[..., -1], cost_of_equity, terminal_growth)
+    pv_tv = discount_terminal_value(tv, cost_of_equity, dividends.shape[-1])
+    return pv + pv_tv
+
+
+def calculate_intrinsic_value_batch(
+    equity_value: np.ndarray, shares_outstanding: np.ndarray
+) -> np.ndarray:
+    if np.any(shares_outstanding <= 0):
+        raise ValueError("Shares outstanding must be positive")
+    return equity_value / shares_outstanding
+
+
 def create_bank_graph() -> CalculationGraph:
     graph = CalculationGraph("Bank_DDM")
 
     # Inputs: initial_net_income, income_growth_rates, rwa_intensity (RoRWA), tier1_target_ratio, initial_capital, cost_of_equity, terminal_growth
 
-    graph.add_node("net_income", project_net_income)
+    graph.add_node("net_income", project_net_income, project_net_income_batch)
 
     # calculate_rwa(net_income, rwa_intensity)
-    graph.add_node("rwa", calculate_rwa)
+    graph.add_node("rwa", calculate_rwa, calculate_rwa_batch)
 
     # calculate_required_capital(rwa, tier1_target_ratio)
-    graph.add_node("required_capital", calculate_required_capital)
+    graph.add_node(
+        "required_capital", calculate_required_capital, calculate_required_capital_batch
+    )
 
     # calculate_dividends(net_income, required_capital, initial_capital)
-    graph.add_node("dividends", calculate_dividends)
+    graph.add_node("dividends", calculate_dividends, calculate_dividends_batch)
 
     # calculate_cost_of_equity(risk_free_rate, beta, market_risk_premium, cost_of_equity_override)
-    graph.add_node("cost_of_equity", calculate_cost_of_equity)
+    # Scalar-override branch and CAPM arithmetic both broadcast over arrays.
+    graph.add_node("cost_of_equity", calculate_cost_of_equity, calculate_cost_of_equity)
 
     # calculate_pv(dividends, cost_of_equity, terminal_growth)
-    graph.add_node("equity_value", calculate_pv)
-    graph.add_node("intrinsic_value", calculate_intrinsic_value)
+    graph.add_node("equity_value", calculate_pv, calculate_pv_batch)
+    graph.add_node(
+        "intrinsic_value", calculate_intrinsic_value, calculate_intrinsic_value_batch
+    )
 
     return graph
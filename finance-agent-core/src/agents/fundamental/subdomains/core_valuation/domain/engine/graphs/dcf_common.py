@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+import numpy as np
+
+from ..dcf_kernels import (
+    as_kernel_array,
+    compound_levels,
+    gordon_terminal_value,
+    guard_terminal_growth,
+    lag_series,
+    present_value,
+)
+
 
 def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(maximum, value))
@@ -212,3 +223,179 @@ def calculate_intrinsic_value(equity_value: float, shares_outstanding: float) ->
     if shares_outstanding <= 0:
         raise ValueError("shares_outstanding must be positive")
     return equity_value / shares_outstanding
+
+
+# Batch (NumPy) counterparts used by CalculationGraph.calculate_batch.
+# Scalars arrive as floats or (N,) arrays, series as (Y,) or (N, Y) arrays.
+
+
+def converge_series_batch(
+    values: np.ndarray,
+    *,
+    target: np.ndarray | float,
+    start_index: int,
+    min_value: np.ndarray | float,
+    max_value: np.ndarray | float,
+) -> np.ndarray:
+    values = as_kernel_array(values)
+    if values.shape[-1] == 0:
+        raise ValueError("projection series cannot be empty")
+
+    min_column = _as_column(min_value)
+    max_column = _as_column(max_value)
+    clamped_target = np.clip(_as_column(target), min_column, max_column)
+    clamped = np.clip(values, min_column, max_column)
+    clamped = np.array(
+        np.broadcast_to(
+            clamped, np.broadcast_shapes(clamped.shape, clamped_target.shape)
+        )
+    )
+    n = clamped.shape[-1]
+    start = max(0, min(start_index, n - 1))
+    if start < n - 1:
+        start_value = clamped[..., start : start + 1]
+        progress = np.arange(1, n - start, dtype=clamped.dtype) / (n - start - 1)
+        clamped[..., start + 1 :] = start_value + (
+            (clamped_target - start_value) * progress
+        )
+    clamped[..., -1:] = clamped_target
+    return clamped
+
+
+def projection_years_batch(growth_rates: np.ndarray) -> int:
+    if growth_rates.shape[-1] == 0:
+        raise ValueError("growth_rates cannot be empty")
+    return int(growth_rates.shape[-1])
+
+
+def batch_guard_mask(
+    *,
+    initial_revenue: np.ndarray,
+    wacc: np.ndarray,
+    shares_outstanding: np.ndarray,
+) -> np.ndarray:
+    """
+    Per-row form of the input guards the batch kernels raise on for the whole
+    batch. Rows where this is False would trip project_revenue_batch,
+    effective_terminal_growth_batch or calculate_intrinsic_value_batch; the
+    terminal value guards cannot trip once terminal growth is guarded.
+    """
+    return (
+        _positive_rows(initial_revenue)
+        & _terminal_wacc_rows(wacc)
+        & _positive_rows(shares_outstanding)
+    )
+
+
+def project_revenue_batch(
+    initial_revenue: np.ndarray, growth_rates_converged: np.ndarray
+) -> np.ndarray:
+    if not np.all(_positive_rows(initial_revenue)):
+        raise ValueError("initial_revenue must be positive")
+    growth = as_kernel_array(growth_rates_converged)
+    if growth.shape[-1] == 0:
+        raise ValueError("growth_rates_converged cannot be empty")
+    return compound_levels(initial_revenue, growth)
+
+
+def calculate_ebit_batch(
+    projected_revenue: np.ndarray, operating_margins_converged: np.ndarray
+) -> np.ndarray:
+    return projected_revenue * operating_margins_converged
+
+
+def calculate_nopat_batch(ebit: np.ndarray, tax_rate: np.ndarray) -> np.ndarray:
+    effective_tax = np.clip(tax_rate, 0.0, 0.60)
+    return ebit * (1.0 - _as_column(effective_tax))
+
+
+def calculate_delta_wc_batch(
+    projected_revenue: np.ndarray,
+    initial_revenue: np.ndarray,
+    wc_rates_converged: np.ndarray,
+) -> np.ndarray:
+    previous = lag_series(projected_revenue, initial_revenue)
+    return (projected_revenue - previous) * wc_rates_converged
+
+
+def calculate_fcff_batch(
+    nopat: np.ndarray,
+    projected_revenue: np.ndarray,
+    da_rates_converged: np.ndarray,
+    capex_rates_converged: np.ndarray,
+    delta_wc: np.ndarray,
+    sbc_rates_converged: np.ndarray,
+) -> np.ndarray:
+    da = projected_revenue * da_rates_converged
+    capex = projected_revenue * capex_rates_converged
+    return nopat + da - capex - delta_wc
+
+
+def calculate_reinvestment_rates_batch(
+    projected_revenue: np.ndarray,
+    da_rates_converged: np.ndarray,
+    capex_rates_converged: np.ndarray,
+    delta_wc: np.ndarray,
+) -> np.ndarray:
+    reinvestment = (
+        (projected_revenue * capex_rates_converged)
+        - (projected_revenue * da_rates_converged)
+        + delta_wc
+    )
+    safe_revenue = np.where(projected_revenue == 0, 1.0, projected_revenue)
+    return np.where(projected_revenue == 0, 0.0, reinvestment / safe_revenue)
+
+
+def final_fcff_batch(fcff: np.ndarray) -> np.ndarray:
+    if fcff.shape[-1] == 0:
+        raise ValueError("fcff cannot be empty")
+    return fcff[..., -1]
+
+
+def effective_terminal_growth_batch(
+    terminal_growth: np.ndarray, wacc: np.ndarray
+) -> np.ndarray:
+    if not np.all(_terminal_wacc_rows(wacc)):
+        raise ValueError(
+            "wacc must be greater than 0.5% for terminal value calculation"
+        )
+    return guard_terminal_growth(
+        terminal_growth, wacc, spread=0.005, floor=-0.01, cap=0.05
+    )
+
+
+def calculate_terminal_value_batch(
+    final_fcff: np.ndarray, wacc: np.ndarray, terminal_growth_effective: np.ndarray
+) -> np.ndarray:
+    if np.any(terminal_growth_effective >= wacc):
+        raise ValueError("terminal_growth_effective must be less than wacc")
+    denominator = wacc - terminal_growth_effective
+    if np.any(denominator <= 1e-6):
+        raise ValueError("terminal value denominator too small")
+    return gordon_terminal_value(final_fcff, wacc, terminal_growth_effective)
+
+
+def calculate_pv_fcff_batch(fcff: np.ndarray, wacc: np.ndarray) -> np.ndarray:
+    return present_value(fcff, wacc)
+
+
+def calculate_intrinsic_value_batch(
+    equity_value: np.ndarray, shares_outstanding: np.ndarray
+) -> np.ndarray:
+    if not np.all(_positive_rows(shares_outstanding)):
+        raise ValueError("shares_outstanding must be positive")
+    return equity_value / shares_outstanding
+
+
+# Written as "not failing" so NaN rows pass, as with the original np.any checks.
+def _positive_rows(value: np.ndarray) -> np.ndarray:
+    return ~(np.asarray(value) <= 0)
+
+
+def _terminal_wacc_rows(wacc: np.ndarray) -> np.ndarray:
+    return ~(np.asarray(wacc) - 0.005 <= -0.01)
+
+
+def _as_column(value: np.ndarray) -> np.ndarray:
+    # Lift per-scenario scalars to (N, 1) so they broadcast across projection years.
+    return as_kernel_array(value)[..., np.newaxis]
@@ -1,24 +1,39 @@
 from __future__ import annotations
 
+import numpy as np
+
 from ..core import CalculationGraph
 from .dcf_common import (
     calculate_delta_wc,
+    calculate_delta_wc_batch,
     calculate_ebit,
+    calculate_ebit_batch,
     calculate_enterprise_value,
     calculate_equity_value,
     calculate_fcff,
+    calculate_fcff_batch,
     calculate_intrinsic_value,
+    calculate_intrinsic_value_batch,
     calculate_nopat,
+    calculate_nopat_batch,
     calculate_pv_fcff,
+    calculate_pv_fcff_batch,
     calculate_pv_terminal,
     calculate_reinvestment_rates,
+    calculate_reinvestment_rates_batch,
     calculate_terminal_value,
+    calculate_terminal_value_batch,
     clamp,
     converge_series,
+    converge_series_batch,
     effective_terminal_growth,
+    effective_terminal_growth_batch,
     final_fcff,
+    final_fcff_batch,
     project_revenue,
+    project_revenue_batch,
     projection_years,
+    projection_years_batch,
 )
 
 HIGH_MARGIN_REGIME_TRIGGER = 0.50
@@ -139,31 +154,150 @@ def converge_sbc_rates_growth(sbc_rates: list[float]) -> list[float]:
     )
 
 
+def converge_growth_rates_growth_batch(
+    growth_rates: np.ndarray, terminal_growth: np.ndarray
+) -> np.ndarray:
+    length = growth_rates.shape[-1]
+    target = np.clip(terminal_growth, -0.005, 0.05)
+    raw_last = np.clip(growth_rates[..., -1], -0.50, 1.20)
+    if length <= SHORT_HORIZON_YEARS:
+        bridge_target = np.minimum(
+            raw_last, target + SHORT_HORIZON_TERMINAL_BRIDGE_SPREAD
+        )
+        target = np.where(raw_last > target, np.maximum(target, bridge_target), target)
+    return converge_series_batch(
+        growth_rates,
+        target=target,
+        start_index=_late_growth_rate_convergence_start(length),
+        min_value=-0.50,
+        max_value=1.20,
+    )
+
+
+def converge_operating_margins_growth_batch(
+    operating_margins: np.ndarray,
+) -> np.ndarray:
+    trailing_margin = operating_margins[..., -1]
+    high_margin = trailing_margin >= HIGH_MARGIN_REGIME_TRIGGER
+    target_ceiling = np.where(
+        high_margin, HIGH_MARGIN_TARGET_CEILING, BASE_MARGIN_TARGET_CEILING
+    )
+    series_ceiling = np.where(
+        high_margin, HIGH_MARGIN_SERIES_CEILING, BASE_MARGIN_SERIES_CEILING
+    )
+    return converge_series_batch(
+        operating_margins,
+        target=np.clip(np.maximum(trailing_margin, 0.18), 0.10, target_ceiling),
+        start_index=_growth_convergence_start(operating_margins.shape[-1]),
+        min_value=-0.25,
+        max_value=series_ceiling,
+    )
+
+
+def converge_da_rates_growth_batch(da_rates: np.ndarray) -> np.ndarray:
+    return converge_series_batch(
+        da_rates,
+        target=np.clip(da_rates[..., -1], 0.02, 0.10),
+        start_index=_growth_convergence_start(da_rates.shape[-1]),
+        min_value=0.0,
+        max_value=0.15,
+    )
+
+
+def converge_capex_rates_growth_batch(
+    capex_rates: np.ndarray, da_rates_converged: np.ndarray
+) -> np.ndarray:
+    da_anchor = np.clip(da_rates_converged[..., -1], 0.02, 0.10)
+    target = np.maximum(da_anchor * 1.20, np.clip(capex_rates[..., -1], 0.04, 0.18))
+    return converge_series_batch(
+        capex_rates,
+        target=target,
+        start_index=_growth_convergence_start(capex_rates.shape[-1]),
+        min_value=0.0,
+        max_value=0.25,
+    )
+
+
+def converge_wc_rates_growth_batch(wc_rates: np.ndarray) -> np.ndarray:
+    return converge_series_batch(
+        wc_rates,
+        target=np.clip(wc_rates[..., -1], 0.0, 0.12),
+        start_index=_growth_convergence_start(wc_rates.shape[-1]),
+        min_value=-0.08,
+        max_value=0.20,
+    )
+
+
+def converge_sbc_rates_growth_batch(sbc_rates: np.ndarray) -> np.ndarray:
+    return converge_series_batch(
+        sbc_rates,
+        target=np.clip(np.minimum(sbc_rates[..., -1], 0.05), 0.0, 0.12),
+        start_index=_growth_convergence_start(sbc_rates.shape[-1]),
+        min_value=0.0,
+        max_value=0.18,
+    )
+
+
 def create_dcf_growth_graph() -> CalculationGraph:
     graph = CalculationGraph("DCF_GROWTH")
 
-    graph.add_node("projection_years", projection_years)
-    graph.add_node("growth_rates_converged", converge_growth_rates_growth)
-    graph.add_node("operating_margins_converged", converge_operating_margins_growth)
-    graph.add_node("da_rates_converged", converge_da_rates_growth)
-    graph.add_node("capex_rates_converged", converge_capex_rates_growth)
-    graph.add_node("wc_rates_converged", converge_wc_rates_growth)
-    graph.add_node("sbc_rates_converged", converge_sbc_rates_growth)
-
-    graph.add_node("projected_revenue", project_revenue)
-    graph.add_node("ebit", calculate_ebit)
-    graph.add_node("nopat", calculate_nopat)
-    graph.add_node("delta_wc", calculate_delta_wc)
-    graph.add_node("fcff", calculate_fcff)
-    graph.add_node("reinvestment_rates", calculate_reinvestment_rates)
-
-    graph.add_node("final_fcff", final_fcff)
-    graph.add_node("terminal_growth_effective", effective_terminal_growth)
-    graph.add_node("terminal_value", calculate_terminal_value)
-    graph.add_node("pv_fcff", calculate_pv_fcff)
-    graph.add_node("pv_terminal", calculate_pv_terminal)
-    graph.add_node("enterprise_value", calculate_enterprise_value)
-    graph.add_node("equity_value", calculate_equity_value)
-    graph.add_node("intrinsic_value", calculate_intrinsic_value)
+    graph.add_node("projection_years", projection_years, projection_years_batch)
+    graph.add_node(
+        "growth_rates_converged",
+        converge_growth_rates_growth,
+        converge_growth_rates_growth_batch,
+    )
+    graph.add_node(
+        "operating_margins_converged",
+        converge_operating_margins_growth,
+        converge_operating_margins_growth_batch,
+    )
+    graph.add_node(
+        "da_rates_converged", converge_da_rates_growth, converge_da_rates_growth_batch
+    )
+    graph.add_node(
+        "capex_rates_converged",
+        converge_capex_rates_growth,
+        converge_capex_rates_growth_batch,
+    )
+    graph.add_node(
+        "wc_rates_converged", converge_wc_rates_growth, converge_wc_rates_growth_batch
+    )
+    graph.add_node(
+        "sbc_rates_converged",
+        converge_sbc_rates_growth,
+        converge_sbc_rates_growth_batch,
+    )
+
+    graph.add_node("projected_revenue", project_revenue, project_revenue_batch)
+    graph.add_node("ebit", calculate_ebit, calculate_ebit_batch)
+    graph.add_node("nopat", calculate_nopat, calculate_nopat_batch)
+    graph.add_node("delta_wc", calculate_delta_wc, calculate_delta_wc_batch)
+    graph.add_node("fcff", calculate_fcff, calculate_fcff_batch)
+    graph.add_node(
+        "reinvestment_rates",
+        calculate_reinvestment_rates,
+        calculate_reinvestment_rates_batch,
+    )
+
+    graph.add_node("final_fcff", final_fcff, final_fcff_batch)
+    graph.add_node(
+        "terminal_growth_effective",
+        effective_terminal_growth,
+        effective_terminal_growth_batch,
+    )
+    graph.add_node(
+        "terminal_value", calculate_terminal_value, calculate_terminal_value_batch
+    )
+    graph.add_node("pv_fcff", calculate_pv_fcff, calculate_pv_fcff_batch)
+    # Plain arithmetic nodes broadcast over NumPy arrays as-is.
+    graph.add_node("pv_terminal", calculate_pv_terminal, calculate_pv_terminal)
+    graph.add_node(
+        "enterprise_value", calculate_enterprise_value, calculate_enterprise_value
+    )
+    graph.add_node("equity_value", calculate_equity_value, calculate_equity_value)
+    graph.add_node(
+        "intrinsic_value", calculate_intrinsic_value, calculate_intrinsic_value_batch
+    )
 
     return graph
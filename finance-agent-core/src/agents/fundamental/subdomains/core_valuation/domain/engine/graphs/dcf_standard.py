@@ -1,24 +1,39 @@
 from __future__ import annotations
 
+import numpy as np
+
 from ..core import CalculationGraph
 from .dcf_common import (
     calculate_delta_wc,
+    calculate_delta_wc_batch,
     calculate_ebit,
+    calculate_ebit_batch,
     calculate_enterprise_value,
     calculate_equity_value,
     calculate_fcff,
+    calculate_fcff_batch,
     calculate_intrinsic_value,
+    calculate_intrinsic_value_batch,
     calculate_nopat,
+    calculate_nopat_batch,
     calculate_pv_fcff,
+    calculate_pv_fcff_batch,
     calculate_pv_terminal,
     calculate_reinvestment_rates,
+    calculate_reinvestment_rates_batch,
     calculate_terminal_value,
+    calculate_terminal_value_batch,
     clamp,
     converge_series,
+    converge_series_batch,
     effective_terminal_growth,
+    effective_terminal_growth_batch,
     final_fcff,
+    final_fcff_batch,
     project_revenue,
+    project_revenue_batch,
     projection_years,
+    projection_years_batch,
 )
 
 
@@ -133,31 +148,141 @@ def converge_sbc_rates_standard(sbc_rates: list[float]) -> list[float]:
     )
 
 
+def converge_growth_rates_standard_batch(
+    growth_rates: np.ndarray, terminal_growth: np.ndarray
+) -> np.ndarray:
+    return converge_series_batch(
+        growth_rates,
+        target=np.clip(terminal_growth, -0.01, 0.04),
+        start_index=_late_growth_convergence_start(growth_rates.shape[-1]),
+        min_value=-0.40,
+        max_value=0.80,
+    )
+
+
+def converge_operating_margins_standard_batch(
+    operating_margins: np.ndarray,
+) -> np.ndarray:
+    anchor = operating_margins[..., -1]
+    lower_bound = np.where(anchor >= 0.34, 0.10, 0.08)
+    upper_bound = np.where(anchor >= 0.34, 0.40, np.where(anchor >= 0.28, 0.34, 0.30))
+    return converge_series_batch(
+        operating_margins,
+        target=np.clip(anchor, lower_bound, upper_bound),
+        start_index=max(1, operating_margins.shape[-1] // 2),
+        min_value=-0.20,
+        max_value=0.45,
+    )
+
+
+def converge_da_rates_standard_batch(da_rates: np.ndarray) -> np.ndarray:
+    return converge_series_batch(
+        da_rates,
+        target=np.clip(da_rates[..., -1], 0.015, 0.08),
+        start_index=max(1, da_rates.shape[-1] // 2),
+        min_value=0.0,
+        max_value=0.12,
+    )
+
+
+def converge_capex_rates_standard_batch(
+    capex_rates: np.ndarray, da_rates_converged: np.ndarray
+) -> np.ndarray:
+    da_anchor = np.clip(da_rates_converged[..., -1], 0.015, 0.08)
+    target = np.maximum(da_anchor * 1.05, np.clip(capex_rates[..., -1], 0.03, 0.12))
+    return converge_series_batch(
+        capex_rates,
+        target=target,
+        start_index=max(1, capex_rates.shape[-1] // 2),
+        min_value=0.0,
+        max_value=0.18,
+    )
+
+
+def converge_wc_rates_standard_batch(wc_rates: np.ndarray) -> np.ndarray:
+    return converge_series_batch(
+        wc_rates,
+        target=np.clip(wc_rates[..., -1], 0.0, 0.08),
+        start_index=max(1, wc_rates.shape[-1] // 2),
+        min_value=-0.05,
+        max_value=0.15,
+    )
+
+
+def converge_sbc_rates_standard_batch(sbc_rates: np.ndarray) -> np.ndarray:
+    return converge_series_batch(
+        sbc_rates,
+        target=np.clip(np.minimum(sbc_rates[..., -1], 0.03), 0.0, 0.08),
+        start_index=max(1, sbc_rates.shape[-1] // 2),
+        min_value=0.0,
+        max_value=0.12,
+    )
+
+
 def create_dcf_standard_graph() -> CalculationGraph:
     graph = CalculationGraph("DCF_STANDARD")
 
-    graph.add_node("projection_years", projection_years)
-    graph.add_node("growth_rates_converged", converge_growth_rates_standard)
-    graph.add_node("operating_margins_converged", converge_operating_margins_standard)
-    graph.add_node("da_rates_converged", converge_da_rates_standard)
-    graph.add_node("capex_rates_converged", converge_capex_rates_standard)
-    graph.add_node("wc_rates_converged", converge_wc_rates_standard)
-    graph.add_node("sbc_rates_converged", converge_sbc_rates_standard)
-
-    graph.add_node("projected_revenue", project_revenue)
-    graph.add_node("ebit", calculate_ebit)
-    graph.add_node("nopat", calculate_nopat)
-    graph.add_node("delta_wc", calculate_delta_wc)
-    graph.add_node("fcff", calculate_fcff)
-    graph.add_node("reinvestment_rates", calculate_reinvestment_rates)
-
-    graph.add_node("final_fcff", final_fcff)
-    graph.add_node("terminal_growth_effective", effective_terminal_growth)
-    graph.add_node("terminal_value", calculate_terminal_value)
-    graph.add_node("pv_fcff", calculate_pv_fcff)
-    graph.add_node("pv_terminal", calculate_pv_terminal)
-    graph.add_node("enterprise_value", calculate_enterprise_value)
-    graph.add_node("equity_value", calculate_equity_value)
-    graph.add_node("intrinsic_value", calculate_intrinsic_value)
+    graph.add_node("projection_years", projection_years, projection_years_batch)
+    graph.add_node(
+        "growth_rates_converged",
+        converge_growth_rates_standard,
+        converge_growth_rates_standard_batch,
+    )
+    graph.add_node(
+        "operating_margins_converged",
+        converge_operating_margins_standard,
+        converge_operating_margins_standard_batch,
+    )
+    graph.add_node(
+        "da_rates_converged",
+        converge_da_rates_standard,
+        converge_da_rates_standard_batch,
+    )
+    graph.add_node(
+        "capex_rates_converged",
+        converge_capex_rates_standard,
+        converge_capex_rates_standard_batch,
+    )
+    graph.add_node(
+        "wc_rates_converged",
+        converge_wc_rates_standard,
+        converge_wc_rates_standard_batch,
+    )
+    graph.add_node(
+        "sbc_rates_converged",
+        converge_sbc_rates_standard,
+        converge_sbc_rates_standard_batch,
+    )
+
+    graph.add_node("projected_revenue", project_revenue, project_revenue_batch)
+    graph.add_node("ebit", calculate_ebit, calculate_ebit_batch)
+    graph.add_node("nopat", calculate_nopat, calculate_nopat_batch)
+    graph.add_node("delta_wc", calculate_delta_wc, calculate_delta_wc_batch)
+    graph.add_node("fcff", calculate_fcff, calculate_fcff_batch)
+    graph.add_node(
+        "reinvestment_rates",
+        calculate_reinvestment_rates,
+        calculate_reinvestment_rates_batch,
+    )
+
+    graph.add_node("final_fcff", final_fcff, final_fcff_batch)
+    graph.add_node(
+        "terminal_growth_effective",
+        effective_terminal_growth,
+        effective_terminal_growth_batch,
+    )
+    graph.add_node(
+        "terminal_value", calculate_terminal_value, calculate_terminal_value_batch
+    )
+    graph.add_node("pv_fcff", calculate_pv_fcff, calculate_pv_fcff_batch)
+    # Plain arithmetic nodes broadcast over NumPy arrays as-is.
+    graph.add_node("pv_terminal", calculate_pv_terminal, calculate_pv_terminal)
+    graph.add_node(
+        "enterprise_value", calculate_enterprise_value, calculate_enterprise_value
+    )
+    graph.add_node("equity_value", calculate_equity_value, calculate_equity_value)
+    graph.add_node(
+        "intrinsic_value", calculate_intrinsic_value, calculate_intrinsic_value_batch
+    )
 
     return graph
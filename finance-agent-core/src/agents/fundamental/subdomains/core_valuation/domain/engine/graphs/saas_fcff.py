@@ -1,6 +1,16 @@
 from __future__ import annotations
 
+import numpy as np
+
 from ..core import CalculationGraph
+from ..dcf_kernels import (
+    as_kernel_array,
+    compound_levels,
+    gordon_terminal_value,
+    lag_series,
+    present_value,
+)
+from .dcf_common import final_fcff, final_fcff_batch
 
 
 def project_revenue(initial_revenue: float, growth_rates: list[float]) -> list[float]:
@@ -90,28 +100,96 @@ def calculate_intrinsic_value(equity_value: float, shares_outstanding: float) ->
     return equity_value / shares_outstanding
 
 
+def project_revenue_batch(
+    initial_revenue: np.ndarray, growth_rates: np.ndarray
+) -> np.ndarray:
+    return compound_levels(initial_revenue, growth_rates)
+
+
+def calculate_ebit_batch(
+    projected_revenue: np.ndarray, operating_margins: np.ndarray
+) -> np.ndarray:
+    return projected_revenue * operating_margins
+
+
+def calculate_nopat_batch(ebit: np.ndarray, tax_rate: np.ndarray) -> np.ndarray:
+    return ebit * (1 - as_kernel_array(tax_rate)[..., np.newaxis])
+
+
+def calculate_delta_wc_batch(
+    projected_revenue: np.ndarray,
+    initial_revenue: np.ndarray,
+    wc_rates: np.ndarray,
+) -> np.ndarray:
+    previous = lag_series(projected_revenue, initial_revenue)
+    return (projected_revenue - previous) * wc_rates
+
+
+def calculate_fcff_batch(
+    nopat: np.ndarray,
+    projected_revenue: np.ndarray,
+    da_rates: np.ndarray,
+    capex_rates: np.ndarray,
+    delta_wc: np.ndarray,
+    sbc_rates: np.ndarray,
+) -> np.ndarray:
+    da = projected_revenue * da_rates
+    capex = projected_revenue * capex_rates
+    return nopat + da - capex - delta_wc
+
+
+def calculate_terminal_value_batch(
+    final_fcff: np.ndarray, wacc: np.ndarray, terminal_growth: np.ndarray
+) -> np.ndarray:
+    if np.any(terminal_growth >= wacc):
+        raise ValueError("Terminal growth rate must be less than WACC")
+    return gordon_terminal_value(final_fcff, wacc, terminal_growth)
+
+
+def calculate_pv_fcff_batch(fcff: np.ndarray, wacc: np.ndarray) -> np.ndarray:
+    return present_value(fcff, wacc)
+
+
+def calculate_intrinsic_value_batch(
+    equity_value: np.ndarray, shares_outstanding: np.ndarray
+) -> np.ndarray:
+    if np.any(shares_outstanding <= 0):
+        raise ValueError("Shares outstanding must be positive")
+    return equity_value / shares_outstanding
+
+
+def fcff_projection_years(fcff: list[float]) -> int:
+    return len(fcff)
+
+
+def fcff_projection_years_batch(fcff: np.ndarray) -> int:
+    return int(fcff.shape[-1])
+
+
 def create_saas_graph() -> CalculationGraph:
     graph = CalculationGraph("SaaS_FCFF")
 
-    graph.add_node("projected_revenue", project_revenue)
-    graph.add_node("ebit", calculate_ebit)
-    graph.add_node("nopat", calculate_nopat)
-    graph.add_node("delta_wc", calculate_delta_wc)
-    graph.add_node("fcff", calculate_fcff)
-
-    def get_final_fcff(fcff: list[float]) -> float:
-        return fcff[-1]
-
-    def projection_years(fcff: list[float]) -> int:
-        return len(fcff)
-
-    graph.add_node("final_fcff", get_final_fcff)
-    graph.add_node("terminal_value", calculate_terminal_value)
-    graph.add_node("pv_fcff", calculate_pv_fcff)
-    graph.add_node("projection_years", projection_years)
-    graph.add_node("pv_terminal", calculate_pv_terminal)
-    graph.add_node("enterprise_value", calculate_enterprise_value)
-    graph.add_node("equity_value", calculate_equity_value)
-    graph.add_node("intrinsic_value", calculate_intrinsic_value)
+    graph.add_node("projected_revenue", project_revenue, project_revenue_batch)
+    graph.add_node("ebit", calculate_ebit, calculate_ebit_batch)
+    graph.add_node("nopat", calculate_nopat, calculate_nopat_batch)
+    graph.add_node("delta_wc", calculate_delta_wc, calculate_delta_wc_batch)
+    graph.add_node("fcff", calculate_fcff, calculate_fcff_batch)
+    graph.add_node("final_fcff", final_fcff, final_fcff_batch)
+    graph.add_node(
+        "terminal_value", calculate_terminal_value, calculate_terminal_value_batch
+    )
+    graph.add_node("pv_fcff", calculate_pv_fcff, calculate_pv_fcff_batch)
+    graph.add_node(
+        "projection_years", fcff_projection_years, fcff_projection_years_batch
+    )
+    # Plain arithmetic nodes broadcast over NumPy arrays as-is.
+    graph.add_node("pv_terminal", calculate_pv_terminal, calculate_pv_terminal)
+    graph.add_node(
+        "enterprise_value", calculate_enterprise_value, calculate_enterprise_value
+    )
+    graph.add_node("equity_value", calculate_equity_value, calculate_equity_value)
+    graph.add_node(
+        "intrinsic_value", calculate_intrinsic_value, calculate_intrinsic_value_batch
+    )
 
     return graph
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures.process import BrokenProcessPool
 
 import numpy as np
 
@@ -14,7 +15,22 @@ from .monte_carlo_diagnostics_service import (
     build_convergence_diagnostics,
     build_summary,
 )
-from .monte_carlo_sampling_service import sample_variables
+from .monte_carlo_outcome_capture_service import (
+    CapturedOutcomes,
+    get_active_monte_carlo_outcome_capture,
+)
+from .monte_carlo_parallel_service import (
+    BatchOutcome,
+    iter_parallel_batch_outcomes,
+    resolve_parallel_workers,
+)
+from .monte_carlo_precision_service import build_quantile_precision_diagnostics
+from .monte_carlo_sampling_service import VariableSampleStream
+from .monte_carlo_sketch_service import (
+    StreamingQuantileSketch,
+    build_sketch_accuracy_diagnostics,
+)
+from .monte_carlo_variance_service import VarianceReductionTracker
 
 
 class MonteCarloEngine:
@@ -31,6 +47,14 @@ class MonteCarloEngine:
             raise ValueError("dynamic_window_min must be > 1")
         if config.convergence_tolerance <= 0:
             raise ValueError("convergence_tolerance must be positive")
+        if config.convergence_mode not in {"median_window", "quantile_precision"}:
+            raise ValueError(
+                "convergence_mode must be one of: median_window, quantile_precision"
+            )
+        if config.quantile_precision_target <= 0:
+            raise ValueError("quantile_precision_target must be positive")
+        if not 0 < config.quantile_precision_confidence < 1:
+            raise ValueError("quantile_precision_confidence must be in (0, 1)")
         if config.psd_eigen_floor <= 0:
             raise ValueError("psd_eigen_floor must be positive")
         if config.higham_max_iterations <= 0:
@@ -39,6 +63,20 @@ class MonteCarloEngine:
             raise ValueError("higham_tolerance must be positive")
         if config.sampler_type not in {"pseudo", "sobol", "lhs"}:
             raise ValueError("sampler_type must be one of: pseudo, sobol, lhs")
+        if config.workers <= 0:
+            raise ValueError("workers must be positive")
+        if config.parallel_shard_batches <= 0:
+            raise ValueError("parallel_shard_batches must be positive")
+        if config.summary_backend not in {"exact", "sketch"}:
+            raise ValueError("summary_backend must be one of: exact, sketch")
+        if config.sketch_compression < 20:
+            raise ValueError("sketch_compression must be >= 20")
+        if config.corr_diagnostics_max_samples < 0:
+            raise ValueError("corr_diagnostics_max_samples must be >= 0")
+        if config.antithetic and config.batch_size % 2 != 0:
+            # Odd batches would split (u, 1 - u) pairs across batch and shard
+            # boundaries, breaking seek and pair-level diagnostics.
+            raise ValueError("batch_size must be even when antithetic is enabled")
         self._config = config
 
     def run(
@@ -50,65 +88,259 @@ class MonteCarloEngine:
             [dict[str, np.ndarray], Mapping[str, float]], np.ndarray
         ],
         correlation_groups: tuple[CorrelationGroup, ...] = (),
+    ) -> MonteCarloResult:
+        workers, parallel_fallback_reason = resolve_parallel_workers(
+            config=self._config,
+            batch_evaluator=batch_evaluator,
+        )
+        if workers > 1:
+            try:
+                return self._run(
+                    base_inputs=base_inputs,
+                    distributions=distributions,
+                    batch_evaluator=batch_evaluator,
+                    correlation_groups=correlation_groups,
+                    workers=workers,
+                    parallel_fallback_reason=None,
+                )
+            except BrokenProcessPool:
+                # Shards reproduce the serial stream, so rerunning in-process
+                # yields the same result the pool would have produced.
+                workers = 1
+                parallel_fallback_reason = "process pool unavailable"
+        return self._run(
+            base_inputs=base_inputs,
+            distributions=distributions,
+            batch_evaluator=batch_evaluator,
+            correlation_groups=correlation_groups,
+            workers=workers,
+            parallel_fallback_reason=parallel_fallback_reason,
+        )
+
+    def _run(
+        self,
+        *,
+        base_inputs: Mapping[str, float],
+        distributions: Mapping[str, DistributionSpec],
+        batch_evaluator: Callable[
+            [dict[str, np.ndarray], Mapping[str, float]], np.ndarray
+        ],
+        correlation_groups: tuple[CorrelationGroup, ...],
+        workers: int,
+        parallel_fallback_reason: str | None,
     ) -> MonteCarloResult:
         max_iterations = self._config.iterations
         min_iterations = min(max_iterations, self._config.min_iterations)
-        batch_size = self._config.batch_size
 
-        rng = np.random.default_rng(self._config.seed)
-        sampled, sampling_diagnostics = sample_variables(
-            rng=rng,
+        # Draws are produced per batch so early stopping skips unused sampling.
+        sampler = VariableSampleStream(
             distributions=distributions,
             correlation_groups=correlation_groups,
-            iterations=max_iterations,
             config=self._config,
         )
-
-        outcomes = np.zeros(max_iterations, dtype=float)
-        executed_iterations = 0
-        while executed_iterations < max_iterations:
-            batch_end = min(executed_iterations + batch_size, max_iterations)
-            batch_length = batch_end - executed_iterations
-            sampled_batch = {
-                name: values[executed_iterations:batch_end]
-                for name, values in sampled.items()
-            }
-            batch_outcomes = np.asarray(
-                batch_evaluator(sampled_batch, base_inputs), dtype=float
+        if workers > 1:
+            batches = iter_parallel_batch_outcomes(
+                workers=workers,
+                distributions=distributions,
+                correlation_groups=correlation_groups,
+                config=self._config,
+                batch_evaluator=batch_evaluator,
+                base_inputs=base_inputs,
+            )
+        else:
+            batches = self._iter_serial_batch_outcomes(
+                sampler=sampler,
+                batch_evaluator=batch_evaluator,
+                base_inputs=base_inputs,
             )
-            if batch_outcomes.shape != (batch_length,):
-                raise ValueError(
-                    "batch_evaluator must return one outcome per sampled row "
-                    f"(expected={(batch_length,)}, actual={batch_outcomes.shape})"
-                )
-            outcomes[executed_iterations:batch_end] = batch_outcomes
-            executed_iterations = batch_end
 
-            if executed_iterations < min_iterations:
-                continue
+        outcomes = _OutcomeStore(self._config)
+        variance = VarianceReductionTracker(self._config)
+        executed_iterations = 0
+        try:
+            for batch in batches:
+                batch_length = batch.rows
+                batch_end = executed_iterations + batch_length
+                batch_outcomes = np.asarray(batch.outcomes, dtype=float)
+                if batch_outcomes.shape != (batch_length,):
+                    raise ValueError(
+                        "batch_evaluator must return one outcome per sampled row "
+                        f"(expected={(batch_length,)}, "
+                        f"actual={batch_outcomes.shape})"
+                    )
+                if batch.draw_records is not None:
+                    sampler.absorb(batch_length, batch.draw_records)
+                outcomes.append(batch_outcomes)
+                if variance.enabled:
+                    variance.update(batch_outcomes, batch.latent)
+                executed_iterations = batch_end
 
-            interim_diagnostics = build_convergence_diagnostics(
-                outcomes[:executed_iterations],
-                config=self._config,
-            )
-            converged = bool(interim_diagnostics.get("converged"))
-            sufficient_window = bool(interim_diagnostics.get("sufficient_window"))
-            if converged and sufficient_window:
-                break
+                if executed_iterations < min_iterations:
+                    continue
 
-        final_outcomes = outcomes[:executed_iterations]
+                # Convergence is checked on the merged, row-ordered stream, so
+                # the stopping point does not depend on the worker count.
+                interim_diagnostics = self._convergence_diagnostics(
+                    outcomes=outcomes,
+                    variance=variance,
+                    sample_size=executed_iterations,
+                )
+                converged = bool(interim_diagnostics.get("converged"))
+                sufficient_window = bool(interim_diagnostics.get("sufficient_window"))
+                if converged and sufficient_window:
+                    break
+        finally:
+            batches.close()
 
-        summary = build_summary(final_outcomes)
+        summary = variance.adjust_summary(outcomes.summary())
         diagnostics: dict[str, float | bool | int | str] = {
-            **build_convergence_diagnostics(final_outcomes, config=self._config),
+            **self._convergence_diagnostics(
+                outcomes=outcomes,
+                variance=variance,
+                sample_size=executed_iterations,
+            ),
             "configured_iterations": max_iterations,
             "executed_iterations": executed_iterations,
             "stopped_early": executed_iterations < max_iterations,
             "batch_evaluator_used": True,
-            **sampling_diagnostics,
+            "parallel_workers_requested": self._config.workers,
+            "parallel_workers": workers,
+            **sampler.diagnostics(),
+            **outcomes.diagnostics(),
+            **variance.diagnostics(),
         }
+        if parallel_fallback_reason is not None:
+            diagnostics["parallel_fallback_reason"] = parallel_fallback_reason
+        capture = get_active_monte_carlo_outcome_capture()
+        if capture is not None:
+            values, weights = outcomes.weighted_points()
+            capture.record(
+                CapturedOutcomes(
+                    values=values,
+                    weights=weights,
+                    executed_iterations=executed_iterations,
+                )
+            )
         return MonteCarloResult(summary=summary, diagnostics=diagnostics)
 
+    def _convergence_diagnostics(
+        self,
+        *,
+        outcomes: _OutcomeStore,
+        variance: VarianceReductionTracker,
+        sample_size: int,
+    ) -> dict[str, float | bool | int | str]:
+        diagnostics: dict[str, float | bool | int | str] = {
+            **build_convergence_diagnostics(
+                variance.convergence_outcomes(outcomes.recent()),
+                config=self._config,
+                sample_size=sample_size,
+            )
+        }
+        if self._config.convergence_mode == "quantile_precision":
+            # Median-window fields stay for reporting; the stopping decision
+            # ("converged"/"sufficient_window") comes from quantile precision.
+            diagnostics.update(
+                build_quantile_precision_diagnostics(
+                    outcomes.quantiles,
+                    config=self._config,
+                    sample_size=sample_size,
+                )
+            )
+        return diagnostics
+
+    def _iter_serial_batch_outcomes(
+        self,
+        *,
+        sampler: VariableSampleStream,
+        batch_evaluator: Callable[
+            [dict[str, np.ndarray], Mapping[str, float]], np.ndarray
+        ],
+        base_inputs: Mapping[str, float],
+    ) -> Generator[BatchOutcome, None, None]:
+        batch_size = self._config.batch_size
+        while sampler.drawn < self._config.iterations:
+            batch_length = min(batch_size, self._config.iterations - sampler.drawn)
+            sampled_batch = sampler.draw(batch_length)
+            yield BatchOutcome(
+                rows=batch_length,
+                outcomes=batch_evaluator(sampled_batch, base_inputs),
+                latent=sampler.take_latent_draws(),
+            )
+
+
+class _OutcomeStore:
+    """
+    Exact backend keeps every outcome for np.percentile summaries.
+    Sketch backend keeps a bounded quantile sketch plus the trailing windows
+    the convergence check needs; outcomes are retained only for the optional
+    exact accuracy check.
+    """
+
+    def __init__(self, config: MonteCarloConfig) -> None:
+        self._backend = config.summary_backend
+        self._sketch = (
+            StreamingQuantileSketch(compression=config.sketch_compression)
+            if config.summary_backend == "sketch"
+            else None
+        )
+        retain_outcomes = self._sketch is None or config.sketch_exact_check
+        self._outcomes = (
+            np.zeros(config.iterations, dtype=float) if retain_outcomes else None
+        )
+        self._tail = np.empty(0, dtype=float)
+        self._tail_length = 2 * config.convergence_window
+        self._count = 0
+
+    def append(self, batch_outcomes: np.ndarray) -> None:
+        end = self._count + batch_outcomes.shape[0]
+        if self._outcomes is not None:
+            self._outcomes[self._count : end] = batch_outcomes
+        if self._sketch is not None:
+            self._sketch.update(batch_outcomes)
+            self._tail = np.concatenate([self._tail, batch_outcomes])[
+                -self._tail_length :
+            ]
+        self._count = end
+
+    def recent(self) -> np.ndarray:
+        if self._sketch is not None:
+            return self._tail
+        return self._outcomes[: self._count]
+
+    def quantiles(self, percentiles: np.ndarray) -> np.ndarray:
+        if self._sketch is not None:
+            return self._sketch.quantiles(percentiles)
+        return np.percentile(self._outcomes[: self._count], percentiles)
+
+    def weighted_points(self) -> tuple[np.ndarray, np.ndarray]:
+        # Retained outcomes are exact unit-weight points; otherwise the sketch
+        # centroids stand in for them.
+        if self._outcomes is not None:
+            values = self._outcomes[: self._count].copy()
+            return values, np.ones(values.shape[0], dtype=float)
+        return self._sketch.centroids()
+
+    def summary(self) -> dict[str, float]:
+        if self._sketch is not None:
+            return self._sketch.summary()
+        return build_summary(self._outcomes[: self._count])
+
+    def diagnostics(self) -> dict[str, float | int | str]:
+        diagnostics: dict[str, float | int | str] = {
+            "summary_backend": self._backend,
+        }
+        if self._sketch is None:
+            return diagnostics
+        diagnostics.update(self._sketch.diagnostics())
+        if self._outcomes is not None:
+            diagnostics.update(
+                build_sketch_accuracy_diagnostics(
+                    self._sketch, self._outcomes[: self._count]
+                )
+            )
+        return diagnostics
+
 
 __all__ = [
     "CorrelationGroup",
@@ -35,11 +35,26 @@ class MonteCarloConfig:
     convergence_window: int = 250
     dynamic_window_min: int = 50
     convergence_tolerance: float = 0.002
+    # "median_window" compares medians of two trailing windows;
+    # "quantile_precision" stops once every reported percentile's confidence
+    # interval half-width is within quantile_precision_target (relative).
+    convergence_mode: Literal["median_window", "quantile_precision"] = "median_window"
+    quantile_precision_target: float = 0.01
+    quantile_precision_confidence: float = 0.95
     psd_repair_policy: Literal["error", "clip", "higham"] = "clip"
     psd_eigen_floor: float = 1e-8
     psd_tolerance: float = -1e-10
     higham_max_iterations: int = 50
     higham_tolerance: float = 1e-9
+    workers: int = 1
+    parallel_min_iterations: int = 20_000
+    parallel_shard_batches: int = 8
+    summary_backend: Literal["exact", "sketch"] = "exact"
+    sketch_compression: int = 400
+    sketch_exact_check: bool = False
+    corr_diagnostics_max_samples: int = 10_000
+    antithetic: bool = False
+    control_variate: bool = False
 
 
 @dataclass(frozen=True)
@@ -25,8 +25,12 @@ def build_convergence_diagnostics(
     outcomes: np.ndarray,
     *,
     config: MonteCarloConfig,
+    sample_size: int | None = None,
 ) -> dict[str, float | bool | int]:
-    sample_size = len(outcomes)
+    # `outcomes` may be only the trailing window when `sample_size` says how
+    # many outcomes the run has produced in total (streaming summaries).
+    if sample_size is None:
+        sample_size = len(outcomes)
     configured_window = config.convergence_window
     effective_window = min(
         configured_window,
@@ -69,6 +73,7 @@ def build_correlation_diagnostics(
     transformed_samples: Mapping[str, np.ndarray],
 ) -> dict[str, float | int]:
     pair_count = len(variables) * (len(variables) - 1) // 2
+    sample_size = int(latent_draws.shape[0])
     if pair_count <= 0:
         return {
             "corr_pairs_total": 0,
@@ -76,6 +81,9 @@ def build_correlation_diagnostics(
             "corr_pearson_max_abs_error": 0.0,
             "corr_spearman_mae": 0.0,
             "corr_spearman_max_abs_error": 0.0,
+            "corr_sample_size": sample_size,
+            "corr_pearson_error_bar": 0.0,
+            "corr_spearman_error_bar": 0.0,
         }
 
     pearson_realized = np.corrcoef(latent_draws, rowvar=False)
@@ -94,9 +102,37 @@ def build_correlation_diagnostics(
         "corr_pearson_max_abs_error": float(np.max(pearson_errors)),
         "corr_spearman_mae": float(np.mean(spearman_errors)),
         "corr_spearman_max_abs_error": float(np.max(spearman_errors)),
+        "corr_sample_size": sample_size,
+        "corr_pearson_error_bar": _correlation_error_bar(
+            _upper_triangle(pearson_realized, k=1),
+            sample_size=sample_size,
+            variance_factor=1.0,
+        ),
+        # Fieller et al.: var(z) of Spearman's rho is ~1.06 / (n - 3).
+        "corr_spearman_error_bar": _correlation_error_bar(
+            _upper_triangle(spearman_realized, k=1),
+            sample_size=sample_size,
+            variance_factor=1.06,
+        ),
     }
 
 
+def _correlation_error_bar(
+    realized: np.ndarray,
+    *,
+    sample_size: int,
+    variance_factor: float,
+) -> float:
+    # 95% half-width from the Fisher z standard error mapped back to r
+    # (delta method), worst case across pairs.
+    if sample_size <= 3:
+        return 0.0
+    z_stderr = np.sqrt(variance_factor / (sample_size - 3))
+    half_widths = 1.96 * z_stderr * (1.0 - np.clip(realized, -1.0, 1.0) ** 2)
+    half_width = float(np.max(half_widths))
+    return half_width if np.isfinite(half_width) else 0.0
+
+
 def _upper_triangle(matrix: np.ndarray, *, k: int = 1) -> np.ndarray:
     row_idx, col_idx = np.triu_indices(matrix.shape[0], k=k)
     return matrix[row_idx, col_idx]
@@ -111,21 +147,29 @@ def _gaussian_spearman_from_pearson(pearson_corr: np.ndarray) -> np.ndarray:
 
 
 def _spearman_corrcoef(matrix: np.ndarray) -> np.ndarray:
-    ranks = np.apply_along_axis(_rankdata, 0, matrix)
-    return np.corrcoef(ranks, rowvar=False)
-
-
-def _rankdata(values: np.ndarray) -> np.ndarray:
-    n = len(values)
-    order = np.argsort(values, kind="mergesort")
-    sorted_values = values[order]
-    ranks = np.empty(n, dtype=float)
-    i = 0
-    while i < n:
-        j = i
-        while j + 1 < n and sorted_values[j + 1] == sorted_values[i]:
-            j += 1
-        average_rank = (i + j + 2) / 2.0
-        ranks[order[i : j + 1]] = average_rank
-        i = j + 1
+    return np.corrcoef(_rankdata_columns(matrix), rowvar=False)
+
+
+def _rankdata_columns(matrix: np.ndarray) -> np.ndarray:
+    """
+    Average (tie-aware) 1-based ranks of every column, fully vectorized.
+    Ties become groups of equal sorted values; a group's rank is the mean of
+    the positions it occupies, computed for all columns with one bincount.
+    """
+    n_rows, n_cols = matrix.shape
+    if n_rows == 0:
+        return np.empty((0, n_cols), dtype=float)
+    order = np.argsort(matrix, axis=0, kind="mergesort")
+    sorted_values = np.take_along_axis(matrix, order, axis=0)
+    new_group = np.empty((n_rows, n_cols), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = sorted_values[1:] != sorted_values[:-1]
+    # Number groups column-major so ids are unique across columns.
+    group_ids = np.cumsum(new_group.T.ravel()) - 1
+    positions = np.tile(np.arange(1, n_rows + 1, dtype=float), n_cols)
+    group_ranks = np.bincount(group_ids, weights=positions) / np.bincount(group_ids)
+    ranks = np.empty((n_rows, n_cols), dtype=float)
+    np.put_along_axis(
+        ranks, order, group_ranks[group_ids].reshape(n_cols, n_rows).T, axis=0
+    )
     return ranks
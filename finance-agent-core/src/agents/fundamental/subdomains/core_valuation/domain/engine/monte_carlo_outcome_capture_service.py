@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import numpy as np
+
+from .monte_carlo_sketch_service import SUMMARY_PERCENTILES
+
+
+@dataclass(frozen=True)
+class CapturedOutcomes:
+    """
+    Outcome distribution of one engine run as weighted points: every outcome
+    with weight 1 (exact backend) or the sketch centroids (sketch backend).
+    """
+
+    values: np.ndarray
+    weights: np.ndarray
+    executed_iterations: int
+
+
+class MonteCarloOutcomeCapture:
+    """Collects the outcome distributions of engine runs made while active."""
+
+    def __init__(self) -> None:
+        self._runs: list[CapturedOutcomes] = []
+        self._lock = threading.Lock()
+
+    def record(self, outcomes: CapturedOutcomes) -> None:
+        with self._lock:
+            self._runs.append(outcomes)
+
+    def drain(self) -> list[CapturedOutcomes]:
+        """Return and forget the runs recorded since the previous drain."""
+        with self._lock:
+            runs, self._runs = self._runs, []
+            return runs
+
+
+_ACTIVE_OUTCOME_CAPTURE: contextvars.ContextVar[MonteCarloOutcomeCapture | None] = (
+    contextvars.ContextVar("monte_carlo_outcome_capture", default=None)
+)
+
+
+def get_active_monte_carlo_outcome_capture() -> MonteCarloOutcomeCapture | None:
+    return _ACTIVE_OUTCOME_CAPTURE.get()
+
+
+@contextmanager
+def capture_monte_carlo_outcomes(
+    capture: MonteCarloOutcomeCapture | None = None,
+) -> Iterator[MonteCarloOutcomeCapture]:
+    """Record the outcomes of engine runs in this context into ``capture``."""
+    active = capture if capture is not None else MonteCarloOutcomeCapture()
+    token = _ACTIVE_OUTCOME_CAPTURE.set(active)
+    try:
+        yield active
+    finally:
+        _ACTIVE_OUTCOME_CAPTURE.reset(token)
+
+
+def build_mixture_summary(
+    components: Sequence[tuple[CapturedOutcomes, float]],
+) -> dict[str, float]:
+    """
+    Summary of the mixture that draws component i with probability weight_i.
+    Each component's points are rescaled to total weight_i, so components
+    with different iteration counts or backends mix by weight alone.
+    Quantiles interpolate between point mid-ranks, as np.percentile does
+    for unit weights.
+    """
+    values_parts: list[np.ndarray] = []
+    weight_parts: list[np.ndarray] = []
+    for outcomes, weight in components:
+        total = float(np.sum(outcomes.weights))
+        if weight <= 0 or total <= 0:
+            continue
+        values_parts.append(np.asarray(outcomes.values, dtype=float))
+        weight_parts.append(np.asarray(outcomes.weights, dtype=float) * weight / total)
+    if not values_parts:
+        raise ValueError("mixture needs at least one positively weighted component")
+
+    values = np.concatenate(values_parts)
+    weights = np.concatenate(weight_parts)
+    order = np.argsort(values, kind="mergesort")
+    values = values[order]
+    weights = weights[order]
+    total = float(np.sum(weights))
+    mean = float(np.sum(values * weights) / total)
+    variance = float(np.sum(weights * (values - mean) ** 2) / total)
+
+    positions = (np.cumsum(weights) - weights / 2.0) / total
+    fractions = np.array([percentile / 100.0 for _, percentile in SUMMARY_PERCENTILES])
+    quantiles = np.interp(fractions, positions, values)
+    by_name = {
+        name: float(value)
+        for (name, _), value in zip(SUMMARY_PERCENTILES, quantiles, strict=True)
+    }
+    return {
+        "mean": mean,
+        "median": by_name["median"],
+        "std": float(np.sqrt(variance)),
+        "percentile_5": by_name["percentile_5"],
+        "percentile_25": by_name["percentile_25"],
+        "percentile_75": by_name["percentile_75"],
+        "percentile_95": by_name["percentile_95"],
+        "min": float(values[0]),
+        "max": float(values[-1]),
+    }
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import deque
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from uuid import uuid4
+
+import numpy as np
+
+from .monte_carlo_contracts import CorrelationGroup, DistributionSpec, MonteCarloConfig
+from .monte_carlo_sampling_service import GroupDrawRecords, VariableSampleStream
+
+MONTE_CARLO_WORKERS_ENV = "FUNDAMENTAL_MONTE_CARLO_WORKERS"
+
+BatchEvaluator = Callable[[dict[str, np.ndarray], Mapping[str, float]], np.ndarray]
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    rows: int
+    outcomes: np.ndarray
+    draw_records: tuple[GroupDrawRecords, ...] | None = None
+    latent: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class _ShardTask:
+    run_key: str
+    start: int
+    size: int
+    distributions: Mapping[str, DistributionSpec]
+    correlation_groups: tuple[CorrelationGroup, ...]
+    config: MonteCarloConfig
+    batch_evaluator: BatchEvaluator
+    base_inputs: Mapping[str, float]
+
+
+_POOL_LOCK = threading.Lock()
+_PROCESS_POOLS: dict[int, ProcessPoolExecutor] = {}
+# Worker-local: the stream of the run this process served last, reused by seek.
+_WORKER_STREAM: tuple[str, VariableSampleStream] | None = None
+
+
+def resolve_monte_carlo_workers() -> int:
+    raw = os.getenv(MONTE_CARLO_WORKERS_ENV)
+    if raw is None:
+        return 1
+    normalized = raw.strip().lower()
+    if not normalized:
+        return 1
+    if normalized == "auto":
+        return max(os.cpu_count() or 1, 1)
+    try:
+        parsed = int(normalized)
+    except ValueError:
+        return 1
+    return max(parsed, 1)
+
+
+def resolve_parallel_workers(
+    *,
+    config: MonteCarloConfig,
+    batch_evaluator: BatchEvaluator,
+) -> tuple[int, str | None]:
+    if config.workers <= 1:
+        return 1, None
+    if config.iterations < config.parallel_min_iterations:
+        return 1, "iterations below parallel_min_iterations"
+    try:
+        pickle.dumps(batch_evaluator)
+    except Exception:
+        return 1, "batch_evaluator is not picklable"
+    return config.workers, None
+
+
+def iter_parallel_batch_outcomes(
+    *,
+    workers: int,
+    distributions: Mapping[str, DistributionSpec],
+    correlation_groups: tuple[CorrelationGroup, ...],
+    config: MonteCarloConfig,
+    batch_evaluator: BatchEvaluator,
+    base_inputs: Mapping[str, float],
+) -> Generator[BatchOutcome, None, None]:
+    """
+    Evaluate contiguous row shards on a process pool and yield their batches in
+    row order. Shards seek into the same per-block streams the serial run uses,
+    so the merged outcome stream is identical for any worker count.
+    Closing the iterator (early convergence) cancels shards not yet started.
+    """
+    if config.seed is None:
+        # Every shard must seek into the same streams, so an unseeded run is
+        # pinned to one fresh seed before it is split across processes.
+        config = replace(
+            config, seed=int(np.random.SeedSequence().generate_state(1)[0])
+        )
+    pool = _get_process_pool(workers)
+    shard_rows = config.batch_size * config.parallel_shard_batches
+    run_key = uuid4().hex
+    pending: deque[Future[tuple[BatchOutcome, ...]]] = deque()
+    next_start = 0
+    try:
+        while pending or next_start < config.iterations:
+            # Two shards in flight per worker keep the pool busy while the
+            # parent merges results and checks convergence.
+            while len(pending) < workers * 2 and next_start < config.iterations:
+                size = min(shard_rows, config.iterations - next_start)
+                task = _ShardTask(
+                    run_key=run_key,
+                    start=next_start,
+                    size=size,
+                    distributions=distributions,
+                    correlation_groups=correlation_groups,
+                    config=config,
+                    batch_evaluator=batch_evaluator,
+                    base_inputs=base_inputs,
+                )
+                pending.append(pool.submit(_evaluate_shard, task))
+                next_start += size
+            yield from pending.popleft().result()
+    except BrokenProcessPool:
+        _discard_process_pool(workers, pool)
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def shutdown_monte_carlo_process_pools() -> None:
+    with _POOL_LOCK:
+        pools = list(_PROCESS_POOLS.values())
+        _PROCESS_POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    # Pools stay warm across runs; spawn avoids forking a threaded parent.
+    with _POOL_LOCK:
+        pool = _PROCESS_POOLS.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _PROCESS_POOLS[workers] = pool
+        return pool
+
+
+def _discard_process_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    with _POOL_LOCK:
+        if _PROCESS_POOLS.get(workers) is pool:
+            del _PROCESS_POOLS[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _evaluate_shard(task: _ShardTask) -> tuple[BatchOutcome, ...]:
+    stream = _worker_stream(task)
+    stream.seek(task.start)
+    end = task.start + task.size
+    batches: list[BatchOutcome] = []
+    position = task.start
+    # Draw and evaluate in the engine's batch size so every row sees exactly
+    # the same array shapes as in a serial run.
+    while position < end:
+        rows = min(task.config.batch_size, end - position)
+        sampled = stream.draw(rows)
+        outcomes = np.asarray(
+            task.batch_evaluator(sampled, task.base_inputs), dtype=float
+        )
+        batches.append(
+            BatchOutcome(
+                rows=rows,
+                outcomes=outcomes,
+                draw_records=stream.take_draw_records(),
+                latent=stream.take_latent_draws(),
+            )
+        )
+        position += rows
+    return tuple(batches)
+
+
+def _worker_stream(task: _ShardTask) -> VariableSampleStream:
+    global _WORKER_STREAM
+    if _WORKER_STREAM is not None and _WORKER_STREAM[0] == task.run_key:
+        return _WORKER_STREAM[1]
+    stream = VariableSampleStream(
+        distributions=task.distributions,
+        correlation_groups=task.correlation_groups,
+        config=task.config,
+    )
+    _WORKER_STREAM = (task.run_key, stream)
+    return stream
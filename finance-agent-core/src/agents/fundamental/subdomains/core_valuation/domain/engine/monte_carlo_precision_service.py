@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from math import sqrt
+from statistics import NormalDist
+from typing import Literal
+
+import numpy as np
+
+from .monte_carlo_contracts import MonteCarloConfig
+from .monte_carlo_sketch_service import SUMMARY_PERCENTILES
+
+MONTE_CARLO_CONVERGENCE_MODE_ENV = "FUNDAMENTAL_MONTE_CARLO_CONVERGENCE_MODE"
+MONTE_CARLO_QUANTILE_PRECISION_ENV = "FUNDAMENTAL_MONTE_CARLO_QUANTILE_PRECISION"
+
+_DEFAULT_QUANTILE_PRECISION = 0.01
+# The normal approximation to the binomial rank distribution needs a few
+# expected observations beyond each reported percentile.
+_MIN_TAIL_OBSERVATIONS = 10.0
+
+QuantileFn = Callable[[np.ndarray], np.ndarray]
+
+
+def resolve_monte_carlo_convergence_mode() -> Literal[
+    "median_window", "quantile_precision"
+]:
+    raw = os.getenv(MONTE_CARLO_CONVERGENCE_MODE_ENV)
+    if raw is None:
+        return "median_window"
+    normalized = raw.strip().lower()
+    if normalized == "quantile_precision":
+        return "quantile_precision"
+    return "median_window"
+
+
+def resolve_monte_carlo_quantile_precision() -> float:
+    raw = os.getenv(MONTE_CARLO_QUANTILE_PRECISION_ENV)
+    if raw is None or not raw.strip():
+        return _DEFAULT_QUANTILE_PRECISION
+    try:
+        parsed = float(raw.strip())
+    except ValueError:
+        return _DEFAULT_QUANTILE_PRECISION
+    return parsed if parsed > 0 else _DEFAULT_QUANTILE_PRECISION
+
+
+def build_quantile_precision_diagnostics(
+    quantiles: QuantileFn,
+    *,
+    config: MonteCarloConfig,
+    sample_size: int,
+) -> dict[str, float | bool | int | str]:
+    """
+    Distribution-free confidence intervals for the reported percentiles.
+    For percentile p the rank of the sample quantile is ~Binomial(n, p), so
+    the interval runs between the order statistics at p -/+ z*sqrt(p(1-p)/n).
+    Half-widths are reported relative to |quantile|, floored at the
+    interquartile range so percentiles near zero are judged against the
+    spread; the run has converged once every percentile is within the target.
+    For QMC samplers the iid interval is conservative.
+    """
+    z = NormalDist().inv_cdf(0.5 + config.quantile_precision_confidence / 2.0)
+    diagnostics: dict[str, float | bool | int | str] = {
+        "convergence_mode": "quantile_precision",
+        "quantile_precision_target": config.quantile_precision_target,
+        "quantile_precision_confidence": config.quantile_precision_confidence,
+    }
+    fractions = np.array([percentile / 100.0 for _, percentile in SUMMARY_PERCENTILES])
+    sufficient = bool(
+        sample_size > 1
+        and np.all(
+            sample_size * np.minimum(fractions, 1.0 - fractions)
+            >= _MIN_TAIL_OBSERVATIONS
+        )
+    )
+    if not sufficient:
+        diagnostics.update(
+            {
+                "converged": False,
+                "sufficient_window": False,
+                "quantile_precision_max_rel_half_width": 0.0,
+                "quantile_precision_binding": "",
+            }
+        )
+        return diagnostics
+
+    offsets = np.array([z * sqrt(p * (1.0 - p) / sample_size) for p in fractions])
+    lower = np.clip(fractions - offsets, 0.0, 1.0) * 100.0
+    upper = np.clip(fractions + offsets, 0.0, 1.0) * 100.0
+    values = quantiles(np.concatenate([fractions * 100.0, lower, upper]))
+    count = len(fractions)
+    centers = values[:count]
+    half_widths = (values[2 * count :] - values[count : 2 * count]) / 2.0
+
+    by_name = {
+        name: float(center)
+        for (name, _), center in zip(SUMMARY_PERCENTILES, centers, strict=True)
+    }
+    spread = by_name["percentile_75"] - by_name["percentile_25"]
+    max_rel = 0.0
+    binding = ""
+    for (name, _), center, half_width in zip(
+        SUMMARY_PERCENTILES, centers, half_widths, strict=True
+    ):
+        denominator = max(abs(float(center)), spread)
+        denominator = denominator if denominator > 1e-9 else 1.0
+        rel_half_width = float(half_width) / denominator
+        diagnostics[f"quantile_precision_{name}_half_width"] = float(half_width)
+        diagnostics[f"quantile_precision_{name}_rel_half_width"] = rel_half_width
+        if rel_half_width >= max_rel:
+            max_rel = rel_half_width
+            binding = name
+    diagnostics.update(
+        {
+            "converged": max_rel <= config.quantile_precision_target,
+            "sufficient_window": True,
+            "quantile_precision_max_rel_half_width": max_rel,
+            "quantile_precision_binding": binding,
+        }
+    )
+    return diagnostics
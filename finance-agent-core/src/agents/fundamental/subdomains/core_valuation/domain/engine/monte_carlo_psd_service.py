@@ -1,9 +1,119 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
 import numpy as np
 
 from .monte_carlo_contracts import MonteCarloConfig
 
+_PSD_CACHE_MAX_ENTRIES = 128
+
+
+@dataclass(frozen=True)
+class CorrelationFactor:
+    """PSD correlation matrix, its lower Cholesky factor and repair diagnostics."""
+
+    matrix: np.ndarray
+    cholesky: np.ndarray
+    diagnostics: dict[str, float | bool | int]
+
+
+class _CorrelationFactorCache:
+    # Correlation groups come from a handful of policy configs, so a small
+    # process-wide LRU lets every model reuse the repair and factorization.
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[object, ...], CorrelationFactor] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[object, ...]) -> CorrelationFactor | None:
+        with self._lock:
+            factor = self._entries.get(key)
+            if factor is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return factor
+
+    def put(self, key: tuple[object, ...], factor: CorrelationFactor) -> None:
+        with self._lock:
+            self._entries[key] = factor
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+_FACTOR_CACHE = _CorrelationFactorCache(max_entries=_PSD_CACHE_MAX_ENTRIES)
+
+
+def resolve_correlation_factor(
+    corr: np.ndarray,
+    *,
+    config: MonteCarloConfig,
+) -> CorrelationFactor:
+    """
+    Memoized ensure_correlation_psd plus Cholesky factorization.
+    Keyed by the matrix bytes and the PSD repair settings; cached arrays are
+    read-only and shared, diagnostics are copied per call. Repair failures
+    raise and are not cached.
+    """
+    matrix = np.ascontiguousarray(corr, dtype=float)
+    key = (
+        matrix.shape,
+        hashlib.sha256(matrix.tobytes()).hexdigest(),
+        config.psd_repair_policy,
+        config.psd_eigen_floor,
+        config.psd_tolerance,
+        config.higham_max_iterations,
+        config.higham_tolerance,
+    )
+    cached = _FACTOR_CACHE.get(key)
+    if cached is None:
+        repaired, diagnostics = ensure_correlation_psd(matrix, config=config)
+        cholesky = np.linalg.cholesky(repaired)
+        repaired.setflags(write=False)
+        cholesky.setflags(write=False)
+        cached = CorrelationFactor(
+            matrix=repaired, cholesky=cholesky, diagnostics=diagnostics
+        )
+        _FACTOR_CACHE.put(key, cached)
+    return CorrelationFactor(
+        matrix=cached.matrix,
+        cholesky=cached.cholesky,
+        diagnostics=dict(cached.diagnostics),
+    )
+
+
+def correlation_factor_cache_info() -> dict[str, int]:
+    return _FACTOR_CACHE.info()
+
+
+def clear_correlation_factor_cache() -> None:
+    _FACTOR_CACHE.clear()
+
 
 def ensure_correlation_psd(
     corr: np.ndarray,
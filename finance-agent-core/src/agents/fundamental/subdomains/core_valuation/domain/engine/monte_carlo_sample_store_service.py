@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import numpy as np
+
+_DEFAULT_MAX_ENTRIES = 16
+
+
+@dataclass(frozen=True)
+class SampleBlockKey:
+    seed: int
+    sampler_type: str
+    dimensions: int
+    iterations: int
+    antithetic: bool
+    sobol_scramble: bool
+
+
+class SampleBlock:
+    """
+    Unit-cube rows of one stream, materialized on demand and shared by every
+    run with the same key. Standard normals are derived lazily from the same
+    rows. Returned slices are read-only views.
+    """
+
+    def __init__(
+        self,
+        *,
+        dimensions: int,
+        iterations: int,
+        produce: Callable[[int], np.ndarray],
+        to_normals: Callable[[np.ndarray], np.ndarray],
+        row_alignment: int = 1,
+    ) -> None:
+        self._iterations = iterations
+        self._row_alignment = max(1, row_alignment)
+        self._produce = produce
+        self._to_normals = to_normals
+        self._units = np.empty((0, dimensions), dtype=float)
+        self._normals = np.empty((0, dimensions), dtype=float)
+        self._lock = threading.Lock()
+
+    def units(self, start: int, stop: int) -> np.ndarray:
+        with self._lock:
+            self._extend_units(stop)
+            return self._units[start:stop]
+
+    def normals(self, start: int, stop: int) -> np.ndarray:
+        with self._lock:
+            self._extend_units(stop)
+            have = self._normals.shape[0]
+            if have < stop:
+                extra = self._to_normals(self._units[have:stop])
+                normals = np.concatenate([self._normals, extra], axis=0)
+                normals.setflags(write=False)
+                self._normals = normals
+            return self._normals[start:stop]
+
+    def _extend_units(self, stop: int) -> None:
+        if stop > self._iterations:
+            raise ValueError("sample block request exceeds configured iterations")
+        have = self._units.shape[0]
+        if have >= stop:
+            return
+        # Produce whole alignment units (antithetic pairs), so the rows do not
+        # depend on how the first consumer split its batches.
+        alignment = self._row_alignment
+        target = min(-(-stop // alignment) * alignment, self._iterations)
+        units = np.concatenate([self._units, self._produce(target - have)], axis=0)
+        units.setflags(write=False)
+        self._units = units
+
+
+class MonteCarloSampleStore:
+    """
+    Bounded LRU of sample blocks keyed by (seed, sampler, dimensions,
+    iterations). Engines created while a store is active reuse its draws, so
+    repeated runs skip Sobol/LHS generation and normal PPFs, and models
+    compared within one run see common random numbers.
+    """
+
+    def __init__(self, *, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._blocks: OrderedDict[SampleBlockKey, SampleBlock] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def block(
+        self,
+        key: SampleBlockKey,
+        factory: Callable[[], SampleBlock],
+    ) -> SampleBlock:
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._blocks.move_to_end(key)
+                self.hits += 1
+                return block
+            self.misses += 1
+            block = factory()
+            self._blocks[key] = block
+            while len(self._blocks) > self.max_entries:
+                self._blocks.popitem(last=False)
+            return block
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._blocks),
+                "max_entries": self.max_entries,
+            }
+
+
+_ACTIVE_SAMPLE_STORE: contextvars.ContextVar[MonteCarloSampleStore | None] = (
+    contextvars.ContextVar("monte_carlo_sample_store", default=None)
+)
+
+
+def get_active_monte_carlo_sample_store() -> MonteCarloSampleStore | None:
+    return _ACTIVE_SAMPLE_STORE.get()
+
+
+@contextmanager
+def use_monte_carlo_sample_store(
+    store: MonteCarloSampleStore | None = None,
+) -> Iterator[MonteCarloSampleStore]:
+    """Make ``store`` (or a fresh one) serve Monte Carlo draws in this context."""
+    active = store if store is not None else MonteCarloSampleStore()
+    token = _ACTIVE_SAMPLE_STORE.set(active)
+    try:
+        yield active
+    finally:
+        _ACTIVE_SAMPLE_STORE.reset(token)
@@ -8,182 +8,441 @@ import numpy as np
 
 from .monte_carlo_contracts import CorrelationGroup, DistributionSpec, MonteCarloConfig
 from .monte_carlo_diagnostics_service import build_correlation_diagnostics
-from .monte_carlo_psd_service import ensure_correlation_psd
+from .monte_carlo_psd_service import resolve_correlation_factor
+from .monte_carlo_sample_store_service import (
+    SampleBlock,
+    SampleBlockKey,
+    get_active_monte_carlo_sample_store,
+)
 
 try:
     from scipy.stats import qmc as scipy_qmc
 except Exception:  # pragma: no cover - optional runtime dependency guard
     scipy_qmc = None
 
-
-def sample_variables(
-    *,
-    rng: np.random.Generator,
-    distributions: Mapping[str, DistributionSpec],
-    correlation_groups: tuple[CorrelationGroup, ...],
-    iterations: int,
-    config: MonteCarloConfig,
-) -> tuple[dict[str, np.ndarray], dict[str, float | bool | int | str]]:
-    _validate_correlation_group_variables(correlation_groups)
-    sampled: dict[str, np.ndarray] = {}
-    sampler_requested = config.sampler_type
-    sampler_effective, sampler_fallback_reason = _resolve_sampler_type(
-        sampler_requested
-    )
-    diagnostics: dict[str, float | bool | int | str] = {
-        "sampler_requested": sampler_requested,
-        "sampler_type": sampler_effective,
-        "sampler_fallback_used": sampler_effective != sampler_requested,
-        "psd_repaired": False,
-        "psd_repaired_groups": 0,
-        "psd_repair_failed_groups": 0,
-        "psd_min_eigen_before": 0.0,
-        "psd_min_eigen_after": 0.0,
-        "psd_repair_clip_used": False,
-        "psd_repair_higham_used": False,
-        "corr_diagnostics_available": False,
-        "corr_pairs_total": 0,
-        "corr_pearson_mae": 0.0,
-        "corr_pearson_max_abs_error": 0.0,
-        "corr_spearman_mae": 0.0,
-        "corr_spearman_max_abs_error": 0.0,
-    }
-    if sampler_fallback_reason is not None:
-        diagnostics["sampler_fallback_reason"] = sampler_fallback_reason
-    grouped_vars: set[str] = set()
-
-    for group in correlation_groups:
-        group_samples, group_diag = _sample_correlation_group(
-            rng=rng,
-            group=group,
-            distributions=distributions,
-            sampler_type=sampler_effective,
-            iterations=iterations,
-            config=config,
+# Per-batch (subsample keys, latent draws, transformed samples) kept for
+# correlation diagnostics; keys are None when diagnostics use every draw.
+DrawRecord = tuple[np.ndarray | None, np.ndarray, np.ndarray]
+GroupDrawRecords = tuple[DrawRecord, ...]
+
+
+class VariableSampleStream:
+    """
+    Lazily produce correlated draws batch by batch.
+    Each correlation group and the ungrouped block own an independent stream
+    seeded from the run seed (in the same order the eager sampler consumed it),
+    so results depend only on the seed and the number of rows drawn, not on how
+    draws are split into batches.
+    Control-variate runs also keep the latent standard normals of the last
+    batch (one column per unit-cube dimension) for the engine to regress on.
+    """
+
+    def __init__(
+        self,
+        *,
+        distributions: Mapping[str, DistributionSpec],
+        correlation_groups: tuple[CorrelationGroup, ...],
+        config: MonteCarloConfig,
+    ) -> None:
+        _validate_correlation_group_variables(correlation_groups)
+        sampler_requested = config.sampler_type
+        sampler_effective, sampler_fallback_reason = _resolve_sampler_type(
+            sampler_requested
         )
-        sampled.update(group_samples)
-        grouped_vars.update(group.variables)
-        if bool(group_diag["psd_repaired"]):
-            diagnostics["psd_repaired"] = True
-            diagnostics["psd_repaired_groups"] = (
-                int(diagnostics["psd_repaired_groups"]) + 1
-            )
-        if bool(group_diag["psd_repair_failed"]):
-            diagnostics["psd_repair_failed_groups"] = (
-                int(diagnostics["psd_repair_failed_groups"]) + 1
+        self._sampler_requested = sampler_requested
+        self._sampler_effective = sampler_effective
+        self._sampler_fallback_reason = sampler_fallback_reason
+        self._config = config
+        self._drawn = 0
+        self._latent: np.ndarray | None = None
+
+        grouped_vars = {var for group in correlation_groups for var in group.variables}
+        ungrouped_items = [
+            (name, spec)
+            for name, spec in distributions.items()
+            if name not in grouped_vars
+        ]
+        for _, spec in ungrouped_items:
+            _validate_distribution_spec(spec)
+
+        rng = np.random.default_rng(config.seed)
+        self._groups = [
+            _CorrelatedGroupStream(
+                group=group,
+                distributions=distributions,
+                unit_stream=self._build_unit_stream(
+                    rng=rng, dimensions=len(group.variables)
+                ),
+                config=config,
+                group_index=group_index,
             )
-        diagnostics["psd_repair_clip_used"] = bool(
-            diagnostics["psd_repair_clip_used"]
-        ) or bool(group_diag["psd_repair_clip_used"])
-        diagnostics["psd_repair_higham_used"] = bool(
-            diagnostics["psd_repair_higham_used"]
-        ) or bool(group_diag["psd_repair_higham_used"])
-        diagnostics["psd_min_eigen_before"] = min(
-            float(diagnostics["psd_min_eigen_before"]),
-            float(group_diag["psd_min_eigen_before"]),
+            for group_index, group in enumerate(correlation_groups)
+        ]
+        self._ungrouped_items = ungrouped_items
+        self._ungrouped_stream = (
+            self._build_unit_stream(rng=rng, dimensions=len(ungrouped_items))
+            if ungrouped_items
+            else None
         )
-        diagnostics["psd_min_eigen_after"] = min(
-            float(diagnostics["psd_min_eigen_after"]),
-            float(group_diag["psd_min_eigen_after"]),
-        )
-        pair_count = int(group_diag["corr_pairs_total"])
-        if pair_count > 0:
-            total_pairs = int(diagnostics["corr_pairs_total"])
-            new_total = total_pairs + pair_count
-            old_pearson_mae = float(diagnostics["corr_pearson_mae"])
-            old_spearman_mae = float(diagnostics["corr_spearman_mae"])
-            diagnostics["corr_pearson_mae"] = (
-                (old_pearson_mae * total_pairs)
-                + (float(group_diag["corr_pearson_mae"]) * pair_count)
-            ) / new_total
-            diagnostics["corr_spearman_mae"] = (
-                (old_spearman_mae * total_pairs)
-                + (float(group_diag["corr_spearman_mae"]) * pair_count)
-            ) / new_total
-            diagnostics["corr_pairs_total"] = new_total
-            diagnostics["corr_diagnostics_available"] = True
-            diagnostics["corr_pearson_max_abs_error"] = max(
-                float(diagnostics["corr_pearson_max_abs_error"]),
-                float(group_diag["corr_pearson_max_abs_error"]),
+
+    @property
+    def drawn(self) -> int:
+        return self._drawn
+
+    def seek(self, position: int) -> None:
+        """
+        Reposition every block stream to row ``position`` of the run.
+        Used by process shards to draw rows [position, position + size) exactly
+        as the serial stream would have produced them.
+        """
+        if position < 0 or position > self._config.iterations:
+            raise ValueError(
+                "seek position must be within configured iterations "
+                f"(position={position}, iterations={self._config.iterations})"
+            )
+        for group_stream in self._groups:
+            group_stream.seek(position)
+        if self._ungrouped_stream is not None:
+            self._ungrouped_stream.seek(position)
+        self._drawn = position
+
+    def take_draw_records(self) -> tuple[GroupDrawRecords, ...]:
+        """Hand over (and forget) correlated draws kept for diagnostics."""
+        return tuple(group_stream.take_draw_records() for group_stream in self._groups)
+
+    def take_latent_draws(self) -> np.ndarray | None:
+        """Hand over (and forget) the last batch's latent normals, if kept."""
+        latent = self._latent
+        self._latent = None
+        return latent
+
+    def absorb(self, rows: int, records: tuple[GroupDrawRecords, ...]) -> None:
+        """Account for rows drawn by another stream (e.g. a worker process)."""
+        if len(records) != len(self._groups):
+            raise ValueError("draw records must match correlation group count")
+        for group_stream, group_records in zip(self._groups, records, strict=True):
+            group_stream.absorb_draw_records(group_records, rows=rows)
+        self._drawn += rows
+
+    def draw(self, size: int) -> dict[str, np.ndarray]:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if self._drawn + size > self._config.iterations:
+            raise ValueError(
+                "cannot draw beyond configured iterations "
+                f"(drawn={self._drawn}, requested={size}, "
+                f"iterations={self._config.iterations})"
             )
-            diagnostics["corr_spearman_max_abs_error"] = max(
-                float(diagnostics["corr_spearman_max_abs_error"]),
-                float(group_diag["corr_spearman_max_abs_error"]),
+        sampled: dict[str, np.ndarray] = {}
+        latent_blocks: list[np.ndarray] = []
+        for group_stream in self._groups:
+            sampled.update(group_stream.draw(size))
+            latent_blocks.append(group_stream.last_independent_normals)
+        if self._ungrouped_stream is not None:
+            unit_cube = self._ungrouped_stream.draw(size)
+            for idx, (name, spec) in enumerate(self._ungrouped_items):
+                sampled[name] = _transform_unit_samples(unit_cube[:, idx], spec)
+            if self._config.control_variate:
+                latent_blocks.append(_normal_ppf(unit_cube))
+        if self._config.control_variate:
+            self._latent = np.concatenate(latent_blocks, axis=1)
+        self._drawn += size
+        return sampled
+
+    def diagnostics(self) -> dict[str, float | bool | int | str]:
+        diagnostics: dict[str, float | bool | int | str] = {
+            "sampler_requested": self._sampler_requested,
+            "sampler_type": self._sampler_effective,
+            "sampler_fallback_used": self._sampler_effective != self._sampler_requested,
+            "sampled_iterations": self._drawn,
+            "psd_repaired": False,
+            "psd_repaired_groups": 0,
+            "psd_repair_failed_groups": 0,
+            "psd_min_eigen_before": 0.0,
+            "psd_min_eigen_after": 0.0,
+            "psd_repair_clip_used": False,
+            "psd_repair_higham_used": False,
+            "corr_diagnostics_available": False,
+            "corr_pairs_total": 0,
+            "corr_pearson_mae": 0.0,
+            "corr_pearson_max_abs_error": 0.0,
+            "corr_spearman_mae": 0.0,
+            "corr_spearman_max_abs_error": 0.0,
+            "corr_sample_size": 0,
+            "corr_subsampled": False,
+            "corr_pearson_error_bar": 0.0,
+            "corr_spearman_error_bar": 0.0,
+        }
+        if self._sampler_fallback_reason is not None:
+            diagnostics["sampler_fallback_reason"] = self._sampler_fallback_reason
+        for group_stream in self._groups:
+            _merge_group_diagnostics(diagnostics, group_stream.diagnostics())
+        return diagnostics
+
+    def _build_unit_stream(
+        self, *, rng: np.random.Generator, dimensions: int
+    ) -> _UnitCubeStream | _StoredUnitCubeStream:
+        seed = int(rng.integers(0, np.iinfo(np.uint32).max))
+        config = self._config
+
+        def _new_stream() -> _UnitCubeStream:
+            return _UnitCubeStream(
+                seed=seed,
+                dimensions=dimensions,
+                total=config.iterations,
+                sampler_type=self._sampler_effective,
+                config=config,
             )
 
-    ungrouped_items = [
-        (name, spec) for name, spec in distributions.items() if name not in grouped_vars
-    ]
-    if ungrouped_items:
-        unit_cube = _sample_unit_cube(
-            rng=rng,
-            iterations=iterations,
-            dimensions=len(ungrouped_items),
-            sampler_type=sampler_effective,
-            config=config,
+        store = get_active_monte_carlo_sample_store()
+        if store is None:
+            return _new_stream()
+        key = SampleBlockKey(
+            seed=seed,
+            sampler_type=self._sampler_effective,
+            dimensions=dimensions,
+            iterations=config.iterations,
+            antithetic=config.antithetic,
+            sobol_scramble=config.sobol_scramble,
         )
-        for idx, (name, spec) in enumerate(ungrouped_items):
-            sampled[name] = _transform_unit_samples(unit_cube[:, idx], spec)
-
-    return sampled, diagnostics
+        block = store.block(
+            key,
+            lambda: SampleBlock(
+                dimensions=dimensions,
+                iterations=config.iterations,
+                produce=_new_stream().draw,
+                to_normals=_normal_ppf,
+                row_alignment=2 if config.antithetic else 1,
+            ),
+        )
+        return _StoredUnitCubeStream(block=block, total=config.iterations)
 
 
-def _sample_correlation_group(
+def sample_variables(
     *,
-    rng: np.random.Generator,
-    group: CorrelationGroup,
     distributions: Mapping[str, DistributionSpec],
-    sampler_type: Literal["pseudo", "sobol", "lhs"],
+    correlation_groups: tuple[CorrelationGroup, ...],
     iterations: int,
     config: MonteCarloConfig,
 ) -> tuple[dict[str, np.ndarray], dict[str, float | bool | int | str]]:
-    size = len(group.variables)
-    if size == 0:
-        raise ValueError("correlation group cannot be empty")
-    if len(group.matrix) != size:
-        raise ValueError("correlation matrix row count must match variable count")
-    for row in group.matrix:
-        if len(row) != size:
-            raise ValueError(
-                "correlation matrix column count must match variable count"
+    stream = VariableSampleStream(
+        distributions=distributions,
+        correlation_groups=correlation_groups,
+        config=config,
+    )
+    sampled = stream.draw(iterations)
+    return sampled, stream.diagnostics()
+
+
+class _CorrelatedGroupStream:
+    def __init__(
+        self,
+        *,
+        group: CorrelationGroup,
+        distributions: Mapping[str, DistributionSpec],
+        unit_stream: _UnitCubeStream | _StoredUnitCubeStream,
+        config: MonteCarloConfig,
+        group_index: int,
+    ) -> None:
+        size = len(group.variables)
+        if size == 0:
+            raise ValueError("correlation group cannot be empty")
+        if len(group.matrix) != size:
+            raise ValueError("correlation matrix row count must match variable count")
+        for row in group.matrix:
+            if len(row) != size:
+                raise ValueError(
+                    "correlation matrix column count must match variable count"
+                )
+
+        specs: list[DistributionSpec] = []
+        for var in group.variables:
+            spec = distributions.get(var)
+            if spec is None:
+                raise ValueError(f"missing distribution for correlated variable {var}")
+            _validate_distribution_spec(spec)
+            specs.append(spec)
+
+        corr = np.array(group.matrix, dtype=float)
+        if not np.allclose(corr, corr.T):
+            raise ValueError("correlation matrix must be symmetric")
+        if not np.allclose(np.diag(corr), 1.0):
+            raise ValueError("correlation matrix diagonal must be 1")
+
+        # PSD repair and Cholesky are memoized per process, so repeat runs and
+        # other models with the same policy matrix skip the linear algebra.
+        factor = resolve_correlation_factor(corr, config=config)
+        self._variables = group.variables
+        self._specs = specs
+        self._corr_psd = factor.matrix
+        self._chol_t = factor.cholesky.T
+        self._psd_diag = factor.diagnostics
+        self._unit_stream = unit_stream
+        self._records: list[DrawRecord] = []
+        self._rows_seen = 0
+        self.last_independent_normals = np.empty((0, size), dtype=float)
+        # Diagnostics keep a bottom-k subsample by per-row random key. Keys come
+        # from their own stream (not the sampling seeds), addressable by row,
+        # so the subsample is identical for any batch split or worker count.
+        self._max_samples = config.corr_diagnostics_max_samples
+        self._key_rng: np.random.Generator | None = None
+        if self._max_samples > 0:
+            self._key_rng = np.random.default_rng(
+                np.random.SeedSequence(config.seed, spawn_key=(group_index,))
             )
+            self._key_origin_state = self._key_rng.bit_generator.state
+
+    def draw(self, size: int) -> dict[str, np.ndarray]:
+        independent_normals = self._unit_stream.draw_normals(size)
+        self.last_independent_normals = independent_normals
+        draws = independent_normals @ self._chol_t
+        output = {
+            var: _transform_standard_normal(draws[:, idx], self._specs[idx])
+            for idx, var in enumerate(self._variables)
+        }
+        keys = self._key_rng.random(size) if self._key_rng is not None else None
+        transformed = np.column_stack([output[var] for var in self._variables])
+        self._records.append(self._limit_record((keys, draws, transformed)))
+        self._rows_seen += size
+        self._compact_records()
+        return output
+
+    def seek(self, position: int) -> None:
+        self._unit_stream.seek(position)
+        if self._key_rng is not None:
+            bit_generator = self._key_rng.bit_generator
+            bit_generator.state = self._key_origin_state
+            bit_generator.advance(position)
+
+    def take_draw_records(self) -> GroupDrawRecords:
+        records = tuple(self._records)
+        self._records = []
+        return records
+
+    def absorb_draw_records(self, records: GroupDrawRecords, *, rows: int) -> None:
+        self._records.extend(records)
+        self._rows_seen += rows
+        self._compact_records()
+
+    def diagnostics(self) -> dict[str, float | bool | int | str]:
+        if not self._records:
+            return dict(self._psd_diag)
+        _, latent_draws, transformed = self._limit_record(
+            _concatenate_records(self._records)
+        )
+        corr_diag = build_correlation_diagnostics(
+            variables=self._variables,
+            target_corr=self._corr_psd,
+            latent_draws=latent_draws,
+            transformed_samples={
+                var: transformed[:, idx] for idx, var in enumerate(self._variables)
+            },
+        )
+        return {
+            **self._psd_diag,
+            **corr_diag,
+            "corr_subsampled": latent_draws.shape[0] < self._rows_seen,
+        }
+
+    def _limit_record(self, record: DrawRecord) -> DrawRecord:
+        keys, latent, transformed = record
+        if keys is None or keys.shape[0] <= self._max_samples:
+            return record
+        # Sorting the kept indices preserves row order, so the final sample
+        # does not depend on how often records were compacted.
+        kept = np.sort(
+            np.argpartition(keys, self._max_samples - 1)[: self._max_samples]
+        )
+        return keys[kept], latent[kept], transformed[kept]
+
+    def _compact_records(self) -> None:
+        if self._max_samples <= 0 or len(self._records) < 2:
+            return
+        retained = sum(record[1].shape[0] for record in self._records)
+        if retained > 2 * self._max_samples:
+            self._records = [self._limit_record(_concatenate_records(self._records))]
+
+
+def _concatenate_records(records: list[DrawRecord]) -> DrawRecord:
+    if len(records) == 1:
+        return records[0]
+    keys = (
+        None
+        if records[0][0] is None
+        else np.concatenate([record[0] for record in records])
+    )
+    return (
+        keys,
+        np.concatenate([record[1] for record in records], axis=0),
+        np.concatenate([record[2] for record in records], axis=0),
+    )
 
-    specs: list[DistributionSpec] = []
-    for var in group.variables:
-        spec = distributions.get(var)
-        if spec is None:
-            raise ValueError(f"missing distribution for correlated variable {var}")
-        _validate_distribution_spec(spec)
-        specs.append(spec)
-
-    corr = np.array(group.matrix, dtype=float)
-    if not np.allclose(corr, corr.T):
-        raise ValueError("correlation matrix must be symmetric")
-    if not np.allclose(np.diag(corr), 1.0):
-        raise ValueError("correlation matrix diagonal must be 1")
-
-    corr_psd, psd_diag = ensure_correlation_psd(corr, config=config)
-
-    unit_cube = _sample_unit_cube(
-        rng=rng,
-        iterations=iterations,
-        dimensions=size,
-        sampler_type=sampler_type,
-        config=config,
+
+def _merge_group_diagnostics(
+    diagnostics: dict[str, float | bool | int | str],
+    group_diag: Mapping[str, float | bool | int | str],
+) -> None:
+    if bool(group_diag["psd_repaired"]):
+        diagnostics["psd_repaired"] = True
+        diagnostics["psd_repaired_groups"] = int(diagnostics["psd_repaired_groups"]) + 1
+    if bool(group_diag["psd_repair_failed"]):
+        diagnostics["psd_repair_failed_groups"] = (
+            int(diagnostics["psd_repair_failed_groups"]) + 1
+        )
+    diagnostics["psd_repair_clip_used"] = bool(
+        diagnostics["psd_repair_clip_used"]
+    ) or bool(group_diag["psd_repair_clip_used"])
+    diagnostics["psd_repair_higham_used"] = bool(
+        diagnostics["psd_repair_higham_used"]
+    ) or bool(group_diag["psd_repair_higham_used"])
+    diagnostics["psd_min_eigen_before"] = min(
+        float(diagnostics["psd_min_eigen_before"]),
+        float(group_diag["psd_min_eigen_before"]),
+    )
+    diagnostics["psd_min_eigen_after"] = min(
+        float(diagnostics["psd_min_eigen_after"]),
+        float(group_diag["psd_min_eigen_after"]),
+    )
+    pair_count = int(group_diag.get("corr_pairs_total", 0))
+    if pair_count <= 0:
+        return
+    sample_size = int(group_diag["corr_sample_size"])
+    if int(diagnostics["corr_pairs_total"]) > 0:
+        sample_size = min(sample_size, int(diagnostics["corr_sample_size"]))
+    diagnostics["corr_sample_size"] = sample_size
+    diagnostics["corr_subsampled"] = bool(diagnostics["corr_subsampled"]) or bool(
+        group_diag["corr_subsampled"]
     )
-    independent_normals = _normal_ppf(unit_cube)
-    chol = np.linalg.cholesky(corr_psd)
-    draws = independent_normals @ chol.T
-    output: dict[str, np.ndarray] = {}
-    for idx, var in enumerate(group.variables):
-        output[var] = _transform_standard_normal(draws[:, idx], specs[idx])
-    corr_diag = build_correlation_diagnostics(
-        variables=group.variables,
-        target_corr=corr_psd,
-        latent_draws=draws,
-        transformed_samples=output,
+    diagnostics["corr_pearson_error_bar"] = max(
+        float(diagnostics["corr_pearson_error_bar"]),
+        float(group_diag["corr_pearson_error_bar"]),
+    )
+    diagnostics["corr_spearman_error_bar"] = max(
+        float(diagnostics["corr_spearman_error_bar"]),
+        float(group_diag["corr_spearman_error_bar"]),
+    )
+    total_pairs = int(diagnostics["corr_pairs_total"])
+    new_total = total_pairs + pair_count
+    old_pearson_mae = float(diagnostics["corr_pearson_mae"])
+    old_spearman_mae = float(diagnostics["corr_spearman_mae"])
+    diagnostics["corr_pearson_mae"] = (
+        (old_pearson_mae * total_pairs)
+        + (float(group_diag["corr_pearson_mae"]) * pair_count)
+    ) / new_total
+    diagnostics["corr_spearman_mae"] = (
+        (old_spearman_mae * total_pairs)
+        + (float(group_diag["corr_spearman_mae"]) * pair_count)
+    ) / new_total
+    diagnostics["corr_pairs_total"] = new_total
+    diagnostics["corr_diagnostics_available"] = True
+    diagnostics["corr_pearson_max_abs_error"] = max(
+        float(diagnostics["corr_pearson_max_abs_error"]),
+        float(group_diag["corr_pearson_max_abs_error"]),
+    )
+    diagnostics["corr_spearman_max_abs_error"] = max(
+        float(diagnostics["corr_spearman_max_abs_error"]),
+        float(group_diag["corr_spearman_max_abs_error"]),
     )
-    return output, {**psd_diag, **corr_diag}
 
 
 def _validate_correlation_group_variables(
@@ -208,7 +467,7 @@ def _validate_correlation_group_variables(
     if repeated_across_groups:
         repeated_list = ", ".join(sorted(repeated_across_groups))
         raise ValueError(
-            "correlated variables cannot appear in multiple groups: " f"{repeated_list}"
+            f"correlated variables cannot appear in multiple groups: {repeated_list}"
         )
 
 
@@ -220,71 +479,137 @@ def _resolve_sampler_type(
     return requested, None
 
 
-def _sample_unit_cube(
-    *,
-    rng: np.random.Generator,
-    iterations: int,
-    dimensions: int,
-    sampler_type: Literal["pseudo", "sobol", "lhs"],
-    config: MonteCarloConfig,
-) -> np.ndarray:
-    if dimensions <= 0:
-        raise ValueError("dimensions must be positive")
-    if iterations <= 0:
-        raise ValueError("iterations must be positive")
-
-    if sampler_type == "pseudo":
-        return rng.random((iterations, dimensions))
-    if sampler_type == "lhs":
-        return _sample_lhs(rng=rng, iterations=iterations, dimensions=dimensions)
-    return _sample_sobol(
-        rng=rng,
-        iterations=iterations,
-        dimensions=dimensions,
-        config=config,
-    )
-
-
-def _sample_lhs(
-    *,
-    rng: np.random.Generator,
-    iterations: int,
-    dimensions: int,
-) -> np.ndarray:
-    # Classic random LHS: stratify each marginal into N bins and permute per dim.
-    lower = np.arange(iterations, dtype=float) / float(iterations)
-    upper = (np.arange(iterations, dtype=float) + 1.0) / float(iterations)
-    points = rng.random((iterations, dimensions))
-    points = lower[:, None] + ((upper - lower)[:, None] * points)
-    for dim in range(dimensions):
-        permutation = rng.permutation(iterations)
-        points[:, dim] = points[permutation, dim]
-    return points
-
-
-def _sample_sobol(
-    *,
-    rng: np.random.Generator,
-    iterations: int,
-    dimensions: int,
-    config: MonteCarloConfig,
-) -> np.ndarray:
-    if scipy_qmc is None:
-        # Guarded by _resolve_sampler_type, but keep safe fallback.
-        return rng.random((iterations, dimensions))
-
-    seed_value = int(rng.integers(0, np.iinfo(np.uint32).max))
-    sobol_engine = scipy_qmc.Sobol(
-        d=dimensions,
-        scramble=config.sobol_scramble,
-        seed=seed_value,
-    )
-    m = int(ceil(log2(max(1, iterations))))
-    sampled = sobol_engine.random_base2(m)
-    if sampled.shape[0] < iterations:
-        extra = sobol_engine.random(iterations - sampled.shape[0])
-        sampled = np.vstack([sampled, extra])
-    return sampled[:iterations]
+class _UnitCubeStream:
+    """
+    Continuous unit-cube sequence served in arbitrary batch sizes.
+    Sobol points come from one engine so the scrambled sequence never restarts;
+    LHS strata are permuted once over the full run and jittered per batch.
+    Every sampler supports ``seek`` so any row range can be reproduced without
+    drawing the rows before it.
+    Antithetic runs draw one base point per row pair and emit it interleaved
+    with its mirror (u, 1 - u); positions then count base points.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int,
+        dimensions: int,
+        total: int,
+        sampler_type: Literal["pseudo", "sobol", "lhs"],
+        config: MonteCarloConfig,
+    ) -> None:
+        if dimensions <= 0:
+            raise ValueError("dimensions must be positive")
+        if total <= 0:
+            raise ValueError("iterations must be positive")
+        rng = np.random.default_rng(seed)
+        self._rng = rng
+        self._dimensions = dimensions
+        self._antithetic = config.antithetic
+        self._rows_total = total
+        self._total = (total + 1) // 2 if config.antithetic else total
+        self._sampler_type = sampler_type
+        self._position = 0
+        self._sobol_engine = None
+        self._sobol_buffer = np.empty((0, dimensions), dtype=float)
+        self._lhs_strata: np.ndarray | None = None
+        if sampler_type == "sobol" and scipy_qmc is not None:
+            self._sobol_engine = scipy_qmc.Sobol(
+                d=dimensions,
+                scramble=config.sobol_scramble,
+                seed=seed,
+            )
+        elif sampler_type == "lhs":
+            # Classic random LHS: one stratum permutation per dim over all rows.
+            self._lhs_strata = np.column_stack(
+                [rng.permutation(self._total) for _ in range(dimensions)]
+            )
+        # Pseudo/LHS rows consume exactly `dimensions` doubles each from here on.
+        self._origin_state = rng.bit_generator.state
+
+    def seek(self, position: int) -> None:
+        if position < 0 or position > self._rows_total:
+            raise ValueError("seek position must be within iterations")
+        if self._antithetic:
+            position = (position + 1) // 2
+        self._position = position
+        if self._sobol_engine is not None:
+            self._sobol_engine.reset()
+            if position > 0:
+                self._sobol_engine.fast_forward(position)
+            self._sobol_buffer = np.empty((0, self._dimensions), dtype=float)
+            return
+        bit_generator = self._rng.bit_generator
+        bit_generator.state = self._origin_state
+        bit_generator.advance(position * self._dimensions)
+
+    def draw(self, size: int) -> np.ndarray:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if not self._antithetic:
+            return self._draw_base(size)
+        base = self._draw_base((size + 1) // 2)
+        paired = np.empty((base.shape[0] * 2, self._dimensions), dtype=float)
+        paired[0::2] = base
+        paired[1::2] = 1.0 - base
+        return paired[:size]
+
+    def draw_normals(self, size: int) -> np.ndarray:
+        return _normal_ppf(self.draw(size))
+
+    def _draw_base(self, size: int) -> np.ndarray:
+        start = self._position
+        self._position += size
+        if self._sampler_type == "lhs" and self._lhs_strata is not None:
+            strata = self._lhs_strata[start : self._position]
+            jitter = self._rng.random((size, self._dimensions))
+            return (strata + jitter) / float(self._total)
+        if self._sobol_engine is not None:
+            return self._draw_sobol(size)
+        return self._rng.random((size, self._dimensions))
+
+    def _draw_sobol(self, size: int) -> np.ndarray:
+        if self._sobol_buffer.shape[0] < size:
+            deficit = size - self._sobol_buffer.shape[0]
+            if self._sobol_engine.num_generated == 0:
+                # Start on a power-of-two block to keep Sobol balance properties.
+                extra = self._sobol_engine.random_base2(int(ceil(log2(deficit))))
+            else:
+                extra = self._sobol_engine.random(deficit)
+            self._sobol_buffer = np.vstack([self._sobol_buffer, extra])
+        sampled = self._sobol_buffer[:size]
+        self._sobol_buffer = self._sobol_buffer[size:]
+        return sampled
+
+
+class _StoredUnitCubeStream:
+    """_UnitCubeStream interface served from a shared MonteCarloSampleStore block."""
+
+    def __init__(self, *, block: SampleBlock, total: int) -> None:
+        self._block = block
+        self._total = total
+        self._position = 0
+
+    def seek(self, position: int) -> None:
+        if position < 0 or position > self._total:
+            raise ValueError("seek position must be within iterations")
+        self._position = position
+
+    def draw(self, size: int) -> np.ndarray:
+        start = self._advance(size)
+        return self._block.units(start, self._position)
+
+    def draw_normals(self, size: int) -> np.ndarray:
+        start = self._advance(size)
+        return self._block.normals(start, self._position)
+
+    def _advance(self, size: int) -> int:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        start = self._position
+        self._position += size
+        return start
 
 
 def _transform_unit_samples(u: np.ndarray, spec: DistributionSpec) -> np.ndarray:
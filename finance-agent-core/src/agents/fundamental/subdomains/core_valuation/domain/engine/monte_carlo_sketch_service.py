@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import os
+from typing import Literal
+
+import numpy as np
+
+MONTE_CARLO_SUMMARY_BACKEND_ENV = "FUNDAMENTAL_MONTE_CARLO_SUMMARY_BACKEND"
+
+SUMMARY_PERCENTILES: tuple[tuple[str, float], ...] = (
+    ("percentile_5", 5.0),
+    ("percentile_25", 25.0),
+    ("median", 50.0),
+    ("percentile_75", 75.0),
+    ("percentile_95", 95.0),
+)
+
+
+class StreamingQuantileSketch:
+    """
+    Mergeable t-digest style quantile sketch.
+    Centroids are re-clustered on the arcsine (k1) scale after every update,
+    which keeps at most ~compression/2 centroids and gives the tails finer
+    resolution than the body. Moments use Chan's parallel update, so both
+    batch updates and merges of shard sketches are exact for mean/std/min/max.
+    """
+
+    def __init__(self, *, compression: int = 400) -> None:
+        if compression < 20:
+            raise ValueError("compression must be >= 20")
+        self._compression = compression
+        self._means = np.empty(0, dtype=float)
+        self._weights = np.empty(0, dtype=float)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def centroid_count(self) -> int:
+        return int(self._means.shape[0])
+
+    def update(self, values: np.ndarray) -> None:
+        batch = np.asarray(values, dtype=float).ravel()
+        if batch.size == 0:
+            return
+        batch_mean = float(np.mean(batch))
+        batch_m2 = float(np.sum((batch - batch_mean) ** 2))
+        self._absorb_moments(
+            count=int(batch.size),
+            mean=batch_mean,
+            m2=batch_m2,
+            minimum=float(np.min(batch)),
+            maximum=float(np.max(batch)),
+        )
+        self._recluster(
+            np.concatenate([self._means, batch]),
+            np.concatenate([self._weights, np.ones(batch.size, dtype=float)]),
+        )
+
+    def merge(self, other: StreamingQuantileSketch) -> None:
+        if other._count == 0:
+            return
+        self._absorb_moments(
+            count=other._count,
+            mean=other._mean,
+            m2=other._m2,
+            minimum=other._min,
+            maximum=other._max,
+        )
+        self._recluster(
+            np.concatenate([self._means, other._means]),
+            np.concatenate([self._weights, other._weights]),
+        )
+
+    def quantiles(self, percentiles: np.ndarray) -> np.ndarray:
+        if self._count == 0:
+            raise ValueError("cannot compute quantiles of an empty sketch")
+        # Match np.percentile's linear interpolation: with unit weights the
+        # i-th sorted value sits at rank i + 0.5, so the target rank is
+        # q * (n - 1) + 0.5 and an uncompressed sketch is exact.
+        ranks = np.asarray(percentiles, dtype=float) / 100.0 * (self._count - 1) + 0.5
+        centers = np.cumsum(self._weights) - (self._weights / 2.0)
+        positions = np.concatenate([[0.0], centers, [float(self._count)]])
+        values = np.concatenate([[self._min], self._means, [self._max]])
+        return np.interp(ranks, positions, values)
+
+    def summary(self) -> dict[str, float]:
+        quantiles = self.quantiles(
+            np.array([percentile for _, percentile in SUMMARY_PERCENTILES])
+        )
+        by_name = {
+            name: float(value)
+            for (name, _), value in zip(SUMMARY_PERCENTILES, quantiles, strict=True)
+        }
+        return {
+            "mean": float(self._mean),
+            "median": by_name["median"],
+            "std": float(np.sqrt(self._m2 / self._count)),
+            "percentile_5": by_name["percentile_5"],
+            "percentile_25": by_name["percentile_25"],
+            "percentile_75": by_name["percentile_75"],
+            "percentile_95": by_name["percentile_95"],
+            "min": float(self._min),
+            "max": float(self._max),
+        }
+
+    def centroids(self) -> tuple[np.ndarray, np.ndarray]:
+        """Copies of the centroid means and weights, sorted by mean."""
+        return self._means.copy(), self._weights.copy()
+
+    def rank_error_bound(self) -> float:
+        # A value inside a centroid can be misplaced by at most half its weight.
+        if self._count == 0:
+            return 0.0
+        merged = self._weights[self._weights > 1.0]
+        if merged.size == 0:
+            return 0.0
+        return float(np.max(merged) / (2.0 * self._count))
+
+    def diagnostics(self) -> dict[str, float | int]:
+        return {
+            "sketch_compression": self._compression,
+            "sketch_centroids": self.centroid_count,
+            "sketch_rank_error_bound": self.rank_error_bound(),
+        }
+
+    def _absorb_moments(
+        self,
+        *,
+        count: int,
+        mean: float,
+        m2: float,
+        minimum: float,
+        maximum: float,
+    ) -> None:
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + (delta * delta) * self._count * count / total
+        self._count = total
+        self._min = min(self._min, minimum)
+        self._max = max(self._max, maximum)
+
+    def _recluster(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind="mergesort")
+        means = means[order]
+        weights = weights[order]
+        total = float(np.sum(weights))
+        q_mid = (np.cumsum(weights) - (weights / 2.0)) / total
+        # k1 scale: one cluster per unit of k, clusters shrink towards q=0/1.
+        k = (self._compression / (2.0 * np.pi)) * np.arcsin(2.0 * q_mid - 1.0)
+        cluster_ids = np.floor(k).astype(np.int64)
+        starts = np.flatnonzero(np.diff(cluster_ids, prepend=cluster_ids[0] - 1))
+        cluster_weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / cluster_weights
+        self._weights = cluster_weights
+
+
+def build_sketch_accuracy_diagnostics(
+    sketch: StreamingQuantileSketch,
+    outcomes: np.ndarray,
+) -> dict[str, float]:
+    """
+    Compare sketch percentiles with exact ones over the retained outcomes.
+    Rank error is scale-free (fraction of samples) and is the gate metric;
+    relative error is reported for readability.
+    """
+    percentiles = np.array([percentile for _, percentile in SUMMARY_PERCENTILES])
+    estimated = sketch.quantiles(percentiles)
+    exact = np.percentile(outcomes, percentiles)
+    sorted_outcomes = np.sort(outcomes)
+    realized_ranks = np.searchsorted(sorted_outcomes, estimated, side="right") / len(
+        sorted_outcomes
+    )
+    rank_errors = np.abs(realized_ranks - (percentiles / 100.0))
+    denominators = np.where(np.abs(exact) > 1e-9, np.abs(exact), 1.0)
+    relative_errors = np.abs(estimated - exact) / denominators
+    return {
+        "sketch_max_rank_error": float(np.max(rank_errors)),
+        "sketch_max_relative_error": float(np.max(relative_errors)),
+    }
+
+
+def resolve_monte_carlo_summary_backend() -> Literal["exact", "sketch"]:
+    raw = os.getenv(MONTE_CARLO_SUMMARY_BACKEND_ENV)
+    if raw is None:
+        return "exact"
+    normalized = raw.strip().lower()
+    if normalized == "sketch":
+        return "sketch"
+    return "exact"
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .monte_carlo_contracts import MonteCarloConfig
+
+
+def control_features(latent: np.ndarray) -> np.ndarray:
+    """
+    Control variates built from the latent standard normals behind each draw:
+    z and z**2 - 1 per dimension, both with known mean zero. The linear terms
+    capture the first-order response around the base case; the quadratic terms
+    capture the curvature that antithetic pairing leaves behind.
+    """
+    z = np.asarray(latent, dtype=float)
+    return np.concatenate([z, (z * z) - 1.0], axis=1)
+
+
+def resolve_variance_reduction_label(config: MonteCarloConfig) -> str:
+    modes = [
+        name
+        for name, enabled in (
+            ("antithetic", config.antithetic),
+            ("control_variate", config.control_variate),
+        )
+        if enabled
+    ]
+    return "+".join(modes) if modes else "none"
+
+
+class VarianceReductionTracker:
+    """
+    Streaming estimators for antithetic pairing and regression control variates.
+    Antithetic rows arrive as consecutive (u, 1 - u) pairs, so pair means are
+    accumulated across batches. Control-variate coefficients come from running
+    sufficient statistics, so the adjusted mean does not depend on how rows
+    were split into batches or shards.
+    """
+
+    def __init__(self, config: MonteCarloConfig) -> None:
+        self._label = resolve_variance_reduction_label(config)
+        self._antithetic = config.antithetic
+        self._control_variate = config.control_variate
+        self._tail_length = 2 * config.convergence_window
+        self._count = 0
+        self._sum_y = 0.0
+        self._sum_yy = 0.0
+        self._pair_count = 0
+        self._sum_pair = 0.0
+        self._sum_pair_sq = 0.0
+        self._sum_x: np.ndarray | None = None
+        self._sum_xx: np.ndarray | None = None
+        self._sum_xy: np.ndarray | None = None
+        self._tail_x: np.ndarray | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._antithetic or self._control_variate
+
+    def update(self, outcomes: np.ndarray, latent: np.ndarray | None) -> None:
+        y = np.asarray(outcomes, dtype=float)
+        self._count += int(y.shape[0])
+        self._sum_y += float(np.sum(y))
+        self._sum_yy += float(np.dot(y, y))
+        if self._antithetic:
+            # Batches are even-sized, so rows 2k and 2k + 1 are always a pair.
+            paired = y[: (y.shape[0] // 2) * 2].reshape(-1, 2)
+            pair_means = np.mean(paired, axis=1)
+            self._pair_count += int(pair_means.shape[0])
+            self._sum_pair += float(np.sum(pair_means))
+            self._sum_pair_sq += float(np.dot(pair_means, pair_means))
+        if not self._control_variate:
+            return
+        if latent is None:
+            raise ValueError("control variate runs require latent draws per batch")
+        x = control_features(latent)
+        if self._sum_x is None:
+            width = x.shape[1]
+            self._sum_x = np.zeros(width, dtype=float)
+            self._sum_xx = np.zeros((width, width), dtype=float)
+            self._sum_xy = np.zeros(width, dtype=float)
+            self._tail_x = np.empty((0, width), dtype=float)
+        self._sum_x += np.sum(x, axis=0)
+        self._sum_xx += x.T @ x
+        self._sum_xy += x.T @ y
+        self._tail_x = np.concatenate([self._tail_x, x])[-self._tail_length :]
+
+    def convergence_outcomes(self, recent: np.ndarray) -> np.ndarray:
+        """Trailing outcomes with the fitted control response removed."""
+        if not self._control_variate or self._tail_x is None:
+            return recent
+        tail_x = self._tail_x[-recent.shape[0] :]
+        return recent[-tail_x.shape[0] :] - (tail_x @ self._coefficients())
+
+    def adjust_summary(self, summary: dict[str, float]) -> dict[str, float]:
+        if not self._control_variate or self._sum_x is None:
+            return summary
+        return {**summary, "mean": self._controlled_mean()}
+
+    def diagnostics(self) -> dict[str, float | int | str]:
+        diagnostics: dict[str, float | int | str] = {
+            "variance_reduction": self._label,
+        }
+        if not self.enabled or self._count < 2:
+            return diagnostics
+        raw_variance = self._raw_variance()
+        raw_std_error = float(np.sqrt(raw_variance / self._count))
+        diagnostics["raw_mean"] = self._sum_y / self._count
+        diagnostics["raw_mean_std_error"] = raw_std_error
+        if self._antithetic and self._pair_count >= 2:
+            pair_mean = self._sum_pair / self._pair_count
+            pair_variance = max(
+                (self._sum_pair_sq / self._pair_count) - (pair_mean * pair_mean), 0.0
+            )
+            # Plain MC with the same row budget averages two independent rows
+            # per pair, i.e. variance raw_variance / 2 per pair mean.
+            diagnostics["antithetic_pairs"] = self._pair_count
+            diagnostics["antithetic_variance_ratio"] = _safe_ratio(
+                pair_variance, raw_variance / 2.0
+            )
+        if self._control_variate and self._sum_x is not None:
+            residual_variance = self._residual_variance()
+            diagnostics["control_variate_count"] = int(self._sum_x.shape[0])
+            diagnostics["cv_variance_ratio"] = _safe_ratio(
+                residual_variance, raw_variance
+            )
+            diagnostics["cv_mean_std_error"] = float(
+                np.sqrt(residual_variance / self._count)
+            )
+        return diagnostics
+
+    def _raw_variance(self) -> float:
+        mean = self._sum_y / self._count
+        return max((self._sum_yy / self._count) - (mean * mean), 0.0)
+
+    def _centered_moments(self) -> tuple[np.ndarray, np.ndarray]:
+        mean_x = self._sum_x / self._count
+        mean_y = self._sum_y / self._count
+        cov_xx = (self._sum_xx / self._count) - np.outer(mean_x, mean_x)
+        cov_xy = (self._sum_xy / self._count) - (mean_x * mean_y)
+        return cov_xx, cov_xy
+
+    def _coefficients(self) -> np.ndarray:
+        cov_xx, cov_xy = self._centered_moments()
+        # lstsq tolerates controls that are collinear in a short prefix
+        # (e.g. clipped draws), where a plain solve would fail.
+        beta, *_ = np.linalg.lstsq(cov_xx, cov_xy, rcond=None)
+        return beta
+
+    def _controlled_mean(self) -> float:
+        # Controls have known mean zero, so y_bar - beta . (x_bar - 0).
+        beta = self._coefficients()
+        return float((self._sum_y / self._count) - ((self._sum_x / self._count) @ beta))
+
+    def _residual_variance(self) -> float:
+        _, cov_xy = self._centered_moments()
+        explained = float(cov_xy @ self._coefficients())
+        return max(self._raw_variance() - explained, 0.0)
+
+
+def _safe_ratio(numerator: float, denominator: float) -> float:
+    if denominator <= 0.0:
+        return 1.0
+    return float(numerator / denominator)
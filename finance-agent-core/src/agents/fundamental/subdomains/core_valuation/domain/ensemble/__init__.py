@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from .contracts import (
+    EnsembleMember,
+    EnsembleModelResult,
+    EnsembleValuationResult,
+)
+from .runtime_service import run_ensemble_valuation
+
+__all__ = [
+    "EnsembleMember",
+    "EnsembleModelResult",
+    "EnsembleValuationResult",
+    "run_ensemble_valuation",
+]
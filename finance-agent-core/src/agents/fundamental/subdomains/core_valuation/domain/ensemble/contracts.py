@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+EnsembleModelStatus = Literal["ok", "missing_inputs", "error"]
+
+
+@dataclass(frozen=True)
+class EnsembleMember:
+    model: str
+    weight: float
+
+
+@dataclass(frozen=True)
+class EnsembleModelResult:
+    model: str
+    weight: float
+    status: EnsembleModelStatus
+    intrinsic_value: float | None = None
+    upside_potential: float | None = None
+    distribution_summary: dict[str, float] | None = None
+    executed_iterations: int = 0
+    missing: tuple[str, ...] = ()
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class EnsembleValuationResult:
+    ticker: str | None
+    models: tuple[EnsembleModelResult, ...]
+    blended_intrinsic_value: float | None
+    blended_upside_potential: float | None
+    blended_distribution: dict[str, float] | None
+    sample_store: dict[str, int] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import replace
+
+from ..engine.monte_carlo_outcome_capture_service import (
+    CapturedOutcomes,
+    build_mixture_summary,
+    capture_monte_carlo_outcomes,
+)
+from ..engine.monte_carlo_sample_store_service import use_monte_carlo_sample_store
+from ..parameterization import ParamBuildResult, build_params
+from ..valuation_model_registry import ValuationModelRegistry
+from ..value_objects import MODEL_TYPE_BY_SELECTION
+from .contracts import (
+    EnsembleMember,
+    EnsembleModelResult,
+    EnsembleValuationResult,
+)
+
+BuildParamsFn = Callable[
+    [str, str | None, list[Mapping[str, object]], Mapping[str, object] | None],
+    ParamBuildResult,
+]
+
+# Copied from the leading member so members seed the shared sample store the
+# same way; iteration counts and samplers stay per member.
+_SHARED_MONTE_CARLO_CONTROLS = ("monte_carlo_seed",)
+
+
+def run_ensemble_valuation(
+    *,
+    ticker: str | None,
+    financial_reports: list[Mapping[str, object]],
+    members: Sequence[EnsembleMember],
+    market_snapshot: Mapping[str, object] | None = None,
+    build_params_fn: BuildParamsFn = build_params,
+) -> EnsembleValuationResult:
+    """
+    Value one ticker under several models in one call and blend them.
+    Members are selection names (e.g. "ddm") or registry model types; members
+    resolving to the same calculator are merged by summing their weights.
+    All members run with the leading member's Monte Carlo seed inside one
+    sample store, so members with the same number of stochastic variables and
+    iterations reuse one set of draws instead of sampling again. The blended
+    value is the weighted mean over the members that valued successfully. The
+    blended distribution is the weight mixture of the members' raw Monte Carlo
+    outcomes (before any control-variate adjustment), with weights
+    renormalized over the members that produced a distribution.
+    """
+    started = time.perf_counter()
+    resolved = _resolve_members(members)
+
+    built: list[tuple[str, float, ParamBuildResult | None, str | None]] = []
+    for model, weight in resolved:
+        try:
+            build = build_params_fn(model, ticker, financial_reports, market_snapshot)
+        except Exception as exc:  # noqa: BLE001
+            built.append((model, weight, None, str(exc)))
+            continue
+        built.append((model, weight, build, None))
+    leading_params = next(
+        (
+            build.params
+            for _, _, build, _ in built
+            if build is not None and not build.missing
+        ),
+        None,
+    )
+
+    results: list[EnsembleModelResult] = []
+    components: list[tuple[CapturedOutcomes, float]] = []
+    with (
+        use_monte_carlo_sample_store() as store,
+        capture_monte_carlo_outcomes() as capture,
+    ):
+        for model, weight, build, build_error in built:
+            if build is None:
+                results.append(
+                    EnsembleModelResult(
+                        model=model, weight=weight, status="error", error=build_error
+                    )
+                )
+                continue
+            if build.missing:
+                results.append(
+                    EnsembleModelResult(
+                        model=model,
+                        weight=weight,
+                        status="missing_inputs",
+                        missing=tuple(build.missing),
+                    )
+                )
+                continue
+            result = _run_member(model, weight, build, leading_params)
+            runs = capture.drain()
+            if result.status == "ok" and runs:
+                outcomes = runs[-1]
+                components.append((outcomes, weight))
+                result = replace(
+                    result, executed_iterations=outcomes.executed_iterations
+                )
+            results.append(result)
+        store_info = store.info()
+
+    ok_results = [item for item in results if item.status == "ok"]
+    blended_intrinsic_value = _weighted_mean(
+        [(item.intrinsic_value, item.weight) for item in ok_results]
+    )
+    blended_upside_potential = _weighted_mean(
+        [(item.upside_potential, item.weight) for item in ok_results]
+    )
+    blended_distribution = (
+        build_mixture_summary(_renormalized(components)) if components else None
+    )
+    return EnsembleValuationResult(
+        ticker=ticker,
+        models=tuple(results),
+        blended_intrinsic_value=blended_intrinsic_value,
+        blended_upside_potential=blended_upside_potential,
+        blended_distribution=blended_distribution,
+        sample_store=store_info,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+def _resolve_members(members: Sequence[EnsembleMember]) -> list[tuple[str, float]]:
+    weights: dict[str, float] = {}
+    for member in members:
+        if member.weight < 0:
+            raise ValueError(f"ensemble weight must be non-negative: {member.model}")
+        selection = MODEL_TYPE_BY_SELECTION.get(member.model)
+        model = selection.value if selection is not None else member.model
+        weights[model] = weights.get(model, 0.0) + float(member.weight)
+    if not weights:
+        raise ValueError("ensemble needs at least one member")
+    return list(weights.items())
+
+
+def _run_member(
+    model: str,
+    weight: float,
+    build: ParamBuildResult,
+    leading_params: Mapping[str, object] | None,
+) -> EnsembleModelResult:
+    model_runtime = ValuationModelRegistry.get_model_runtime(model)
+    schema = model_runtime.get("schema") if isinstance(model_runtime, Mapping) else None
+    calculator = (
+        model_runtime.get("calculator") if isinstance(model_runtime, Mapping) else None
+    )
+    if not callable(schema) or not callable(calculator):
+        return EnsembleModelResult(
+            model=model,
+            weight=weight,
+            status="error",
+            error=(
+                f"Unknown valuation model: {model}"
+                if model_runtime is None
+                else f"Incomplete model runtime for model: {model}"
+            ),
+        )
+
+    params = dict(build.params)
+    if leading_params is not None:
+        for key in _SHARED_MONTE_CARLO_CONTROLS:
+            if key in params and key in leading_params:
+                params[key] = leading_params[key]
+    params["trace_inputs"] = build.trace_inputs
+    try:
+        raw_result = calculator(schema(**params))
+    except Exception as exc:  # noqa: BLE001
+        return EnsembleModelResult(
+            model=model, weight=weight, status="error", error=str(exc)
+        )
+    if not isinstance(raw_result, Mapping):
+        return EnsembleModelResult(
+            model=model,
+            weight=weight,
+            status="error",
+            error=f"calculation result for '{model}' must be an object",
+        )
+    error_raw = raw_result.get("error")
+    if isinstance(error_raw, str) and error_raw:
+        return EnsembleModelResult(
+            model=model, weight=weight, status="error", error=error_raw
+        )
+    return EnsembleModelResult(
+        model=model,
+        weight=weight,
+        status="ok",
+        intrinsic_value=_optional_float(raw_result.get("intrinsic_value")),
+        upside_potential=_optional_float(raw_result.get("upside_potential")),
+        distribution_summary=_distribution_summary(raw_result.get("details")),
+    )
+
+
+def _distribution_summary(details: object) -> dict[str, float] | None:
+    if not isinstance(details, Mapping):
+        return None
+    distribution = details.get("distribution_summary")
+    if not isinstance(distribution, Mapping):
+        return None
+    summary = distribution.get("summary")
+    if not isinstance(summary, Mapping):
+        return None
+    return {
+        str(key): float(value)
+        for key, value in summary.items()
+        if isinstance(value, int | float) and not isinstance(value, bool)
+    }
+
+
+def _renormalized(
+    components: list[tuple[CapturedOutcomes, float]],
+) -> list[tuple[CapturedOutcomes, float]]:
+    total = sum(weight for _, weight in components)
+    if total <= 0:
+        return components
+    return [(outcomes, weight / total) for outcomes, weight in components]
+
+
+def _weighted_mean(items: list[tuple[float | None, float]]) -> float | None:
+    present = [(value, weight) for value, weight in items if value is not None]
+    total = sum(weight for _, weight in present)
+    if total <= 0:
+        return None
+    return sum(value * weight for value, weight in present) / total
+
+
+def _optional_float(value: object) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
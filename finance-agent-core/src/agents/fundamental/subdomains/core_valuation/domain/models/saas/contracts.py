@@ -73,6 +73,13 @@ class SaaSParams(BaseValuationParams):
     monte_carlo_sampler: Literal["pseudo", "sobol", "lhs"] = Field(
         "sobol", description="Monte Carlo sampler strategy"
     )
+    monte_carlo_antithetic: bool = Field(
+        False, description="Pair every Monte Carlo draw with its antithetic mirror"
+    )
+    monte_carlo_control_variate: bool = Field(
+        False,
+        description="Adjust the Monte Carlo mean with latent-draw control variates",
+    )
     growth_shock_std: float = Field(
         0.03, gt=0, description="Std dev for growth shock in Monte Carlo"
     )
@@ -13,6 +13,12 @@ from .contracts import ParamBuildResult
 from .core_ops_service import (
     sort_reports_by_year_desc as _sort_reports_by_year_desc,
 )
+from .param_cache_service import (
+    PARAM_CACHE_METADATA_KEY,
+)
+from .param_cache_service import (
+    build_params_cached as _build_params_cached_service,
+)
 from .policy_service import (
     apply_forward_signal_adjustments as _apply_forward_signal_adjustments_service,
 )
@@ -85,6 +91,43 @@ def build_params(
             "input_reports_count": len(reports_raw or []),
         },
     )
+    result = _build_params_cached_service(
+        model_type=model_type,
+        ticker=ticker,
+        reports_raw=reports_raw or [],
+        market_snapshot=market_snapshot,
+        build_fn=lambda: _build_params_uncached(
+            model_type, ticker, reports_raw, market_snapshot
+        ),
+    )
+    cache_metadata = result.metadata.get(PARAM_CACHE_METADATA_KEY)
+
+    log_event(
+        logger,
+        event="valuation_params_build_completed",
+        message="valuation parameter build completed",
+        fields={
+            "model_type": model_type,
+            "ticker": ticker,
+            "missing_count": len(result.missing),
+            "assumptions_count": len(result.assumptions),
+            "trace_input_count": len(result.trace_inputs),
+            "param_cache_status": (
+                cache_metadata.get("status")
+                if isinstance(cache_metadata, Mapping)
+                else None
+            ),
+        },
+    )
+    return result
+
+
+def _build_params_uncached(
+    model_type: str,
+    ticker: str | None,
+    reports_raw: list[Mapping[str, object]] | None,
+    market_snapshot: Mapping[str, object] | None,
+) -> ParamBuildResult:
     reports = parse_domain_financial_reports(reports_raw or [])
     if not reports:
         log_event(
@@ -123,19 +166,6 @@ def build_params(
         model_type=model_type,
         market_snapshot=market_snapshot,
     )
-
-    log_event(
-        logger,
-        event="valuation_params_build_completed",
-        message="valuation parameter build completed",
-        fields={
-            "model_type": model_type,
-            "ticker": ticker,
-            "missing_count": len(result.missing),
-            "assumptions_count": len(result.assumptions),
-            "trace_input_count": len(result.trace_inputs),
-        },
-    )
     return result
 
 
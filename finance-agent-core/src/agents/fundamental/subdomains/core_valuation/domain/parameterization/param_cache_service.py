@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from src.agents.fundamental.domain.shared.contracts.traceable import SourceType
+from src.shared.kernel.types import JSONObject
+
+from .contracts import ParamBuildResult
+from .forward_signal_calibration_mapping_service import (
+    FORWARD_SIGNAL_CALIBRATION_MAPPING_PATH_ENV,
+)
+from .reinvestment_clamp_profile_service import REINVESTMENT_CLAMP_PROFILE_PATH_ENV
+from .snapshot_service import env_bool, env_int
+from .types import TraceInput
+
+PARAM_CACHE_ENABLED_ENV = "FUNDAMENTAL_PARAM_CACHE_ENABLED"
+PARAM_CACHE_MAX_ENTRIES_ENV = "FUNDAMENTAL_PARAM_CACHE_MAX_ENTRIES"
+PARAM_CACHE_DIR_ENV = "FUNDAMENTAL_PARAM_CACHE_DIR"
+PARAM_CACHE_METADATA_KEY = "parameterization_cache"
+
+_CACHE_SCHEMA_VERSION = "param_cache_v2"
+_DEFAULT_MAX_ENTRIES = 256
+_DOMAIN_ROOT = Path(__file__).resolve().parents[1]
+# Directory holding the first-party ``src`` package.
+_PROJECT_ROOT = Path(__file__).resolve().parents[7]
+_FIRST_PARTY_PACKAGE = "src"
+# Builders, policies and the report contract they parse. The builder version
+# hashes these, every first-party module they import (transitively), and the
+# JSON configs under them; any edit invalidates every cached entry.
+_BUILDER_SOURCE_ROOTS = (
+    _DOMAIN_ROOT / "parameterization",
+    _DOMAIN_ROOT / "policies",
+    _DOMAIN_ROOT / "report_contract.py",
+)
+_BUILDER_DATA_SUFFIXES = (".json",)
+# Environment knobs read while building params. Config path overrides are
+# fingerprinted by file content as well as by path.
+_BUILDER_ENV_VARS = (
+    "FUNDAMENTAL_DCF_GROWTH_CONSENSUS_TERMINAL_NUDGE_ENABLED",
+    "FUNDAMENTAL_DCF_SHARES_SCOPE_POLICY",
+    "FUNDAMENTAL_DCF_STANDARD_CONSENSUS_TERMINAL_NUDGE_ENABLED",
+    "FUNDAMENTAL_DEFAULT_MARKET_RISK_PREMIUM",
+    "FUNDAMENTAL_LONG_RUN_GROWTH_NOMINAL_BRIDGE_INFLATION",
+    "FUNDAMENTAL_MARKET_STALE_MAX_DAYS",
+    "FUNDAMENTAL_MONTE_CARLO_ENABLED",
+    "FUNDAMENTAL_MONTE_CARLO_ITERATIONS",
+    "FUNDAMENTAL_MONTE_CARLO_SAMPLER",
+    "FUNDAMENTAL_MONTE_CARLO_SEED",
+    "FUNDAMENTAL_TERMINAL_GROWTH_STALE_FALLBACK_MODE",
+    "FUNDAMENTAL_TIME_ALIGNMENT_MAX_DAYS",
+    "FUNDAMENTAL_TIME_ALIGNMENT_POLICY",
+)
+_BUILDER_CONFIG_PATH_ENV_VARS = (
+    FORWARD_SIGNAL_CALIBRATION_MAPPING_PATH_ENV,
+    REINVESTMENT_CLAMP_PROFILE_PATH_ENV,
+)
+
+_TRACE_INPUTS_ADAPTER = TypeAdapter(dict[str, TraceInput])
+
+
+@dataclass(frozen=True)
+class ParamCacheLookup:
+    result: ParamBuildResult | None
+    layer: str | None
+
+
+@lru_cache(maxsize=1)
+def _builder_source_version() -> str:
+    digest = hashlib.sha256()
+    for path in _builder_source_files(
+        _BUILDER_SOURCE_ROOTS, project_root=_PROJECT_ROOT
+    ):
+        digest.update(path.relative_to(_PROJECT_ROOT).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _builder_source_files(roots: tuple[Path, ...], *, project_root: Path) -> list[Path]:
+    entry_points: list[Path] = []
+    data_files: list[Path] = []
+    for root in roots:
+        paths = sorted(root.rglob("*")) if root.is_dir() else [root]
+        for path in paths:
+            if not path.is_file() or "__pycache__" in path.parts:
+                continue
+            if path.suffix == ".py":
+                entry_points.append(path)
+            elif path.suffix in _BUILDER_DATA_SUFFIXES:
+                data_files.append(path)
+    closure = _first_party_import_closure(entry_points, project_root=project_root)
+    return sorted(closure.union(data_files))
+
+
+def _first_party_import_closure(
+    entry_points: list[Path], *, project_root: Path
+) -> set[Path]:
+    """Source files of ``entry_points`` and every first-party module they import."""
+    seen: set[Path] = set()
+    pending = list(entry_points)
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for module in _imported_modules(path, project_root=project_root):
+            module_path = _first_party_module_path(module, project_root=project_root)
+            if module_path is not None:
+                pending.append(module_path)
+    return seen
+
+
+def _imported_modules(path: Path, *, project_root: Path) -> list[tuple[str, ...]]:
+    """
+    Absolute module names a source file imports. ``from x import y`` yields
+    both ``x`` and ``x.y``, since ``y`` may be a submodule.
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    package = path.relative_to(project_root).with_suffix("").parts[:-1]
+    modules: list[tuple[str, ...]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(tuple(alias.name.split(".")) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = package[: len(package) - node.level + 1] if node.level else ()
+            target = base + (tuple(node.module.split(".")) if node.module else ())
+            modules.append(target)
+            modules.extend((*target, alias.name) for alias in node.names)
+    return modules
+
+
+def _first_party_module_path(
+    module: tuple[str, ...], *, project_root: Path
+) -> Path | None:
+    if not module or module[0] != _FIRST_PARTY_PACKAGE:
+        return None
+    base = project_root.joinpath(*module)
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def resolve_param_builder_version() -> str:
+    """Source version plus the environment-dependent builder configuration."""
+    digest = hashlib.sha256(_builder_source_version().encode("utf-8"))
+    for name in _BUILDER_ENV_VARS:
+        digest.update(f"{name}={os.getenv(name)}\0".encode())
+    for name in _BUILDER_CONFIG_PATH_ENV_VARS:
+        raw_path = os.getenv(name)
+        digest.update(f"{name}={raw_path}\0".encode())
+        if raw_path and raw_path.strip():
+            try:
+                digest.update(Path(raw_path.strip()).read_bytes())
+            except OSError:
+                digest.update(b"<unreadable>")
+    return digest.hexdigest()[:16]
+
+
+def build_param_cache_key(
+    *,
+    model_type: str,
+    ticker: str | None,
+    reports_raw: list[Mapping[str, object]],
+    market_snapshot: Mapping[str, object] | None,
+    builder_version: str,
+) -> str | None:
+    """Content hash of every build input; None when an input is not JSON-stable."""
+    payload = {
+        "schema_version": _CACHE_SCHEMA_VERSION,
+        "builder_version": builder_version,
+        "model_type": model_type,
+        "ticker": ticker,
+        "reports": reports_raw,
+        "market_snapshot": market_snapshot,
+    }
+    try:
+        canonical = json.dumps(
+            payload,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            allow_nan=True,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def encode_param_build_result(result: ParamBuildResult) -> bytes:
+    envelope = {
+        "schema_version": _CACHE_SCHEMA_VERSION,
+        "params": result.params,
+        "trace_inputs": _stamp_manual_provenance(
+            _TRACE_INPUTS_ADAPTER.dump_python(result.trace_inputs, mode="json"),
+            modified_at="",
+        ),
+        "missing": result.missing,
+        "assumptions": result.assumptions,
+        "metadata": result.metadata,
+    }
+    return json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def decode_param_build_result(raw: bytes) -> ParamBuildResult | None:
+    try:
+        envelope = json.loads(raw)
+        if (
+            not isinstance(envelope, dict)
+            or envelope.get("schema_version") != _CACHE_SCHEMA_VERSION
+        ):
+            return None
+        params = envelope["params"]
+        missing = envelope["missing"]
+        assumptions = envelope["assumptions"]
+        metadata = envelope["metadata"]
+        if not isinstance(params, dict) or not isinstance(metadata, dict):
+            return None
+        if not isinstance(missing, list) or not isinstance(assumptions, list):
+            return None
+        # Manual provenance is stamped with wall-clock time at build time;
+        # entries are stored without it and restamped when served.
+        trace_inputs = _TRACE_INPUTS_ADAPTER.validate_python(
+            _stamp_manual_provenance(
+                envelope["trace_inputs"], modified_at=str(datetime.now())
+            )
+        )
+    except (ValueError, KeyError):
+        return None
+    return ParamBuildResult(
+        params=params,
+        trace_inputs=trace_inputs,
+        missing=missing,
+        assumptions=assumptions,
+        metadata=metadata,
+    )
+
+
+def _stamp_manual_provenance(node: object, *, modified_at: str) -> object:
+    """Set ``modified_at`` on every manual provenance in a JSON trace tree."""
+    if isinstance(node, dict):
+        if node.get("type") == SourceType.MANUAL.value and "modified_at" in node:
+            node["modified_at"] = modified_at
+        for value in node.values():
+            _stamp_manual_provenance(value, modified_at=modified_at)
+    elif isinstance(node, list):
+        for item in node:
+            _stamp_manual_provenance(item, modified_at=modified_at)
+    return node
+
+
+class ParamBuildCache:
+    """
+    Two-tier cache for ParamBuildResult: an in-memory LRU and an optional
+    directory of JSON entries shared across processes (replays, backtests).
+    Entries are stored encoded, so every hit returns a fresh result the caller
+    is free to mutate.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        directory: Path | None = None,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.directory = directory
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+        }
+
+    def get(self, key: str) -> ParamCacheLookup:
+        with self._lock:
+            raw = self._entries.get(key)
+            if raw is not None:
+                self._entries.move_to_end(key)
+        if raw is not None:
+            result = decode_param_build_result(raw)
+            if result is not None:
+                self._bump("memory_hits")
+                return ParamCacheLookup(result=result, layer="memory")
+
+        raw = self._disk_get(key)
+        if raw is not None:
+            result = decode_param_build_result(raw)
+            if result is not None:
+                self._remember(key, raw)
+                self._bump("disk_hits")
+                return ParamCacheLookup(result=result, layer="disk")
+
+        self._bump("misses")
+        return ParamCacheLookup(result=None, layer=None)
+
+    def put(self, key: str, result: ParamBuildResult) -> None:
+        try:
+            raw = encode_param_build_result(result)
+        except (TypeError, ValueError):
+            return
+        self._remember(key, raw)
+        self._disk_set(key, raw)
+        self._bump("stores")
+
+    def stats_snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def _remember(self, key: str, raw: bytes) -> None:
+        with self._lock:
+            self._entries[key] = raw
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str) -> bytes | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _disk_set(self, key: str, raw: bytes) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(raw)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+_CACHE_LOCK = threading.Lock()
+_CACHE: ParamBuildCache | None = None
+
+
+def get_param_build_cache() -> ParamBuildCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            raw_dir = os.getenv(PARAM_CACHE_DIR_ENV)
+            _CACHE = ParamBuildCache(
+                max_entries=env_int(
+                    PARAM_CACHE_MAX_ENTRIES_ENV, _DEFAULT_MAX_ENTRIES, minimum=1
+                ),
+                directory=(
+                    Path(raw_dir.strip()) if raw_dir and raw_dir.strip() else None
+                ),
+            )
+        return _CACHE
+
+
+def reset_param_build_cache() -> None:
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = None
+
+
+def build_params_cached(
+    *,
+    model_type: str,
+    ticker: str | None,
+    reports_raw: list[Mapping[str, object]],
+    market_snapshot: Mapping[str, object] | None,
+    build_fn: Callable[[], ParamBuildResult],
+) -> ParamBuildResult:
+    """
+    Return build_fn() through the parameterization cache and record the
+    outcome under metadata["parameterization_cache"].
+    """
+    if not env_bool(PARAM_CACHE_ENABLED_ENV, True):
+        return _with_cache_metadata(build_fn(), status="disabled")
+
+    builder_version = resolve_param_builder_version()
+    key = build_param_cache_key(
+        model_type=model_type,
+        ticker=ticker,
+        reports_raw=reports_raw,
+        market_snapshot=market_snapshot,
+        builder_version=builder_version,
+    )
+    if key is None:
+        return _with_cache_metadata(
+            build_fn(), status="bypass", builder_version=builder_version
+        )
+
+    cache = get_param_build_cache()
+    lookup = cache.get(key)
+    if lookup.result is not None:
+        return _with_cache_metadata(
+            lookup.result,
+            status="hit",
+            layer=lookup.layer,
+            key=key,
+            builder_version=builder_version,
+        )
+
+    result = build_fn()
+    cache.put(key, result)
+    return _with_cache_metadata(
+        result, status="miss", key=key, builder_version=builder_version
+    )
+
+
+def _with_cache_metadata(
+    result: ParamBuildResult,
+    *,
+    status: str,
+    layer: str | None = None,
+    key: str | None = None,
+    builder_version: str | None = None,
+) -> ParamBuildResult:
+    metadata: JSONObject = dict(result.metadata)
+    metadata[PARAM_CACHE_METADATA_KEY] = {
+        "status": status,
+        "layer": layer,
+        "key": key[:16] if key is not None else None,
+        "builder_version": builder_version,
+    }
+    return ParamBuildResult(
+        params=result.params,
+        trace_inputs=result.trace_inputs,
+        missing=result.missing,
+        assumptions=result.assumptions,
+        metadata=metadata,
+    )
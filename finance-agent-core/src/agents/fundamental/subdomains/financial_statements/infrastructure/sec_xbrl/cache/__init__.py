@@ -4,10 +4,18 @@ from .filing_cache_service import (
     FilingCacheService,
     build_default_filing_cache_service,
 )
+from .filing_fact_store_service import (
+    FilingFactStore,
+    StoredFilingFacts,
+    build_default_filing_fact_store,
+)
 
 __all__ = [
     "FilingCacheCoordinates",
     "FilingCacheLookupResult",
     "FilingCacheService",
+    "FilingFactStore",
+    "StoredFilingFacts",
     "build_default_filing_cache_service",
+    "build_default_filing_fact_store",
 ]
@@ -249,7 +249,7 @@ class FilingCacheService:
             if not isinstance(text, str):
                 return None
             parsed = json.loads(text)
-            return _as_json_object(parsed)
+            return as_json_object(parsed)
         except Exception:
             return None
 
@@ -282,7 +282,7 @@ class FilingCacheService:
                 path.unlink(missing_ok=True)
                 return None
             payload = parsed.get("payload")
-            return _as_json_object(payload)
+            return as_json_object(payload)
         except Exception:
             return None
 
@@ -313,8 +313,8 @@ def build_default_filing_cache_service() -> FilingCacheService:
         l3_ttl_seconds=_env_int("FUNDAMENTAL_XBRL_CACHE_L3_TTL_SECONDS", 21600),
         redis_url=os.getenv("FUNDAMENTAL_XBRL_REDIS_URL"),
         l3_cache_dir=os.getenv("FUNDAMENTAL_XBRL_CACHE_DIR"),
-        l2_enabled=_env_flag("FUNDAMENTAL_XBRL_CACHE_L2_ENABLED", default=False),
-        l3_enabled=_env_flag("FUNDAMENTAL_XBRL_CACHE_L3_ENABLED", default=True),
+        l2_enabled=env_flag("FUNDAMENTAL_XBRL_CACHE_L2_ENABLED", default=False),
+        l3_enabled=env_flag("FUNDAMENTAL_XBRL_CACHE_L3_ENABLED", default=True),
     )
 
 
@@ -337,7 +337,7 @@ def _build_redis_client(redis_url: str) -> _RedisClientLike | None:
         return None
 
 
-def _as_json_object(value: object) -> JSONObject | None:
+def as_json_object(value: object) -> JSONObject | None:
     if not isinstance(value, dict):
         return None
     parsed: JSONObject = {}
@@ -422,7 +422,7 @@ def _env_int(name: str, default: int) -> int:
     return parsed if parsed > 0 else default
 
 
-def _env_flag(name: str, *, default: bool) -> bool:
+def env_flag(name: str, *, default: bool) -> bool:
     raw = os.getenv(name)
     if not isinstance(raw, str):
         return default
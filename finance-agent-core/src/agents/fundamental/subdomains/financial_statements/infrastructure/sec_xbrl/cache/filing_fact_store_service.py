@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.shared.kernel.types import JSONObject
+
+from .filing_cache_service import as_json_object, env_flag
+
+FACT_STORE_SCHEMA_VERSION = "filing_fact_store_v1"
+_MANIFEST_NAME = "manifest.json"
+_DEFAULT_FACT_STORE_DIR = "/tmp/fundamental_xbrl_fact_store"
+
+
+class UnsupportedFactColumnError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class StoredFilingFacts:
+    key: str
+    dataframe: pd.DataFrame
+    metadata: JSONObject | None
+    load_ms: float
+
+
+class FilingFactStore:
+    """
+    Immutable on-disk store of parsed XBRL fact tables, one entry per filing
+    accession and parser fingerprint. Entries are directories of one .npy
+    file per column: string columns as int32 codes into a category list,
+    numeric, boolean and datetime columns as raw arrays. Loads open the arrays
+    memory-mapped and decode them straight into the frame, with no parse or
+    intermediate copy of the file contents.
+    Entries are written once under a temporary name and renamed into place;
+    an existing entry is never rewritten.
+    """
+
+    def __init__(self, *, root_dir: str | None = None, enabled: bool = True) -> None:
+        self._enabled = enabled
+        self._root = Path(
+            root_dir
+            if isinstance(root_dir, str) and root_dir.strip()
+            else _DEFAULT_FACT_STORE_DIR
+        )
+        self._stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "store_skips": 0,
+        }
+        self._stats_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def stats_snapshot(self) -> dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def build_key(self, *, accession: str, parser_fingerprint: str) -> str:
+        source = "|".join(
+            (FACT_STORE_SCHEMA_VERSION, accession.strip(), parser_fingerprint)
+        )
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> StoredFilingFacts | None:
+        if not self._enabled:
+            return None
+        started = time.perf_counter()
+        entry_dir = self._entry_dir(key)
+        try:
+            manifest = json.loads(
+                (entry_dir / _MANIFEST_NAME).read_text(encoding="utf-8")
+            )
+            if manifest.get("schema_version") != FACT_STORE_SCHEMA_VERSION:
+                raise ValueError("fact store schema version mismatch")
+            dataframe = _read_dataframe(entry_dir, manifest)
+        except Exception:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return StoredFilingFacts(
+            key=key,
+            dataframe=dataframe,
+            metadata=as_json_object(manifest.get("metadata")),
+            load_ms=(time.perf_counter() - started) * 1000.0,
+        )
+
+    def store(
+        self,
+        key: str,
+        dataframe: pd.DataFrame,
+        *,
+        metadata: JSONObject | None = None,
+    ) -> bool:
+        """
+        Persist ``dataframe`` under ``key``. Returns False when the store is
+        disabled, the entry already exists, or a column cannot be encoded.
+        """
+        if not self._enabled:
+            return False
+        entry_dir = self._entry_dir(key)
+        if (entry_dir / _MANIFEST_NAME).exists():
+            self._count("store_skips")
+            return False
+        tmp_dir = entry_dir.parent / f".{key}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            tmp_dir.mkdir(parents=True, exist_ok=False)
+            manifest: JSONObject = {
+                "schema_version": FACT_STORE_SCHEMA_VERSION,
+                "key": key,
+                "row_count": len(dataframe),
+                "index": _write_index(tmp_dir, dataframe.index),
+                "columns": [
+                    _write_column(tmp_dir, f"c{position}", name, dataframe[name])
+                    for position, name in enumerate(dataframe.columns)
+                ],
+                "metadata": metadata,
+                "created_at_epoch": time.time(),
+            }
+            (tmp_dir / _MANIFEST_NAME).write_text(
+                json.dumps(manifest, ensure_ascii=True, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            tmp_dir.rename(entry_dir)
+        except Exception:
+            # Unsupported column, full disk, or a concurrent writer won the
+            # rename; the entry (if any) is left as whoever completed it.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            self._count("store_skips")
+            return False
+        self._count("stores")
+        return True
+
+    def _entry_dir(self, key: str) -> Path:
+        return self._root / key[:2] / key
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+
+def build_default_filing_fact_store() -> FilingFactStore:
+    return FilingFactStore(
+        root_dir=os.getenv("FUNDAMENTAL_XBRL_FACT_STORE_DIR"),
+        enabled=env_flag("FUNDAMENTAL_XBRL_FACT_STORE_ENABLED", default=True),
+    )
+
+
+def _write_index(entry_dir: Path, index: pd.Index) -> JSONObject:
+    if isinstance(index, pd.RangeIndex):
+        return {
+            "kind": "range",
+            "start": index.start,
+            "stop": index.stop,
+            "step": index.step,
+        }
+    if pd.api.types.is_integer_dtype(index.dtype):
+        np.save(entry_dir / "index.npy", index.to_numpy(dtype=np.int64))
+        return {"kind": "int64", "file": "index.npy"}
+    raise UnsupportedFactColumnError(f"unsupported index dtype: {index.dtype}")
+
+
+def _write_column(
+    entry_dir: Path,
+    file_stem: str,
+    name: object,
+    series: pd.Series,
+) -> JSONObject:
+    if not isinstance(name, str):
+        raise UnsupportedFactColumnError(f"unsupported column name: {name!r}")
+    file_name = f"{file_stem}.npy"
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = [_require_str(name, item) for item in dtype.categories]
+        np.save(entry_dir / file_name, series.cat.codes.to_numpy(dtype=np.int32))
+        return {
+            "name": name,
+            "kind": "category",
+            "file": file_name,
+            "categories": categories,
+            "ordered": bool(dtype.ordered),
+        }
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype):
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        categories = [_require_str(name, item) for item in uniques]
+        np.save(entry_dir / file_name, codes.astype(np.int32, copy=False))
+        return {
+            "name": name,
+            "kind": "strings",
+            "dtype": str(dtype),
+            "file": file_name,
+            "categories": categories,
+        }
+    if isinstance(dtype, pd.BooleanDtype):
+        encoded = np.where(
+            series.isna().to_numpy(),
+            -1,
+            series.fillna(False).to_numpy(dtype=np.int8),
+        ).astype(np.int8)
+        np.save(entry_dir / file_name, encoded)
+        return {"name": name, "kind": "boolean", "file": file_name}
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        np.save(entry_dir / file_name, series.to_numpy())
+        return {"name": name, "kind": "numeric", "file": file_name}
+    if isinstance(dtype, np.dtype) and dtype.kind == "M":
+        np.save(entry_dir / file_name, series.to_numpy().view(np.int64))
+        return {
+            "name": name,
+            "kind": "datetime",
+            "dtype": str(dtype),
+            "file": file_name,
+        }
+    raise UnsupportedFactColumnError(f"unsupported dtype for {name}: {dtype}")
+
+
+def _require_str(column: str, value: object) -> str:
+    if not isinstance(value, str):
+        raise UnsupportedFactColumnError(
+            f"column {column} holds a non-string value: {type(value).__name__}"
+        )
+    return value
+
+
+def _read_dataframe(entry_dir: Path, manifest: JSONObject) -> pd.DataFrame:
+    row_count = int(manifest["row_count"])
+    index = _read_index(entry_dir, manifest["index"])
+    columns: dict[str, object] = {}
+    for spec in manifest["columns"]:
+        columns[str(spec["name"])] = _read_column(entry_dir, spec)
+    dataframe = pd.DataFrame(columns, index=index, copy=False)
+    if len(dataframe) != row_count:
+        raise ValueError("fact store row count mismatch")
+    return dataframe
+
+
+def _read_index(entry_dir: Path, spec: JSONObject) -> pd.Index:
+    if spec["kind"] == "range":
+        return pd.RangeIndex(int(spec["start"]), int(spec["stop"]), int(spec["step"]))
+    return pd.Index(np.load(entry_dir / str(spec["file"]), mmap_mode="r"))
+
+
+def _read_column(entry_dir: Path, spec: JSONObject) -> object:
+    values = np.load(entry_dir / str(spec["file"]), mmap_mode="r")
+    kind = spec["kind"]
+    if kind == "category":
+        return pd.Categorical.from_codes(
+            values,
+            categories=list(spec["categories"]),
+            ordered=bool(spec.get("ordered", False)),
+        )
+    if kind == "strings":
+        # The trailing None turns the -1 missing code into a null.
+        lookup = np.array([*spec["categories"], None], dtype=object)
+        decoded = lookup[values]
+        if spec["dtype"] == "object":
+            return decoded
+        return pd.array(decoded, dtype=str(spec["dtype"]))
+    if kind == "boolean":
+        return pd.arrays.BooleanArray(values == 1, values == -1)
+    if kind == "datetime":
+        return values.view(np.dtype(str(spec["dtype"])))
+    return values
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TypeVar, cast
+from collections.abc import Callable, Mapping
+from typing import Any, TypeVar, cast
 
 from src.agents.fundamental.domain.shared.contracts.traceable import (
     ManualProvenance,
@@ -19,9 +20,10 @@ from ..map.field_resolution_service import (
     preview_value,
     search_config_key,
 )
-from .extractor import SearchConfig, SECReportExtractor
+from .extractor import SearchConfig, SECExtractResult, SECReportExtractor
 
 T = TypeVar("T")
+SearchManyFn = Callable[[list[SearchConfig]], list[list[SECExtractResult]]]
 
 
 def collect_parsed_candidates(
@@ -31,11 +33,29 @@ def collect_parsed_candidates(
     name: str,
     target_type: type[T],
     logger_: logging.Logger,
+) -> list[ParsedCandidate[T]]:
+    return parse_search_candidates(
+        configs=configs,
+        results_by_config=[extractor.search(config) for config in configs],
+        name=name,
+        target_type=target_type,
+        logger_=logger_,
+    )
+
+
+def parse_search_candidates(
+    *,
+    configs: list[SearchConfig],
+    results_by_config: list[list[SECExtractResult]],
+    name: str,
+    target_type: type[T],
+    logger_: logging.Logger,
 ) -> list[ParsedCandidate[T]]:
     parsed_candidates: list[ParsedCandidate[T]] = []
 
-    for config_index, config in enumerate(configs):
-        results = extractor.search(config)
+    for config_index, (config, results) in enumerate(
+        zip(configs, results_by_config, strict=True)
+    ):
         if not results:
             log_event(
                 logger_,
@@ -147,59 +167,156 @@ def extract_field(
     name: str,
     target_type: type[T] = float,
     logger_: logging.Logger,
+    search_many_fn: SearchManyFn | None = None,
 ) -> TraceableField[T]:
     stages = build_resolution_stages(configs)
 
     for stage_name, stage_configs in stages:
-        parsed_candidates = collect_parsed_candidates(
-            extractor=extractor,
-            configs=stage_configs,
-            name=name,
-            target_type=target_type,
-            logger_=logger_,
-        )
+        if search_many_fn is None:
+            parsed_candidates = collect_parsed_candidates(
+                extractor=extractor,
+                configs=stage_configs,
+                name=name,
+                target_type=target_type,
+                logger_=logger_,
+            )
+        else:
+            parsed_candidates = parse_search_candidates(
+                configs=stage_configs,
+                results_by_config=search_many_fn(stage_configs),
+                name=name,
+                target_type=target_type,
+                logger_=logger_,
+            )
         selected = choose_best_candidate(parsed_candidates)
         if selected is None:
             continue
-
-        selected_result = selected.ranked.result
-        log_event(
-            logger_,
-            event="fundamental_xbrl_field_hit",
-            message="xbrl field hit",
-            fields={
-                "field_name": name,
-                "concept": selected_result.concept,
-                "period_key": selected_result.period_key,
-                "value_preview": preview_value(selected_result.value),
-                "selected_config_index": selected.config_index,
-                "selected_result_index": selected.ranked.result_index,
-                "resolution_stage": stage_name,
-                "resolution_confidence": round(selected.ranked.overall_confidence, 4),
-                "concept_match_score": round(selected.ranked.concept_match_score, 4),
-                "presentation_proximity_score": round(
-                    selected.ranked.presentation_proximity_score, 4
-                ),
-                "calculation_consistency_score": round(
-                    selected.ranked.calculation_consistency_score, 4
-                ),
-                "label_similarity_score": round(
-                    selected.ranked.label_similarity_score, 4
-                ),
-                "anchor_confidence_score": round(
-                    selected.ranked.anchor_confidence_score, 4
-                ),
-            },
+        return _build_hit_field(
+            name=name, stage_name=stage_name, selected=selected, logger_=logger_
         )
 
-        provenance = XBRLProvenance(
-            concept=selected_result.concept,
-            period=selected_result.period_key,
-            resolution_stage=stage_name,
-            confidence=round(selected.ranked.overall_confidence, 4),
+    return _build_missing_field(name=name, configs=configs, stages=stages)
+
+
+class PrefetchedFieldExtractor:
+    """
+    ``extract_field`` replacement that shares search results across fields.
+    The first call runs the first-stage searches of the whole field catalog
+    as one ``search_many`` pass; later stages and configs outside the catalog
+    are searched when a field needs them, one ``search_many`` per stage, and
+    cached too. Fields are still parsed, ranked and logged one call at a time,
+    so every call returns what ``extract_field`` would. Calls for another
+    extractor go to ``fallback_fn``.
+    """
+
+    def __init__(
+        self,
+        *,
+        extractor: SECReportExtractor,
+        field_configs: Mapping[str, list[SearchConfig]],
+        fallback_fn: Callable[..., TraceableField[Any]],
+        logger_: logging.Logger,
+    ) -> None:
+        self._extractor = extractor
+        self._field_configs = field_configs
+        self._fallback_fn = fallback_fn
+        self._logger = logger_
+        self._results: dict[tuple[object, ...], list[SECExtractResult]] = {}
+        self._catalog_searched = False
+
+    def __call__(
+        self,
+        extractor: SECReportExtractor,
+        configs: list[SearchConfig],
+        name: str,
+        target_type: type[T] = float,
+    ) -> TraceableField[T]:
+        if extractor is not self._extractor:
+            return self._fallback_fn(extractor, configs, name, target_type)
+        return extract_field(
+            extractor=extractor,
+            configs=configs,
+            name=name,
+            target_type=target_type,
+            logger_=self._logger,
+            search_many_fn=self._search_many,
         )
-        return TraceableField(name=name, value=selected.value, provenance=provenance)
 
+    def _search_many(self, configs: list[SearchConfig]) -> list[list[SECExtractResult]]:
+        if not self._catalog_searched:
+            self._catalog_searched = True
+            self._search_uncached(
+                [
+                    config
+                    for catalog_configs in self._field_configs.values()
+                    for config in catalog_configs
+                ]
+            )
+        self._search_uncached(configs)
+        return [self._results[search_config_key(config)] for config in configs]
+
+    def _search_uncached(self, configs: list[SearchConfig]) -> None:
+        pending: dict[tuple[object, ...], SearchConfig] = {}
+        for config in configs:
+            key = search_config_key(config)
+            if key not in self._results:
+                pending.setdefault(key, config)
+        if not pending:
+            return
+        results = self._extractor.search_many(list(pending.values()))
+        self._results.update(zip(pending.keys(), results, strict=True))
+
+
+def _build_hit_field(
+    *,
+    name: str,
+    stage_name: str,
+    selected: ParsedCandidate[T],
+    logger_: logging.Logger,
+) -> TraceableField[T]:
+    selected_result = selected.ranked.result
+    log_event(
+        logger_,
+        event="fundamental_xbrl_field_hit",
+        message="xbrl field hit",
+        fields={
+            "field_name": name,
+            "concept": selected_result.concept,
+            "period_key": selected_result.period_key,
+            "value_preview": preview_value(selected_result.value),
+            "selected_config_index": selected.config_index,
+            "selected_result_index": selected.ranked.result_index,
+            "resolution_stage": stage_name,
+            "resolution_confidence": round(selected.ranked.overall_confidence, 4),
+            "concept_match_score": round(selected.ranked.concept_match_score, 4),
+            "presentation_proximity_score": round(
+                selected.ranked.presentation_proximity_score, 4
+            ),
+            "calculation_consistency_score": round(
+                selected.ranked.calculation_consistency_score, 4
+            ),
+            "label_similarity_score": round(selected.ranked.label_similarity_score, 4),
+            "anchor_confidence_score": round(
+                selected.ranked.anchor_confidence_score, 4
+            ),
+        },
+    )
+
+    provenance = XBRLProvenance(
+        concept=selected_result.concept,
+        period=selected_result.period_key,
+        resolution_stage=stage_name,
+        confidence=round(selected.ranked.overall_confidence, 4),
+    )
+    return TraceableField(name=name, value=selected.value, provenance=provenance)
+
+
+def _build_missing_field(
+    *,
+    name: str,
+    configs: list[SearchConfig],
+    stages: list[tuple[str, list[SearchConfig]]],
+) -> TraceableField[T]:
     tags_searched = [c.concept_regex for c in configs]
     stages_searched = [stage_name for stage_name, _stage in stages]
     return TraceableField(
@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import importlib.metadata
+import json
 import logging
 import os
+from collections.abc import Sequence
+from dataclasses import asdict
+from typing import cast
 
+import numpy as np
 import pandas as pd
 from edgar import Company
 from tabulate import tabulate
 
 from src.shared.kernel.tools.logger import get_logger, log_event
+from src.shared.kernel.types import JSONObject
 
+from ..cache.filing_fact_store_service import (
+    FilingFactStore,
+    build_default_filing_fact_store,
+)
+from ..fetch.extractor_search_index_service import FactSearchIndex
 from ..fetch.extractor_search_processing_service import (
-    apply_search_type_mask,
-    build_base_mask,
-    filter_and_format_results,
+    format_prepared_rows,
     identify_dimension_columns,
     period_sort_key,
 )
@@ -42,6 +52,17 @@ _XBRL_DIAGNOSTICS_ENABLED = os.getenv("FUNDAMENTAL_XBRL_DIAG", "0").strip().lowe
     "yes",
 }
 _REQUIRED_XBRL_COLUMNS = ("concept", "value", "period_key")
+# Bump when the facts frame built by the parsers changes columns or dtypes, so
+# fact store entries written by the previous layout are no longer read.
+_FACT_STORE_FRAME_VERSION = 3
+_PARSE_RUN_METADATA_KEYS = frozenset(
+    {
+        "arelle_parse_latency_ms",
+        "arelle_facts_build_ms",
+        "arelle_facts_rss_delta_kib",
+    }
+)
+_filing_fact_store = build_default_filing_fact_store()
 _XBRL_INSTANCE_DESCRIPTIONS = {
     "XBRL INSTANCE DOCUMENT",
     "XBRL INSTANCE FILE",
@@ -65,6 +86,7 @@ class SECReportExtractor:
         self.actual_date: str | None = None
         self.real_dim_cols: list[str] = []
         self.selected_filing_metadata: dict[str, object] | None = None
+        self._search_index: FactSearchIndex | None = None
         self._load_report_data()
 
     def _load_report_data(self) -> None:
@@ -116,20 +138,46 @@ class SECReportExtractor:
             },
         )
 
-        xb = call_with_sec_retry(
-            operation=f"filing_xbrl_{self.fiscal_year or 'latest'}",
-            ticker=self.ticker,
-            execute=target_filing.xbrl,
-        )
-        if not xb:
-            raise ValueError(f"No XBRL data found for {self.ticker}")
-
-        self.df, parse_metadata = _resolve_xbrl_facts_dataframe(
-            primary_df=xb.facts.to_dataframe(),
-            filing=target_filing,
-            ticker=self.ticker,
-            fiscal_year=self.fiscal_year,
+        fact_store_key = _resolve_fact_store_key(target_filing)
+        stored_facts = (
+            _filing_fact_store.load(fact_store_key)
+            if fact_store_key is not None
+            else None
         )
+        if stored_facts is not None:
+            self.df = stored_facts.dataframe
+            parse_metadata = (
+                dict(stored_facts.metadata)
+                if stored_facts.metadata is not None
+                else None
+            )
+            log_event(
+                logger,
+                event="fundamental_xbrl_fact_store_hit",
+                message="xbrl facts loaded from fact store; filing parse skipped",
+                fields={
+                    "ticker": self.ticker,
+                    "fiscal_year": self.fiscal_year,
+                    "fact_store_key": fact_store_key,
+                    "row_count": len(self.df),
+                    "load_ms": round(stored_facts.load_ms, 3),
+                },
+            )
+        else:
+            xb = call_with_sec_retry(
+                operation=f"filing_xbrl_{self.fiscal_year or 'latest'}",
+                ticker=self.ticker,
+                execute=target_filing.xbrl,
+            )
+            if not xb:
+                raise ValueError(f"No XBRL data found for {self.ticker}")
+
+            self.df, parse_metadata = _resolve_xbrl_facts_dataframe(
+                primary_df=xb.facts.to_dataframe(),
+                filing=target_filing,
+                ticker=self.ticker,
+                fiscal_year=self.fiscal_year,
+            )
         if isinstance(parse_metadata, dict) and isinstance(
             self.selected_filing_metadata, dict
         ):
@@ -139,12 +187,31 @@ class SECReportExtractor:
             ticker=self.ticker,
             fiscal_year=self.fiscal_year,
         )
+        if stored_facts is not None:
+            fact_store_status = "hit"
+        elif fact_store_key is None:
+            fact_store_status = "disabled"
+        elif _filing_fact_store.store(
+            fact_store_key,
+            self.df,
+            metadata=_as_fact_store_metadata(parse_metadata),
+        ):
+            fact_store_status = "stored"
+        else:
+            fact_store_status = "miss"
+        if isinstance(self.selected_filing_metadata, dict):
+            self.selected_filing_metadata["fact_store_status"] = fact_store_status
+            if stored_facts is not None:
+                self.selected_filing_metadata["fact_store_load_ms"] = round(
+                    stored_facts.load_ms, 3
+                )
 
-        dei_mask = self.df["concept"].str.contains(
-            "DocumentPeriodEndDate", case=False, na=False
+        self.real_dim_cols = identify_dimension_columns(list(self.df.columns))
+        dei_positions = self._resolve_search_index().search_concepts(
+            "DocumentPeriodEndDate"
         )
-        if dei_mask.any():
-            self.actual_date = str(self.df[dei_mask].iloc[0]["value"])[:10]
+        if dei_positions.size:
+            self.actual_date = str(self.df.iloc[dei_positions[0]]["value"])[:10]
             log_event(
                 logger,
                 event="fundamental_xbrl_report_anchor_date_locked",
@@ -152,27 +219,47 @@ class SECReportExtractor:
                 fields={"ticker": self.ticker, "actual_date": self.actual_date},
             )
 
-        self.real_dim_cols = identify_dimension_columns(list(self.df.columns))
-
     def get_selected_filing_metadata(self) -> dict[str, object] | None:
         if not isinstance(self.selected_filing_metadata, dict):
             return None
         return dict(self.selected_filing_metadata)
 
     def search(self, config: SearchConfig) -> list[SECExtractResult]:
+        return self.search_many([config])[0]
+
+    def search_many(
+        self, configs: Sequence[SearchConfig]
+    ) -> list[list[SECExtractResult]]:
+        """
+        Run several searches with one grouped pass over the facts: matching
+        rows for every config are located through the search index, the
+        union of those rows is prepared once, and each config then filters
+        the shared rows. Results and rejection stats match ``search`` called
+        per config.
+        """
         if self.df is None:
-            return []
+            return [[] for _ in configs]
 
-        mask = build_base_mask(df=self.df, actual_date=self.actual_date, config=config)
-        mask = apply_search_type_mask(
-            df=self.df,
-            real_dim_cols=self.real_dim_cols,
-            base_mask=mask,
-            config=config,
-        )
+        index = self._resolve_search_index()
+        positions_by_config = [
+            index.search(config=config, actual_date=self.actual_date)
+            for config in configs
+        ]
+        if positions_by_config:
+            index.prepare_rows(np.unique(np.concatenate(positions_by_config)))
+        return [
+            self._format_search_matches(index=index, config=config, positions=positions)
+            for config, positions in zip(configs, positions_by_config, strict=True)
+        ]
 
-        matches = self.df[mask].copy()
-        if matches.empty:
+    def _format_search_matches(
+        self,
+        *,
+        index: FactSearchIndex,
+        config: SearchConfig,
+        positions: np.ndarray,
+    ) -> list[SECExtractResult]:
+        if positions.size == 0:
             log_event(
                 logger,
                 event="fundamental_xbrl_search_no_matches",
@@ -187,16 +274,28 @@ class SECReportExtractor:
             return []
 
         stats = SearchStats()
-        final_rows = filter_and_format_results(
-            matches=matches,
+        final_rows = format_prepared_rows(
+            rows=index.prepared_rows(positions),
             config=config,
-            real_dim_cols=self.real_dim_cols,
+            has_statement_type=index.has_statement_type,
+            has_unit_columns=index.has_unit_columns,
             stats=stats,
         )
         stats.log(logger)
         final_rows.sort(key=lambda row: period_sort_key(row.period_key), reverse=True)
         return final_rows
 
+    def _resolve_search_index(self) -> FactSearchIndex:
+        # Built at load time; rebuilt if the frame or dimension columns were
+        # swapped afterwards (tests assign ``df`` directly).
+        index = getattr(self, "_search_index", None)
+        if index is None or not index.is_built_for(
+            self.df, real_dim_cols=self.real_dim_cols
+        ):
+            index = FactSearchIndex(self.df, real_dim_cols=self.real_dim_cols)
+            self._search_index = index
+        return index
+
     def sic_code(self) -> int | None:
         return self.standard_industrial_classification_code
 
@@ -252,6 +351,73 @@ class SECReportExtractor:
         )
 
 
+def set_filing_fact_store_for_tests(fact_store: FilingFactStore) -> None:
+    global _filing_fact_store
+    _filing_fact_store = fact_store
+
+
+def reset_filing_fact_store_for_tests() -> None:
+    global _filing_fact_store
+    _filing_fact_store = build_default_filing_fact_store()
+
+
+def _resolve_fact_store_key(filing: object) -> str | None:
+    if not _filing_fact_store.enabled:
+        return None
+    accession = _normalize_text(getattr(filing, "accession_number", None))
+    if accession is None:
+        return None
+    return _filing_fact_store.build_key(
+        accession=accession,
+        parser_fingerprint=_fact_store_parser_fingerprint(),
+    )
+
+
+def _fact_store_parser_fingerprint() -> str:
+    """
+    Everything besides the filing itself that decides the facts frame: the
+    frame layout, both parser versions and the Arelle validation profile.
+    """
+    validation_profile = ArelleXbrlEngine().validation_profile
+    return json.dumps(
+        {
+            "frame_version": _FACT_STORE_FRAME_VERSION,
+            "edgartools": _distribution_version("edgartools"),
+            "arelle": _distribution_version("arelle-release"),
+            "validation_profile": asdict(validation_profile),
+        },
+        sort_keys=True,
+    )
+
+
+def _distribution_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _as_fact_store_metadata(
+    parse_metadata: dict[str, object] | None,
+) -> JSONObject | None:
+    """
+    Parse metadata worth keeping with the stored facts. Timings and worker
+    details describe the parse that produced the entry, not the later loads,
+    so they are dropped.
+    """
+    if parse_metadata is None:
+        return None
+    return cast(
+        JSONObject,
+        {
+            key: value
+            for key, value in parse_metadata.items()
+            if key not in _PARSE_RUN_METADATA_KEYS
+            and not key.startswith("arelle_runtime_")
+        },
+    )
+
+
 def _validate_xbrl_dataframe_schema(
     *,
     df: pd.DataFrame,
@@ -477,6 +643,12 @@ def _build_dataframe_from_filing_attachments(
                         if isinstance(arelle_result.parse_latency_ms, float)
                         else None
                     ),
+                    "facts_build_ms": (
+                        round(arelle_result.facts_build_ms, 3)
+                        if isinstance(arelle_result.facts_build_ms, float)
+                        else None
+                    ),
+                    "facts_rss_delta_kib": arelle_result.facts_rss_delta_kib,
                     "validation_enabled": (
                         arelle_result.runtime_metadata.validation_enabled
                         if arelle_result.runtime_metadata is not None
@@ -528,6 +700,10 @@ def _build_arelle_filing_metadata(
     }
     if isinstance(arelle_result.parse_latency_ms, float):
         metadata["arelle_parse_latency_ms"] = round(arelle_result.parse_latency_ms, 3)
+    if isinstance(arelle_result.facts_build_ms, float):
+        metadata["arelle_facts_build_ms"] = round(arelle_result.facts_build_ms, 3)
+    if isinstance(arelle_result.facts_rss_delta_kib, int):
+        metadata["arelle_facts_rss_delta_kib"] = arelle_result.facts_rss_delta_kib
     runtime_metadata = arelle_result.runtime_metadata
     if runtime_metadata is None:
         return metadata
@@ -542,6 +718,16 @@ def _build_arelle_filing_metadata(
         metadata["arelle_runtime_lock_wait_ms"] = round(
             runtime_metadata.runtime_lock_wait_ms, 3
         )
+    if isinstance(runtime_metadata.runtime_worker_pid, int):
+        metadata["arelle_runtime_worker_pid"] = runtime_metadata.runtime_worker_pid
+    if isinstance(runtime_metadata.runtime_worker_parse_ms, float):
+        metadata["arelle_runtime_worker_parse_ms"] = round(
+            runtime_metadata.runtime_worker_parse_ms, 3
+        )
+    if isinstance(runtime_metadata.runtime_worker_parse_count, int):
+        metadata["arelle_runtime_worker_parse_count"] = (
+            runtime_metadata.runtime_worker_parse_count
+        )
     return metadata
 
 
@@ -1,5 +1,6 @@
+from collections.abc import Callable
 from functools import partial
-from typing import Literal, TypeVar
+from typing import Any, Literal, TypeVar
 
 from src.agents.fundamental.domain.shared.contracts.traceable import (
     ComputedProvenance,
@@ -12,6 +13,9 @@ from ..fetch.resolver import ParsedCandidate
 from ..map.base_model_mapping_resolver_service import (
     resolve_configs as resolve_configs_util,
 )
+from ..map.base_model_mapping_resolver_service import (
+    resolve_field_catalog as resolve_field_catalog_util,
+)
 from ..map.extension_token_normalizer import normalize_extension_type_token
 from ..map.mapping import get_mapping_registry
 from .base_model_assembler import assemble_base_financial_model
@@ -23,6 +27,7 @@ from .base_model_debt_policy_service import (
     resolve_total_debt_policy as resolve_total_debt_policy_util,
 )
 from .base_model_extraction_context import BaseModelExtractionContext
+from .base_model_field_extraction_service import PrefetchedFieldExtractor
 from .base_model_field_extraction_service import (
     build_resolution_stages as build_resolution_stages_util,
 )
@@ -150,6 +155,27 @@ class BaseFinancialModelFactory:
     ) -> list[tuple[str, list[SearchConfig]]]:
         return build_resolution_stages_util(configs)
 
+    @staticmethod
+    def _build_extract_field_fn(
+        extractor: SECReportExtractor,
+        extraction_context: BaseModelExtractionContext,
+    ) -> Callable[..., TraceableField[Any]]:
+        # Search the first stage of the whole mapping catalog in one grouped
+        # pass; the pipelines' field calls then reuse those search results
+        # instead of searching the facts once per field.
+        if not isinstance(extractor, SECReportExtractor):
+            return BaseFinancialModelFactory._extract_field
+        return PrefetchedFieldExtractor(
+            extractor=extractor,
+            field_configs=resolve_field_catalog_util(
+                industry=extraction_context.industry,
+                issuer=extraction_context.issuer_ticker,
+                registry=get_mapping_registry(),
+            ),
+            fallback_fn=BaseFinancialModelFactory._extract_field,
+            logger_=logger,
+        )
+
     @staticmethod
     def create(
         extractor: SECReportExtractor, industry_type: str | None = None
@@ -159,12 +185,15 @@ class BaseFinancialModelFactory:
             issuer_ticker=extractor.ticker,
             resolve_configs_fn=BaseFinancialModelFactory._resolve_configs,
         )
+        extract_field_fn = BaseFinancialModelFactory._build_extract_field_fn(
+            extractor, extraction_context
+        )
 
         context_balance_fields = build_context_balance_fields(
             extractor=extractor,
             resolve_configs=extraction_context.resolve_configs,
             build_config=extraction_context.build_config,
-            extract_field_fn=BaseFinancialModelFactory._extract_field,
+            extract_field_fn=extract_field_fn,
             bs_statement_tokens=BS_STATEMENT_TOKENS,
             is_statement_tokens=IS_STATEMENT_TOKENS,
             usd_units=USD_UNITS,
@@ -172,7 +201,7 @@ class BaseFinancialModelFactory:
         )
 
         debt_ops = DebtBuilderOps(
-            extract_field_fn=BaseFinancialModelFactory._extract_field,
+            extract_field_fn=extract_field_fn,
             resolve_total_debt_policy_fn=partial(
                 resolve_total_debt_policy_util,
                 env_var=TOTAL_DEBT_POLICY_ENV,
@@ -209,7 +238,7 @@ class BaseFinancialModelFactory:
         )
 
         income_cashflow_ops = IncomeCashflowOps(
-            extract_field_fn=BaseFinancialModelFactory._extract_field,
+            extract_field_fn=extract_field_fn,
             calc_subtract_fn=calc_subtract_util,
             calc_ratio_fn=calc_ratio_util,
             calc_invested_capital_fn=calc_invested_capital_util,
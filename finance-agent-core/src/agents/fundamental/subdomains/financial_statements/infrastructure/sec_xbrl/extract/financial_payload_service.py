@@ -496,6 +496,32 @@ def _merge_arelle_runtime_diagnostics(
         for value in (_as_float(entry.get("lock_wait_ms")) for entry in runtime_entries)
         if value is not None
     ]
+    worker_parse_latencies = [
+        value
+        for value in (
+            _as_float(entry.get("worker_parse_ms")) for entry in runtime_entries
+        )
+        if value is not None
+    ]
+    facts_build_latencies = [
+        value
+        for value in (
+            _as_float(entry.get("facts_build_ms")) for entry in runtime_entries
+        )
+        if value is not None
+    ]
+    rss_delta_values = [
+        value
+        for value in (
+            _as_float(entry.get("facts_rss_delta_kib")) for entry in runtime_entries
+        )
+        if value is not None
+    ]
+    worker_pids = {
+        pid
+        for pid in (entry.get("worker_pid") for entry in runtime_entries)
+        if isinstance(pid, int) and not isinstance(pid, bool)
+    }
     isolation_modes = sorted(
         {
             mode
@@ -523,6 +549,14 @@ def _merge_arelle_runtime_diagnostics(
         "parse_latency_ms_max": _round_or_none(max(parse_latencies, default=None)),
         "runtime_lock_wait_ms_avg": _round_or_none(_average(lock_waits)),
         "runtime_lock_wait_ms_max": _round_or_none(max(lock_waits, default=None)),
+        "worker_parse_ms_avg": _round_or_none(_average(worker_parse_latencies)),
+        "worker_parse_ms_max": _round_or_none(
+            max(worker_parse_latencies, default=None)
+        ),
+        "facts_build_ms_avg": _round_or_none(_average(facts_build_latencies)),
+        "facts_build_ms_max": _round_or_none(max(facts_build_latencies, default=None)),
+        "facts_rss_delta_kib_max": _round_or_none(max(rss_delta_values, default=None)),
+        "worker_count": len(worker_pids),
         "isolation_modes": isolation_modes,
         "validation_modes": validation_modes,
     }
@@ -540,6 +574,9 @@ def _extract_arelle_runtime_entries_from_reports(
         filing_metadata = _extract_filing_metadata(report)
         if not isinstance(filing_metadata, Mapping):
             continue
+        # Facts loaded from the fact store were not parsed in this run.
+        if filing_metadata.get("fact_store_status") == "hit":
+            continue
         parse_latency = _as_float(filing_metadata.get("arelle_parse_latency_ms"))
         lock_wait = _as_float(filing_metadata.get("arelle_runtime_lock_wait_ms"))
         isolation_mode = _normalize_string(
@@ -548,6 +585,14 @@ def _extract_arelle_runtime_entries_from_reports(
         validation_mode = _normalize_string(
             filing_metadata.get("arelle_validation_mode")
         )
+        worker_parse_ms = _as_float(
+            filing_metadata.get("arelle_runtime_worker_parse_ms")
+        )
+        worker_pid = filing_metadata.get("arelle_runtime_worker_pid")
+        facts_build_ms = _as_float(filing_metadata.get("arelle_facts_build_ms"))
+        facts_rss_delta_kib = _as_float(
+            filing_metadata.get("arelle_facts_rss_delta_kib")
+        )
         if (
             parse_latency is None
             and lock_wait is None
@@ -561,6 +606,10 @@ def _extract_arelle_runtime_entries_from_reports(
                 "lock_wait_ms": lock_wait,
                 "isolation_mode": isolation_mode,
                 "validation_mode": validation_mode,
+                "worker_parse_ms": worker_parse_ms,
+                "worker_pid": worker_pid,
+                "facts_build_ms": facts_build_ms,
+                "facts_rss_delta_kib": facts_rss_delta_kib,
             }
         )
     return entries
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import re
+from typing import cast
+
+import numpy as np
+import pandas as pd
+
+from ..extract.extractor_models import SearchConfig
+from .extractor_search_processing_service import (
+    PreparedFactRow,
+    build_anchor_date_mask,
+    build_consolidated_mask,
+    is_plain_tag,
+    prepare_fact_rows,
+    unit_columns_present,
+)
+
+_EMPTY_POSITIONS = np.empty(0, dtype=np.intp)
+
+
+class FactSearchIndex:
+    """
+    Search index over one facts frame, built once per loaded filing.
+    Rows are grouped by concept: plain tags resolve through a dict keyed by
+    the lower-cased concept, and regex searches run over the unique concepts
+    (a few thousand) instead of every fact row. The consolidated mask is
+    computed up front, and anchor date and dimension regex masks once per
+    value. Matched rows are turned into ``PreparedFactRow`` records once and
+    shared by every later search that hits them.
+    Positions are row positions (``iloc``) in ascending row order, so results
+    come back in the same order as a boolean mask over the whole frame.
+    """
+
+    def __init__(self, df: pd.DataFrame, *, real_dim_cols: list[str]) -> None:
+        self._df = df
+        self._real_dim_cols = list(real_dim_cols)
+        codes, uniques = pd.factorize(df["concept"], use_na_sentinel=True)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        # (concept, row positions) for every string concept in the frame.
+        self._concept_rows: list[tuple[str, np.ndarray]] = []
+        positions_by_tag: dict[str, list[np.ndarray]] = {}
+        for code, concept in enumerate(uniques):
+            if not isinstance(concept, str):
+                continue
+            positions = order[bounds[code] : bounds[code + 1]]
+            self._concept_rows.append((concept, positions))
+            positions_by_tag.setdefault(concept.lower(), []).append(positions)
+        self._positions_by_tag = {
+            tag: _merge_positions(parts) for tag, parts in positions_by_tag.items()
+        }
+        self._regex_positions: dict[str, np.ndarray] = {}
+        self._consolidated = build_consolidated_mask(
+            df=df, real_dim_cols=self._real_dim_cols
+        ).to_numpy(dtype=bool)
+        self._date_masks: dict[str, np.ndarray] = {}
+        self._dimension_codes: list[tuple[np.ndarray, pd.Index]] | None = None
+        self._dimension_masks: dict[str, np.ndarray] = {}
+        self._prepared: list[PreparedFactRow | None] = [None] * len(df)
+        columns = list(df.columns)
+        self.has_statement_type = "statement_type" in columns
+        self.has_unit_columns = unit_columns_present(columns)
+
+    def is_built_for(self, df: pd.DataFrame, *, real_dim_cols: list[str]) -> bool:
+        return df is self._df and real_dim_cols == self._real_dim_cols
+
+    def concept_positions(self, concept_regex: str) -> np.ndarray:
+        """
+        Row positions whose concept matches ``concept_regex`` under the
+        extractor's rules: plain ``prefix:Name`` tags match the whole concept,
+        anything else is a case-insensitive search, anchored to the local
+        name when the pattern carries no prefix.
+        """
+        if is_plain_tag(concept_regex):
+            return self._positions_by_tag.get(concept_regex.lower(), _EMPTY_POSITIONS)
+        processed_regex = (
+            concept_regex if ":" in concept_regex else f".*:{concept_regex}$"
+        )
+        return self.search_concepts(processed_regex)
+
+    def search_concepts(self, pattern: str) -> np.ndarray:
+        cached = self._regex_positions.get(pattern)
+        if cached is not None:
+            return cached
+        compiled = re.compile(pattern, flags=re.IGNORECASE)
+        positions = _merge_positions(
+            [rows for concept, rows in self._concept_rows if compiled.search(concept)]
+        )
+        self._regex_positions[pattern] = positions
+        return positions
+
+    def search(self, *, config: SearchConfig, actual_date: str | None) -> np.ndarray:
+        positions = self.concept_positions(config.concept_regex)
+        if positions.size == 0:
+            return positions
+        if actual_date and config.respect_anchor_date:
+            positions = positions[self._date_mask(actual_date)[positions]]
+
+        # Statement/period/unit filters are applied later to capture rejection reasons.
+        consolidated = self._consolidated[positions]
+        if config.type_name == "CONSOLIDATED":
+            return positions[consolidated]
+        positions = positions[~consolidated]
+        if config.dimension_regex and self._real_dim_cols and positions.size:
+            positions = positions[
+                self._dimension_mask(config.dimension_regex)[positions]
+            ]
+        return positions
+
+    def prepare_rows(self, positions: np.ndarray) -> None:
+        """Prepare every not-yet-prepared row in ``positions`` in one pass."""
+        prepared = self._prepared
+        missing = [
+            int(position) for position in positions if prepared[position] is None
+        ]
+        if not missing:
+            return
+        rows = prepare_fact_rows(
+            matches=self._df.iloc[missing], real_dim_cols=self._real_dim_cols
+        )
+        for position, row in zip(missing, rows, strict=True):
+            prepared[position] = row
+
+    def prepared_rows(self, positions: np.ndarray) -> list[PreparedFactRow]:
+        self.prepare_rows(positions)
+        return [
+            cast(PreparedFactRow, self._prepared[position]) for position in positions
+        ]
+
+    def _dimension_mask(self, dimension_regex: str) -> np.ndarray:
+        """
+        Rows where any dimension column, as text, matches ``dimension_regex``.
+        The regex runs over each column's distinct values, not every row.
+        """
+        mask = self._dimension_masks.get(dimension_regex)
+        if mask is not None:
+            return mask
+        if self._dimension_codes is None:
+            self._dimension_codes = [
+                pd.factorize(self._df[column].astype(str))
+                for column in self._real_dim_cols
+            ]
+        compiled = re.compile(dimension_regex, flags=re.IGNORECASE)
+        mask = np.zeros(len(self._df), dtype=bool)
+        for codes, uniques in self._dimension_codes:
+            matched = np.fromiter(
+                (compiled.search(value) is not None for value in uniques),
+                dtype=bool,
+                count=len(uniques),
+            )
+            mask |= matched[codes]
+        self._dimension_masks[dimension_regex] = mask
+        return mask
+
+    def _date_mask(self, actual_date: str) -> np.ndarray:
+        mask = self._date_masks.get(actual_date)
+        if mask is None:
+            mask = build_anchor_date_mask(
+                df=self._df, actual_date=actual_date
+            ).to_numpy(dtype=bool)
+            self._date_masks[actual_date] = mask
+        return mask
+
+
+def _merge_positions(parts: list[np.ndarray]) -> np.ndarray:
+    if not parts:
+        return _EMPTY_POSITIONS
+    if len(parts) == 1:
+        return parts[0]
+    return np.sort(np.concatenate(parts))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from datetime import date
 
 import pandas as pd
@@ -13,66 +14,96 @@ from ..extract.extractor_models import (
 )
 
 
-def build_base_mask(
-    *,
-    df: pd.DataFrame,
-    actual_date: str | None,
-    config: SearchConfig,
-) -> pd.Series:
-    if is_plain_tag(config.concept_regex):
-        pattern = re.escape(config.concept_regex) + r"$"
-        mask = df["concept"].str.match(pattern, flags=re.IGNORECASE, na=False)
-    else:
-        processed_regex = (
-            config.concept_regex
-            if ":" in config.concept_regex
-            else f".*:{config.concept_regex}$"
-        )
-        mask = df["concept"].str.contains(
-            processed_regex, flags=re.IGNORECASE, na=False
-        )
-
-    if actual_date and config.respect_anchor_date:
-        date_mask = (df["period_end"] == actual_date) | (
-            df["period_key"].str.contains(actual_date, na=False)
-        )
-        return mask & date_mask
-    return mask
+def build_anchor_date_mask(*, df: pd.DataFrame, actual_date: str) -> pd.Series:
+    return (df["period_end"] == actual_date) | (
+        df["period_key"].str.contains(actual_date, na=False)
+    )
 
 
-def apply_search_type_mask(
+def build_consolidated_mask(
     *,
     df: pd.DataFrame,
     real_dim_cols: list[str],
-    base_mask: pd.Series,
-    config: SearchConfig,
 ) -> pd.Series:
-    # Statement/period/unit filters are applied later to capture rejection reasons.
-    if real_dim_cols:
-        dim_df = df[real_dim_cols]
-        dim_str = dim_df.astype(str).apply(lambda s: s.str.strip().str.lower())
-        empty_tokens = {"", "none", "none (total)", "total"}
-        empty_mask = dim_df.isna() | dim_str.isin(empty_tokens)
-        is_consolidated_series = empty_mask.all(axis=1)
-    else:
-        is_consolidated_series = pd.Series(True, index=df.index)
-
-    if config.type_name == "CONSOLIDATED":
-        return base_mask & is_consolidated_series
-
-    mask = base_mask & (~is_consolidated_series)
-    if config.dimension_regex and real_dim_cols:
-        dim_mask = (
-            df[real_dim_cols]
-            .apply(
-                lambda x: x.astype(str).str.contains(
-                    config.dimension_regex, flags=re.IGNORECASE, na=False
-                )
+    if not real_dim_cols:
+        return pd.Series(True, index=df.index)
+    dim_df = df[real_dim_cols]
+    dim_str = dim_df.astype(str).apply(lambda s: s.str.strip().str.lower())
+    empty_tokens = {"", "none", "none (total)", "total"}
+    empty_mask = dim_df.isna() | dim_str.isin(empty_tokens)
+    return empty_mask.all(axis=1)
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedFactRow:
+    """
+    One fact row with everything the search filters and result formatting
+    read, derived once so many searches can share it.
+    """
+
+    concept: str
+    period_key: str
+    statement_value: object
+    raw_value: object
+    unit: str | None
+    normalized_unit: str | None
+    row_period_type: object
+    dimension_detail: dict[str, object]
+    dedup_key: tuple[str, str, str | None, tuple[tuple[str, str], ...], str]
+    label: object
+    decimals: object
+    scale: object
+    presentation_score: float | None
+    calculation_score: float | None
+
+
+def prepare_fact_rows(
+    *,
+    matches: pd.DataFrame,
+    real_dim_cols: list[str],
+) -> list[PreparedFactRow]:
+    columns = list(matches.columns)
+    column_index = {column: index for index, column in enumerate(columns)}
+    prepared: list[PreparedFactRow] = []
+    for row in matches.itertuples(index=False, name=None):
+        concept = str(tuple_get(row, column_index, "concept") or "")
+        period_key = str(tuple_get(row, column_index, "period_key") or "")
+        raw_value = tuple_get(row, column_index, "value")
+        unit = extract_unit_from_tuple(row, column_index)
+        normalized_unit = normalize_unit(unit) if unit else None
+        dim_detail = extract_dimension_detail_from_tuple(
+            row, column_index, real_dim_cols
+        )
+        dim_key = tuple(sorted((str(k), str(v)) for k, v in dim_detail.items()))
+        prepared.append(
+            PreparedFactRow(
+                concept=concept,
+                period_key=period_key,
+                statement_value=tuple_get(row, column_index, "statement_type"),
+                raw_value=raw_value,
+                unit=unit,
+                normalized_unit=normalized_unit,
+                row_period_type=tuple_get(row, column_index, "period_type"),
+                dimension_detail=dim_detail,
+                dedup_key=(
+                    concept,
+                    period_key,
+                    normalized_unit,
+                    dim_key,
+                    str(raw_value),
+                ),
+                label=tuple_get(row, column_index, "label"),
+                decimals=tuple_get(row, column_index, "decimals"),
+                scale=tuple_get(row, column_index, "scale"),
+                presentation_score=_to_optional_float(
+                    tuple_get(row, column_index, "presentation_score")
+                ),
+                calculation_score=_to_optional_float(
+                    tuple_get(row, column_index, "calculation_score")
+                ),
             )
-            .any(axis=1)
         )
-        mask = mask & dim_mask
-    return mask
+    return prepared
 
 
 def filter_and_format_results(
@@ -81,6 +112,24 @@ def filter_and_format_results(
     config: SearchConfig,
     real_dim_cols: list[str],
     stats: SearchStats,
+) -> list[SECExtractResult]:
+    columns = list(matches.columns)
+    return format_prepared_rows(
+        rows=prepare_fact_rows(matches=matches, real_dim_cols=real_dim_cols),
+        config=config,
+        has_statement_type="statement_type" in columns,
+        has_unit_columns=unit_columns_present(columns),
+        stats=stats,
+    )
+
+
+def format_prepared_rows(
+    *,
+    rows: list[PreparedFactRow],
+    config: SearchConfig,
+    has_statement_type: bool,
+    has_unit_columns: bool,
+    stats: SearchStats,
 ) -> list[SECExtractResult]:
     final_rows: list[SECExtractResult] = []
     seen: set[tuple[str, str, str | None, tuple[tuple[str, str], ...], str]] = set()
@@ -90,127 +139,82 @@ def filter_and_format_results(
         if config.statement_types
         else []
     )
-    has_statement_type = "statement_type" in matches.columns
     has_unit_filter = bool(config.unit_whitelist or config.unit_blacklist)
-    columns = list(matches.columns)
-    column_index = {column: index for index, column in enumerate(columns)}
 
-    for row in matches.itertuples(index=False, name=None):
-        concept = str(tuple_get(row, column_index, "concept") or "")
-        period_key = str(tuple_get(row, column_index, "period_key") or "")
-        statement_value = tuple_get(row, column_index, "statement_type")
-        raw_value = tuple_get(row, column_index, "value")
-
-        unit = extract_unit_from_tuple(row, column_index)
-        normalized_unit = normalize_unit(unit) if unit else None
+    for row in rows:
+        statement_value = row.statement_value
+        unit = row.unit
 
         statement_ok = True
         if statement_tokens and has_statement_type:
             statement_ok = statement_matches(statement_value, statement_tokens)
 
-        row_period_type = tuple_get(row, column_index, "period_type")
         period_ok = True
         if config.period_type:
             period_ok = period_matches_values(
-                period_key=period_key,
-                row_period_type=row_period_type,
+                period_key=row.period_key,
+                row_period_type=row.row_period_type,
                 period_type=config.period_type,
             )
 
         unit_ok = True
-        if has_unit_filter and unit_columns_present(columns):
+        if has_unit_filter and has_unit_columns:
             unit_ok = unit_matches(
-                normalized_unit,
+                row.normalized_unit,
                 config.unit_whitelist,
                 config.unit_blacklist,
             )
 
-        if not statement_ok:
-            stats.add(
-                Rejection(
-                    reason="statement_mismatch",
-                    concept=concept,
-                    period_key=period_key,
-                    statement_type=(
-                        str(statement_value) if pd.notna(statement_value) else None
-                    ),
-                    unit=str(unit) if unit is not None else None,
-                    value_preview=value_preview(raw_value),
-                )
-            )
-        if not period_ok:
+        for reason, ok in (
+            ("statement_mismatch", statement_ok),
+            ("period_mismatch", period_ok),
+            ("unit_mismatch", unit_ok),
+        ):
+            if ok:
+                continue
             stats.add(
                 Rejection(
-                    reason="period_mismatch",
-                    concept=concept,
-                    period_key=period_key,
+                    reason=reason,
+                    concept=row.concept,
+                    period_key=row.period_key,
                     statement_type=(
                         str(statement_value) if pd.notna(statement_value) else None
                     ),
                     unit=str(unit) if unit is not None else None,
-                    value_preview=value_preview(raw_value),
-                )
-            )
-        if not unit_ok:
-            stats.add(
-                Rejection(
-                    reason="unit_mismatch",
-                    concept=concept,
-                    period_key=period_key,
-                    statement_type=(
-                        str(statement_value) if pd.notna(statement_value) else None
-                    ),
-                    unit=str(unit) if unit is not None else None,
-                    value_preview=value_preview(raw_value),
+                    value_preview=value_preview(row.raw_value),
                 )
             )
         if not (statement_ok and period_ok and unit_ok):
             continue
 
-        dim_detail = extract_dimension_detail_from_tuple(
-            row, column_index, real_dim_cols
-        )
-        dim_key = tuple(sorted((str(k), str(v)) for k, v in dim_detail.items()))
-        dedup_key = (
-            concept,
-            period_key,
-            normalized_unit,
-            dim_key,
-            str(raw_value),
-        )
-        if dedup_key in seen:
+        if row.dedup_key in seen:
             continue
-        seen.add(dedup_key)
+        seen.add(row.dedup_key)
 
+        dim_detail = row.dimension_detail
         dimensions = (
             "\n".join([f"{k}: {v}" for k, v in dim_detail.items()])
             if dim_detail
             else "None (Total)"
         )
-        label = tuple_get(row, column_index, "label")
-        decimals = tuple_get(row, column_index, "decimals")
-        scale = tuple_get(row, column_index, "scale")
-        presentation_score = _to_optional_float(
-            tuple_get(row, column_index, "presentation_score")
-        )
-        calculation_score = _to_optional_float(
-            tuple_get(row, column_index, "calculation_score")
-        )
+        label = row.label
+        decimals = row.decimals
+        scale = row.scale
 
         final_rows.append(
             SECExtractResult(
-                concept=concept,
-                value=str(raw_value),
+                concept=row.concept,
+                value=str(row.raw_value),
                 label=str(label) if pd.notna(label) else None,
                 statement=str(statement_value) if pd.notna(statement_value) else None,
-                period_key=period_key,
+                period_key=row.period_key,
                 dimensions=dimensions,
-                dimension_detail=dim_detail,
+                dimension_detail=dict(dim_detail),
                 unit=str(unit) if unit is not None else None,
                 decimals=str(decimals) if pd.notna(decimals) else None,
                 scale=str(scale) if pd.notna(scale) else None,
-                presentation_score=presentation_score,
-                calculation_score=calculation_score,
+                presentation_score=row.presentation_score,
+                calculation_score=row.calculation_score,
             )
         )
 
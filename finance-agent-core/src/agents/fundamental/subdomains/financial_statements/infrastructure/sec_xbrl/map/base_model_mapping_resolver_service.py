@@ -16,6 +16,8 @@ class MappingRegistryProtocol(Protocol):
         self, field_key: str, *, industry: str | None, issuer: str | None
     ): ...
 
+    def list_fields(self) -> list[str]: ...
+
 
 def resolve_configs(
     *,
@@ -76,3 +78,31 @@ def resolve_configs(
         anchor_source=resolved.anchor_source,
         anchor_rule_count=resolved.anchor_rule_count,
     )
+
+
+def resolve_field_catalog(
+    *,
+    industry: str | None,
+    issuer: str | None,
+    registry: MappingRegistryProtocol,
+) -> dict[str, list[SearchConfig]]:
+    """
+    Configs for every registered base field, keyed by the mapped field name
+    (the name the extraction pipelines rank candidates under). Fields without
+    a mapping for this industry/issuer are left out; the first field wins
+    when two share a name.
+    """
+    catalog: dict[str, list[SearchConfig]] = {}
+    for field_key in registry.list_fields():
+        resolved = registry.resolve(field_key, industry=industry, issuer=issuer)
+        if resolved is None or resolved.spec.name in catalog:
+            continue
+        configs = enrich_configs_with_resolution_metadata(
+            configs=resolved.spec.configs,
+            source=resolved.source,
+            anchor_source=resolved.anchor_source,
+            anchor_rule_count=resolved.anchor_rule_count,
+        )
+        if configs:
+            catalog[resolved.spec.name] = configs
+    return catalog
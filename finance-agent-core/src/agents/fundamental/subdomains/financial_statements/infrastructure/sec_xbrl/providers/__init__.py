@@ -2,7 +2,9 @@ from .arelle_engine import (
     ArelleEngineParseError,
     ArelleEngineUnavailableError,
     ArelleXbrlEngine,
+    warmup_arelle_worker_pool,
 )
+from .arelle_worker_pool import shutdown_arelle_worker_pools
 from .engine_contracts import (
     ArelleParseResult,
     ArelleRuntimeMetadata,
@@ -22,4 +24,6 @@ __all__ = [
     "ArelleXbrlEngine",
     "XbrlAttachment",
     "XbrlAttachmentBundle",
+    "shutdown_arelle_worker_pools",
+    "warmup_arelle_worker_pool",
 ]
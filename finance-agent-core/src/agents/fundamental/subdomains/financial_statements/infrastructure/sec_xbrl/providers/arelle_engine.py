@@ -9,10 +9,21 @@ import threading
 import time
 import zipfile
 from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
+from .arelle_worker_pool import (
+    discard_arelle_worker_pool,
+    get_arelle_worker_pool,
+    resolve_arelle_worker_timeout_seconds,
+    run_arelle_worker_task,
+)
 from .engine_contracts import (
     ArelleParseResult,
     ArelleRuntimeMetadata,
@@ -34,6 +45,8 @@ _BASE_FACT_COLUMNS = (
     "decimals",
     "scale",
 )
+# Low-cardinality columns stored as categoricals; dimension columns are too.
+_CATEGORICAL_FACT_COLUMNS = ("concept", "unit", "period_key")
 
 
 class ArelleEngineUnavailableError(RuntimeError):
@@ -63,9 +76,11 @@ _DEFAULT_PLUGINS_BY_MODE: dict[str, tuple[str, ...]] = {
     _VALIDATION_MODE_EFM_VALIDATE: ("validate/EFM",),
     _VALIDATION_MODE_EFM_DQC_VALIDATE: ("validate/EFM", "validate/DQC"),
 }
+_RUNTIME_ISOLATION_WORKER_POOL = "worker_pool"
 _RUNTIME_ISOLATION_SERIAL = "serial"
 _RUNTIME_ISOLATION_NONE = "none"
 _SUPPORTED_RUNTIME_ISOLATION_MODES = {
+    _RUNTIME_ISOLATION_WORKER_POOL,
     _RUNTIME_ISOLATION_SERIAL,
     _RUNTIME_ISOLATION_NONE,
 }
@@ -89,6 +104,10 @@ class ArelleXbrlEngine(IArelleXbrlEngine):
             )
         )
 
+    @property
+    def validation_profile(self) -> ArelleValidationProfile:
+        return self._validation_profile
+
     def parse_attachment_bundle(
         self,
         *,
@@ -109,36 +128,155 @@ def _parse_bundle_with_arelle_runtime(
             "Arelle runtime unavailable. Install arelle to enable Arelle-first XBRL parsing."
         )
 
+    if isolation_mode == _RUNTIME_ISOLATION_WORKER_POOL:
+        worker_output, pool_size = _parse_bundle_in_worker_pool(
+            bundle,
+            validation_profile=validation_profile,
+        )
+        dataframe = worker_output.facts_dataframe
+        validation_issues = worker_output.validation_issues
+        build_stats = worker_output.facts_build_stats
+        runtime_metadata = _build_runtime_metadata(
+            validation_profile=validation_profile,
+            isolation_mode=isolation_mode,
+            lock_wait_ms=worker_output.queue_wait_ms,
+            worker_pid=worker_output.worker_pid,
+            worker_parse_ms=round(worker_output.worker_parse_ms, 3),
+            worker_parse_count=worker_output.worker_parse_count,
+            worker_pool_size=pool_size,
+        )
+    else:
+        (
+            dataframe,
+            validation_issues,
+            build_stats,
+            lock_wait_ms,
+        ) = _parse_bundle_in_process(
+            bundle,
+            validation_profile=validation_profile,
+            isolation_mode=isolation_mode,
+        )
+        runtime_metadata = _build_runtime_metadata(
+            validation_profile=validation_profile,
+            isolation_mode=isolation_mode,
+            lock_wait_ms=lock_wait_ms,
+        )
+
+    doc_types = {attachment.document_type.upper() for attachment in bundle.attachments}
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    return ArelleParseResult(
+        facts_dataframe=dataframe,
+        instance_document=bundle.instance_document,
+        loaded_attachment_count=len(bundle.attachments),
+        schema_loaded="EX-101.SCH" in doc_types,
+        label_loaded="EX-101.LAB" in doc_types,
+        presentation_loaded="EX-101.PRE" in doc_types,
+        calculation_loaded="EX-101.CAL" in doc_types,
+        definition_loaded="EX-101.DEF" in doc_types,
+        validation_issues=validation_issues,
+        runtime_metadata=runtime_metadata,
+        parse_latency_ms=elapsed_ms,
+        facts_build_ms=build_stats.build_ms if build_stats is not None else None,
+        facts_rss_delta_kib=(
+            build_stats.rss_delta_kib if build_stats is not None else None
+        ),
+    )
+
+
+def _build_runtime_metadata(
+    *,
+    validation_profile: ArelleValidationProfile,
+    isolation_mode: str,
+    lock_wait_ms: float,
+    worker_pid: int | None = None,
+    worker_parse_ms: float | None = None,
+    worker_parse_count: int | None = None,
+    worker_pool_size: int | None = None,
+) -> ArelleRuntimeMetadata:
+    return ArelleRuntimeMetadata(
+        mode=validation_profile.mode,
+        disclosure_system=validation_profile.disclosure_system,
+        plugins=validation_profile.plugins,
+        packages=validation_profile.packages,
+        arelle_version=_resolve_arelle_version(),
+        validation_enabled=validation_profile.validation_enabled,
+        runtime_isolation_mode=isolation_mode,
+        runtime_lock_wait_ms=round(lock_wait_ms, 3),
+        runtime_worker_pid=worker_pid,
+        runtime_worker_parse_ms=worker_parse_ms,
+        runtime_worker_parse_count=worker_parse_count,
+        runtime_worker_pool_size=worker_pool_size,
+    )
+
+
+def _parse_bundle_in_process(
+    bundle: XbrlAttachmentBundle,
+    *,
+    validation_profile: ArelleValidationProfile,
+    isolation_mode: str,
+) -> tuple[pd.DataFrame, tuple[ArelleValidationIssue, ...], _FactsBuildStats, float]:
     try:
         from arelle import (  # type: ignore[import-not-found]
             Cntlr,
-            FileSource,
             ModelManager,
-            ModelXbrl,
-            Validate,
         )
     except Exception as exc:  # pragma: no cover - guarded by find_spec
         raise ArelleEngineUnavailableError(
             f"Arelle import failed: {type(exc).__name__}: {exc}"
         ) from exc
 
-    zip_stream = _build_zip_stream(bundle)
     controller = Cntlr.Cntlr(logFileName="structured-message")
     manager = ModelManager.initialize(controller)
-
-    model_xbrl = None
-    file_source = None
     lock_wait_ms = 0.0
-    dataframe = pd.DataFrame(columns=list(_BASE_FACT_COLUMNS))
-    validation_issues: tuple[ArelleValidationIssue, ...] = ()
 
-    def _parse_once() -> None:
-        nonlocal model_xbrl, file_source, validation_issues, dataframe
+    def _parse_once() -> tuple[
+        pd.DataFrame, tuple[ArelleValidationIssue, ...], _FactsBuildStats
+    ]:
         _configure_validation_runtime(
             controller=controller,
             manager=manager,
             validation_profile=validation_profile,
         )
+        return _load_bundle_facts(
+            manager=manager,
+            bundle=bundle,
+            validation_profile=validation_profile,
+        )
+
+    try:
+        if isolation_mode == _RUNTIME_ISOLATION_SERIAL:
+            lock_started = time.perf_counter()
+            with _ARELLE_RUNTIME_PARSE_LOCK:
+                lock_wait_ms = (time.perf_counter() - lock_started) * 1000.0
+                dataframe, validation_issues, build_stats = _parse_once()
+        else:
+            dataframe, validation_issues, build_stats = _parse_once()
+    except Exception as exc:
+        raise ArelleEngineParseError(
+            f"Arelle parse failed for {bundle.instance_document}: "
+            f"{type(exc).__name__}: {exc}"
+        ) from exc
+    finally:
+        _close_quietly(controller)
+    return dataframe, validation_issues, build_stats, lock_wait_ms
+
+
+def _load_bundle_facts(
+    *,
+    manager: object,
+    bundle: XbrlAttachmentBundle,
+    validation_profile: ArelleValidationProfile,
+) -> tuple[pd.DataFrame, tuple[ArelleValidationIssue, ...], _FactsBuildStats]:
+    from arelle import (  # type: ignore[import-not-found]
+        FileSource,
+        ModelXbrl,
+        Validate,
+    )
+
+    zip_stream = _build_zip_stream(bundle)
+    model_xbrl = None
+    file_source = None
+    try:
         file_source = FileSource.openFileSource(
             bundle.instance_document,
             sourceZipStream=zip_stream,
@@ -147,67 +285,207 @@ def _parse_bundle_with_arelle_runtime(
         if validation_profile.validation_enabled:
             Validate.validate(model_xbrl)
         validation_issues = _collect_validation_issues(model_xbrl)
+        rss_before_kib = _current_rss_kib()
+        build_started = time.perf_counter()
         dataframe = _facts_to_dataframe(model_xbrl)
+        build_ms = (time.perf_counter() - build_started) * 1000.0
+        rss_after_kib = _current_rss_kib()
+        build_stats = _FactsBuildStats(
+            build_ms=build_ms,
+            rss_delta_kib=(
+                rss_after_kib - rss_before_kib
+                if rss_before_kib is not None and rss_after_kib is not None
+                else None
+            ),
+        )
+        return dataframe, validation_issues, build_stats
+    finally:
+        _close_quietly(model_xbrl)
+        _close_quietly(file_source)
 
+
+def _close_quietly(resource: object) -> None:
     try:
-        if isolation_mode == _RUNTIME_ISOLATION_SERIAL:
-            lock_started = time.perf_counter()
-            with _ARELLE_RUNTIME_PARSE_LOCK:
-                lock_wait_ms = (time.perf_counter() - lock_started) * 1000.0
-                _parse_once()
-        else:
-            _parse_once()
+        close = getattr(resource, "close", None)
+        if callable(close):
+            close()
+    except Exception:
+        pass
+
+
+def _current_rss_kib() -> int | None:
+    """Current resident set size of this process in KiB, where /proc has it."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+@dataclass(frozen=True)
+class _FactsBuildStats:
+    build_ms: float
+    # Change in this process's resident set size across the frame build,
+    # roughly the memory the new frame holds; None where RSS is unreadable.
+    rss_delta_kib: int | None
+
+
+@dataclass(frozen=True)
+class _ArelleWorkerParseOutput:
+    facts_dataframe: pd.DataFrame
+    validation_issues: tuple[ArelleValidationIssue, ...]
+    worker_pid: int
+    worker_parse_ms: float
+    worker_parse_count: int
+    queue_wait_ms: float
+    facts_build_stats: _FactsBuildStats | None = None
+
+
+@dataclass
+class _ArelleWorkerRuntime:
+    controller: object
+    manager: object
+    validation_profile: ArelleValidationProfile
+    parse_count: int = 0
+
+
+# Set once per worker process by _initialize_arelle_worker.
+_WORKER_RUNTIME: _ArelleWorkerRuntime | None = None
+
+
+def _parse_bundle_in_worker_pool(
+    bundle: XbrlAttachmentBundle,
+    *,
+    validation_profile: ArelleValidationProfile,
+) -> tuple[_ArelleWorkerParseOutput, int]:
+    pool, pool_size = get_arelle_worker_pool(
+        validation_profile,
+        initializer=_initialize_arelle_worker,
+        initargs=(validation_profile,),
+    )
+    timeout_seconds = resolve_arelle_worker_timeout_seconds()
+    try:
+        output = run_arelle_worker_task(
+            pool,
+            _parse_bundle_in_worker,
+            bundle,
+            time.time(),
+            timeout_seconds=timeout_seconds,
+        )
+        return output, pool_size
+    except ArelleEngineParseError:
+        raise
+    except FutureTimeoutError as exc:
+        discard_arelle_worker_pool(validation_profile, pool)
+        raise ArelleEngineParseError(
+            f"Arelle parse timed out after {timeout_seconds:g}s for "
+            f"{bundle.instance_document}"
+        ) from exc
+    except BrokenProcessPool as exc:
+        discard_arelle_worker_pool(validation_profile, pool)
+        raise ArelleEngineParseError(
+            f"Arelle worker pool failed for {bundle.instance_document}: "
+            f"{type(exc).__name__}: {exc}"
+        ) from exc
     except Exception as exc:
         raise ArelleEngineParseError(
             f"Arelle parse failed for {bundle.instance_document}: "
             f"{type(exc).__name__}: {exc}"
         ) from exc
-    finally:
-        try:
-            close_model = getattr(model_xbrl, "close", None)
-            if callable(close_model):
-                close_model()
-        except Exception:
-            pass
-        try:
-            close_source = getattr(file_source, "close", None)
-            if callable(close_source):
-                close_source()
-        except Exception:
-            pass
-        try:
-            close_controller = getattr(controller, "close", None)
-            if callable(close_controller):
-                close_controller()
-        except Exception:
-            pass
 
-    doc_types = {attachment.document_type.upper() for attachment in bundle.attachments}
-    elapsed_ms = (time.perf_counter() - started) * 1000.0
-    return ArelleParseResult(
+
+def _initialize_arelle_worker(validation_profile: ArelleValidationProfile) -> None:
+    """Pool initializer: build the controller and load plugins/packages once."""
+    global _WORKER_RUNTIME
+    from arelle import (  # type: ignore[import-not-found]
+        Cntlr,
+        ModelManager,
+    )
+
+    controller = Cntlr.Cntlr(logFileName="structured-message")
+    manager = ModelManager.initialize(controller)
+    _configure_validation_runtime(
+        controller=controller,
+        manager=manager,
+        validation_profile=validation_profile,
+    )
+    _WORKER_RUNTIME = _ArelleWorkerRuntime(
+        controller=controller,
+        manager=manager,
+        validation_profile=validation_profile,
+    )
+
+
+def _parse_bundle_in_worker(
+    bundle: XbrlAttachmentBundle,
+    submitted_at: float,
+) -> _ArelleWorkerParseOutput:
+    # Wall-clock time, so the queue wait is comparable across processes.
+    queue_wait_ms = max(0.0, (time.time() - submitted_at) * 1000.0)
+    started = time.perf_counter()
+    runtime = _WORKER_RUNTIME
+    if runtime is None:
+        raise ArelleEngineParseError("Arelle worker runtime is not initialized.")
+    try:
+        dataframe, validation_issues, build_stats = _load_bundle_facts(
+            manager=runtime.manager,
+            bundle=bundle,
+            validation_profile=runtime.validation_profile,
+        )
+    except Exception as exc:
+        raise ArelleEngineParseError(
+            f"Arelle parse failed for {bundle.instance_document}: "
+            f"{type(exc).__name__}: {exc}"
+        ) from exc
+    runtime.parse_count += 1
+    return _ArelleWorkerParseOutput(
         facts_dataframe=dataframe,
-        instance_document=bundle.instance_document,
-        loaded_attachment_count=len(bundle.attachments),
-        schema_loaded="EX-101.SCH" in doc_types,
-        label_loaded="EX-101.LAB" in doc_types,
-        presentation_loaded="EX-101.PRE" in doc_types,
-        calculation_loaded="EX-101.CAL" in doc_types,
-        definition_loaded="EX-101.DEF" in doc_types,
         validation_issues=validation_issues,
-        runtime_metadata=ArelleRuntimeMetadata(
-            mode=validation_profile.mode,
-            disclosure_system=validation_profile.disclosure_system,
-            plugins=validation_profile.plugins,
-            packages=validation_profile.packages,
-            arelle_version=_resolve_arelle_version(),
-            validation_enabled=validation_profile.validation_enabled,
-            runtime_isolation_mode=isolation_mode,
-            runtime_lock_wait_ms=round(lock_wait_ms, 3),
-        ),
-        parse_latency_ms=elapsed_ms,
+        worker_pid=os.getpid(),
+        worker_parse_ms=(time.perf_counter() - started) * 1000.0,
+        worker_parse_count=runtime.parse_count,
+        queue_wait_ms=queue_wait_ms,
+        facts_build_stats=build_stats,
     )
 
 
+def warmup_arelle_worker_pool() -> dict[str, object]:
+    """
+    Start every worker of the pool for the env validation profile, so the
+    first filings parsed after startup do not pay for Arelle initialization.
+    """
+    started = time.perf_counter()
+    isolation_mode = _resolve_runtime_isolation_mode_from_env()
+    if isolation_mode != _RUNTIME_ISOLATION_WORKER_POOL:
+        return {"mode": isolation_mode, "workers": 0, "warmup_ms": 0.0}
+    if importlib.util.find_spec("arelle") is None:
+        raise ArelleEngineUnavailableError(
+            "Arelle runtime unavailable. Install arelle to enable Arelle-first XBRL parsing."
+        )
+    validation_profile = _resolve_validation_profile_from_env()
+    pool, pool_size = get_arelle_worker_pool(
+        validation_profile,
+        initializer=_initialize_arelle_worker,
+        initargs=(validation_profile,),
+    )
+    # Workers spawn on demand; concurrent no-op tasks bring up the full pool.
+    futures = [pool.submit(os.getpid) for _ in range(pool_size)]
+    timeout_seconds = resolve_arelle_worker_timeout_seconds()
+    done, pending = wait_futures(futures, timeout=timeout_seconds)
+    if pending:
+        discard_arelle_worker_pool(validation_profile, pool)
+        raise ArelleEngineParseError(
+            f"Arelle worker pool warmup timed out after {timeout_seconds:g}s"
+        )
+    worker_pids = {future.result() for future in done}
+    return {
+        "mode": isolation_mode,
+        "workers": len(worker_pids),
+        "warmup_ms": round((time.perf_counter() - started) * 1000.0, 3),
+    }
+
+
 def _build_zip_stream(bundle: XbrlAttachmentBundle) -> io.BytesIO:
     zip_stream = io.BytesIO()
     with zipfile.ZipFile(zip_stream, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
@@ -218,51 +496,79 @@ def _build_zip_stream(bundle: XbrlAttachmentBundle) -> io.BytesIO:
 
 
 def _facts_to_dataframe(model_xbrl: object) -> pd.DataFrame:
+    """
+    Build the facts frame column by column into preallocated arrays.
+    Period and dimension fields are derived once per context and labels once
+    per concept. ``concept``, ``unit``, ``period_key`` and the ``dim_*``
+    columns are categorical. A model without facts yields an empty frame
+    with the same columns and dtypes.
+    """
     facts_raw = getattr(model_xbrl, "facts", None)
     if not isinstance(facts_raw, list):
-        return pd.DataFrame(columns=list(_BASE_FACT_COLUMNS))
-
-    rows: list[dict[str, object]] = []
-    for fact in facts_raw:
-        row = _build_fact_row(fact)
-        rows.append(row)
-
-    if not rows:
-        return pd.DataFrame(columns=list(_BASE_FACT_COLUMNS))
-
-    dataframe = pd.DataFrame(rows)
-    for column in _BASE_FACT_COLUMNS:
-        if column not in dataframe.columns:
-            dataframe[column] = None
-    return dataframe
-
-
-def _build_fact_row(fact: object) -> dict[str, object]:
-    context = getattr(fact, "context", None)
-    period_key, period_end, period_type = _period_fields_from_context(context)
-
-    concept = _concept_name(fact)
-    label = _concept_label(fact)
-    value = _fact_value(fact)
-    unit = _fact_unit(fact)
-    decimals = _optional_string(getattr(fact, "decimals", None))
-    scale = _optional_string(getattr(fact, "scale", None))
-
-    row: dict[str, object] = {
-        "concept": concept,
-        "value": value,
-        "label": label,
-        "statement_type": None,
-        "period_key": period_key,
-        "period_end": period_end,
-        "period_type": period_type,
-        "unit": unit,
-        "decimals": decimals,
-        "scale": scale,
-    }
+        facts_raw = []
 
-    row.update(_dimension_fields_from_context(context))
-    return row
+    count = len(facts_raw)
+    columns = {
+        column: np.full(count, None, dtype=object) for column in _BASE_FACT_COLUMNS
+    }
+    concepts = columns["concept"]
+    values = columns["value"]
+    labels = columns["label"]
+    period_keys = columns["period_key"]
+    period_ends = columns["period_end"]
+    period_types = columns["period_type"]
+    units = columns["unit"]
+    decimals = columns["decimals"]
+    scales = columns["scale"]
+    dimensions: dict[str, np.ndarray] = {}
+    # Keyed by id(): contexts and concepts stay alive on model_xbrl for the
+    # whole build.
+    context_fields: dict[
+        int, tuple[tuple[str, str | None, str | None], dict[str, str]]
+    ] = {}
+    concept_labels: dict[int, str | None] = {}
+
+    for position, fact in enumerate(facts_raw):
+        context = getattr(fact, "context", None)
+        cached = context_fields.get(id(context))
+        if cached is None:
+            cached = (
+                _period_fields_from_context(context),
+                _dimension_fields_from_context(context),
+            )
+            context_fields[id(context)] = cached
+        period_fields, dimension_fields = cached
+
+        concepts[position] = _concept_name(fact)
+        values[position] = _fact_value(fact)
+        concept_id = id(getattr(fact, "concept", None))
+        if concept_id not in concept_labels:
+            concept_labels[concept_id] = _concept_label(fact)
+        labels[position] = concept_labels[concept_id]
+        (
+            period_keys[position],
+            period_ends[position],
+            period_types[position],
+        ) = period_fields
+        units[position] = _fact_unit(fact)
+        decimals[position] = _optional_string(getattr(fact, "decimals", None))
+        scales[position] = _optional_string(getattr(fact, "scale", None))
+        for column, member in dimension_fields.items():
+            members = dimensions.get(column)
+            if members is None:
+                members = np.full(count, None, dtype=object)
+                dimensions[column] = members
+            members[position] = member
+
+    data: dict[str, object] = {
+        column: (
+            pd.Categorical(array) if column in _CATEGORICAL_FACT_COLUMNS else array
+        )
+        for column, array in columns.items()
+    }
+    for column, members in dimensions.items():
+        data[column] = pd.Categorical(members)
+    return pd.DataFrame(data, copy=False)
 
 
 def _concept_name(fact: object) -> str:
@@ -444,10 +750,10 @@ def _split_csv_env(name: str) -> tuple[str, ...]:
 
 
 def _resolve_runtime_isolation_mode_from_env() -> str:
-    raw = os.getenv(_RUNTIME_ISOLATION_ENV, _RUNTIME_ISOLATION_SERIAL)
+    raw = os.getenv(_RUNTIME_ISOLATION_ENV, _RUNTIME_ISOLATION_WORKER_POOL)
     normalized = raw.strip().lower()
     if normalized not in _SUPPORTED_RUNTIME_ISOLATION_MODES:
-        return _RUNTIME_ISOLATION_SERIAL
+        return _RUNTIME_ISOLATION_WORKER_POOL
     return normalized
 
 
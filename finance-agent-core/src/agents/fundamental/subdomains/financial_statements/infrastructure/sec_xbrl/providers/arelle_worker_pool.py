@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing.queues import SimpleQueue
+from typing import TypeVar
+from uuid import uuid4
+
+_WORKERS_ENV = "FUNDAMENTAL_XBRL_ARELLE_WORKERS"
+_WORKER_MAX_TASKS_ENV = "FUNDAMENTAL_XBRL_ARELLE_WORKER_MAX_TASKS"
+_WORKER_TIMEOUT_ENV = "FUNDAMENTAL_XBRL_ARELLE_WORKER_TIMEOUT_SECONDS"
+_DEFAULT_MAX_WORKERS = 4
+# Arelle keeps per-model caches alive in long-running processes; recycle
+# workers periodically so their memory stays bounded.
+_DEFAULT_WORKER_MAX_TASKS = 64
+# Tasks running longer than this are treated as hung and their pool recycled.
+_DEFAULT_WORKER_TIMEOUT_SECONDS = 300.0
+# How often a task still waiting for a worker checks for its start report.
+_START_POLL_SECONDS = 0.25
+
+_T = TypeVar("_T")
+
+_POOLS: dict[Hashable, tuple[ProcessPoolExecutor, int]] = {}
+_POOLS_LOCK = threading.Lock()
+# Worker-local: the queue this process reports task start times on.
+_WORKER_START_QUEUE: SimpleQueue | None = None
+
+
+class _TaskStartReports:
+    """Parent side of the queue a pool's workers report task start times on."""
+
+    def __init__(self, queue: SimpleQueue) -> None:
+        self._queue = queue
+        self._started_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def started_at(self, task_id: str) -> float | None:
+        with self._lock:
+            self._drain()
+            return self._started_at.get(task_id)
+
+    def forget(self, task_id: str) -> None:
+        with self._lock:
+            self._drain()
+            self._started_at.pop(task_id, None)
+
+    def _drain(self) -> None:
+        while not self._queue.empty():
+            task_id, started_at = self._queue.get()
+            self._started_at[task_id] = started_at
+
+
+_START_REPORTS: dict[ProcessPoolExecutor, _TaskStartReports] = {}
+
+
+def resolve_arelle_worker_count() -> int:
+    default = min(_DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    return _positive_int_env(_WORKERS_ENV, default)
+
+
+def resolve_arelle_worker_max_tasks() -> int:
+    return _positive_int_env(_WORKER_MAX_TASKS_ENV, _DEFAULT_WORKER_MAX_TASKS)
+
+
+def resolve_arelle_worker_timeout_seconds() -> float:
+    return _positive_float_env(_WORKER_TIMEOUT_ENV, _DEFAULT_WORKER_TIMEOUT_SECONDS)
+
+
+def get_arelle_worker_pool(
+    key: Hashable,
+    *,
+    initializer: Callable[..., None],
+    initargs: tuple[object, ...],
+) -> tuple[ProcessPoolExecutor, int]:
+    """
+    Return the long-lived worker pool for ``key`` and its size, creating it on
+    first use. Workers are spawned (not forked) so they never inherit the
+    parent's threads or Arelle state, and run ``initializer`` once at start.
+    """
+    with _POOLS_LOCK:
+        entry = _POOLS.get(key)
+        if entry is not None:
+            return entry
+        max_workers = resolve_arelle_worker_count()
+        context = multiprocessing.get_context("spawn")
+        start_queue = context.SimpleQueue()
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_initialize_pool_worker,
+            initargs=(start_queue, initializer, initargs),
+            max_tasks_per_child=resolve_arelle_worker_max_tasks(),
+        )
+        entry = (pool, max_workers)
+        _POOLS[key] = entry
+        _START_REPORTS[pool] = _TaskStartReports(start_queue)
+        return entry
+
+
+def run_arelle_worker_task(
+    pool: ProcessPoolExecutor,
+    fn: Callable[..., _T],
+    *args: object,
+    timeout_seconds: float,
+) -> _T:
+    """
+    Run ``fn(*args)`` on ``pool`` and return its result. The timeout starts when
+    a worker picks the task up, so time spent queued behind other tasks does not
+    count; ``concurrent.futures.TimeoutError`` means the task itself overran.
+    """
+    with _POOLS_LOCK:
+        reports = _START_REPORTS.get(pool)
+    if reports is None:
+        return pool.submit(fn, *args).result(timeout=timeout_seconds)
+    task_id = uuid4().hex
+    future = pool.submit(_run_reported_task, task_id, fn, args)
+    try:
+        while True:
+            started_at = reports.started_at(task_id)
+            if started_at is None:
+                try:
+                    return future.result(timeout=_START_POLL_SECONDS)
+                except FutureTimeoutError:
+                    continue
+            # Wall-clock time, so the worker's start is comparable here.
+            remaining = started_at + timeout_seconds - time.time()
+            return future.result(timeout=max(remaining, 0.0))
+    finally:
+        reports.forget(task_id)
+
+
+def discard_arelle_worker_pool(key: Hashable, pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken or hung pool so the next parse starts a fresh one. Its
+    workers are terminated; shutdown alone would leave a hung task running.
+    """
+    with _POOLS_LOCK:
+        entry = _POOLS.get(key)
+        if entry is not None and entry[0] is pool:
+            del _POOLS[key]
+        _START_REPORTS.pop(pool, None)
+    # The executor keeps no public handle on its processes.
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def shutdown_arelle_worker_pools(*, wait: bool = True) -> None:
+    with _POOLS_LOCK:
+        pools = [pool for pool, _ in _POOLS.values()]
+        _POOLS.clear()
+        _START_REPORTS.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _initialize_pool_worker(
+    start_queue: SimpleQueue,
+    initializer: Callable[..., None],
+    initargs: tuple[object, ...],
+) -> None:
+    global _WORKER_START_QUEUE
+    _WORKER_START_QUEUE = start_queue
+    initializer(*initargs)
+
+
+def _run_reported_task(
+    task_id: str,
+    fn: Callable[..., _T],
+    args: tuple[object, ...],
+) -> _T:
+    start_queue = _WORKER_START_QUEUE
+    if start_queue is not None:
+        start_queue.put((task_id, time.time()))
+    return fn(*args)
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        parsed = int(raw.strip())
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _positive_float_env(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        parsed = float(raw.strip())
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
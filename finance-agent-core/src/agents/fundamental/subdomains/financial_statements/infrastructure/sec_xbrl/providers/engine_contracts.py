@@ -58,7 +58,13 @@ class ArelleRuntimeMetadata:
     arelle_version: str | None
     validation_enabled: bool
     runtime_isolation_mode: str | None = None
+    # Serial mode: time spent waiting for the process-wide parse lock.
+    # Worker-pool mode: time from submission until a worker started the parse.
     runtime_lock_wait_ms: float | None = None
+    runtime_worker_pid: int | None = None
+    runtime_worker_parse_ms: float | None = None
+    runtime_worker_parse_count: int | None = None
+    runtime_worker_pool_size: int | None = None
 
 
 @dataclass(frozen=True)
@@ -74,6 +80,10 @@ class ArelleParseResult:
     validation_issues: tuple[ArelleValidationIssue, ...] = ()
     runtime_metadata: ArelleRuntimeMetadata | None = None
     parse_latency_ms: float | None = None
+    # Facts frame construction time, and the change in the parsing
+    # process's resident set size across it.
+    facts_build_ms: float | None = None
+    facts_rss_delta_kib: int | None = None
 
 
 class IArelleXbrlEngine(Protocol):
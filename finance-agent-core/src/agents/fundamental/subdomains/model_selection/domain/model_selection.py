@@ -29,7 +29,10 @@ from .model_selection_contracts import (
     SelectionField,
     SelectionSignals,
 )
-from .model_selection_scoring_service import evaluate_model_spec
+from .model_selection_scoring_service import (
+    evaluate_model_spec,
+    select_ensemble_candidates,
+)
 from .model_selection_signal_service import collect_selection_signals
 from .model_selection_spec_catalog import MODEL_SPECS
 
@@ -134,5 +137,6 @@ __all__ = [
     "SelectionField",
     "SelectionSignals",
     "_evaluate_spec",
+    "select_ensemble_candidates",
     "select_valuation_model",
 ]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from math import exp
+
 from .model_selection_contracts import (
     DEFAULT_SCORING_WEIGHTS,
     ModelCandidate,
@@ -80,6 +83,34 @@ def evaluate_model_spec(
     )
 
 
+def select_ensemble_candidates(
+    ranked_candidates: Sequence[ModelCandidate],
+    *,
+    top_k: int = 3,
+    temperature: float = 1.0,
+) -> tuple[tuple[ModelCandidate, float], ...]:
+    """
+    Top-k candidates by score with blend weights softmax(score / temperature).
+    A lower temperature concentrates weight on the leading candidate.
+    """
+    if top_k <= 0:
+        raise ValueError("top_k must be positive")
+    if temperature <= 0:
+        raise ValueError("temperature must be positive")
+    top = sorted(
+        ranked_candidates, key=lambda candidate: candidate.score, reverse=True
+    )[:top_k]
+    if not top:
+        return ()
+    leading_score = top[0].score
+    raw_weights = [exp((item.score - leading_score) / temperature) for item in top]
+    total = sum(raw_weights)
+    return tuple(
+        (candidate, weight / total)
+        for candidate, weight in zip(top, raw_weights, strict=True)
+    )
+
+
 def _in_sic_ranges(sic: int | None, ranges: tuple[tuple[int, int], ...]) -> bool:
     if sic is None or not ranges:
         return False
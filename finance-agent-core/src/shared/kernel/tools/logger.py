@@ -296,6 +296,9 @@ def log_event(
     error_code: str | None = None,
     fields: Mapping[str, object] | None = None,
 ) -> None:
+    # Skip field sanitization for records the logger would drop anyway.
+    if not logger.isEnabledFor(level):
+        return
     extra: dict[str, object] = {"event": event}
     if error_code is not None:
         extra["error_code"] = error_code
@@ -1,8 +1,15 @@
+import numpy as np
 import pytest
 
 from src.agents.fundamental.subdomains.core_valuation.domain.engine.core import (
     CalculationGraph,
 )
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.dcf_growth import (
+    create_dcf_growth_graph,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.dcf_standard import (
+    create_dcf_standard_graph,
+)
 
 
 def test_add_node_no_func():
@@ -63,3 +70,107 @@ def test_cycle_detection():
 
     with pytest.raises(ValueError, match="contains cycles"):
         graph.validate()
+
+
+def test_compile_reuses_plan_and_prunes_provided_nodes():
+    graph = CalculationGraph("plan_graph")
+
+    def doubled(val: float) -> float:
+        return val * 2
+
+    def tripled(doubled: float) -> float:
+        return doubled * 3
+
+    graph.add_node("val")
+    graph.add_node("doubled", doubled)
+    graph.add_node("tripled", tripled)
+
+    plan = graph.compile(inputs=("val",))
+    assert graph.compile(inputs=("val",)) is plan
+    assert plan.output_names == ("doubled", "tripled")
+    assert plan.calculate({"val": 2.0})["tripled"] == 12.0
+
+    pruned = graph.compile(inputs=("doubled",), outputs=("tripled",))
+    assert pruned.output_names == ("tripled",)
+    assert pruned.calculate({"doubled": 5.0})["tripled"] == 15.0
+
+
+def test_compile_reports_missing_dependency():
+    graph = CalculationGraph("missing_graph")
+
+    def total(a: float, b: float) -> float:
+        return a + b
+
+    graph.add_node("total", total)
+
+    with pytest.raises(ValueError, match="Missing dependency 'b'"):
+        graph.compile(inputs=("a",))
+
+
+def test_calculate_batch_requires_batch_implementation():
+    graph = CalculationGraph("batch_graph")
+
+    def doubled(val: float) -> float:
+        return val * 2
+
+    graph.add_node("doubled", doubled)
+
+    with pytest.raises(ValueError, match="no batch implementation"):
+        graph.calculate_batch({"val": np.array([1.0, 2.0])})
+
+
+def test_add_node_rejects_mismatched_batch_signature():
+    graph = CalculationGraph("batch_graph")
+
+    def doubled(val: float) -> float:
+        return val * 2
+
+    def doubled_batch(values: np.ndarray) -> np.ndarray:
+        return values * 2
+
+    with pytest.raises(ValueError, match="batch_func"):
+        graph.add_node("doubled", doubled, doubled_batch)
+
+
+@pytest.mark.parametrize(
+    "graph_factory", [create_dcf_standard_graph, create_dcf_growth_graph]
+)
+def test_dcf_batch_matches_scalar_graph(graph_factory):
+    graph = graph_factory()
+    scalar_inputs = {
+        "initial_revenue": 1000.0,
+        "growth_rates": [0.12, 0.10, 0.08, 0.06, 0.04],
+        "operating_margins": [0.18, 0.19, 0.20, 0.21, 0.22],
+        "tax_rate": 0.21,
+        "da_rates": [0.04] * 5,
+        "capex_rates": [0.05] * 5,
+        "wc_rates": [0.02] * 5,
+        "sbc_rates": [0.01] * 5,
+        "wacc": 0.09,
+        "terminal_growth": 0.025,
+        "cash": 200.0,
+        "total_debt": 150.0,
+        "preferred_stock": 0.0,
+        "shares_outstanding": 100.0,
+    }
+    waccs = np.array([0.08, 0.09, 0.11])
+    margins = np.array(
+        [
+            [0.18, 0.19, 0.20, 0.21, 0.22],
+            [0.30, 0.32, 0.34, 0.35, 0.36],
+            [0.45, 0.50, 0.52, 0.55, 0.58],
+        ]
+    )
+    expected = [
+        graph.calculate(
+            {**scalar_inputs, "wacc": float(wacc), "operating_margins": list(margin)}
+        )["intrinsic_value"]
+        for wacc, margin in zip(waccs, margins, strict=True)
+    ]
+
+    batch = graph.calculate_batch(
+        {**scalar_inputs, "wacc": waccs, "operating_margins": margins},
+        outputs=("intrinsic_value",),
+    )
+
+    np.testing.assert_allclose(batch["intrinsic_value"], expected, rtol=1e-12)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.agents.fundamental.subdomains.core_valuation.domain.batch import (
+    BatchValuationCase,
+    build_batch_valuation_payload,
+    run_batch_valuation,
+)
+
+
+def _load_cases() -> list[BatchValuationCase]:
+    fixture_path = (
+        Path(__file__).resolve().parent / "fixtures" / "fundamental_backtest_cases.json"
+    )
+    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
+    return [
+        BatchValuationCase(
+            ticker=item["id"], model=item["model"], params=item["params"]
+        )
+        for item in payload["cases"]
+    ]
+
+
+def _dcf_universe(size: int) -> list[BatchValuationCase]:
+    base = next(case for case in _load_cases() if case.model == "dcf_standard")
+    cases: list[BatchValuationCase] = []
+    for index in range(size):
+        params = dict(base.params)
+        params["wacc"] = 0.07 + 0.002 * index
+        params["initial_revenue"] = float(params["initial_revenue"]) * (1 + index / 10)
+        params["monte_carlo_iterations"] = 0
+        cases.append(
+            BatchValuationCase(
+                ticker=f"T{index:03d}", model="dcf_standard", params=params
+            )
+        )
+    return cases
+
+
+def test_packed_batch_matches_per_case_calculators_in_case_order() -> None:
+    cases = _load_cases()
+
+    packed = run_batch_valuation(cases)
+    per_case = run_batch_valuation(cases, packed=False)
+
+    assert [item.ticker for item in packed.results] == [case.ticker for case in cases]
+    for packed_result, calculator_result in zip(
+        packed.results, per_case.results, strict=True
+    ):
+        assert packed_result.status == calculator_result.status == "ok"
+        assert packed_result.intrinsic_value == pytest.approx(
+            calculator_result.intrinsic_value, rel=1e-9
+        )
+        assert packed_result.upside_potential == pytest.approx(
+            calculator_result.upside_potential, rel=1e-9, abs=1e-12
+        )
+        assert packed_result.equity_value == pytest.approx(
+            calculator_result.equity_value, rel=1e-9
+        )
+    paths = {item.model: item.path for item in packed.results}
+    assert paths["dcf_standard"] == "packed"
+    assert paths["dcf_growth"] == "packed"
+    assert paths["bank"] == "calculator"
+    assert per_case.report.packed_count == 0
+
+
+def test_same_model_cases_share_one_pack_and_report_throughput() -> None:
+    cases = _dcf_universe(24)
+
+    run = run_batch_valuation(cases)
+
+    report = run.report
+    assert report.case_count == 24
+    assert report.ok_count == 24
+    assert report.packed_count == 24
+    assert report.cases_per_second > 0
+    (model_report,) = report.models
+    assert model_report.model == "dcf_standard"
+    assert model_report.pack_count == 1
+    intrinsic = [item.intrinsic_value for item in run.results]
+    assert len(set(intrinsic)) == 24
+
+    payload = build_batch_valuation_payload(run)
+    assert payload["throughput"]["models"][0]["packed_count"] == 24
+    assert len(payload["results"]) == 24
+
+
+def test_invalid_members_fall_back_without_failing_the_pack() -> None:
+    cases = _dcf_universe(4)
+    bad_params = dict(cases[1].params)
+    bad_params["terminal_growth"] = 0.5
+    cases[1] = BatchValuationCase(ticker="BAD", model="dcf_standard", params=bad_params)
+    cases.append(BatchValuationCase(ticker="NOPE", model="unknown_model", params={}))
+
+    run = run_batch_valuation(cases)
+
+    by_ticker = {item.ticker: item for item in run.results}
+    assert by_ticker["BAD"].status == "error"
+    assert by_ticker["BAD"].path == "calculator"
+    assert by_ticker["BAD"].error == "terminal_growth must be lower than wacc"
+    assert by_ticker["NOPE"].path == "validation"
+    assert by_ticker["NOPE"].error == "Unknown valuation model: unknown_model"
+    assert [by_ticker[f"T{index:03d}"].path for index in (0, 2, 3)] == ["packed"] * 3
+    assert run.report.error_count == 2
+
+
+def test_mixed_pack_drops_only_rejected_rows_to_the_calculator() -> None:
+    cases = _dcf_universe(6)
+    for index, ticker, field, value in (
+        (1, "NEG", "initial_revenue", -5.0),
+        (4, "HUGE", "initial_revenue", 1e308),
+    ):
+        params = dict(cases[index].params)
+        params[field] = value
+        cases[index] = BatchValuationCase(
+            ticker=ticker, model="dcf_standard", params=params
+        )
+
+    run = run_batch_valuation(cases)
+
+    by_ticker = {item.ticker: item for item in run.results}
+    assert by_ticker["NEG"].path == "calculator"
+    assert by_ticker["NEG"].status == "error"
+    assert by_ticker["NEG"].error.endswith("initial_revenue must be positive")
+    assert by_ticker["HUGE"].path == "calculator"
+    assert [by_ticker[f"T{index:03d}"].path for index in (0, 2, 3, 5)] == ["packed"] * 4
+    (model_report,) = run.report.models
+    assert model_report.pack_count == 1
+    assert model_report.packed_count == 4
+    assert model_report.calculator_count == 2
+    per_case = run_batch_valuation(cases, packed=False)
+    for packed_result, calculator_result in zip(
+        run.results, per_case.results, strict=True
+    ):
+        if packed_result.path == "packed":
+            assert packed_result.intrinsic_value == pytest.approx(
+                calculator_result.intrinsic_value, rel=1e-9
+            )
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _load_script_module():
+    project_root = Path(__file__).resolve().parents[1]
+    script_path = project_root / "scripts" / "benchmark_fundamental_valuation_engine.py"
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_fundamental_valuation_engine", script_path
+    )
+    if spec is None or spec.loader is None:
+        raise RuntimeError("failed to load benchmark_fundamental_valuation_engine.py")
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve their module through sys.modules while executing.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _replay_input(name: str) -> Path:
+    return (
+        Path(__file__).resolve().parent
+        / "fixtures"
+        / "fundamental_replay_inputs"
+        / f"{name}.replay.json"
+    )
+
+
+def _result(module, name: str, *, p50: float, p95: float, peak: float):
+    return module.BenchmarkResult(
+        name=name,
+        kind="calculator",
+        model="dcf_standard",
+        ticker="AAPL",
+        iterations=None,
+        samples=5,
+        p50_ms=p50,
+        p95_ms=p95,
+        peak_kib=peak,
+    )
+
+
+def test_gate_requires_relative_and_absolute_regression() -> None:
+    module = _load_script_module()
+    baseline = {
+        "slow": {"p50_ms": 10.0, "p95_ms": 12.0, "peak_kib": 500.0},
+        "jitter": {"p50_ms": 0.2, "p95_ms": 0.3, "peak_kib": 10.0},
+    }
+    results = [
+        _result(module, "slow", p50=14.0, p95=13.0, peak=800.0),
+        _result(module, "jitter", p50=0.4, p95=0.6, peak=20.0),
+        _result(module, "new", p50=1.0, p95=1.0, peak=1.0),
+    ]
+
+    failures = module.collect_gate_failures(
+        results,
+        baseline=baseline,
+        max_p50_regression_pct=25.0,
+        max_p95_regression_pct=50.0,
+        max_memory_regression_pct=20.0,
+        min_regression_ms=1.0,
+        min_memory_regression_kib=64.0,
+    )
+
+    assert len(failures) == 2
+    assert failures[0].startswith("`slow` p50_ms=14.0000 regressed 40.0%")
+    assert failures[1].startswith("`slow` peak_kib=800.0000 regressed 60.0%")
+
+
+def test_run_benchmarks_covers_builders_calculators_and_monte_carlo() -> None:
+    module = _load_script_module()
+
+    results, skipped = module.run_benchmarks(
+        [_replay_input("aapl")],
+        models=["dcf_standard", "eva"],
+        mc_iterations=[200],
+        repeats=2,
+    )
+
+    assert skipped == []
+    assert [item.name for item in results] == [
+        "param_builder:dcf_standard:AAPL",
+        "calculator:dcf_standard:AAPL",
+        "monte_carlo:dcf_standard:AAPL@200",
+        "param_builder:eva:AAPL",
+        "calculator:eva:AAPL",
+    ]
+    assert all(item.error is None for item in results)
+    assert all(item.p95_ms >= item.p50_ms > 0 for item in results)
+    assert all(item.peak_kib > 0 for item in results)
+
+
+def test_main_updates_baseline_then_fails_on_regression(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module = _load_script_module()
+    baseline_path = tmp_path / "baseline.json"
+    common_args = [
+        "benchmark_fundamental_valuation_engine.py",
+        "--replay-inputs",
+        str(_replay_input("nvda")),
+        "--models",
+        "ev_revenue",
+        "--repeats",
+        "2",
+        "--baseline",
+        str(baseline_path),
+        "--report-json",
+        str(tmp_path / "report.json"),
+        "--report-md",
+        str(tmp_path / "report.md"),
+    ]
+
+    monkeypatch.setattr(sys, "argv", [*common_args, "--update-baseline"])
+    assert module.main() == 0
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    assert baseline["schema_version"] == module.BASELINE_SCHEMA_VERSION
+    assert set(baseline["benchmarks"]) == {
+        "param_builder:ev_revenue:NVDA",
+        "calculator:ev_revenue:NVDA",
+    }
+
+    # Only p50 regresses; p95 and memory baselines are widened so timing and
+    # allocator noise between the two runs cannot add gate failures.
+    for entry in baseline["benchmarks"].values():
+        entry["p50_ms"] = entry["p50_ms"] / 100.0
+        entry["p95_ms"] = entry["p95_ms"] * 100.0
+        entry["peak_kib"] = entry["peak_kib"] * 100.0
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", [*common_args, "--min-regression-ms", "0"])
+    assert module.main() == 2
+    report = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert report["summary"]["gate_passed"] is False
+    assert len(report["summary"]["gate_failures"]) == 2
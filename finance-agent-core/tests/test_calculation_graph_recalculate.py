@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+
+from src.agents.fundamental.domain.shared.contracts.traceable import TraceableField
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.core import (
+    CalculationGraph,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.saas_fcff import (
+    create_saas_graph,
+)
+
+
+def _saas_inputs() -> dict[str, object]:
+    return {
+        "initial_revenue": 100.0,
+        "growth_rates": [0.15, 0.14, 0.12, 0.10, 0.08],
+        "operating_margins": [0.10, 0.12, 0.14, 0.16, 0.18],
+        "tax_rate": 0.21,
+        "da_rates": [0.03, 0.03, 0.03, 0.03, 0.03],
+        "capex_rates": [0.05, 0.05, 0.05, 0.05, 0.05],
+        "wc_rates": [0.01, 0.01, 0.01, 0.01, 0.01],
+        "sbc_rates": [0.02, 0.02, 0.02, 0.02, 0.02],
+        "wacc": 0.10,
+        "terminal_growth": 0.025,
+        "cash": 10.0,
+        "total_debt": 5.0,
+        "preferred_stock": 0.0,
+        "shares_outstanding": 100.0,
+    }
+
+
+def _unwrap(value: object) -> object:
+    return value.value if isinstance(value, TraceableField) else value
+
+
+@pytest.mark.parametrize("trace", [False, True])
+def test_recalculate_matches_full_run_and_reuses_upstream_nodes(trace: bool) -> None:
+    graph = create_saas_graph()
+    graph.calculate(_saas_inputs(), trace=trace, emit_lifecycle_events=False)
+
+    updated = graph.recalculate({"terminal_growth": 0.03})
+    expected = create_saas_graph().calculate(
+        {**_saas_inputs(), "terminal_growth": 0.03},
+        trace=trace,
+        emit_lifecycle_events=False,
+    )
+
+    assert updated.keys() == expected.keys()
+    for name, value in expected.items():
+        assert _unwrap(updated[name]) == _unwrap(value)
+    if trace:
+        assert updated["intrinsic_value"] == expected["intrinsic_value"]
+
+    stats = graph.last_recalculation
+    assert stats is not None
+    assert stats.changed_inputs == ("terminal_growth",)
+    assert "intrinsic_value" in stats.recomputed_nodes
+    assert "projected_revenue" in stats.reused_nodes
+    assert "pv_fcff" in stats.reused_nodes
+    assert stats.recomputed_count + stats.reused_count == len(
+        graph.compile(inputs=_saas_inputs().keys()).steps
+    )
+    assert stats.reused_count > stats.recomputed_count
+
+
+def test_recalculate_chains_and_skips_unchanged_inputs() -> None:
+    graph = create_saas_graph()
+    graph.calculate(_saas_inputs(), emit_lifecycle_events=False)
+    graph.recalculate({"wacc": 0.09})
+
+    unchanged = graph.recalculate({"wacc": 0.09, "cash": 10.0})
+
+    assert graph.last_recalculation.changed_inputs == ()
+    assert graph.last_recalculation.recomputed_count == 0
+    expected = create_saas_graph().calculate(
+        {**_saas_inputs(), "wacc": 0.09}, emit_lifecycle_events=False
+    )
+    assert unchanged["intrinsic_value"] == expected["intrinsic_value"]
+
+
+def test_recalculate_stops_propagation_when_output_is_unchanged() -> None:
+    graph = CalculationGraph("cutoff")
+    graph.add_node("x")
+    graph.add_node("floored", lambda x: max(x, 0.0))
+    graph.add_node("doubled", lambda floored: floored * 2.0)
+    graph.calculate({"x": -1.0}, emit_lifecycle_events=False)
+
+    results = graph.recalculate({"x": -5.0})
+
+    assert results["doubled"] == 0.0
+    assert graph.last_recalculation.recomputed_nodes == ("floored",)
+    assert graph.last_recalculation.reused_nodes == ("doubled",)
+
+
+def test_recalculate_rejects_unknown_inputs_and_missing_baseline() -> None:
+    graph = create_saas_graph()
+    with pytest.raises(ValueError, match="no previous calculation"):
+        graph.recalculate({"wacc": 0.09})
+
+    graph.calculate(_saas_inputs(), emit_lifecycle_events=False)
+    with pytest.raises(ValueError, match="Unknown plan inputs"):
+        graph.recalculate({"fcff": [1.0]})
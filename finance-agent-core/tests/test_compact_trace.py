@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from src.agents.fundamental.domain.shared.contracts.traceable import (
+    ComputedProvenance,
+    TraceableField,
+    XBRLProvenance,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.calculators.dcf_standard_calculator import (
+    calculate_dcf_standard_valuation,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.compact_trace import (
+    CompactTrace,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.saas_fcff import (
+    create_saas_graph,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.models.dcf_standard.contracts import (
+    DCFStandardParams,
+)
+
+
+def _saas_inputs() -> dict[str, object]:
+    return {
+        "initial_revenue": TraceableField(
+            name="Revenue",
+            value=100.0,
+            provenance=XBRLProvenance(concept="us-gaap:Revenues", period="FY2025"),
+        ),
+        "growth_rates": [0.15, 0.14, 0.12, 0.10, 0.08],
+        "operating_margins": [0.10, 0.12, 0.14, 0.16, 0.18],
+        "tax_rate": 0.21,
+        "da_rates": [0.03, 0.03, 0.03, 0.03, 0.03],
+        "capex_rates": [0.05, 0.05, 0.05, 0.05, 0.05],
+        "wc_rates": [0.01, 0.01, 0.01, 0.01, 0.01],
+        "sbc_rates": [0.02, 0.02, 0.02, 0.02, 0.02],
+        "wacc": 0.10,
+        "terminal_growth": 0.025,
+        "cash": 10.0,
+        "total_debt": 5.0,
+        "preferred_stock": 0.0,
+        "shares_outstanding": 100.0,
+    }
+
+
+def test_compact_trace_materializes_the_full_trace() -> None:
+    full = create_saas_graph().calculate(
+        _saas_inputs(), trace=True, emit_lifecycle_events=False
+    )
+    compact = create_saas_graph().calculate_compact(
+        _saas_inputs(), emit_lifecycle_events=False
+    )
+
+    assert compact.materialize_all() == full
+    assert compact.raw_values()["intrinsic_value"] == full["intrinsic_value"].value
+    revenue = compact.materialize("projected_revenue")
+    assert isinstance(revenue.provenance, ComputedProvenance)
+    # Caller-supplied provenance is kept as-is, and subtrees are shared.
+    assert revenue.provenance.inputs["initial_revenue"].name == "Revenue"
+    assert compact.materialize("initial_revenue") is (
+        revenue.provenance.inputs["initial_revenue"]
+    )
+
+
+def test_compact_trace_serializes_flat_and_round_trips() -> None:
+    compact = create_saas_graph().calculate_compact(
+        _saas_inputs(), emit_lifecycle_events=False
+    )
+    payload = compact.model_dump(mode="json")
+
+    assert set(payload) == {
+        "graph_name",
+        "nodes",
+        "values",
+        "expressions",
+        "edge_offsets",
+        "edge_sources",
+        "fields",
+    }
+    assert len(payload["edge_offsets"]) == len(payload["nodes"]) + 1
+    assert list(payload["fields"]) == ["initial_revenue"]
+
+    restored = CompactTrace.model_validate(payload)
+    assert restored.materialize("intrinsic_value") == compact.materialize(
+        "intrinsic_value"
+    )
+
+
+def test_dcf_calculator_returns_compact_trace() -> None:
+    params = DCFStandardParams(
+        ticker="DCF",
+        rationale="unit-test",
+        initial_revenue=220.0,
+        growth_rates=[0.22, 0.20, 0.18, 0.16, 0.14],
+        operating_margins=[0.12, 0.13, 0.14, 0.15, 0.16],
+        tax_rate=0.21,
+        da_rates=[0.03] * 5,
+        capex_rates=[0.06] * 5,
+        wc_rates=[0.01] * 5,
+        sbc_rates=[0.015] * 5,
+        wacc=0.105,
+        terminal_growth=0.028,
+        shares_outstanding=120.0,
+        cash=25.0,
+        total_debt=12.0,
+        preferred_stock=0.0,
+        current_price=30.0,
+    )
+
+    result = calculate_dcf_standard_valuation(params)
+
+    trace = result["trace"]
+    assert isinstance(trace, CompactTrace)
+    assert trace.value("intrinsic_value") == result["intrinsic_value"]
+    assert trace.materialize("intrinsic_value").value == result["intrinsic_value"]
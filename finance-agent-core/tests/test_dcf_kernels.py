@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.agents.fundamental.subdomains.core_valuation.domain.calculators.saas_calculator import (
+    calculate_saas_valuation,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.dcf_kernels import (
+    DCF_KERNEL_DTYPE_ENV,
+    compound_levels,
+    guard_terminal_growth,
+    present_value,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.graphs.saas_fcff import (
+    create_saas_graph,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.models.saas.contracts import (
+    SaaSParams,
+)
+
+
+def _saas_params() -> SaaSParams:
+    return SaaSParams(
+        ticker="SAAS",
+        rationale="test",
+        initial_revenue=100.0,
+        growth_rates=[0.15, 0.14, 0.12, 0.10, 0.08],
+        operating_margins=[0.10, 0.12, 0.14, 0.16, 0.18],
+        tax_rate=0.21,
+        da_rates=[0.03, 0.03, 0.03, 0.03, 0.03],
+        capex_rates=[0.05, 0.05, 0.05, 0.05, 0.05],
+        wc_rates=[0.01, 0.01, 0.01, 0.01, 0.01],
+        sbc_rates=[0.02, 0.02, 0.02, 0.02, 0.02],
+        wacc=0.10,
+        terminal_growth=0.025,
+        shares_outstanding=100.0,
+        cash=10.0,
+        total_debt=5.0,
+        preferred_stock=0.0,
+        monte_carlo_iterations=500,
+        monte_carlo_seed=7,
+        monte_carlo_sampler="sobol",
+    )
+
+
+def test_compound_levels_matches_year_by_year_loop_exactly() -> None:
+    rng = np.random.default_rng(3)
+    growth = rng.normal(0.08, 0.05, size=(64, 7))
+    initial = rng.uniform(50.0, 150.0, size=64)
+
+    expected = np.empty_like(growth)
+    level = initial.copy()
+    for index in range(growth.shape[1]):
+        level = level * (1.0 + growth[:, index])
+        expected[:, index] = level
+
+    np.testing.assert_array_equal(compound_levels(initial, growth), expected)
+    # Scalar initial level broadcasts against a single (Y,) path.
+    np.testing.assert_array_equal(
+        compound_levels(100.0, growth[0]),
+        compound_levels(np.full(64, 100.0), growth)[0],
+    )
+
+
+def test_kernel_outputs_do_not_alias_reused_work_buffers() -> None:
+    first = compound_levels(1.0, np.full((4, 3), 0.1))
+    first_snapshot = first.copy()
+    second = compound_levels(2.0, np.full((4, 3), 0.1))
+
+    np.testing.assert_array_equal(first, first_snapshot)
+    assert not np.shares_memory(first, second)
+
+    cash_flows = np.ones((4, 3))
+    pv_low = present_value(cash_flows, np.full(4, 0.05))
+    pv_high = present_value(cash_flows, np.full(4, 0.10))
+    assert np.all(pv_low > pv_high)
+    expected = sum(1.0 / (1.05**period) for period in range(1, 4))
+    np.testing.assert_allclose(pv_low, expected, rtol=1e-15)
+
+
+def test_guard_terminal_growth_applies_bounds_and_spread() -> None:
+    guarded = guard_terminal_growth(
+        np.array([0.08, -0.05, 0.02]),
+        np.array([0.06, 0.10, 0.10]),
+        spread=0.005,
+        floor=-0.01,
+        cap=0.05,
+    )
+    np.testing.assert_allclose(guarded, [0.05, -0.01, 0.02])
+
+
+def test_calculation_plan_float32_path_keeps_kernel_dtype() -> None:
+    plan = create_saas_graph().compile(
+        inputs=(
+            "initial_revenue",
+            "tax_rate",
+            "da_rates",
+            "capex_rates",
+            "wc_rates",
+            "sbc_rates",
+            "cash",
+            "total_debt",
+            "preferred_stock",
+            "shares_outstanding",
+            "growth_rates",
+            "operating_margins",
+            "wacc",
+            "terminal_growth",
+        ),
+        outputs=("intrinsic_value",),
+    )
+    inputs: dict[str, object] = {
+        "initial_revenue": 100.0,
+        "tax_rate": 0.21,
+        "da_rates": np.full(5, 0.03),
+        "capex_rates": np.full(5, 0.05),
+        "wc_rates": np.full(5, 0.01),
+        "sbc_rates": np.full(5, 0.02),
+        "cash": 10.0,
+        "total_debt": 5.0,
+        "preferred_stock": 0.0,
+        "shares_outstanding": 100.0,
+        "growth_rates": np.tile([0.15, 0.14, 0.12, 0.10, 0.08], (32, 1)),
+        "operating_margins": np.tile([0.10, 0.12, 0.14, 0.16, 0.18], (32, 1)),
+        "wacc": np.linspace(0.08, 0.12, 32),
+        "terminal_growth": np.full(32, 0.025),
+    }
+
+    float64_values = plan.calculate_batch(inputs)["intrinsic_value"]
+    float32_values = plan.calculate_batch(inputs, dtype="float32")["intrinsic_value"]
+
+    assert isinstance(float32_values, np.ndarray)
+    assert float32_values.dtype == np.float32
+    np.testing.assert_allclose(float32_values, float64_values, rtol=1e-5)
+
+
+def test_saas_monte_carlo_float32_opt_in_tracks_float64(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    float64_result = calculate_saas_valuation(_saas_params())
+    monkeypatch.setenv(DCF_KERNEL_DTYPE_ENV, "float32")
+    float32_result = calculate_saas_valuation(_saas_params())
+
+    float64_summary = float64_result["details"]["distribution_summary"]["summary"]
+    float32_summary = float32_result["details"]["distribution_summary"]["summary"]
+    assert float32_result["intrinsic_value"] == float64_result["intrinsic_value"]
+    for key in ("mean", "median", "percentile_5", "percentile_95"):
+        assert float32_summary[key] == pytest.approx(float64_summary[key], rel=1e-5)
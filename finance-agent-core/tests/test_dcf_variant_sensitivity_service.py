@@ -11,6 +11,9 @@ from src.agents.fundamental.subdomains.core_valuation.domain.calculators.dcf_var
 from src.agents.fundamental.subdomains.core_valuation.domain.calculators.dcf_variant_result_service import (
     build_dcf_variant_static_inputs,
 )
+from src.agents.fundamental.subdomains.core_valuation.domain.calculators.dcf_variant_sensitivity_contracts import (
+    DcfSensitivitySurfaceSpec,
+)
 from src.agents.fundamental.subdomains.core_valuation.domain.calculators.dcf_variant_sensitivity_service import (
     run_dcf_variant_sensitivity,
 )
@@ -174,6 +177,87 @@ def test_run_dcf_variant_sensitivity_builds_expected_case_set() -> None:
     assert wacc_down["intrinsic_value"] > wacc_up["intrinsic_value"]
     assert wacc_down["delta_pct_vs_base"] > 0
     assert wacc_up["delta_pct_vs_base"] < 0
+    assert summary["surface"] is None
+
+
+def test_run_dcf_variant_sensitivity_surface_matches_one_at_a_time_cases() -> None:
+    base_intrinsic_value, converged_inputs, static_inputs = _build_sensitivity_inputs()
+    kwargs = _base_kwargs()
+    spec = DcfSensitivitySurfaceSpec()
+    summary = run_dcf_variant_sensitivity(
+        base_intrinsic_value=base_intrinsic_value,
+        converged_inputs=converged_inputs,
+        static_inputs=static_inputs,
+        base_wacc=float(kwargs["wacc"]),
+        base_terminal_growth=float(kwargs["terminal_growth"]),
+        policy=_policy(),
+        surface_spec=spec,
+    )
+
+    surface = summary["surface"]
+    assert surface is not None
+    assert [axis["dimension"] for axis in surface["axes"]] == [
+        "wacc",
+        "terminal_growth",
+    ]
+    assert surface["shape"] == [9, 9]
+    assert surface["point_count"] == 81
+    assert len(summary["top_drivers"]) == 5
+
+    base_terminal_index = spec.terminal_growth_shocks_bp.index(0)
+    base_wacc_index = spec.wacc_shocks_bp.index(0)
+    for case in summary["cases"]:
+        if case["shock_dimension"] == "wacc":
+            point = surface["intrinsic_values"][
+                spec.wacc_shocks_bp.index(case["shock_value_bp"])
+            ][base_terminal_index]
+        elif case["shock_dimension"] == "terminal_growth":
+            point = surface["intrinsic_values"][base_wacc_index][
+                spec.terminal_growth_shocks_bp.index(case["shock_value_bp"])
+            ]
+        else:
+            continue
+        assert point == pytest.approx(case["intrinsic_value"], rel=1e-12)
+
+    values = surface["intrinsic_values"]
+    # Lower WACC and higher terminal growth both raise value.
+    assert values[0][base_terminal_index] > values[-1][base_terminal_index]
+    assert values[base_wacc_index][-1] > values[base_wacc_index][0]
+    assert surface["max_upside_delta_pct"] >= summary["max_upside_delta_pct"]
+    assert surface["max_downside_delta_pct"] <= summary["max_downside_delta_pct"]
+
+
+def test_run_dcf_variant_sensitivity_surface_adds_level_axes() -> None:
+    base_intrinsic_value, converged_inputs, static_inputs = _build_sensitivity_inputs()
+    spec = DcfSensitivitySurfaceSpec(
+        wacc_shocks_bp=(-100, 0, 100),
+        terminal_growth_shocks_bp=(-50, 0, 50),
+        growth_level_shocks_bp=(-200, 0, 200),
+        margin_level_shocks_bp=(-100, 100),
+    )
+    summary = run_dcf_variant_sensitivity(
+        base_intrinsic_value=base_intrinsic_value,
+        converged_inputs=converged_inputs,
+        static_inputs=static_inputs,
+        base_wacc=0.052,
+        base_terminal_growth=0.054,
+        policy=_policy(),
+        surface_spec=spec,
+    )
+
+    surface = summary["surface"]
+    assert surface is not None
+    assert surface["shape"] == [3, 3, 3, 2]
+    assert surface["point_count"] == 54
+    assert [axis["dimension"] for axis in surface["axes"]][2:] == [
+        "growth_level",
+        "margin_level",
+    ]
+    # WACC 4.2% cannot support any clamped terminal rate without the guard.
+    assert surface["guard_applied"][0] == [True, True, True]
+    growth_slice = surface["intrinsic_values"][2][0]
+    assert growth_slice[0][0] < growth_slice[2][0]
+    assert growth_slice[0][0] < growth_slice[0][1]
 
 
 def test_run_dcf_variant_sensitivity_marks_terminal_guard_when_needed() -> None:
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_outcome_capture_service import (
+    CapturedOutcomes,
+    build_mixture_summary,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.ensemble import (
+    EnsembleMember,
+    EnsembleValuationResult,
+    run_ensemble_valuation,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization import (
+    ParamBuildResult,
+    build_params,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.valuation_model import (
+    ValuationModel,
+)
+from src.agents.fundamental.subdomains.model_selection.domain.model_selection import (
+    ModelCandidate,
+    select_ensemble_candidates,
+)
+
+
+def _load_replay_fixture() -> dict[str, object]:
+    fixture_path = (
+        Path(__file__).resolve().parent
+        / "fixtures"
+        / "fundamental_replay_inputs"
+        / "aapl.replay.json"
+    )
+    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
+    assert isinstance(payload, dict)
+    return payload
+
+
+def _outcomes(values: np.ndarray) -> CapturedOutcomes:
+    return CapturedOutcomes(
+        values=values,
+        weights=np.ones(values.shape[0], dtype=float),
+        executed_iterations=values.shape[0],
+    )
+
+
+def test_mixture_summary_of_single_component_matches_numpy() -> None:
+    values = np.random.default_rng(7).normal(10.0, 2.0, 5_000)
+
+    summary = build_mixture_summary([(_outcomes(values), 1.0)])
+
+    assert summary["mean"] == pytest.approx(float(np.mean(values)))
+    assert summary["std"] == pytest.approx(float(np.std(values)))
+    assert summary["median"] == pytest.approx(float(np.median(values)), abs=1e-2)
+    assert summary["percentile_5"] == pytest.approx(
+        float(np.percentile(values, 5)), abs=1e-2
+    )
+    assert summary["min"] == float(np.min(values))
+    assert summary["max"] == float(np.max(values))
+
+
+def test_mixture_summary_weights_components_independent_of_sample_size() -> None:
+    low = _outcomes(np.zeros(100))
+    high = _outcomes(np.ones(10_000))
+
+    summary = build_mixture_summary([(low, 0.75), (high, 0.25)])
+
+    assert summary["mean"] == pytest.approx(0.25)
+    assert summary["median"] == 0.0
+    assert summary["percentile_95"] == 1.0
+    with pytest.raises(ValueError):
+        build_mixture_summary([(low, 0.0)])
+
+
+def test_select_ensemble_candidates_returns_top_k_with_softmax_weights() -> None:
+    candidates = [
+        ModelCandidate(ValuationModel.EV_REVENUE, 0.5, (), ()),
+        ModelCandidate(ValuationModel.DCF_STANDARD, 2.0, (), ()),
+        ModelCandidate(ValuationModel.DCF_GROWTH, 1.0, (), ()),
+        ModelCandidate(ValuationModel.DDM, -1.0, (), ()),
+    ]
+
+    selected = select_ensemble_candidates(candidates, top_k=3)
+    sharp = select_ensemble_candidates(candidates, top_k=3, temperature=0.1)
+
+    assert [candidate.model for candidate, _ in selected] == [
+        ValuationModel.DCF_STANDARD,
+        ValuationModel.DCF_GROWTH,
+        ValuationModel.EV_REVENUE,
+    ]
+    weights = [weight for _, weight in selected]
+    assert sum(weights) == pytest.approx(1.0)
+    assert weights[0] / weights[1] == pytest.approx(np.e)
+    assert sharp[0][1] > 0.99
+
+
+def test_ensemble_valuation_shares_draws_and_blends_member_distributions() -> None:
+    fixture = _load_replay_fixture()
+
+    result = run_ensemble_valuation(
+        ticker=str(fixture["ticker"]),
+        financial_reports=fixture["reports"],
+        market_snapshot=fixture["market_snapshot"],
+        members=[
+            EnsembleMember("dcf_standard", 0.5),
+            EnsembleMember("dcf_growth", 0.3),
+            EnsembleMember("saas", 0.2),
+        ],
+    )
+
+    assert [item.model for item in result.models] == [
+        "dcf_standard",
+        "dcf_growth",
+        "saas",
+    ]
+    assert all(item.status == "ok" for item in result.models)
+    assert all(item.distribution_summary is not None for item in result.models)
+    assert all(item.executed_iterations > 0 for item in result.models)
+    # Later members reuse the leading member's draws instead of sampling again.
+    assert result.sample_store["hits"] > 0
+
+    expected = sum(item.intrinsic_value * item.weight for item in result.models) / sum(
+        item.weight for item in result.models
+    )
+    assert result.blended_intrinsic_value == pytest.approx(expected)
+    blended = result.blended_distribution
+    assert blended is not None
+    medians = [item.distribution_summary["median"] for item in result.models]
+    assert min(medians) <= blended["median"] <= max(medians)
+    assert blended["percentile_5"] <= blended["median"] <= blended["percentile_95"]
+
+
+def test_ensemble_valuation_reports_missing_inputs_and_merges_aliases() -> None:
+    fixture = _load_replay_fixture()
+
+    result = run_ensemble_valuation(
+        ticker=str(fixture["ticker"]),
+        financial_reports=fixture["reports"],
+        market_snapshot=fixture["market_snapshot"],
+        members=[
+            EnsembleMember("dcf_standard", 0.4),
+            EnsembleMember("ddm", 0.3),
+            EnsembleMember("bank", 0.3),
+        ],
+    )
+
+    assert [item.model for item in result.models] == ["dcf_standard", "bank"]
+    bank = result.models[1]
+    assert bank.weight == pytest.approx(0.6)
+    assert bank.status == "missing_inputs"
+    assert bank.missing
+    # The blend renormalizes over the members that valued successfully.
+    assert result.blended_intrinsic_value == pytest.approx(
+        result.models[0].intrinsic_value
+    )
+
+
+def test_ensemble_members_keep_their_own_iteration_counts() -> None:
+    fixture = _load_replay_fixture()
+
+    def build_without_leading_monte_carlo(
+        model: str, *args: object
+    ) -> ParamBuildResult:
+        build = build_params(model, *args)
+        if model != "dcf_standard":
+            return build
+        return replace(build, params={**build.params, "monte_carlo_iterations": 0})
+
+    def run(members: list[EnsembleMember]) -> EnsembleValuationResult:
+        return run_ensemble_valuation(
+            ticker=str(fixture["ticker"]),
+            financial_reports=fixture["reports"],
+            market_snapshot=fixture["market_snapshot"],
+            members=members,
+            build_params_fn=build_without_leading_monte_carlo,
+        )
+
+    result = run(
+        [
+            EnsembleMember("dcf_standard", 0.5),
+            EnsembleMember("dcf_growth", 0.3),
+            EnsembleMember("saas", 0.2),
+        ]
+    )
+    stochastic_only = run(
+        [EnsembleMember("dcf_growth", 0.3), EnsembleMember("saas", 0.2)]
+    )
+
+    leading, *others = result.models
+    assert all(item.status == "ok" for item in result.models)
+    # A leader without Monte Carlo no longer switches it off for everyone.
+    assert leading.executed_iterations == 0
+    assert all(item.executed_iterations > 0 for item in others)
+    expected = sum(item.intrinsic_value * item.weight for item in result.models)
+    assert result.blended_intrinsic_value == pytest.approx(expected)
+    # The distribution mixes only the members that have one, renormalized.
+    assert result.blended_distribution == pytest.approx(
+        stochastic_only.blended_distribution
+    )
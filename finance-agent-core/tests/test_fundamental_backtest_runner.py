@@ -6,14 +6,19 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 from src.agents.fundamental.subdomains.core_valuation.domain.backtest import (
     BacktestCase,
     BacktestConfig,
+    BacktestResultCache,
     build_baseline_payload,
     compare_with_baseline,
     load_baseline,
     load_cases,
+    resolve_backtest_workers,
     run_cases,
+    run_cases_with_timings,
 )
 
 
@@ -202,6 +207,92 @@ def test_fixture_dataset_matches_fixture_baseline() -> None:
     assert issues == []
 
 
+def test_parallel_run_matches_serial_run_in_case_order() -> None:
+    fixture_path = (
+        Path(__file__).resolve().parent / "fixtures" / "fundamental_backtest_cases.json"
+    )
+    cases = load_cases(fixture_path)
+
+    serial = run_cases(cases)
+    parallel, timings = run_cases_with_timings(cases, workers=2)
+
+    assert parallel == serial
+    assert [item.case_id for item in timings] == [case.case_id for case in cases]
+    assert all(not item.cached and item.elapsed_ms > 0.0 for item in timings)
+
+
+def test_result_cache_reuses_results_and_keys_on_code_version(
+    tmp_path: Path,
+) -> None:
+    fixture_path = (
+        Path(__file__).resolve().parent / "fixtures" / "fundamental_backtest_cases.json"
+    )
+    cases = load_cases(fixture_path)
+    cache = BacktestResultCache(tmp_path / "cache", code_version="v-test")
+    progress: list[tuple[int, int, bool]] = []
+
+    first, _ = run_cases_with_timings(cases, cache=cache)
+    second, timings = run_cases_with_timings(
+        cases,
+        cache=cache,
+        progress=lambda done, total, timing: progress.append(
+            (done, total, timing.cached)
+        ),
+    )
+
+    assert second == first
+    assert all(item.cached for item in timings)
+    assert progress == [(index + 1, len(cases), True) for index in range(len(cases))]
+
+    # Same inputs under a new case id still hit; a new code version misses.
+    renamed = BacktestCase(
+        case_id="renamed_case",
+        model=cases[0].model,
+        params=cases[0].params,
+        required_metrics=cases[0].required_metrics,
+        consensus_target_price_median=cases[0].consensus_target_price_median,
+        target_consensus_quality_bucket=cases[0].target_consensus_quality_bucket,
+        target_consensus_confidence_weight=cases[0].target_consensus_confidence_weight,
+        target_consensus_warning_codes=cases[0].target_consensus_warning_codes,
+    )
+    cached = cache.get(renamed)
+    assert cached is not None and cached.case_id == "renamed_case"
+    assert cached.metrics == first[0].metrics
+    new_version = BacktestResultCache(tmp_path / "cache", code_version="v-next")
+    assert new_version.get(cases[0]) is None
+
+
+def test_result_cache_keys_on_result_affecting_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fixture_path = (
+        Path(__file__).resolve().parent / "fixtures" / "fundamental_backtest_cases.json"
+    )
+    case = next(
+        item for item in load_cases(fixture_path) if item.case_id == "saas_mc_seeded"
+    )
+    cache = BacktestResultCache(tmp_path / "cache", code_version="v-test")
+    monkeypatch.delenv("FUNDAMENTAL_DCF_KERNEL_DTYPE", raising=False)
+    run_cases_with_timings([case], cache=cache)
+    assert cache.get(case) is not None
+
+    monkeypatch.setenv("FUNDAMENTAL_DCF_KERNEL_DTYPE", "float32")
+    assert cache.get(case) is None
+    _, timings = run_cases_with_timings([case], cache=cache)
+    assert not timings[0].cached
+
+    monkeypatch.setenv("FUNDAMENTAL_DCF_KERNEL_DTYPE", "float64")
+    assert cache.get(case) is not None
+
+
+def test_resolve_backtest_workers_keeps_small_datasets_in_process() -> None:
+    assert resolve_backtest_workers("auto", case_count=6) == 1
+    assert resolve_backtest_workers("3", case_count=6) == 3
+    assert resolve_backtest_workers("bogus", case_count=6) == 1
+    assert resolve_backtest_workers(None, case_count=100) == 1
+
+
 def test_compare_with_baseline_has_no_drift_for_identical_payload(
     tmp_path: Path,
 ) -> None:
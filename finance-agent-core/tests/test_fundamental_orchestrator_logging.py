@@ -1098,7 +1098,7 @@ async def test_run_valuation_offloads_execution_calculation_to_thread() -> None:
         return func(*args, **kwargs)  # type: ignore[misc]
 
     with patch(
-        "src.agents.fundamental.application.workflow_orchestrator.valuation_flow.asyncio.to_thread",
+        "src.agents.fundamental.application.workflow_orchestrator.services.valuation_compute_executor_service.asyncio.to_thread",
         side_effect=_fake_to_thread,
     ):
         result = await orchestrator.run_valuation(
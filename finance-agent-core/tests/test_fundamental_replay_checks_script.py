@@ -725,3 +725,47 @@ def test_run_replay_checks_fails_when_forward_signal_trace_fields_missing(
     assert summary.get("trace_contract_passed_cases") == 0
     assert summary.get("trace_contract_pass_rate") == 0.0
     assert summary.get("error_code_counts") == {"forward_signal_trace_missing": 1}
+
+
+def test_replay_cases_parallel_matches_sequential_with_timing_breakdown() -> None:
+    module = _load_script_module()
+    fixture_dir = (
+        Path(__file__).resolve().parents[1]
+        / "tests"
+        / "fixtures"
+        / "fundamental_replay_inputs"
+    )
+    input_paths = [fixture_dir / "aapl.replay.json", fixture_dir / "nvda.replay.json"]
+
+    sequential = module._replay_cases(
+        input_paths=input_paths,
+        abs_tol=1e-6,
+        rel_tol=1e-4,
+        replay_mode="in_process",
+        workers=1,
+    )
+    parallel = module._replay_cases(
+        input_paths=input_paths,
+        abs_tol=1e-6,
+        rel_tol=1e-4,
+        replay_mode="in_process",
+        workers=2,
+    )
+
+    assert [code for code, _, _ in sequential] == [0, 0]
+    assert [code for code, _, _ in parallel] == [0, 0]
+    for (_, seq_payload, _), (_, par_payload, duration_ms) in zip(
+        sequential, parallel, strict=True
+    ):
+        assert seq_payload is not None and par_payload is not None
+        assert par_payload["ticker"] == seq_payload["ticker"]
+        assert (
+            par_payload["replayed_intrinsic_value"]
+            == seq_payload["replayed_intrinsic_value"]
+        )
+        assert set(par_payload["replay_timing_ms"]) == {
+            "input_load",
+            "valuation",
+            "report",
+        }
+        assert duration_ms > 0.0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import numpy as np
 import pytest
 
@@ -9,6 +11,36 @@ from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo
     MonteCarloConfig,
     MonteCarloEngine,
 )
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_diagnostics_service import (
+    _rankdata_columns,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_parallel_service import (
+    shutdown_monte_carlo_process_pools,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_psd_service import (
+    clear_correlation_factor_cache,
+    correlation_factor_cache_info,
+    resolve_correlation_factor,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_sample_store_service import (
+    use_monte_carlo_sample_store,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_sketch_service import (
+    StreamingQuantileSketch,
+    build_sketch_accuracy_diagnostics,
+)
+
+
+def _sum_product_evaluator(
+    sampled_batch: dict[str, np.ndarray], _base_inputs: object
+) -> np.ndarray:
+    return sampled_batch["a"] + sampled_batch["b"] * sampled_batch["c"]
+
+
+@pytest.fixture
+def monte_carlo_process_pools():
+    yield
+    shutdown_monte_carlo_process_pools()
 
 
 def test_monte_carlo_engine_reproducible_with_seed() -> None:
@@ -108,6 +140,53 @@ def test_monte_carlo_engine_repairs_non_psd_covariance_by_default() -> None:
     assert result.diagnostics["psd_repair_failed_groups"] == 0
 
 
+def test_correlation_factor_cache_reuses_repair_across_runs() -> None:
+    clear_correlation_factor_cache()
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+    }
+    correlation_groups = (
+        CorrelationGroup(variables=("a", "b"), matrix=((1.0, 1.2), (1.2, 1.0))),
+    )
+
+    def _run(config: MonteCarloConfig):
+        return MonteCarloEngine(config).run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=lambda sampled_batch, _base_inputs: sampled_batch["a"]
+            + sampled_batch["b"],
+            correlation_groups=correlation_groups,
+        )
+
+    first = _run(MonteCarloConfig(iterations=300, seed=1))
+    second = _run(MonteCarloConfig(iterations=300, seed=1))
+    assert correlation_factor_cache_info()["misses"] == 1
+    assert correlation_factor_cache_info()["hits"] == 1
+    assert second.summary == first.summary
+    assert second.diagnostics == first.diagnostics
+
+    # A different repair policy is a different entry.
+    _run(MonteCarloConfig(iterations=300, seed=1, psd_repair_policy="higham"))
+    assert correlation_factor_cache_info()["misses"] == 2
+
+
+def test_resolve_correlation_factor_returns_read_only_factor() -> None:
+    clear_correlation_factor_cache()
+    corr = np.array([[1.0, 0.3], [0.3, 1.0]])
+    config = MonteCarloConfig()
+
+    first = resolve_correlation_factor(corr, config=config)
+    first.diagnostics["psd_repaired"] = True
+    second = resolve_correlation_factor(corr, config=config)
+
+    assert second.cholesky is first.cholesky
+    assert np.allclose(second.cholesky @ second.cholesky.T, corr)
+    assert second.diagnostics["psd_repaired"] is False
+    with pytest.raises(ValueError):
+        second.matrix[0, 1] = 0.0
+
+
 def test_monte_carlo_engine_supports_correlated_non_normal_distributions() -> None:
     engine = MonteCarloEngine(MonteCarloConfig(iterations=2000, seed=9))
     distributions = {
@@ -219,6 +298,7 @@ def test_monte_carlo_engine_stops_early_when_converged() -> None:
     assert diagnostics["sufficient_window"] is True
     assert diagnostics["stopped_early"] is True
     assert diagnostics["executed_iterations"] == 300
+    assert diagnostics["sampled_iterations"] == 300
 
 
 def test_monte_carlo_engine_supports_lhs_sampler_with_diagnostics() -> None:
@@ -293,3 +373,520 @@ def test_monte_carlo_engine_sets_batch_diagnostics_flag() -> None:
     )
 
     assert result.diagnostics["batch_evaluator_used"] is True
+
+
+@pytest.mark.parametrize("sampler_type", ["pseudo", "sobol", "lhs"])
+def test_monte_carlo_engine_results_do_not_depend_on_batch_size(
+    sampler_type: str,
+) -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="uniform", low=-1.0, high=1.0),
+        "c": DistributionSpec(kind="normal", mean=2.0, std=0.5),
+    }
+    correlation_groups = (
+        CorrelationGroup(variables=("a", "b"), matrix=((1.0, 0.4), (0.4, 1.0))),
+    )
+
+    def run(batch_size: int) -> dict[str, float]:
+        engine = MonteCarloEngine(
+            MonteCarloConfig(
+                iterations=1000,
+                min_iterations=1000,
+                batch_size=batch_size,
+                seed=41,
+                sampler_type=sampler_type,
+            )
+        )
+        return engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=lambda sampled_batch, _base_inputs: sampled_batch["a"]
+            + sampled_batch["b"] * sampled_batch["c"],
+            correlation_groups=correlation_groups,
+        ).summary
+
+    single_batch = run(1000)
+    streamed = run(96)
+    for key, value in single_batch.items():
+        assert streamed[key] == pytest.approx(value, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("sampler_type", ["pseudo", "sobol", "lhs"])
+def test_monte_carlo_engine_results_do_not_depend_on_worker_count(
+    sampler_type: str,
+    monte_carlo_process_pools: None,
+) -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="uniform", low=-1.0, high=1.0),
+        "c": DistributionSpec(kind="normal", mean=2.0, std=0.5),
+    }
+    correlation_groups = (
+        CorrelationGroup(variables=("a", "b"), matrix=((1.0, 0.4), (0.4, 1.0))),
+    )
+
+    def run(workers: int) -> dict[str, object]:
+        engine = MonteCarloEngine(
+            MonteCarloConfig(
+                iterations=1500,
+                min_iterations=1500,
+                batch_size=100,
+                seed=43,
+                sampler_type=sampler_type,
+                workers=workers,
+                parallel_min_iterations=0,
+                parallel_shard_batches=2,
+            )
+        )
+        result = engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=_sum_product_evaluator,
+            correlation_groups=correlation_groups,
+        )
+        return {**result.summary, **result.diagnostics}
+
+    serial = run(1)
+    parallel = run(2)
+
+    assert parallel["parallel_workers"] == 2
+    assert "parallel_fallback_reason" not in parallel
+    for key in (
+        "mean",
+        "median",
+        "percentile_5",
+        "percentile_95",
+        "corr_pearson_mae",
+        "corr_spearman_mae",
+        "sampled_iterations",
+    ):
+        assert parallel[key] == serial[key]
+
+
+def test_monte_carlo_engine_parallel_run_stops_at_serial_convergence_point(
+    monte_carlo_process_pools: None,
+) -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=1.0, std=0.01),
+        "b": DistributionSpec(kind="normal", mean=0.0, std=0.01),
+        "c": DistributionSpec(kind="normal", mean=1.0, std=0.01),
+    }
+
+    def run(workers: int) -> dict[str, float | bool | int | str]:
+        engine = MonteCarloEngine(
+            MonteCarloConfig(
+                iterations=4000,
+                min_iterations=300,
+                batch_size=100,
+                convergence_window=120,
+                dynamic_window_min=50,
+                seed=17,
+                workers=workers,
+                parallel_min_iterations=0,
+            )
+        )
+        return engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=_sum_product_evaluator,
+        ).diagnostics
+
+    serial = run(1)
+    parallel = run(3)
+
+    assert parallel["stopped_early"] is True
+    assert parallel["executed_iterations"] == serial["executed_iterations"]
+    assert parallel["sampled_iterations"] == serial["executed_iterations"]
+
+
+def test_monte_carlo_engine_falls_back_to_serial_for_unpicklable_evaluator() -> None:
+    engine = MonteCarloEngine(
+        MonteCarloConfig(
+            iterations=500,
+            seed=5,
+            workers=4,
+            parallel_min_iterations=0,
+        )
+    )
+    result = engine.run(
+        base_inputs={},
+        distributions={"x": DistributionSpec(kind="normal", mean=1.0, std=0.1)},
+        batch_evaluator=lambda sampled_batch, _base_inputs: sampled_batch["x"],
+    )
+
+    assert result.diagnostics["parallel_workers_requested"] == 4
+    assert result.diagnostics["parallel_workers"] == 1
+    assert (
+        result.diagnostics["parallel_fallback_reason"]
+        == "batch_evaluator is not picklable"
+    )
+
+
+def test_monte_carlo_engine_sketch_summary_tracks_exact_percentiles() -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="uniform", low=-1.0, high=1.0),
+        "c": DistributionSpec(kind="normal", mean=2.0, std=0.5),
+    }
+
+    def run(summary_backend: str) -> tuple[dict[str, float], dict[str, object]]:
+        engine = MonteCarloEngine(
+            MonteCarloConfig(
+                iterations=20_000,
+                min_iterations=20_000,
+                seed=29,
+                summary_backend=summary_backend,
+                sketch_exact_check=True,
+            )
+        )
+        result = engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=_sum_product_evaluator,
+        )
+        return result.summary, result.diagnostics
+
+    exact_summary, exact_diagnostics = run("exact")
+    sketch_summary, sketch_diagnostics = run("sketch")
+
+    assert exact_diagnostics["summary_backend"] == "exact"
+    assert "sketch_centroids" not in exact_diagnostics
+    assert sketch_diagnostics["summary_backend"] == "sketch"
+    assert sketch_diagnostics["sketch_centroids"] <= 201
+    assert sketch_diagnostics["sketch_max_rank_error"] < 0.002
+    assert sketch_diagnostics["converged"] == exact_diagnostics["converged"]
+    for key in ("mean", "std", "min", "max"):
+        assert sketch_summary[key] == pytest.approx(exact_summary[key], rel=1e-9)
+    for key in ("percentile_5", "median", "percentile_95"):
+        assert sketch_summary[key] == pytest.approx(exact_summary[key], abs=0.02)
+
+
+def test_streaming_quantile_sketch_merges_shards() -> None:
+    values = np.random.default_rng(3).lognormal(size=40_000)
+    merged = StreamingQuantileSketch(compression=200)
+    for shard in np.split(values, 4):
+        shard_sketch = StreamingQuantileSketch(compression=200)
+        for batch in np.split(shard, 20):
+            shard_sketch.update(batch)
+        merged.merge(shard_sketch)
+
+    summary = merged.summary()
+    accuracy = build_sketch_accuracy_diagnostics(merged, values)
+
+    assert merged.count == values.size
+    assert merged.centroid_count <= 101
+    assert summary["mean"] == pytest.approx(float(np.mean(values)), rel=1e-12)
+    assert summary["std"] == pytest.approx(float(np.std(values)), rel=1e-9)
+    assert accuracy["sketch_max_rank_error"] < 0.005
+    assert accuracy["sketch_max_rank_error"] <= merged.rank_error_bound() + 1e-4
+
+
+def test_streaming_quantile_sketch_is_exact_before_compression() -> None:
+    values = np.array([4.0, 1.0, 3.0, 2.0, 10.0])
+    sketch = StreamingQuantileSketch()
+    sketch.update(values)
+
+    percentiles = np.array([0.0, 5.0, 50.0, 95.0, 100.0])
+    np.testing.assert_allclose(
+        sketch.quantiles(percentiles), np.percentile(values, percentiles)
+    )
+    assert sketch.rank_error_bound() == 0.0
+
+
+def test_rankdata_averages_ties_per_column() -> None:
+    matrix = np.array(
+        [
+            [3.0, 1.0],
+            [1.0, 1.0],
+            [3.0, 2.0],
+            [2.0, 1.0],
+            [3.0, 0.5],
+        ]
+    )
+
+    ranks = _rankdata_columns(matrix)
+
+    np.testing.assert_array_equal(ranks[:, 0], [4.0, 1.0, 4.0, 2.0, 4.0])
+    np.testing.assert_array_equal(ranks[:, 1], [3.0, 3.0, 5.0, 3.0, 1.0])
+    # Columns are ranked independently of each other.
+    np.testing.assert_array_equal(_rankdata_columns(matrix[:, 1:])[:, 0], ranks[:, 1])
+    assert _rankdata_columns(np.empty((0, 3))).shape == (0, 3)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_monte_carlo_engine_subsamples_correlation_diagnostics(
+    workers: int,
+    monte_carlo_process_pools: None,
+) -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="uniform", low=-1.0, high=1.0),
+        "c": DistributionSpec(kind="normal", mean=2.0, std=0.5),
+    }
+    correlation_groups = (
+        CorrelationGroup(variables=("a", "b"), matrix=((1.0, 0.6), (0.6, 1.0))),
+    )
+
+    def run(
+        *, batch_size: int, max_samples: int, run_workers: int
+    ) -> dict[str, object]:
+        engine = MonteCarloEngine(
+            MonteCarloConfig(
+                iterations=6000,
+                min_iterations=6000,
+                batch_size=batch_size,
+                seed=13,
+                workers=run_workers,
+                parallel_min_iterations=0,
+                corr_diagnostics_max_samples=max_samples,
+            )
+        )
+        return engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=_sum_product_evaluator,
+            correlation_groups=correlation_groups,
+        ).diagnostics
+
+    full = run(batch_size=500, max_samples=0, run_workers=1)
+    subsampled = run(batch_size=500, max_samples=800, run_workers=workers)
+    rebatched = run(batch_size=170, max_samples=800, run_workers=1)
+
+    assert full["corr_sample_size"] == 6000
+    assert full["corr_subsampled"] is False
+    assert subsampled["corr_sample_size"] == 800
+    assert subsampled["corr_subsampled"] is True
+    assert subsampled["sampled_iterations"] == 6000
+    assert (
+        float(subsampled["corr_pearson_error_bar"])
+        > float(full["corr_pearson_error_bar"])
+        > 0.0
+    )
+    assert float(subsampled["corr_spearman_max_abs_error"]) <= 2.0 * float(
+        subsampled["corr_spearman_error_bar"]
+    )
+    for key in ("corr_pearson_mae", "corr_spearman_mae", "corr_spearman_error_bar"):
+        assert subsampled[key] == rebatched[key]
+
+
+def test_monte_carlo_engine_antithetic_pairs_cancel_linear_response() -> None:
+    config = MonteCarloConfig(
+        iterations=2000, min_iterations=2000, seed=3, sampler_type="pseudo"
+    )
+    distributions = {"x": DistributionSpec(kind="normal", mean=10.0, std=2.0)}
+
+    def run(antithetic: bool) -> dict[str, float | bool | int | str]:
+        engine = MonteCarloEngine(replace(config, antithetic=antithetic))
+        result = engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=lambda sampled_batch, _base_inputs: sampled_batch["x"],
+        )
+        return {**result.summary, **result.diagnostics}
+
+    plain = run(False)
+    paired = run(True)
+
+    assert plain["variance_reduction"] == "none"
+    assert "antithetic_variance_ratio" not in plain
+    assert paired["variance_reduction"] == "antithetic"
+    assert paired["antithetic_pairs"] == 1000
+    assert paired["antithetic_variance_ratio"] < 1e-6
+    assert paired["mean"] == pytest.approx(10.0, abs=1e-6)
+    assert abs(paired["mean"] - 10.0) < abs(plain["mean"] - 10.0)
+
+
+def test_monte_carlo_engine_control_variate_adjusts_mean_and_reports_ratio() -> None:
+    engine = MonteCarloEngine(
+        MonteCarloConfig(
+            iterations=2000,
+            min_iterations=2000,
+            seed=9,
+            sampler_type="pseudo",
+            control_variate=True,
+        )
+    )
+    result = engine.run(
+        base_inputs={},
+        distributions={
+            "a": DistributionSpec(kind="normal", mean=1.0, std=0.5),
+            "b": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        },
+        # E[a + a**2 + b] = 1 + (1 + 0.25) = 2.25; fully spanned by z, z**2.
+        batch_evaluator=lambda sampled_batch, _base_inputs: (
+            sampled_batch["a"] + sampled_batch["a"] ** 2 + sampled_batch["b"]
+        ),
+    )
+
+    diagnostics = result.diagnostics
+    assert diagnostics["variance_reduction"] == "control_variate"
+    assert diagnostics["control_variate_count"] == 4
+    assert diagnostics["cv_variance_ratio"] < 1e-3
+    assert diagnostics["cv_mean_std_error"] < diagnostics["raw_mean_std_error"]
+    assert result.summary["mean"] == pytest.approx(2.25, abs=1e-3)
+    assert abs(result.summary["mean"] - 2.25) < abs(diagnostics["raw_mean"] - 2.25)
+
+
+@pytest.mark.parametrize("sampler_type", ["pseudo", "sobol", "lhs"])
+def test_monte_carlo_engine_variance_reduction_does_not_depend_on_worker_count(
+    sampler_type: str,
+    monte_carlo_process_pools: None,
+) -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="uniform", low=-1.0, high=1.0),
+        "c": DistributionSpec(kind="normal", mean=2.0, std=0.5),
+    }
+    correlation_groups = (
+        CorrelationGroup(variables=("a", "b"), matrix=((1.0, 0.4), (0.4, 1.0))),
+    )
+
+    def run(workers: int, batch_size: int) -> dict[str, object]:
+        engine = MonteCarloEngine(
+            MonteCarloConfig(
+                iterations=1500,
+                min_iterations=1500,
+                batch_size=batch_size,
+                seed=43,
+                sampler_type=sampler_type,
+                workers=workers,
+                parallel_min_iterations=0,
+                parallel_shard_batches=2,
+                antithetic=True,
+                control_variate=True,
+            )
+        )
+        result = engine.run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=_sum_product_evaluator,
+            correlation_groups=correlation_groups,
+        )
+        return {**result.summary, **result.diagnostics}
+
+    serial = run(1, 100)
+    parallel = run(2, 100)
+    rebatched = run(1, 300)
+
+    assert parallel["parallel_workers"] == 2
+    assert serial["variance_reduction"] == "antithetic+control_variate"
+    for key in (
+        "mean",
+        "median",
+        "raw_mean",
+        "antithetic_variance_ratio",
+        "cv_variance_ratio",
+    ):
+        assert parallel[key] == serial[key]
+        assert rebatched[key] == pytest.approx(serial[key], rel=1e-9)
+
+
+def test_monte_carlo_engine_rejects_odd_batch_size_for_antithetic() -> None:
+    with pytest.raises(ValueError, match="batch_size must be even"):
+        MonteCarloEngine(MonteCarloConfig(batch_size=125, antithetic=True))
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"sampler_type": "sobol"},
+        {"sampler_type": "lhs"},
+        {"sampler_type": "pseudo", "antithetic": True},
+        {"control_variate": True},
+    ],
+)
+def test_sample_store_reuses_draws_without_changing_results(
+    overrides: dict[str, object],
+) -> None:
+    config = MonteCarloConfig(iterations=1200, seed=11, batch_size=200, **overrides)
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=0.0, std=1.0),
+        "b": DistributionSpec(kind="uniform", low=0.0, high=2.0),
+        "c": DistributionSpec(kind="triangular", left=0.0, mode=1.0, right=3.0),
+    }
+    correlation_groups = (
+        CorrelationGroup(variables=("a", "b"), matrix=((1.0, 0.4), (0.4, 1.0))),
+    )
+
+    def _run():
+        return MonteCarloEngine(config).run(
+            base_inputs={},
+            distributions=distributions,
+            batch_evaluator=_sum_product_evaluator,
+            correlation_groups=correlation_groups,
+        )
+
+    baseline = _run()
+    with use_monte_carlo_sample_store() as store:
+        first = _run()
+        second = _run()
+
+    assert first.summary == baseline.summary
+    assert second.summary == baseline.summary
+    assert second.diagnostics == baseline.diagnostics
+    # One block for the correlated group and one for the ungrouped variable.
+    assert store.info()["misses"] == 2
+    assert store.info()["hits"] == 2
+
+
+def test_quantile_precision_mode_reports_precision_and_stops_when_tight() -> None:
+    distributions = {"a": DistributionSpec(kind="normal", mean=0.0, std=1.0)}
+    config = MonteCarloConfig(
+        iterations=20_000,
+        seed=3,
+        convergence_mode="quantile_precision",
+        quantile_precision_target=0.01,
+    )
+
+    result = MonteCarloEngine(config).run(
+        base_inputs={},
+        distributions=distributions,
+        batch_evaluator=lambda sampled_batch, _base_inputs: (
+            100.0 + 0.05 * sampled_batch["a"]
+        ),
+    )
+
+    diagnostics = result.diagnostics
+    assert diagnostics["convergence_mode"] == "quantile_precision"
+    assert diagnostics["converged"] is True
+    assert diagnostics["stopped_early"] is True
+    assert diagnostics["executed_iterations"] == config.min_iterations
+    for name in ("percentile_5", "median", "percentile_95"):
+        assert diagnostics[f"quantile_precision_{name}_half_width"] > 0.0
+        assert diagnostics[f"quantile_precision_{name}_rel_half_width"] <= 0.01
+    assert diagnostics["quantile_precision_max_rel_half_width"] <= 0.01
+    # Median-window fields are still reported alongside.
+    assert "median_delta" in diagnostics
+
+
+def test_quantile_precision_mode_keeps_sampling_bimodal_outcomes() -> None:
+    distributions = {
+        "a": DistributionSpec(kind="normal", mean=100.0, std=30.0),
+        "b": DistributionSpec(kind="uniform", low=0.0, high=1.0),
+    }
+
+    def _bimodal(sampled_batch: dict[str, np.ndarray], _base_inputs: object):
+        return np.where(
+            sampled_batch["b"] < 0.5,
+            sampled_batch["a"] - 60.0,
+            sampled_batch["a"] + 60.0,
+        )
+
+    def _run(mode: str):
+        return MonteCarloEngine(
+            MonteCarloConfig(iterations=20_000, seed=3, convergence_mode=mode)
+        ).run(base_inputs={}, distributions=distributions, batch_evaluator=_bimodal)
+
+    window = _run("median_window")
+    precision = _run("quantile_precision")
+
+    assert window.diagnostics["stopped_early"] is True
+    assert (
+        precision.diagnostics["executed_iterations"]
+        > window.diagnostics["executed_iterations"]
+    )
+    assert precision.diagnostics["quantile_precision_binding"] == "median"
+
+    with pytest.raises(ValueError, match="quantile_precision_confidence"):
+        MonteCarloEngine(MonteCarloConfig(quantile_precision_confidence=1.0))
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization import (
+    param_cache_service,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.contracts import (
+    ParamBuildResult,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.orchestrator import (
+    build_params,
+)
+from src.agents.fundamental.subdomains.core_valuation.domain.parameterization.param_cache_service import (
+    PARAM_CACHE_DIR_ENV,
+    PARAM_CACHE_ENABLED_ENV,
+    PARAM_CACHE_METADATA_KEY,
+    ParamBuildCache,
+    build_params_cached,
+    get_param_build_cache,
+    reset_param_build_cache,
+    resolve_param_builder_version,
+)
+
+
+def _load_replay_fixture() -> dict[str, object]:
+    fixture_path = (
+        Path(__file__).resolve().parent
+        / "fixtures"
+        / "fundamental_replay_inputs"
+        / "aapl.replay.json"
+    )
+    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
+    assert isinstance(payload, dict)
+    return payload
+
+
+def _build(fixture: dict[str, object]):
+    return build_params(
+        str(fixture["model_type"]),
+        str(fixture["ticker"]),
+        fixture["reports"],
+        market_snapshot=fixture["market_snapshot"],
+    )
+
+
+def _without_cache_metadata(metadata: dict[str, object]) -> dict[str, object]:
+    return {
+        key: value for key, value in metadata.items() if key != PARAM_CACHE_METADATA_KEY
+    }
+
+
+def _manual_timestamps(node: object) -> list[str]:
+    if isinstance(node, list):
+        return [stamp for item in node for stamp in _manual_timestamps(item)]
+    if not isinstance(node, dict):
+        return []
+    stamps = [stamp for value in node.values() for stamp in _manual_timestamps(value)]
+    if node.get("type") == "MANUAL":
+        stamps.append(str(node["modified_at"]))
+    return stamps
+
+
+def _drop_manual_timestamps(node: object) -> object:
+    if isinstance(node, list):
+        return [_drop_manual_timestamps(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    return {
+        key: _drop_manual_timestamps(value)
+        for key, value in node.items()
+        if not (key == "modified_at" and node.get("type") == "MANUAL")
+    }
+
+
+def _trace_payload(result: ParamBuildResult) -> dict[str, object]:
+    return {
+        name: _drop_manual_timestamps(field.model_dump(mode="json"))
+        for name, field in result.trace_inputs.items()
+    }
+
+
+@pytest.fixture(autouse=True)
+def _isolated_param_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(PARAM_CACHE_DIR_ENV, raising=False)
+    monkeypatch.delenv(PARAM_CACHE_ENABLED_ENV, raising=False)
+    reset_param_build_cache()
+    yield
+    reset_param_build_cache()
+
+
+def test_build_params_second_call_hits_memory_cache_with_identical_result() -> None:
+    fixture = _load_replay_fixture()
+
+    first = _build(fixture)
+    second = _build(fixture)
+
+    assert first.metadata[PARAM_CACHE_METADATA_KEY]["status"] == "miss"
+    cache_meta = second.metadata[PARAM_CACHE_METADATA_KEY]
+    assert cache_meta["status"] == "hit"
+    assert cache_meta["layer"] == "memory"
+    assert second.params == first.params
+    assert _trace_payload(second) == _trace_payload(first)
+    assert second.assumptions == first.assumptions
+    assert _without_cache_metadata(second.metadata) == _without_cache_metadata(
+        first.metadata
+    )
+
+
+def test_cached_results_are_isolated_from_caller_mutation() -> None:
+    fixture = _load_replay_fixture()
+    first = _build(fixture)
+    original_wacc = first.params["wacc"]
+
+    first.params["wacc"] = 0.99
+    first.assumptions.append("mutated")
+    second = _build(fixture)
+
+    assert second.params["wacc"] == original_wacc
+    assert "mutated" not in second.assumptions
+
+
+def test_disk_tier_is_shared_across_cache_instances(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(PARAM_CACHE_DIR_ENV, str(tmp_path))
+    fixture = _load_replay_fixture()
+    first = _build(fixture)
+    assert list(tmp_path.rglob("*.json"))
+
+    # A fresh process-level cache, as in a second replay run.
+    reset_param_build_cache()
+    second = _build(fixture)
+
+    cache_meta = second.metadata[PARAM_CACHE_METADATA_KEY]
+    assert cache_meta["status"] == "hit"
+    assert cache_meta["layer"] == "disk"
+    assert second.params == first.params
+    assert _trace_payload(second) == _trace_payload(first)
+    assert get_param_build_cache().stats_snapshot()["disk_hits"] == 1
+
+
+def test_builder_env_and_input_changes_miss_the_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fixture = _load_replay_fixture()
+    _build(fixture)
+    base_version = resolve_param_builder_version()
+
+    monkeypatch.setenv("FUNDAMENTAL_DCF_STANDARD_CONSENSUS_TERMINAL_NUDGE_ENABLED", "0")
+    assert resolve_param_builder_version() != base_version
+    assert _build(fixture).metadata[PARAM_CACHE_METADATA_KEY]["status"] == "miss"
+
+    monkeypatch.delenv("FUNDAMENTAL_DCF_STANDARD_CONSENSUS_TERMINAL_NUDGE_ENABLED")
+    snapshot = dict(fixture["market_snapshot"])
+    snapshot["current_price"] = 1.0
+    changed = dict(fixture, market_snapshot=snapshot)
+    assert _build(changed).metadata[PARAM_CACHE_METADATA_KEY]["status"] == "miss"
+
+
+def test_param_cache_can_be_disabled_and_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(PARAM_CACHE_ENABLED_ENV, "false")
+    fixture = _load_replay_fixture()
+    _build(fixture)
+    result = _build(fixture)
+    assert result.metadata[PARAM_CACHE_METADATA_KEY]["status"] == "disabled"
+
+    cache = ParamBuildCache(max_entries=1)
+    cache.put("a" * 64, result)
+    cache.put("b" * 64, result)
+    assert cache.get("a" * 64).result is None
+    assert cache.get("b" * 64).layer == "memory"
+
+
+def test_cache_hits_restamp_manual_provenance_timestamps(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(PARAM_CACHE_DIR_ENV, str(tmp_path))
+    fixture = _load_replay_fixture()
+    first = _build(fixture)
+    assert _manual_timestamps(
+        [field.model_dump(mode="json") for field in first.trace_inputs.values()]
+    )
+
+    # Stored entries carry no wall-clock values.
+    (entry_path,) = tmp_path.rglob("*.json")
+    stored = json.loads(entry_path.read_text(encoding="utf-8"))
+    assert set(_manual_timestamps(stored["trace_inputs"])) == {""}
+
+    served_after = str(datetime.now())
+    second = _build(fixture)
+
+    assert second.metadata[PARAM_CACHE_METADATA_KEY]["status"] == "hit"
+    stamps = _manual_timestamps(
+        [field.model_dump(mode="json") for field in second.trace_inputs.values()]
+    )
+    assert stamps
+    assert all(stamp >= served_after for stamp in stamps)
+
+
+def test_builder_version_covers_imported_modules_outside_parameterization(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = tmp_path / "src" / "valuation"
+    (package / "parameterization").mkdir(parents=True)
+    (package / "signals").mkdir()
+    (package / "parameterization" / "builder.py").write_text(
+        "from ..signals.policy import SPREAD\n", encoding="utf-8"
+    )
+    (package / "signals" / "policy.py").write_text(
+        "from src.valuation.signals import weights\nSPREAD = 0.01\n",
+        encoding="utf-8",
+    )
+    dependency = package / "signals" / "weights.py"
+    dependency.write_text("WEIGHT = 0.5\n", encoding="utf-8")
+    monkeypatch.setattr(param_cache_service, "_PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(
+        param_cache_service,
+        "_BUILDER_SOURCE_ROOTS",
+        (package / "parameterization",),
+    )
+    param_cache_service._builder_source_version.cache_clear()
+
+    def _build_cached() -> str:
+        result = build_params_cached(
+            model_type="dcf_standard",
+            ticker="AAPL",
+            reports_raw=[],
+            market_snapshot=None,
+            build_fn=lambda: ParamBuildResult(
+                params={"wacc": 0.1},
+                trace_inputs={},
+                missing=[],
+                assumptions=[],
+                metadata={},
+            ),
+        )
+        return str(result.metadata[PARAM_CACHE_METADATA_KEY]["status"])
+
+    try:
+        assert _build_cached() == "miss"
+        assert _build_cached() == "hit"
+
+        # A module two imports away from the builders, outside parameterization;
+        # the source version is computed once per process.
+        dependency.write_text("WEIGHT = 0.75\n", encoding="utf-8")
+        param_cache_service._builder_source_version.cache_clear()
+        assert _build_cached() == "miss"
+    finally:
+        param_cache_service._builder_source_version.cache_clear()
+
+
+def test_builder_source_files_follow_imports_out_of_parameterization() -> None:
+    files = {
+        path.relative_to(param_cache_service._PROJECT_ROOT).as_posix()
+        for path in param_cache_service._builder_source_files(
+            param_cache_service._BUILDER_SOURCE_ROOTS,
+            project_root=param_cache_service._PROJECT_ROOT,
+        )
+    }
+
+    agents = "src/agents/fundamental"
+    assert {
+        f"{agents}/subdomains/forward_signals/domain/policies/forward_signal_policy.py",
+        f"{agents}/subdomains/core_valuation/domain/models/dcf_standard/contracts.py",
+        f"{agents}/domain/shared/contracts/traceable.py",
+    } <= files
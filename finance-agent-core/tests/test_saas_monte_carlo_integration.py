@@ -9,6 +9,10 @@ from src.agents.fundamental.domain.shared.contracts.traceable import (
 from src.agents.fundamental.subdomains.core_valuation.domain.calculators.saas_calculator import (
     calculate_saas_valuation,
 )
+from src.agents.fundamental.subdomains.core_valuation.domain.engine.monte_carlo_parallel_service import (
+    MONTE_CARLO_WORKERS_ENV,
+    shutdown_monte_carlo_process_pools,
+)
 from src.agents.fundamental.subdomains.core_valuation.domain.models.saas.contracts import (
     SaaSParams,
 )
@@ -127,3 +131,94 @@ def test_saas_monte_carlo_base_case_matches_point_intrinsic() -> None:
     base_case_intrinsic = diagnostics.get("base_case_intrinsic_value")
     assert isinstance(base_case_intrinsic, float)
     assert point_intrinsic == pytest.approx(base_case_intrinsic, rel=1e-9, abs=1e-9)
+
+
+def test_saas_valuation_monte_carlo_is_identical_across_worker_counts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    params = SaaSParams(
+        ticker="SAAS",
+        rationale="test",
+        initial_revenue=100.0,
+        growth_rates=[0.15, 0.14, 0.12, 0.10, 0.08],
+        operating_margins=[0.10, 0.12, 0.14, 0.16, 0.18],
+        tax_rate=0.21,
+        da_rates=[0.03, 0.03, 0.03, 0.03, 0.03],
+        capex_rates=[0.05, 0.05, 0.05, 0.05, 0.05],
+        wc_rates=[0.01, 0.01, 0.01, 0.01, 0.01],
+        sbc_rates=[0.02, 0.02, 0.02, 0.02, 0.02],
+        wacc=0.10,
+        terminal_growth=0.025,
+        shares_outstanding=100.0,
+        cash=10.0,
+        total_debt=5.0,
+        preferred_stock=0.0,
+        monte_carlo_iterations=20_000,
+        monte_carlo_seed=123,
+        monte_carlo_sampler="sobol",
+    )
+
+    def run(workers: str) -> dict[str, object]:
+        monkeypatch.setenv(MONTE_CARLO_WORKERS_ENV, workers)
+        result = calculate_saas_valuation(params)
+        details = result["details"]
+        assert isinstance(details, dict)
+        distribution = details["distribution_summary"]
+        assert isinstance(distribution, dict)
+        return distribution
+
+    try:
+        serial = run("1")
+        parallel = run("2")
+    finally:
+        shutdown_monte_carlo_process_pools()
+
+    assert parallel["diagnostics"]["parallel_workers"] == 2
+    assert parallel["summary"] == serial["summary"]
+    assert (
+        parallel["diagnostics"]["executed_iterations"]
+        == serial["diagnostics"]["executed_iterations"]
+    )
+
+
+def test_saas_variance_reduction_converges_with_fewer_iterations() -> None:
+    params = SaaSParams(
+        ticker="SAAS",
+        rationale="test",
+        initial_revenue=100.0,
+        growth_rates=[0.15, 0.14, 0.12, 0.10, 0.08],
+        operating_margins=[0.10, 0.12, 0.14, 0.16, 0.18],
+        tax_rate=0.21,
+        da_rates=[0.03, 0.03, 0.03, 0.03, 0.03],
+        capex_rates=[0.05, 0.05, 0.05, 0.05, 0.05],
+        wc_rates=[0.01, 0.01, 0.01, 0.01, 0.01],
+        sbc_rates=[0.02, 0.02, 0.02, 0.02, 0.02],
+        wacc=0.10,
+        terminal_growth=0.025,
+        shares_outstanding=100.0,
+        cash=10.0,
+        total_debt=5.0,
+        preferred_stock=0.0,
+        monte_carlo_iterations=10_000,
+        monte_carlo_seed=5,
+        monte_carlo_sampler="pseudo",
+    )
+
+    def run(**updates: bool) -> dict[str, object]:
+        result = calculate_saas_valuation(params.model_copy(update=updates))
+        details = result["details"]
+        assert isinstance(details, dict)
+        distribution = details["distribution_summary"]
+        assert isinstance(distribution, dict)
+        return distribution["diagnostics"]
+
+    plain = run()
+    antithetic = run(monte_carlo_antithetic=True)
+    controlled = run(monte_carlo_control_variate=True)
+
+    assert plain["variance_reduction"] == "none"
+    assert antithetic["antithetic_variance_ratio"] < 0.5
+    assert controlled["cv_variance_ratio"] < 0.25
+    for reduced in (antithetic, controlled):
+        assert reduced["converged"] is True
+        assert reduced["executed_iterations"] * 2 <= plain["executed_iterations"]
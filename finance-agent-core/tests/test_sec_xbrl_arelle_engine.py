@@ -1,17 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
+from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.cache.filing_fact_store_service import (
+    FilingFactStore,
+)
 from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.extract import (
     extractor as extractor_module,
 )
 from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.providers import (
     arelle_engine as arelle_engine_module,
 )
+from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.providers import (
+    arelle_worker_pool as arelle_worker_pool_module,
+)
 from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.providers.arelle_engine import (
+    ArelleEngineParseError,
     ArelleEngineUnavailableError,
     ArelleParseResult,
     ArelleXbrlEngine,
@@ -152,10 +164,10 @@ def test_arelle_validation_profile_applies_mode_default_plugins(monkeypatch) ->
     assert profile_dqc.plugins == ("validate/EFM", "validate/DQC")
 
 
-def test_runtime_isolation_mode_defaults_to_serial(monkeypatch) -> None:
+def test_runtime_isolation_mode_defaults_to_worker_pool(monkeypatch) -> None:
     monkeypatch.delenv("FUNDAMENTAL_XBRL_ARELLE_RUNTIME_ISOLATION", raising=False)
     mode = arelle_engine_module._resolve_runtime_isolation_mode_from_env()
-    assert mode == "serial"
+    assert mode == "worker_pool"
 
 
 def test_runtime_isolation_mode_supports_none(monkeypatch) -> None:
@@ -164,6 +176,270 @@ def test_runtime_isolation_mode_supports_none(monkeypatch) -> None:
     assert mode == "none"
 
 
+def test_runtime_isolation_mode_supports_serial(monkeypatch) -> None:
+    monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_RUNTIME_ISOLATION", "serial")
+    mode = arelle_engine_module._resolve_runtime_isolation_mode_from_env()
+    assert mode == "serial"
+
+
+def test_arelle_worker_count_reads_env(monkeypatch) -> None:
+    monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_WORKERS", "3")
+    assert arelle_worker_pool_module.resolve_arelle_worker_count() == 3
+
+    monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_WORKERS", "0")
+    assert arelle_worker_pool_module.resolve_arelle_worker_count() >= 1
+
+
+def test_worker_pool_parse_reports_worker_runtime_metadata(monkeypatch) -> None:
+    monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_RUNTIME_ISOLATION", "worker_pool")
+    monkeypatch.setattr(
+        arelle_engine_module.importlib.util, "find_spec", lambda _n: object()
+    )
+    facts = pd.DataFrame([{"concept": "us-gaap:Assets", "value": "1"}])
+
+    def _fake_pool_parse(
+        bundle: XbrlAttachmentBundle,
+        *,
+        validation_profile: ArelleValidationProfile,
+    ):
+        return (
+            arelle_engine_module._ArelleWorkerParseOutput(
+                facts_dataframe=facts,
+                validation_issues=(),
+                worker_pid=4242,
+                worker_parse_ms=8.25,
+                worker_parse_count=3,
+                queue_wait_ms=1.5,
+                facts_build_stats=arelle_engine_module._FactsBuildStats(
+                    build_ms=4.125, rss_delta_kib=204800
+                ),
+            ),
+            2,
+        )
+
+    monkeypatch.setattr(
+        arelle_engine_module, "_parse_bundle_in_worker_pool", _fake_pool_parse
+    )
+
+    result = arelle_engine_module._parse_bundle_with_arelle_runtime(
+        _bundle(),
+        validation_profile=ArelleValidationProfile(),
+    )
+
+    assert result.facts_dataframe.equals(facts)
+    runtime = result.runtime_metadata
+    assert runtime is not None
+    assert runtime.runtime_isolation_mode == "worker_pool"
+    assert runtime.runtime_lock_wait_ms == pytest.approx(1.5)
+    assert runtime.runtime_worker_pid == 4242
+    assert runtime.runtime_worker_parse_ms == pytest.approx(8.25)
+    assert runtime.runtime_worker_parse_count == 3
+    assert runtime.runtime_worker_pool_size == 2
+    assert result.facts_build_ms == pytest.approx(4.125)
+    assert result.facts_rss_delta_kib == 204800
+
+    metadata = extractor_module._build_arelle_filing_metadata(result)
+    assert metadata["arelle_runtime_isolation_mode"] == "worker_pool"
+    assert metadata["arelle_runtime_worker_pid"] == 4242
+    assert metadata["arelle_runtime_worker_parse_ms"] == pytest.approx(8.25)
+    assert metadata["arelle_runtime_worker_parse_count"] == 3
+    assert metadata["arelle_facts_build_ms"] == pytest.approx(4.125)
+    assert metadata["arelle_facts_rss_delta_kib"] == 204800
+
+
+def test_worker_parse_reuses_initialized_runtime(monkeypatch) -> None:
+    manager = object()
+    loaded_with: list[object] = []
+
+    def _fake_load(*, manager: object, bundle, validation_profile):
+        loaded_with.append(manager)
+        return (
+            pd.DataFrame(columns=["concept"]),
+            (),
+            arelle_engine_module._FactsBuildStats(build_ms=1.0, rss_delta_kib=None),
+        )
+
+    monkeypatch.setattr(arelle_engine_module, "_load_bundle_facts", _fake_load)
+    monkeypatch.setattr(
+        arelle_engine_module,
+        "_WORKER_RUNTIME",
+        arelle_engine_module._ArelleWorkerRuntime(
+            controller=object(),
+            manager=manager,
+            validation_profile=ArelleValidationProfile(),
+        ),
+    )
+
+    first = arelle_engine_module._parse_bundle_in_worker(_bundle(), time.time())
+    second = arelle_engine_module._parse_bundle_in_worker(_bundle(), time.time())
+
+    assert loaded_with == [manager, manager]
+    assert (first.worker_parse_count, second.worker_parse_count) == (1, 2)
+    assert first.worker_pid == second.worker_pid == os.getpid()
+    assert second.queue_wait_ms >= 0.0
+    assert second.facts_build_stats is not None
+
+
+def _stub_load_bundle_facts(*, manager: object, bundle, validation_profile):
+    if bundle.instance_document.startswith("hang"):
+        time.sleep(60)
+    if bundle.instance_document.startswith("slow"):
+        time.sleep(1.2)
+    return (
+        pd.DataFrame(
+            [{"concept": "us-gaap:Assets", "manager": type(manager).__name__}]
+        ),
+        (),
+        arelle_engine_module._FactsBuildStats(build_ms=1.0, rss_delta_kib=None),
+    )
+
+
+def _initialize_stub_worker(validation_profile: ArelleValidationProfile) -> None:
+    # Runs in the spawned worker: the real initializer, then a stub loader.
+    arelle_engine_module._initialize_arelle_worker(validation_profile)
+    arelle_engine_module._load_bundle_facts = _stub_load_bundle_facts
+
+
+def test_spawned_worker_pool_reuses_workers_and_recycles_hung_ones(
+    monkeypatch,
+) -> None:
+    pytest.importorskip("arelle")
+    monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_WORKERS", "1")
+    profile = ArelleValidationProfile()
+    pool, _ = arelle_worker_pool_module.get_arelle_worker_pool(
+        profile, initializer=_initialize_stub_worker, initargs=(profile,)
+    )
+    try:
+        first, pool_size = arelle_engine_module._parse_bundle_in_worker_pool(
+            _bundle(), validation_profile=profile
+        )
+        second, _ = arelle_engine_module._parse_bundle_in_worker_pool(
+            _bundle(), validation_profile=profile
+        )
+
+        assert pool_size == 1
+        assert first.facts_dataframe["manager"].tolist() == ["ModelManager"]
+        assert first.worker_pid == second.worker_pid != os.getpid()
+        assert (first.worker_parse_count, second.worker_parse_count) == (1, 2)
+
+        # With one worker the second slow parse queues behind the first; its
+        # total wait exceeds the timeout, but its own run does not.
+        monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_WORKER_TIMEOUT_SECONDS", "2")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            slow_futures = [
+                executor.submit(
+                    arelle_engine_module._parse_bundle_in_worker_pool,
+                    replace(_bundle(), instance_document=f"slow-{index}.xml"),
+                    validation_profile=profile,
+                )
+                for index in range(2)
+            ]
+            slow_outputs = [future.result()[0] for future in slow_futures]
+        assert max(output.queue_wait_ms for output in slow_outputs) > 1000.0
+        assert {output.worker_pid for output in slow_outputs} == {first.worker_pid}
+        assert profile in arelle_worker_pool_module._POOLS
+
+        monkeypatch.setenv("FUNDAMENTAL_XBRL_ARELLE_WORKER_TIMEOUT_SECONDS", "1")
+        started = time.perf_counter()
+        with pytest.raises(ArelleEngineParseError, match="timed out"):
+            arelle_engine_module._parse_bundle_in_worker_pool(
+                replace(_bundle(), instance_document="hang.xml"),
+                validation_profile=profile,
+            )
+        assert time.perf_counter() - started < 30
+        assert profile not in arelle_worker_pool_module._POOLS
+    finally:
+        arelle_worker_pool_module.discard_arelle_worker_pool(profile, pool)
+
+
+@dataclass(frozen=True)
+class _FakeQName:
+    localName: str
+    prefix: str = "us-gaap"
+
+
+def _fake_fact(
+    local_name: str,
+    value: str | None,
+    *,
+    context: object,
+    unit_id: str | None = "USD",
+) -> object:
+    qname = _FakeQName(local_name)
+    return SimpleNamespace(
+        concept=SimpleNamespace(qname=qname, label=lambda lang=None: local_name),
+        value=value,
+        unitID=unit_id,
+        decimals="-6",
+        scale=None,
+        context=context,
+    )
+
+
+def test_facts_to_dataframe_builds_typed_columns() -> None:
+    year_context = SimpleNamespace(
+        isInstantPeriod=False,
+        isStartEndPeriod=True,
+        startDatetime=datetime(2025, 1, 1),
+        endDatetime=datetime(2025, 12, 31),
+        qnameDims={},
+    )
+    segment_context = SimpleNamespace(
+        isInstantPeriod=True,
+        instantDatetime=datetime(2025, 12, 31),
+        qnameDims={
+            _FakeQName("StatementBusinessSegmentsAxis"): (
+                SimpleNamespace(memberQname=_FakeQName("AwsSegmentMember"))
+            )
+        },
+    )
+    model_xbrl = SimpleNamespace(
+        facts=[
+            _fake_fact("Revenues", "1000", context=year_context),
+            _fake_fact("Assets", "250.5", context=segment_context),
+            _fake_fact(
+                "AccountingPolicies", "<p>text</p>", context=year_context, unit_id=None
+            ),
+        ]
+    )
+
+    df = arelle_engine_module._facts_to_dataframe(model_xbrl)
+
+    for column in (
+        "concept",
+        "unit",
+        "period_key",
+        "dim_StatementBusinessSegmentsAxis",
+    ):
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert df["concept"].tolist() == [
+        "us-gaap:Revenues",
+        "us-gaap:Assets",
+        "us-gaap:AccountingPolicies",
+    ]
+    assert df["value"].tolist() == ["1000", "250.5", "<p>text</p>"]
+    assert df["period_key"].tolist() == [
+        "duration_2025-01-01_2025-12-31",
+        "instant_2025-12-31",
+        "duration_2025-01-01_2025-12-31",
+    ]
+    assert df["unit"].isna().tolist() == [False, False, True]
+    assert df["dim_StatementBusinessSegmentsAxis"].isna().tolist() == [
+        True,
+        False,
+        True,
+    ]
+    assert df["statement_type"].isna().all()
+
+    empty = arelle_engine_module._facts_to_dataframe(SimpleNamespace(facts=[]))
+    base_columns = [column for column in df.columns if not column.startswith("dim_")]
+    assert empty.empty
+    assert list(empty.columns) == base_columns
+    assert [str(dtype) for dtype in empty.dtypes] == [
+        str(dtype) for dtype in df.dtypes[base_columns]
+    ]
+
+
 def test_configure_validation_runtime_loads_plugins_and_packages() -> None:
     class _FakeDisclosureSystem:
         def __init__(self) -> None:
@@ -457,3 +733,74 @@ def test_extractor_hard_fails_when_arelle_unavailable(
             ticker="AMZN",
             fiscal_year=2025,
         )
+
+
+class _FactStoreFiling:
+    form = "10-K"
+    accession_number = "0001018724-26-000012"
+    filing_date = "2026-02-06"
+    accepted_datetime = None
+    period_of_report = "2025-12-31"
+
+    def __init__(self, facts: pd.DataFrame) -> None:
+        self._facts = facts
+        self.xbrl_calls = 0
+
+    def xbrl(self) -> object:
+        self.xbrl_calls += 1
+        return SimpleNamespace(facts=SimpleNamespace(to_dataframe=lambda: self._facts))
+
+
+def test_extractor_loads_stored_facts_instead_of_parsing_again(
+    monkeypatch, tmp_path
+) -> None:
+    filing = _FactStoreFiling(
+        pd.DataFrame(
+            {
+                "concept": ["dei:DocumentPeriodEndDate", "us-gaap:Assets"],
+                "value": ["2025-12-31", "123"],
+                "period_key": ["duration_2025", "instant_2025-12-31"],
+            }
+        )
+    )
+    company = SimpleNamespace(sic=5961, get_filings=lambda **_kwargs: [filing])
+    monkeypatch.setattr(extractor_module, "Company", lambda _ticker: company)
+    monkeypatch.setattr(extractor_module, "ensure_sec_identity", lambda: None)
+    monkeypatch.setattr(
+        extractor_module,
+        "_resolve_xbrl_facts_dataframe",
+        lambda *, primary_df, **_kwargs: (
+            primary_df,
+            {
+                "arelle_validation_mode": "facts_only",
+                "arelle_parse_latency_ms": 120.5,
+                "arelle_runtime_worker_pid": 4242,
+                "arelle_facts_build_ms": 42.5,
+            },
+        ),
+    )
+    extractor_module.set_filing_fact_store_for_tests(
+        FilingFactStore(root_dir=str(tmp_path))
+    )
+    try:
+        parsed = extractor_module.SECReportExtractor("AMZN", 2025)
+        loaded = extractor_module.SECReportExtractor("AMZN", 2025)
+    finally:
+        extractor_module.reset_filing_fact_store_for_tests()
+
+    assert filing.xbrl_calls == 1
+    pd.testing.assert_frame_equal(loaded.df, parsed.df)
+    assert loaded.actual_date == "2025-12-31"
+    parsed_metadata = parsed.get_selected_filing_metadata()
+    loaded_metadata = loaded.get_selected_filing_metadata()
+    assert parsed_metadata["fact_store_status"] == "stored"
+    assert parsed_metadata["arelle_parse_latency_ms"] == 120.5
+    assert loaded_metadata["fact_store_status"] == "hit"
+    assert loaded_metadata["arelle_validation_mode"] == "facts_only"
+    # Timings of the original parse are not reported as this run's.
+    for key in (
+        "arelle_parse_latency_ms",
+        "arelle_runtime_worker_pid",
+        "arelle_facts_build_ms",
+    ):
+        assert key not in loaded_metadata
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.cache.filing_fact_store_service import (
+    FilingFactStore,
+)
+
+
+def _facts_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "concept": ["us-gaap:Revenues", "us-gaap:NetIncomeLoss", None],
+            "value": ["100", "25", "3"],
+            "numeric_value": [100.0, 25.0, np.nan],
+            "is_dimensioned": pd.array([False, True, None], dtype="boolean"),
+            "unit_ref": pd.Categorical(["USD", "USD", "shares"]),
+            "period_end": pd.to_datetime(["2025-12-31", "2025-12-31", None]),
+        }
+    )
+
+
+def test_fact_store_round_trips_facts_frame(tmp_path) -> None:
+    store = FilingFactStore(root_dir=str(tmp_path))
+    key = store.build_key(
+        accession="0001018724-26-000012", parser_fingerprint="parser-a"
+    )
+    frame = _facts_frame()
+
+    assert store.store(key, frame, metadata={"xbrl_parser": "arelle"}) is True
+
+    reader = FilingFactStore(root_dir=str(tmp_path))
+    stored = reader.load(key)
+    assert stored is not None
+    pd.testing.assert_frame_equal(stored.dataframe, frame)
+    assert stored.metadata == {"xbrl_parser": "arelle"}
+    assert reader.stats_snapshot()["hits"] == 1
+
+
+def test_fact_store_entries_are_written_once(tmp_path) -> None:
+    store = FilingFactStore(root_dir=str(tmp_path))
+    key = store.build_key(
+        accession="0001018724-26-000012", parser_fingerprint="parser-a"
+    )
+    frame = _facts_frame()
+
+    assert store.store(key, frame) is True
+    assert store.store(key, frame.iloc[:1]) is False
+
+    stored = store.load(key)
+    assert stored is not None
+    assert len(stored.dataframe) == len(frame)
+    assert store.stats_snapshot()["store_skips"] == 1
+
+
+def test_fact_store_key_changes_with_parser_fingerprint(tmp_path) -> None:
+    store = FilingFactStore(root_dir=str(tmp_path))
+    accession = "0001018724-26-000012"
+    key = store.build_key(accession=accession, parser_fingerprint="parser-a")
+    store.store(key, _facts_frame())
+
+    other_key = store.build_key(accession=accession, parser_fingerprint="parser-b")
+
+    assert other_key != key
+    assert store.load(other_key) is None
+    assert store.stats_snapshot()["misses"] == 1
+
+
+def test_fact_store_skips_frames_with_unsupported_columns(tmp_path) -> None:
+    store = FilingFactStore(root_dir=str(tmp_path))
+    key = store.build_key(
+        accession="0001018724-26-000012", parser_fingerprint="parser-a"
+    )
+    frame = _facts_frame()
+    frame["mixed"] = ["a", 1, None]
+
+    assert store.store(key, frame) is False
+    assert store.load(key) is None
+    assert list(tmp_path.rglob("*.npy")) == []
+
+
+def test_disabled_fact_store_never_reads_or_writes(tmp_path) -> None:
+    store = FilingFactStore(root_dir=str(tmp_path), enabled=False)
+    key = store.build_key(
+        accession="0001018724-26-000012", parser_fingerprint="parser-a"
+    )
+
+    assert store.store(key, _facts_frame()) is False
+    assert store.load(key) is None
+    assert list(tmp_path.iterdir()) == []
@@ -256,8 +256,20 @@ def test_fetch_financial_reports_payload_emits_arelle_runtime_diagnostics(
                     "arelle_runtime_lock_wait_ms": 3.2,
                     "arelle_runtime_isolation_mode": "serial",
                     "arelle_validation_mode": "efm_validate",
+                    "arelle_runtime_worker_parse_ms": 95.25,
+                    "arelle_runtime_worker_pid": 4242,
+                    "arelle_facts_build_ms": 42.5,
+                    "arelle_facts_rss_delta_kib": 512000,
                 },
-            )
+            ),
+            _report(
+                2024,
+                selection_mode=f"latest_available_{years}",
+                extra_filing_metadata={
+                    "fact_store_status": "hit",
+                    "arelle_validation_mode": "facts_only",
+                },
+            ),
         ],
     )
 
@@ -275,6 +287,10 @@ def test_fetch_financial_reports_payload_emits_arelle_runtime_diagnostics(
     assert arelle_runtime.get("runtime_lock_wait_ms_avg") == 3.2
     assert arelle_runtime.get("isolation_modes") == ["serial"]
     assert arelle_runtime.get("validation_modes") == ["efm_validate"]
+    assert arelle_runtime.get("worker_parse_ms_avg") == 95.25
+    assert arelle_runtime.get("worker_count") == 1
+    assert arelle_runtime.get("facts_build_ms_avg") == 42.5
+    assert arelle_runtime.get("facts_rss_delta_kib_max") == 512000
 
 
 def test_fetch_financial_reports_payload_cache_key_includes_validation_profile(
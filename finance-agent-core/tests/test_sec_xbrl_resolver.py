@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import logging
+
 import pandas as pd
 
+from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.extract.base_model_field_extraction_service import (
+    PrefetchedFieldExtractor,
+)
 from src.agents.fundamental.subdomains.financial_statements.infrastructure.sec_xbrl.extract.extractor import (
     SearchType,
     SECExtractResult,
@@ -171,6 +176,68 @@ def test_search_dedup_keeps_dimensional_and_consolidated_rows() -> None:
     assert len(dimensional_results) == 1
 
 
+def test_search_index_matches_tags_regexes_and_anchor_date() -> None:
+    extractor = SECReportExtractor.__new__(SECReportExtractor)
+    extractor.ticker = "TEST"
+    extractor.fiscal_year = 2025
+    extractor.standard_industrial_classification_code = None
+    extractor.actual_date = "2025-12-31"
+    extractor.real_dim_cols = []
+    extractor.df = pd.DataFrame(
+        [
+            {
+                "concept": "us-gaap:Revenues",
+                "value": "100",
+                "period_key": "duration_2025-01-01_2025-12-31",
+                "period_end": "2025-12-31",
+            },
+            {
+                "concept": "US-GAAP:revenues",
+                "value": "90",
+                "period_key": "duration_2024-01-01_2024-12-31",
+                "period_end": "2024-12-31",
+            },
+            {
+                "concept": "custom:SegmentRevenues",
+                "value": "40",
+                "period_key": "duration_2025-01-01_2025-12-31",
+                "period_end": "2025-12-31",
+            },
+            {
+                "concept": None,
+                "value": "1",
+                "period_key": "duration_2025-01-01_2025-12-31",
+                "period_end": "2025-12-31",
+            },
+        ]
+    )
+
+    plain = extractor.search(
+        SearchType.CONSOLIDATED("us-gaap:Revenues", respect_anchor_date=False)
+    )
+    anchored = extractor.search(SearchType.CONSOLIDATED("us-gaap:Revenues"))
+    by_local_name = extractor.search(
+        SearchType.CONSOLIDATED("Revenues", respect_anchor_date=False)
+    )
+    by_pattern = extractor.search(
+        SearchType.CONSOLIDATED(".*Revenues", respect_anchor_date=False)
+    )
+
+    assert [row.value for row in plain] == ["100", "90"]
+    assert [row.value for row in anchored] == ["100"]
+    assert [row.value for row in by_local_name] == ["100", "90"]
+    assert sorted(row.value for row in by_pattern) == ["100", "40", "90"]
+
+    # Swapping the frame after a search rebuilds the index.
+    extractor.df = extractor.df.iloc[1:]
+    assert [
+        row.value
+        for row in extractor.search(
+            SearchType.CONSOLIDATED("us-gaap:Revenues", respect_anchor_date=False)
+        )
+    ] == ["90"]
+
+
 def test_extract_field_falls_back_to_strict_dimensional() -> None:
     class DummyExtractor:
         def __init__(self) -> None:
@@ -276,3 +343,135 @@ def test_extract_field_falls_back_to_relaxed_context_stage() -> None:
     assert any(call[1] is True and call[2] is False for call in extractor.calls)
     assert field.provenance.resolution_stage == "relaxed_context"
     assert field.provenance.confidence is not None
+
+
+def _batch_extractor() -> SECReportExtractor:
+    extractor = SECReportExtractor.__new__(SECReportExtractor)
+    extractor.ticker = "TEST"
+    extractor.fiscal_year = 2025
+    extractor.standard_industrial_classification_code = None
+    extractor.actual_date = "2025-12-31"
+    extractor.real_dim_cols = []
+    extractor.df = pd.DataFrame(
+        [
+            {
+                "concept": "us-gaap:Revenues",
+                "value": "100",
+                "period_key": "duration_2025-01-01_2025-12-31",
+                "period_end": "2025-12-31",
+                "statement_type": "income statement",
+                "unit": "USD",
+            },
+            {
+                "concept": "us-gaap:Assets",
+                "value": "175",
+                "period_key": "instant_2025-12-31",
+                "period_end": "2025-12-31",
+                "statement_type": "statement of financial position",
+                "unit": "USD",
+            },
+        ]
+    )
+    return extractor
+
+
+def _batch_field_configs() -> dict[str, list]:
+    return {
+        "Total Revenue": [
+            SearchType.CONSOLIDATED(
+                "us-gaap:Revenues",
+                statement_types=["income"],
+                period_type="duration",
+                unit_whitelist=["usd"],
+            )
+        ],
+        "Total Assets": [
+            SearchType.CONSOLIDATED(
+                "us-gaap:Assets",
+                statement_types=["balance"],
+                period_type="instant",
+                unit_whitelist=["usd"],
+            )
+        ],
+        "Goodwill": [SearchType.CONSOLIDATED("us-gaap:Goodwill")],
+    }
+
+
+def test_prefetched_field_extractor_matches_per_field_resolution(
+    monkeypatch,
+) -> None:
+    extractor = _batch_extractor()
+    field_configs = _batch_field_configs()
+    search_many_calls: list[int] = []
+    original_search_many = extractor.search_many
+
+    def counting_search_many(configs):
+        search_many_calls.append(len(configs))
+        return original_search_many(configs)
+
+    monkeypatch.setattr(extractor, "search_many", counting_search_many)
+    fallback_calls: list[str] = []
+
+    def fallback(_extractor, configs, name, target_type=float):
+        fallback_calls.append(name)
+        return BaseFinancialModelFactory._extract_field(
+            _extractor, configs, name, target_type
+        )
+
+    extract_field_fn = PrefetchedFieldExtractor(
+        extractor=extractor,
+        field_configs=field_configs,
+        fallback_fn=fallback,
+        logger_=logging.getLogger(__name__),
+    )
+    assert search_many_calls == []
+
+    served = {
+        name: extract_field_fn(extractor, configs, name)
+        for name, configs in field_configs.items()
+    }
+    searches_after_catalog = list(search_many_calls)
+    # Names and types outside the catalog reuse the cached searches.
+    renamed = extract_field_fn(extractor, field_configs["Total Revenue"], "Revenue")
+    as_text = extract_field_fn(
+        extractor, field_configs["Total Revenue"], "Total Revenue", str
+    )
+
+    # One pass over the catalog's first stage; later stages on demand.
+    assert search_many_calls[0] == 3
+    assert search_many_calls == searches_after_catalog
+    assert served["Total Revenue"].value == 100.0
+    assert served["Total Revenue"].provenance.resolution_stage == "strict_primary"
+    assert served["Total Assets"].value == 175.0
+    assert served["Total Assets"].provenance.resolution_stage == "relaxed_context"
+    assert served["Goodwill"].value is None
+    assert renamed.value == 100.0
+    assert as_text.value == "100"
+    assert fallback_calls == []
+    monkeypatch.setattr(extractor, "search_many", original_search_many)
+    for name, configs in field_configs.items():
+        single = BaseFinancialModelFactory._extract_field(
+            extractor=extractor, configs=configs, name=name, target_type=float
+        )
+        assert served[name].model_dump() == single.model_dump()
+
+
+def test_prefetched_field_extractor_logs_hits_when_served(caplog) -> None:
+    extractor = _batch_extractor()
+    field_configs = _batch_field_configs()
+    extract_field_fn = PrefetchedFieldExtractor(
+        extractor=extractor,
+        field_configs=field_configs,
+        fallback_fn=BaseFinancialModelFactory._extract_field,
+        logger_=logging.getLogger(__name__),
+    )
+
+    with caplog.at_level(logging.INFO):
+        extract_field_fn(extractor, field_configs["Total Revenue"], "Total Revenue")
+
+    hits = [
+        record.fields["field_name"]
+        for record in caplog.records
+        if getattr(record, "event", None) == "fundamental_xbrl_field_hit"
+    ]
+    assert hits == ["Total Revenue"]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from src.agents.fundamental.application.workflow_orchestrator.services.valuation_compute_executor_service import (
+    VALUATION_COMPUTE_EXECUTOR_ENV,
+    VALUATION_COMPUTE_WORKERS_ENV,
+    ValuationComputeExecutor,
+    resolve_valuation_compute_executor_mode,
+    resolve_valuation_compute_workers,
+)
+
+
+def _scaled_pid(value: int, *, factor: int) -> tuple[int, int]:
+    return value * factor, os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_process_mode_runs_picklable_payload_in_worker_and_recycles() -> None:
+    executor = ValuationComputeExecutor(
+        mode="process", workers=1, max_tasks_per_worker=1
+    )
+    try:
+        first_value, first_pid = await executor.run(_scaled_pid, 3, factor=2)
+        second_value, second_pid = await executor.run(_scaled_pid, 4, factor=2)
+    finally:
+        executor.shutdown()
+
+    assert (first_value, second_value) == (6, 8)
+    assert first_pid != os.getpid()
+    # One task per worker: the second call lands on a fresh process.
+    assert second_pid != first_pid
+    metrics = executor.metrics()
+    assert metrics.completed == 2
+    assert metrics.thread_fallbacks == 0
+
+
+@pytest.mark.asyncio
+async def test_process_mode_falls_back_to_thread_for_unpicklable_payload() -> None:
+    executor = ValuationComputeExecutor(mode="process", workers=1)
+    offset = 5
+    try:
+        result = await executor.run(lambda value: (value + offset, os.getpid()), 1)
+    finally:
+        executor.shutdown()
+
+    assert result == (6, os.getpid())
+    assert executor.metrics().thread_fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_bounds_concurrency_and_reports_queue_metrics() -> None:
+    executor = ValuationComputeExecutor(mode="thread", workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "done"
+
+    first = asyncio.create_task(executor.run(_blocking))
+    await asyncio.to_thread(started.wait, 5)
+    second = asyncio.create_task(executor.run(lambda: "queued"))
+    await asyncio.sleep(0.05)
+
+    assert executor.metrics().queue_depth == 1
+    assert executor.metrics().in_flight == 1
+    release.set()
+    assert await asyncio.gather(first, second) == ["done", "queued"]
+
+    metrics = executor.metrics()
+    assert metrics.queue_depth == 0
+    assert metrics.max_queue_depth == 1
+    assert metrics.completed == 2
+    assert metrics.wait_ms_max >= 40.0
+
+
+def test_executor_env_resolution(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(VALUATION_COMPUTE_EXECUTOR_ENV, " Thread ")
+    monkeypatch.setenv(VALUATION_COMPUTE_WORKERS_ENV, "4")
+    assert resolve_valuation_compute_executor_mode() == "thread"
+    assert resolve_valuation_compute_workers() == 4
+
+    monkeypatch.setenv(VALUATION_COMPUTE_EXECUTOR_ENV, "fiber")
+    monkeypatch.setenv(VALUATION_COMPUTE_WORKERS_ENV, "many")
+    assert resolve_valuation_compute_executor_mode() == "process"
+    assert resolve_valuation_compute_workers() == 2